@@ -0,0 +1,188 @@
+"""Closed-form checks of the plane frame and truss solvers (design_type.frame_2D.frame_analysis and
+design_type.truss.truss_analysis), which pin their sign conventions: moments sagging positive, axial forces tension
+positive, loads and displacements positive along the global axes.
+
+    python -m osdag.Analysis_test
+"""
+import math
+import unittest
+
+from .Common import KEY_AXIAL, KEY_SHEAR, KEY_MOMENT, KEY_LOAD_CASES
+from .design_type.frame_2D.frame_analysis import Frame2D
+from .design_type.truss.truss_analysis import Truss2D
+
+E = 2e5         # N/mm2
+A = 5000.0      # mm2
+I = 1e8         # mm4
+PIN = (True, True, False)
+ROLLER = (False, True, False)
+
+
+class AnalysisTestCase(unittest.TestCase):
+
+    def assertClose(self, value, expected, rel=1e-7):
+        self.assertAlmostEqual(value, expected, delta=rel * max(abs(expected), 1.0))
+
+
+class TestFrame2D(AnalysisTestCase):
+
+    def beam(self, nodes, restraints):
+        """A horizontal beam through nodes at x (mm), with the restraints of its end nodes"""
+        frame = Frame2D(E=E)
+        for index, x in enumerate(nodes):
+            frame.add_node(x, 0.0, restraints[index] if index in restraints else (False, False, False))
+        for index in range(len(nodes) - 1):
+            frame.add_member(index, index + 1, None, area=A, inertia=I)
+        return frame
+
+    def test_simply_supported_udl(self):
+        w, L = -10.0, 6000.0
+        frame = self.beam([0.0, L / 2, L], {0: PIN, 2: ROLLER})
+        frame.add_load_case('UDL')
+        for member in range(2):
+            frame.member_load(0, member, w)
+        results = frame.analyse()
+
+        # reactions wL/2 upwards, midspan moment wL^2/8 sagging, midspan deflection 5wL^4/384EI downwards
+        self.assertClose(results.reactions[0, 0, 1], -w * L / 2)
+        self.assertClose(results.reactions[0, 2, 1], -w * L / 2)
+        forces = results.member_forces(0, 0)
+        self.assertClose(forces['moment'], -w * L ** 2 / 8)
+        self.assertClose(forces['moment_i'], 0.0)
+        self.assertClose(forces['moment_j'], -w * L ** 2 / 8)
+        self.assertClose(forces['shear'], -w * L / 2)
+        self.assertClose(forces['axial'], 0.0)
+        self.assertClose(results.displacements[0, 1, 1], 5 * w * L ** 4 / (384 * E * I))
+        self.assertClose(results.displacements[0, 0, 2], w * L ** 3 / (24 * E * I))
+
+        design_forces = results.design_forces(0)
+        self.assertEqual(design_forces[KEY_MOMENT], str(round(-w * L ** 2 / 8 / 1e6, 3)))
+        self.assertEqual(design_forces[KEY_SHEAR], str(round(-w * L / 2 / 1e3, 3)))
+        self.assertEqual(design_forces[KEY_AXIAL], '0.0')
+        self.assertEqual(len(design_forces[KEY_LOAD_CASES]), 1)
+
+    def test_simply_supported_point_load(self):
+        P, L = -50e3, 4000.0
+        frame = self.beam([0.0, L], {0: PIN, 1: ROLLER})
+        frame.add_load_case('Point load')
+        frame.member_point_load(0, 0, P, L / 2)
+        results = frame.analyse()
+
+        # midspan moment PL/4 sagging, reactions P/2 upwards
+        forces = results.member_forces(0, 0)
+        self.assertClose(forces['moment'], -P * L / 4)
+        self.assertClose(forces['shear'], -P / 2)
+        self.assertClose(results.reactions[0, 0, 1], -P / 2)
+        self.assertClose(results.reactions[0, 1, 1], -P / 2)
+
+    def test_fixed_fixed_udl(self):
+        w, L = -10.0, 6000.0
+        frame = self.beam([0.0, L], {0: (True, True, True), 1: (True, True, True)})
+        frame.add_load_case('UDL')
+        frame.member_load(0, 0, w)
+        results = frame.analyse()
+
+        # end moments wL^2/12 hogging, midspan moment wL^2/24 sagging
+        forces = results.member_forces(0, 0)
+        self.assertClose(forces['moment_i'], w * L ** 2 / 12)
+        self.assertClose(forces['moment_j'], w * L ** 2 / 12)
+        self.assertClose(forces['moment'], w * L ** 2 / 12)
+        self.assertClose(forces['shear'], -w * L / 2)
+        self.assertClose(results.reactions[0, 0, 2], -w * L ** 2 / 12)
+        self.assertClose(results.reactions[0, 1, 2], w * L ** 2 / 12)
+
+    def test_cantilever_point_load(self):
+        P, L = -20e3, 3000.0
+        frame = self.beam([0.0, L], {0: (True, True, True)})
+        frame.add_load_case('Tip load')
+        frame.nodal_load(0, 1, fy=P)
+        results = frame.analyse()
+
+        # tip deflection PL^3/3EI, tip rotation PL^2/2EI, moment PL hogging at the support
+        self.assertClose(results.displacements[0, 1, 1], P * L ** 3 / (3 * E * I))
+        self.assertClose(results.displacements[0, 1, 2], P * L ** 2 / (2 * E * I))
+        forces = results.member_forces(0, 0)
+        self.assertClose(forces['moment_i'], P * L)
+        self.assertClose(forces['moment'], P * L)
+        self.assertClose(forces['moment_j'], 0.0)
+        self.assertClose(forces['shear'], -P)
+        self.assertClose(results.reactions[0, 0, 1], -P)
+        self.assertClose(results.reactions[0, 0, 2], -P * L)
+
+    def test_inclined_cantilever(self):
+        H, L, angle = 10e3, 5000.0, math.radians(30)
+        c, s = math.cos(angle), math.sin(angle)
+        frame = Frame2D(E=E)
+        frame.add_node(0.0, 0.0, (True, True, True))
+        frame.add_node(L * c, L * s)
+        frame.add_member(0, 1, None, area=A, inertia=I)
+        frame.add_load_case('Pull')
+        frame.add_load_case('Push')
+        frame.nodal_load(0, 1, fx=H)
+        frame.nodal_load(1, 1, fx=-H)
+        results = frame.analyse()
+
+        # a horizontal pull on the tip: tension H cos, shear H sin, support moment H L sin hogging
+        pull = results.member_forces(0, 0)
+        self.assertClose(pull['axial'], H * c)
+        self.assertClose(pull['shear'], H * s)
+        self.assertClose(pull['moment_i'], -H * L * s)
+        push = results.member_forces(0, 1)
+        self.assertClose(push['axial'], -H * c)
+        self.assertClose(push['moment_i'], H * L * s)
+        self.assertClose(results.reactions[0, 0, 0], -H)
+        self.assertClose(results.reactions[0, 0, 2], H * L * s)
+
+        # elongation along the member H cos L / EA, deflection across it H sin L^3 / 3EI
+        ux, uy = results.displacements[0, 1, :2]
+        self.assertClose(ux * c + uy * s, H * c * L / (E * A))
+        self.assertClose(-ux * s + uy * c, -H * s * L ** 3 / (3 * E * I))
+
+        tension = results.design_forces(0, tension=True)
+        compression = results.design_forces(0)
+        self.assertEqual(tension[KEY_AXIAL], str(round(H * c / 1e3, 3)))
+        self.assertEqual(compression[KEY_AXIAL], str(round(H * c / 1e3, 3)))
+        self.assertEqual([case[KEY_AXIAL] for case in tension[KEY_LOAD_CASES]], [str(round(H * c / 1e3, 3)), '0.0'])
+        self.assertEqual([case[KEY_AXIAL] for case in compression[KEY_LOAD_CASES]], ['0.0', str(round(H * c / 1e3, 3))])
+
+
+class TestTruss2D(AnalysisTestCase):
+
+    def test_three_bar_truss(self):
+        P = 30e3
+        truss = Truss2D(E=E)
+        truss.add_node(0.0, 0.0, (True, True))
+        truss.add_node(4000.0, 0.0, (False, True))
+        truss.add_node(2000.0, 1500.0)
+        truss.add_member(0, 2, None, area=A)
+        truss.add_member(1, 2, None, area=A)
+        truss.add_member(0, 1, None, area=A)
+        truss.add_load_case('Down')
+        truss.add_load_case('Up')
+        truss.nodal_load(0, 2, fy=-P)
+        truss.nodal_load(1, 2, fy=P / 2)
+        results = truss.analyse()
+
+        # rafters in compression 5P/6, tie in tension 2P/3, reactions P/2
+        for value, expected in zip(results.forces[0], [-5 * P / 6, -5 * P / 6, 2 * P / 3]):
+            self.assertClose(value, expected)
+        for value, expected in zip(results.forces[1], [5 * P / 12, 5 * P / 12, -P / 3]):
+            self.assertClose(value, expected)
+        self.assertClose(results.reactions[0, 0, 1], P / 2)
+        self.assertClose(results.reactions[0, 1, 1], P / 2)
+        self.assertClose(results.reactions[0, 0, 0], 0.0)
+        for value, expected in zip(results.lengths, [2500.0, 2500.0, 4000.0]):
+            self.assertClose(value, expected)
+
+        # deflection of the apex by virtual work: sum N n L / EA = 5250 P / EA
+        self.assertClose(results.displacements[0, 2, 1], -5250 * P / (E * A))
+
+        # largest tension and compression of each member over the cases
+        for value, expected in zip(results.tension(), [5 * P / 12, 5 * P / 12, 2 * P / 3]):
+            self.assertClose(value, expected)
+        for value, expected in zip(results.compression(), [5 * P / 6, 5 * P / 6, P / 3]):
+            self.assertClose(value, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,12 @@ from pathlib import Path
 import os
 import errno
 import sys
-import yaml
 from importlib.resources import files
 from .utils.common.component import Bolt, Plate, Weld
 from .Common import *
+from .utils.common.design_cache import design_cache
+from .utils.common.instrumentation import design_timing
+from .utils.common.osi_file import load_osi_files
 
 
 
@@ -101,13 +103,9 @@ files_data = []   # list of tuples in which the first item will be file name and
 
 def precompute_data():
 
-    for file in osi_files:
+    in_files = [input_file_path + '/' + file for file in osi_files]
 
-        in_file = input_file_path + '/' + file
-
-        with open(in_file, 'r') as fileObject:
-
-            uiObj = yaml.load(fileObject, yaml.Loader)
+    for file, (in_file, uiObj) in zip(osi_files, load_osi_files(in_files)):
 
         files_data.append((file, uiObj))
 
@@ -126,7 +124,8 @@ def create_files():
 
             main = available_module[module]
             main.set_osdaglogger(None)
-            main.set_input_values(main, data)
+            with design_timing(module):
+                design_cache.design(main, data, lambda design_inputs: main.set_input_values(main, design_inputs))
 
             # output_dict = main.results_to_test(main)
             #
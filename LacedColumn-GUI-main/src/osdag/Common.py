@@ -14,7 +14,6 @@ PATH_TO_DATABASE = files("osdag.data.ResourceFiles.Database").joinpath("Intg_osd
 import sqlite3
 
 from .utils.common.other_standards import *
-from .utils.common.component import *
 # from design_type.connection.fin_plate_connection import FinPlateConnection
 # from design_type.connection.column_cover_plate import ColumnCoverPlate
 
@@ -578,6 +577,9 @@ KEY_LACEDCOL_BOLT_DIAMETER_OPTIONS = ['16mm', '18mm', '20mm', '22mm']
 KEY_LACEDCOL_WELD_SIZE = 'LacedColumn.WeldSize'
 KEY_DISP_LACEDCOL_WELD_SIZE = 'Weld Size *'
 KEY_LACEDCOL_WELD_SIZE_OPTIONS = ['4mm', '5mm', '6mm', '8mm']
+KEY_LACEDCOL_SPACING_MODE = 'LacedColumn.SpacingMode'
+KEY_DISP_LACEDCOL_SPACING_MODE = 'Spacing of Components'
+KEY_LACEDCOL_SPACING_MODE_OPTIONS = ['Fixed', 'Optimised']
 KEY_SPACING_FOR_2_GIRDERS = "spacing_2_girders"
 KEY_DISP_LACEDCOL_FRONT_TO_FRONT_SPACING = "Spacing (Front-to-Front)"
 # Laced Column Keys
@@ -1234,6 +1236,8 @@ KEY_SEC_TYPE = 'Member.Type'
 KEY_SHEAR = 'Load.Shear'
 KEY_AXIAL = 'Load.Axial'
 KEY_MOMENT = 'Load.Moment'
+KEY_LOAD_CASES = 'Load.Cases'  # table of load cases: list of mappings of the load keys, named by KEY_LOAD_CASE_NAME
+KEY_LOAD_CASE_NAME = 'Name'
 
 KEY_D = 'Bolt.Diameter'
 KEY_TYP = 'Bolt.Type'
@@ -2914,9 +2918,6 @@ def get_leg_lengths(designation):
 
 all_angles = connectdb("Angles","popup")
 VALUES_CLEAT_CUSTOMIZED = get_available_cleat_list(all_angles, 200.0, 50.0)
-print(all_angles)
-print("customised")
-print(VALUES_CLEAT_CUSTOMIZED)
 
 BOLT_DESCRIPTION = str("<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
                 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
@@ -3438,4 +3439,9 @@ PLATE_GIRDER_DEFLECTION_TABLE = str("""
 
 
 
-""")
\ No newline at end of file
+""")
+
+
+# imported last: component, is800_2007 and material import this module in turn, and only get all of its names once they
+# are defined (component keeps its own copies of connectdb and of the weld constants, the same as these)
+from .utils.common.component import *
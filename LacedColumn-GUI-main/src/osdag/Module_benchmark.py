@@ -0,0 +1,297 @@
+"""Headless benchmark of the design modules over the design examples.
+
+Every .osi file of data/ResourceFiles/design_example is run a number of times through its design module, without the
+GUI, and the time of each stage of the design is measured separately:
+
+    import          import of the design module, in a new interpreter (cold import)
+    setup           set_osdaglogger of the module
+    design          set_input_values, i.e. the calculation of the design
+    output_values   output dock values of the design
+    report          report data (save_design, without the generation of the LaTeX report)
+    cad             3D model of the design (only with --cad)
+
+The median and 95th percentile of each stage and the peak memory of a design (measured in a separate run, with
+tracemalloc) are written to a JSON file. When a baseline (a JSON file written by an earlier run) is given, the medians are
+compared with it and the benchmark fails if a stage is slower by more than the threshold:
+
+    python -m osdag.Module_benchmark --repeat 10 --output benchmark.json
+    python -m osdag.Module_benchmark --repeat 10 --baseline benchmark.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import copy
+import datetime
+import fnmatch
+import importlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+
+from .Common import *
+from ._version import __version__
+from .utils.common.osi_file import load_osi_files
+
+# module of the design examples: (python module, design class)
+BENCHMARK_MODULES = {
+    KEY_DISP_FINPLATE: ('osdag.design_type.connection.fin_plate_connection', 'FinPlateConnection'),
+    KEY_DISP_ENDPLATE: ('osdag.design_type.connection.end_plate_connection', 'EndPlateConnection'),
+    KEY_DISP_CLEATANGLE: ('osdag.design_type.connection.cleat_angle_connection', 'CleatAngleConnection'),
+    KEY_DISP_SEATED_ANGLE: ('osdag.design_type.connection.seated_angle_connection', 'SeatedAngleConnection'),
+    KEY_DISP_BASE_PLATE: ('osdag.design_type.connection.base_plate_connection', 'BasePlateConnection'),
+    KEY_DISP_BEAMCOVERPLATE: ('osdag.design_type.connection.beam_cover_plate', 'BeamCoverPlate'),
+    KEY_DISP_BEAMCOVERPLATEWELD: ('osdag.design_type.connection.beam_cover_plate_weld', 'BeamCoverPlateWeld'),
+    KEY_DISP_COLUMNCOVERPLATE: ('osdag.design_type.connection.column_cover_plate', 'ColumnCoverPlate'),
+    KEY_DISP_COLUMNCOVERPLATEWELD: ('osdag.design_type.connection.column_cover_plate_weld', 'ColumnCoverPlateWeld'),
+    KEY_DISP_COLUMNENDPLATE: ('osdag.design_type.connection.column_end_plate', 'ColumnEndPlate'),
+    KEY_DISP_BCENDPLATE: ('osdag.design_type.connection.beam_column_end_plate', 'BeamColumnEndPlate'),
+    KEY_DISP_BB_EP_SPLICE: ('osdag.design_type.connection.beam_beam_end_plate_splice', 'BeamBeamEndPlateSplice'),
+    KEY_DISP_TENSION_BOLTED: ('osdag.design_type.tension_member.tension_bolted', 'Tension_bolted'),
+    KEY_DISP_TENSION_WELDED: ('osdag.design_type.tension_member.tension_welded', 'Tension_welded'),
+}
+
+STAGES = ['setup', 'design', 'output_values', 'report', 'cad']
+
+input_file_path = os.path.join(os.path.dirname(__file__), 'data', 'ResourceFiles', 'design_example')
+
+# summary given to save_design, as in Module_test
+popup_summary = {'ProfileSummary': {'CompanyName': 'LoremIpsum', 'CompanyLogo': '', 'Group/TeamName': 'LoremIpsum',
+                                    'Designer': 'LoremIpsum'}, 'ProjectTitle': 'Fossee', 'Subtitle': '', 'JobNumber': '123',
+                 'AdditionalComments': 'No comments', 'Client': 'LoremIpsum', 'does_design_exist': False,
+                 'logger_messages': ''}
+
+
+def load_examples(directory=input_file_path, pattern='*.osi'):
+    """Read the design examples
+
+    Returns: list of (file name, design dictionary), sorted by file name
+    """
+    file_names = [file_name for file_name in sorted(os.listdir(directory))
+                  if file_name.endswith('.osi') and fnmatch.fnmatch(file_name, pattern)]
+    return [(os.path.basename(path), design_inputs)
+            for path, design_inputs in load_osi_files(os.path.join(directory, file_name) for file_name in file_names)]
+
+
+def timing_summary(values):
+    """Summarise the times (in seconds) of the runs of a stage"""
+    values = np.asarray(values, dtype=float)
+    return {'median': float(np.median(values)), 'p95': float(np.percentile(values, 95)), 'min': float(values.min()),
+            'runs': len(values)}
+
+
+def cold_import_time(module, repeat=3):
+    """Measure the import of a design module in a new interpreter, repeat times
+
+    Returns: list of times in seconds
+    """
+    # the module is imported first, as it is in the application: importing another module before it would hide an
+    # import cycle and take part of the import time out of the measure
+    code = 'import time; start = time.perf_counter(); import {}; print(time.perf_counter() - start)'.format(module)
+    times = []
+    for i in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        if output.returncode != 0:
+            raise RuntimeError(output.stderr.strip().splitlines()[-1] if output.stderr.strip() else 'import failed')
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return times
+
+
+@contextlib.contextmanager
+def quiet_design():
+    """Silence the prints of the design modules and drop the log handlers they add in set_osdaglogger"""
+    logger = logging.getLogger('Osdag')
+    handlers = list(logger.handlers)
+    propagate = logger.propagate
+    logger.propagate = False
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        logger.handlers = handlers
+        logger.propagate = propagate
+
+
+class DesignBenchmark(object):
+    """Run the design examples through their modules and measure the stages of the designs"""
+
+    def __init__(self, repeat=5, import_repeat=3, cad=False, report=True):
+        self.repeat = repeat
+        self.import_repeat = import_repeat
+        self.cad = cad
+        self.report = report
+        self.report_folder = tempfile.mkdtemp(prefix='osdag_benchmark_')
+        self.display = None
+        self.imports = {}
+
+    def design_class(self, module):
+        """Import the design class of a module, measuring the cold import the first time"""
+        path, name = BENCHMARK_MODULES[module]
+        if path not in self.imports:
+            self.imports[path] = timing_summary(cold_import_time(path, self.import_repeat)) \
+                if self.import_repeat else None
+        return getattr(importlib.import_module(path), name)
+
+    def cad_display(self):
+        if self.display is None:
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+            from .texlive.Design_wrapper import init_display
+            self.display = init_display(backend_str="pyqt5")[0]
+        return self.display
+
+    def run_design(self, main, file_name, design_inputs, times=None):
+        """Run one design through its stages
+
+        Args:
+            main: design class (used without an instance, as in the GUI)
+            file_name: name of the design example
+            design_inputs: design dictionary
+            times: dictionary of stage name to list of times, the time of each stage is appended to it (None to not
+                   measure)
+        """
+        from .design_report.reportGenerator_latex import CreateLatex
+
+        def stage(name, function):
+            start = time.perf_counter()
+            function()
+            if times is not None:
+                times.setdefault(name, []).append(time.perf_counter() - start)
+
+        with quiet_design():
+            stage('setup', lambda: main.set_osdaglogger(None))
+            stage('design', lambda: main.set_input_values(main, copy.deepcopy(design_inputs)))
+            stage('output_values', lambda: main.output_values(main, True))
+            if self.report:
+                summary = dict(popup_summary, filename=os.path.join(self.report_folder, file_name.split('.')[0]))
+                with mock.patch.object(CreateLatex, 'save_latex', lambda *args, **kwargs: None):
+                    stage('report', lambda: main.save_design(main, summary))
+            if self.cad:
+                from .cad.common_logic import CommonDesignLogic
+
+                def cad():
+                    display = self.cad_display()
+                    CommonDesignLogic(display, ' ', main.module, main.mainmodule).call_3DModel(main.design_status, main)
+                    display.EraseAll()
+                stage('cad', cad)
+
+    def run(self, examples):
+        """Benchmark the design examples
+
+        Args:
+            examples: list of (file name, design dictionary)
+
+        Returns: dictionary of the results, as written to the JSON file
+        """
+        results = {}
+        for file_name, design_inputs in examples:
+            module = design_inputs.get(KEY_MODULE)
+            result = {'module': module}
+            results[file_name] = result
+            if module not in BENCHMARK_MODULES:
+                result['error'] = 'No design module for {}'.format(module)
+                continue
+            times = {}
+            try:
+                main = self.design_class(module)
+                for i in range(self.repeat):
+                    self.run_design(main, file_name, design_inputs, times)
+                tracemalloc.start()
+                try:
+                    self.run_design(main, file_name, design_inputs)
+                    result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                result['design_status'] = bool(getattr(main, 'design_status', False))
+            except Exception as e:
+                result['error'] = '{}: {}'.format(type(e).__name__, e)
+            result['stages'] = {name: timing_summary(times[name]) for name in STAGES if times.get(name)}
+        return {'osdag_version': __version__, 'python': platform.python_version(), 'platform': platform.platform(),
+                'date': datetime.datetime.now().isoformat(timespec='seconds'), 'repeat': self.repeat, 'imports': self.imports, 'results': results}
+
+
+def compare(results, baseline, threshold=0.2, minimum=0.001):
+    """Compare the median times of a benchmark with a baseline
+
+    Args:
+        results: benchmark results (dict, as returned by DesignBenchmark.run)
+        baseline: baseline results (dict, same format)
+        threshold: allowed relative slowdown of a stage, e.g. 0.2 for 20 %
+        minimum: slowdowns smaller than this time (in seconds) are ignored as noise
+
+    Returns: list of regressions, (file name or design module, stage, baseline median, median)
+    """
+    regressions = []
+    for module, timing in results.get('imports', {}).items():
+        before = baseline.get('imports', {}).get(module)
+        if timing and before and timing['median'] > before['median'] * (1 + threshold) \
+                and timing['median'] - before['median'] > minimum:
+            regressions.append((module, 'import', before['median'], timing['median']))
+    for file_name, result in results['results'].items():
+        base_stages = baseline.get('results', {}).get(file_name, {}).get('stages', {})
+        for name, timing in result.get('stages', {}).items():
+            if name not in base_stages:
+                continue
+            before, after = base_stages[name]['median'], timing['median']
+            if after > before * (1 + threshold) and after - before > minimum:
+                regressions.append((file_name, name, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m osdag.Module_benchmark',
+                                     description='Benchmark the design modules over the design examples')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each design example (default: 5)')
+    parser.add_argument('--import-repeat', type=int, default=3,
+                        help='cold imports of each design module, 0 to not measure the imports (default: 3)')
+    parser.add_argument('--examples', default=input_file_path, help='folder of the .osi files')
+    parser.add_argument('--filter', default='*.osi', help='pattern of the .osi files to run, e.g. "fin*.osi"')
+    parser.add_argument('--no-report', action='store_true', help='do not measure the report data')
+    parser.add_argument('--cad', action='store_true', help='measure the 3D model of the designs (needs PyQt5 and OCC)')
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--baseline', help='JSON file of an earlier run to compare the results with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative slowdown of a stage against the baseline (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    benchmark = DesignBenchmark(args.repeat, args.import_repeat, args.cad, not args.no_report)
+    results = benchmark.run(load_examples(args.examples, args.filter))
+
+    for module, timing in results['imports'].items():
+        if timing:
+            print('import {} {:.1f}/{:.1f} ms (median/p95)'.format(module, timing['median'] * 1000, timing['p95'] * 1000))
+    for file_name, result in results['results'].items():
+        if 'error' in result:
+            print('{:<28} {}'.format(file_name, result['error']))
+            continue
+        stages = ', '.join('{} {:.1f}/{:.1f} ms'.format(name, timing['median'] * 1000, timing['p95'] * 1000)
+                           for name, timing in result['stages'].items())
+        print('{:<28} {} (median/p95), peak {:.1f} MB'.format(file_name, stages, result['peak_memory'] / 2 ** 20))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        for file_name, name, before, after in regressions:
+            print('Regression: {} {} {:.1f} ms -> {:.1f} ms'.format(file_name, name, before * 1000, after * 1000))
+        print('{} regressions above {:.0%}'.format(len(regressions), args.threshold))
+        status = 1 if regressions else 0
+    return status
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,6 +1,5 @@
 import os
 import errno
-import yaml
 import sys
 import unittest
 from pathlib import Path
@@ -57,6 +56,7 @@ from .design_type.connection.column_cover_plate import ColumnCoverPlate
 from .design_type.connection.column_end_plate import ColumnEndPlate
 from .design_type.compression_member.compression import Compression
 from .Common import *
+from .utils.common.osi_file import load_osi_files
 
 
 if not is_travis:
@@ -131,13 +131,9 @@ files_data = []   # list of tuples in which the first item will be file name and
 
 def precompute_data():
 
-    for file in osi_files:
+    in_files = [input_file_path + '/' + file for file in osi_files]
 
-        in_file = input_file_path + '/' + file
-
-        with open(in_file, 'r') as fileObject:
-
-            uiObj = yaml.load(fileObject, yaml.Loader)
+    for file, (in_file, uiObj) in zip(osi_files, load_osi_files(in_files)):
 
         files_data.append((file, uiObj))
 
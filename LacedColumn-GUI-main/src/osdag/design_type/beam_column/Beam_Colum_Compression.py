@@ -21,6 +21,7 @@ from ...utils.common.component import *
 from ..member import Member
 from ...Report_functions import *
 from ...design_report.reportGenerator_latex import CreateLatex
+from ...utils.common.section_classification import classify_column_sections
 
 # TODO: change to BeamColumnDesign
 
@@ -631,6 +632,9 @@ class ColumnDesign(Member):
         self.input_section_list = []
         self.input_section_classification = {}
 
+        trial_sections = []
+        trial_properties = []
+        trial_fy = []
         for section in self.sec_list:
             trial_section = section.strip("'")
 
@@ -652,54 +656,24 @@ class ColumnDesign(Member):
             self.material_property.connect_to_database_to_get_fy_fu(self.material,
                                                                     max(self.section_property.flange_thickness, self.section_property.web_thickness))
 
-            # section classification
-            if (self.sec_profile == VALUES_SEC_PROFILE[0]) or (self.sec_profile == VALUES_SEC_PROFILE[1]):  # Beams or Columns
-
-                if self.section_property.type == 'Rolled':
-                    self.flange_class = IS800_2007.Table2_i((self.section_property.flange_width / 2), self.section_property.flange_thickness,
-                                                            self.material_property.fy, self.section_property.type)[0]
-                else:
-                    self.flange_class = IS800_2007.Table2_i(((self.section_property.flange_width / 2) - (self.section_property.web_thickness / 2)),
-                                                            self.section_property.flange_thickness, self.section_property.fy,
-                                                            self.section_property.type)[0]
-
-                self.web_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                       self.section_property.web_thickness, self.material_property.fy,
-                                                       classification_type='Axial compression')
-
-            elif (self.sec_profile == VALUES_SEC_PROFILE[2]) or (self.sec_profile == VALUES_SEC_PROFILE[3]):  # RHS or SHS
-                self.flange_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                          self.section_property.flange_thickness, self.material_property.fy,
-                                                          classification_type='Axial compression')
-                self.web_class = self.flange_class
-
-            elif self.sec_profile == VALUES_SEC_PROFILE[4]:  # CHS
-                self.flange_class = IS800_2007.Table2_x(self.section_property.out_diameter, self.section_property.flange_thickness,
-                                                        self.material_property.fy, load_type='axial compression')
-                self.web_class = self.flange_class  #Why?
-                # print(f"self.web_class{self.web_class}")
-
-            if self.flange_class == 'Slender' or self.web_class == 'Slender':
-                self.section_class = 'Slender'
+            trial_sections.append(trial_section)
+            trial_properties.append(self.section_property)
+            trial_fy.append(self.material_property.fy)
+
+        # section classification of all the sections at once
+        profile = {VALUES_SEC_PROFILE[0]: 'I', VALUES_SEC_PROFILE[1]: 'I', VALUES_SEC_PROFILE[2]: 'RHS',
+                   VALUES_SEC_PROFILE[3]: 'RHS', VALUES_SEC_PROFILE[4]: 'CHS'}.get(self.sec_profile)
+        if trial_sections and profile is not None:
+            classification = classify_column_sections(trial_properties, trial_fy, profile)
+
+        for k, trial_section in enumerate(trial_sections):
+            self.section_property = trial_properties[k]
+            if profile is not None:
+                self.flange_class = classification['flange_class'][k]
+                self.web_class = classification['web_class'][k]
+                self.section_class = classification['section_class'][k]
             else:
-                if self.flange_class == 'Plastic' and self.web_class == 'Plastic':
-                    self.section_class = 'Plastic'
-                elif self.flange_class == 'Plastic' and self.web_class == 'Compact':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Plastic' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Plastic':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Compact':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Plastic':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
+                self.flange_class = self.web_class = self.section_class = None
 
             logger.info("The flange of the trial section ({}) is {} and web is {}. The section is {} [Reference: Cl 3.7, IS 800:2007].".
                         format(trial_section, self.flange_class, self.web_class, self.section_class))
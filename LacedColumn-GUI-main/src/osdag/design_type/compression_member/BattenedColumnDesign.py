@@ -0,0 +1,242 @@
+import math
+import logging
+
+import numpy as np
+
+from ...Common import *
+from ...utils.common.component import Channel, ISection
+from ...utils.common.is800_2007 import IS800_2007
+from ...utils.common.section_results import SectionResults
+
+logger = logging.getLogger("Osdag.BattenedColumnDesign")
+
+# standard thicknesses of batten plates (mm)
+BATTEN_PLATE_THICKNESSES = [6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32, 36, 40]
+
+# properties of a component read into the section table
+SECTION_PROPERTIES = ['area', 'mass', 'depth', 'flange_width', 'rad_of_gy_z', 'rad_of_gy_y', 'fy']
+
+
+class BattenedColumnDesign:
+    """
+    A class to design battened columns of two components (channels or girders) according to IS 800:2007 Cl 7.7.
+
+    All the candidate sections are designed at once, as arrays of section properties:
+    1. Spacing of the components: the input clear spacing, or the spacing at which the slenderness ratio about the
+       axis between the components (increased by 10%, Cl 7.7.1.4) equals the slenderness ratio about the other axis
+    2. Design compressive strength of the built-up column (buckling class c)
+    3. Spacing of the battens: the largest spacing within the local slenderness limit of the components (Cl 7.7.3),
+       with at least three bays
+    4. Batten plates: the minimum depth (Cl 7.7.2.3) and thickness (Cl 7.7.2.4), the thickness increased for the shear
+       and moment from the transverse shear of 2.5% of the axial load (Cl 7.7.2.1)
+    The lightest column (components and battens) that passes is selected.
+
+    Attributes:
+        design_dict (dict): Dictionary containing all design inputs
+        section_results (SectionResults): results of every candidate section
+        result (dict): results of the selected section
+    """
+
+    def __init__(self, design_dict):
+        self.design_dict = design_dict
+        self.section_results = SectionResults()
+        self.result = {}
+        self.beam_designations = None  # designations of the beams table, read with the first girder
+        self.E = 2e5  # Young's modulus for steel
+        self.gamma_m0 = IS800_2007.cl_5_4_1_Table_5["gamma_m0"]["yielding"]
+
+    def design(self, sections):
+        """Design the battened column with each of the sections and select the lightest that passes
+
+        Args:
+            sections: designations of the candidate sections (one component)
+
+        Returns: dictionary of the results of the selected section, with KEY_DESIGN_STATUS False and a reason if no
+                 section passes
+        """
+        try:
+            self.extract_design_inputs()
+        except (ValueError, TypeError, KeyError) as e:
+            return self.fail_response(f"Design failed: {str(e)}")
+
+        # a section which cannot be read or designed is left out, the others are designed
+        components = []
+        designations = []
+        for designation in sections:
+            try:
+                section = self.component(designation)
+                self.section_table([section])
+            except Exception as e:
+                logger.warning(f"{designation}: section skipped, its properties could not be read ({e})")
+                continue
+            components.append(section)
+            designations.append(designation)
+        if not components:
+            return self.fail_response("None of the sections could be read from the database")
+        try:
+            results = self.design_sections(self.section_table(components))
+        except Exception as e:
+            logger.exception(f"Design of the sections {designations[0]} to {designations[-1]} failed")
+            return self.fail_response(f"Design failed: {str(e)}")
+        sections = designations
+
+        self.section_results = SectionResults()
+        for i, designation in enumerate(sections):
+            details = {name: float(values[i]) for name, values in results.items()}
+            details["designation"] = designation
+            self.section_results.add(designation, details["ur"], capacity=details["capacity"] / 1000,
+                                     mass=details["total_mass"], details=details)
+        selected = self.section_results.lightest(self.allowable_ur)
+        if selected is None:
+            failing = self.section_results.least_failing(self.allowable_ur)
+            self.result = dict(self.section_results[failing]) if failing is not None else {}
+            self.result.update({KEY_DESIGN_STATUS: False, "reason": "No section passed the design checks"})
+            return self.result
+        self.result = dict(self.section_results[selected])
+        self.result[KEY_DESIGN_STATUS] = True
+        return self.result
+
+    def extract_design_inputs(self):
+        """Extract and validate design inputs"""
+        self.profile = self.design_dict.get(KEY_BATTENEDCOL_SEC_PROFILE, KEY_BATTENEDCOL_SEC_PROFILE_OPTIONS[0])
+        self.material = self.design_dict.get(KEY_BATTENEDCOL_MATERIAL)
+        if not self.material:
+            raise ValueError("Invalid material grade")
+
+        self.axial_load = float(self.design_dict.get(KEY_BATTENEDCOL_AXIAL_LOAD, 0)) * 1000  # N
+        if self.axial_load <= 0:
+            raise ValueError("Axial load must be positive")
+
+        self.length_yy = float(self.design_dict.get(KEY_BATTENEDCOL_UNSUPPORTED_LENGTH_YY, 0))
+        self.length_zz = float(self.design_dict.get(KEY_BATTENEDCOL_UNSUPPORTED_LENGTH_ZZ, 0))
+        if self.length_yy <= 0 or self.length_zz <= 0:
+            raise ValueError("Length must be positive")
+
+        self.effective_length_yy = self.effective_length(self.length_yy, KEY_BATTENEDCOL_END_CONDITION_YY_1,
+                                                         KEY_BATTENEDCOL_END_CONDITION_YY_2)
+        self.effective_length_zz = self.effective_length(self.length_zz, KEY_BATTENEDCOL_END_CONDITION_ZZ_1,
+                                                         KEY_BATTENEDCOL_END_CONDITION_ZZ_2)
+
+        spacing = self.design_dict.get(KEY_BATTENEDCOL_SPACING)
+        self.spacing = float(spacing) if spacing not in (None, '') else None
+        self.allowable_ur = float(self.design_dict.get(KEY_BATTENEDCOL_ALLOWABLE_UR, 1.0))
+
+    def effective_length(self, length, key_end_1, key_end_2):
+        # the end conditions of the module are 'Fixed', 'Pinned' and 'Free'; Table 11 calls a pinned end 'Hinged'
+        ends = [self.design_dict.get(key, 'Fixed') for key in (key_end_1, key_end_2)]
+        ends = ['Hinged' if end == 'Pinned' else end for end in ends]
+        return IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(length, end_1=ends[0],
+                                                                                       end_2=ends[1])
+
+    def component(self, designation):
+        """Return the section of one component"""
+        if self.profile == KEY_BATTENEDCOL_SEC_PROFILE_OPTIONS[2]:  # 2 girders, from the table of beams or of columns
+            if self.beam_designations is None:
+                self.beam_designations = set(connectdb("Beams", call_type="popup"))
+            table = "Beams" if designation in self.beam_designations else "Columns"
+            return ISection(designation=designation, material_grade=self.material, table=table)
+        return Channel(designation=designation, material_grade=self.material)
+
+    def section_table(self, components):
+        """Return the properties of the components as a dictionary of arrays, with c, the distance from the centroid of
+        a component to its face towards the other component
+        """
+        table = {name: np.array([getattr(section, name) for section in components], dtype=float)
+                 for name in SECTION_PROPERTIES}
+        if self.profile == KEY_BATTENEDCOL_SEC_PROFILE_OPTIONS[0]:  # back-to-back channels
+            table['c'] = np.array([section.Cy for section in components], dtype=float)
+        elif self.profile == KEY_BATTENEDCOL_SEC_PROFILE_OPTIONS[1]:  # toe-to-toe channels
+            table['c'] = np.array([section.flange_width - section.Cy for section in components], dtype=float)
+        else:
+            table['c'] = table['flange_width'] / 2
+        return table
+
+    def design_compressive_stress(self, fy, slenderness, alpha=0.49):
+        """Design compressive stress (Cl 7.1.2.1), buckling class c by default"""
+        non_dim = np.sqrt(fy / (math.pi ** 2 * self.E / slenderness ** 2))
+        phi = 0.5 * (1 + alpha * (non_dim - 0.2) + non_dim ** 2)
+        return np.minimum(fy / (self.gamma_m0 * (phi + np.sqrt(phi ** 2 - non_dim ** 2))), fy / self.gamma_m0)
+
+    def design_sections(self, table):
+        """Design the battened column with every section of the table
+
+        Returns: dictionary of arrays of the results, one value per section
+        """
+        A, r_z, r_y, c, b, fy = (table[name] for name in ('area', 'rad_of_gy_z', 'rad_of_gy_y', 'c', 'flange_width',
+                                                            'fy'))
+
+        # 1 - clear spacing of the components: the input spacing, or the spacing balancing the slenderness ratios,
+        # 1.1 KLy/ryy = KLz/rz with ryy^2 = ry^2 + (S/2 + c)^2
+        if self.spacing is not None:
+            clear_spacing = np.full(len(A), self.spacing)
+        else:
+            r_target = 1.1 * self.effective_length_yy * r_z / self.effective_length_zz
+            clear_spacing = np.ceil(np.maximum(2 * (np.sqrt(np.maximum(r_target ** 2 - r_y ** 2, 0)) - c), 0) / 5) * 5
+        S = clear_spacing + 2 * c  # distance between the centroids of the components
+        r_yy = np.sqrt(r_y ** 2 + (S / 2) ** 2)
+
+        # 2 - design compressive strength of the built-up column
+        slenderness_zz = self.effective_length_zz / r_z
+        slenderness_yy = 1.1 * self.effective_length_yy / r_yy  # Cl 7.7.1.4
+        f_cd = np.minimum(self.design_compressive_stress(fy, slenderness_zz),
+                          self.design_compressive_stress(fy, slenderness_yy))
+        capacity = 2 * A * f_cd
+        ur = self.axial_load / capacity
+
+        # 3 - spacing of the battens, C/rmin of a component within 50 and 0.7 x the slenderness of the column about
+        # the z-z axis (Cl 7.7.3), at least three bays
+        r_min = np.minimum(r_z, r_y)
+        C_max = np.minimum(50, 0.7 * slenderness_zz) * r_min
+        bays = np.maximum(np.ceil(self.length_yy / C_max), 3)
+        C = self.length_yy / bays
+
+        # 4 - batten plates: depth (Cl 7.7.2.3) of the end and the intermediate battens, thickness (Cl 7.7.2.4) from the
+        # distance between the connecting lines, taken as S, increased for the forces in the battens (Cl 7.7.2.1)
+        end_depth = np.ceil(np.maximum(S, 2 * b) / 10) * 10
+        depth = np.ceil(np.maximum(0.75 * S, 2 * b) / 10) * 10
+        Vt = 0.025 * self.axial_load
+        N = 2  # planes of battens
+        Vb = Vt * C / (N * S)  # longitudinal shear
+        M = Vt * C / (2 * N)  # moment
+        t_required = np.maximum.reduce([S / 50,
+                                        Vb * math.sqrt(3) * self.gamma_m0 / (depth * fy),
+                                        6 * M * self.gamma_m0 / (depth ** 2 * fy)])
+        thicknesses = np.array(BATTEN_PLATE_THICKNESSES, dtype=float)
+        index = np.searchsorted(thicknesses, t_required)
+        fits = index < len(thicknesses)
+        t = np.where(fits, thicknesses[np.minimum(index, len(thicknesses) - 1)], np.nan)
+        ur = np.where(fits, ur, np.inf)
+
+        # mass: two components and the battens of both planes (end battens and bays - 1 intermediate battens)
+        batten_length = clear_spacing + 2 * b
+        batten_volume = N * t * batten_length * (2 * end_depth + (bays - 1) * depth)
+        batten_mass = 7.85e-6 * batten_volume
+        total_mass = 2 * table['mass'] * self.length_yy / 1000 + batten_mass
+
+        return {
+            'clear_spacing': clear_spacing,
+            'spacing_centroids': S,
+            'slenderness_zz': slenderness_zz,
+            'slenderness_yy': slenderness_yy,
+            'f_cd': f_cd,
+            'capacity': capacity,
+            'ur': ur,
+            'batten_spacing': C,
+            'bays': bays,
+            'end_batten_depth': end_depth,
+            'batten_depth': depth,
+            'batten_thickness': t,
+            'batten_length': batten_length,
+            'batten_shear': Vb,
+            'batten_moment': M,
+            'batten_mass': batten_mass,
+            'total_mass': total_mass,
+        }
+
+    def fail_response(self, reason):
+        logger.error(f"Design failed: {reason}")
+        self.result = {
+            KEY_DESIGN_STATUS: False,
+            "reason": reason
+        }
+        return self.result
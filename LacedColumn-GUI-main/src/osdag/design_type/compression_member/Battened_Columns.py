@@ -16,58 +16,7 @@ from ...Report_functions import *
 from ...design_report.reportGenerator_latex import CreateLatex
 from pylatex.utils import NoEscape
 from ...Common import TYPE_TAB_4, TYPE_TAB_5 
-from PyQt5.QtWidgets import QLineEdit, QMainWindow, QMessageBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QValidator, QDoubleValidator
-from ...gui.ui_template import Window
-from PyQt5.QtWidgets import QComboBox
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QFormLayout
-from PyQt5.QtWidgets import QDialogButtonBox
-
-class MaterialDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Custom Material")
-        self.setModal(True)
-        self.setup_ui()
-        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove help button
-
-    def setup_ui(self):
-        layout = QFormLayout(self)
-        
-        # Create input fields
-        self.grade_input = QLineEdit()
-        self.fy_20_input = QLineEdit()
-        self.fy_20_40_input = QLineEdit()
-        self.fy_40_input = QLineEdit()
-        self.fu_input = QLineEdit()
-        
-        # Add fields to layout
-        layout.addRow("Grade:", self.grade_input)
-        layout.addRow("Fy (20mm):", self.fy_20_input)
-        layout.addRow("Fy (20-40mm):", self.fy_20_40_input)
-        layout.addRow("Fy (40mm):", self.fy_40_input)
-        layout.addRow("Fu:", self.fu_input)
-        
-        # Add buttons with proper spacing
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
-        layout.addRow(button_box)
-
-    def closeEvent(self, event):
-        """Handle dialog close event"""
-        self.reject()
-        event.accept()
-
-    def get_material_data(self):
-        return {
-            'grade': self.grade_input.text(),
-            'fy_20': self.fy_20_input.text(),
-            'fy_20_40': self.fy_20_40_input.text(),
-            'fy_40': self.fy_40_input.text(),
-            'fu': self.fu_input.text()
-        }
+from .BattenedColumnDesign import BattenedColumnDesign
 
 
 class BattenedColumn(Member):
@@ -106,12 +55,6 @@ class BattenedColumn(Member):
             KEY_DISP_BATTENEDCOL_WELD_SIZE: "5mm"                        
             }
 
-        
-        # Initialize validators
-        self.double_validator = QDoubleValidator()
-        self.double_validator.setNotation(QDoubleValidator.StandardNotation)
-        self.double_validator.setDecimals(2)
-
 
     def tab_list(self):
         return [
@@ -435,14 +378,52 @@ class BattenedColumn(Member):
         """
         return self.weld_size
     
+    def set_input_values(self, design_dictionary):
+        """
+        Designs the battened column with the sections of the selected profile (all the sections of the database unless
+        a list of sections is given) and keeps the lightest safe design in self.result.
+        """
+        self.design_dict = design_dictionary
+        sections = design_dictionary.get(KEY_BATTENEDCOL_SEC_SIZE)
+        if not isinstance(sections, list):
+            if design_dictionary.get(KEY_BATTENEDCOL_SEC_PROFILE) == KEY_BATTENEDCOL_SEC_PROFILE_OPTIONS[2]:
+                sections = connectdb("Beams", call_type="popup")
+            else:
+                sections = connectdb("Channels", call_type="popup")
+        self.batten_design = BattenedColumnDesign(design_dictionary)
+        self.result = self.batten_design.design(sections)
+        self.design_status = self.result.get(KEY_DESIGN_STATUS, False)
+        self.utilization_ratio = self.result.get("ur", 0)
+        self.result.update({
+            "section": self.result.get("designation", ""),
+            "material": design_dictionary.get(KEY_BATTENEDCOL_MATERIAL, ""),
+            "load": design_dictionary.get(KEY_BATTENEDCOL_AXIAL_LOAD, ""),
+            "design_safe": self.design_status,
+            "message": self.result.get("reason", ""),
+        })
+
     def output_values(self, flag):
         if not flag:
             return []
+
+        def value(key, digits=2):
+            val = self.result.get(key, "")
+            return round(val, digits) if isinstance(val, float) else val
+
         return [
             (None, "Design Summary", TYPE_TITLE, None, True),
             ("section", "Section Profile", TYPE_TEXTBOX, self.result.get("section", ""), True),
             ("material", "Material Grade", TYPE_TEXTBOX, self.result.get("material", ""), True),
             ("load", "Axial Load (kN)", TYPE_TEXTBOX, self.result.get("load", ""), True),
+            ("capacity", "Design Compressive Strength (kN)", TYPE_TEXTBOX, round(self.result["capacity"] / 1000, 2) if "capacity" in self.result else "", True),
+            ("ur", "Utilization Ratio", TYPE_TEXTBOX, value("ur", 3), True),
+            ("clear_spacing", "Clear Spacing of Components (mm)", TYPE_TEXTBOX, value("clear_spacing"), True),
+            (None, "Batten Plates", TYPE_TITLE, None, True),
+            ("batten_spacing", "Spacing of Battens (mm)", TYPE_TEXTBOX, value("batten_spacing"), True),
+            ("end_batten_depth", "Depth of End Battens (mm)", TYPE_TEXTBOX, value("end_batten_depth"), True),
+            ("batten_depth", "Depth of Intermediate Battens (mm)", TYPE_TEXTBOX, value("batten_depth"), True),
+            ("batten_thickness", "Thickness of Battens (mm)", TYPE_TEXTBOX, value("batten_thickness"), True),
+            ("batten_length", "Length of Battens (mm)", TYPE_TEXTBOX, value("batten_length"), True),
             ("status", "Design Status", TYPE_TEXTBOX, "Safe" if self.result.get("design_safe", False) else "Unsafe", True)
         ]
     
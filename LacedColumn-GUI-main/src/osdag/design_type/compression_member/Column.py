@@ -20,6 +20,7 @@ from ...utils.common.component import *
 from ..member import Member
 from ...Report_functions import *
 from ...design_report.reportGenerator_latex import CreateLatex
+from ...utils.common.section_classification import classify_column_sections
 from pylatex.utils import NoEscape
 
 class ColumnDesign(Member):
@@ -681,6 +682,9 @@ class ColumnDesign(Member):
         self.input_section_list = []
         self.input_section_classification = {} 
 
+        trial_sections = []
+        trial_properties = []
+        trial_fy = []
         for section in self.sec_list:
             trial_section = section.strip("'")
 
@@ -706,63 +710,28 @@ class ColumnDesign(Member):
             self.material_property.connect_to_database_to_get_fy_fu(self.material,
                                                                     max(self.section_property.flange_thickness, self.section_property.web_thickness))
 
-            # section classification
-            if (self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]):  # Beams and Columns
-
-                if self.section_property.type == 'Rolled':
-                    self.flange_class = IS800_2007.Table2_i((self.section_property.flange_width / 2), self.section_property.flange_thickness,
-                                                            self.material_property.fy, self.section_property.type)[0]
-                else:
-                    self.flange_class = IS800_2007.Table2_i(((self.section_property.flange_width / 2) - (self.section_property.web_thickness / 2)),
-                                                            self.section_property.flange_thickness, self.section_property.fy,
-                                                            self.section_property.type)[0]
-
-                self.web_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                       self.section_property.web_thickness, self.material_property.fy,
-                                                       classification_type='Axial compression')
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-
-            elif (self.sec_profile ==KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]):  # RHS and SHS
-                self.flange_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                          self.section_property.flange_thickness, self.material_property.fy,
-                                                          classification_type='Axial compression')
-                self.web_class = self.flange_class
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-
-            elif self.sec_profile ==KEY_LACEDCOL_SEC_PROFILE_OPTIONS[2]:  # CHS
-                self.flange_class = IS800_2007.Table2_x(self.section_property.out_diameter, self.section_property.flange_thickness,
-                                                        self.material_property.fy, load_type='axial compression')
-                self.web_class = self.flange_class  #Why?
+            trial_sections.append(trial_section)
+            trial_properties.append(self.section_property)
+            trial_fy.append(self.material_property.fy)
+
+        # section classification of all the sections at once
+        profile = {KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]: 'I', KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]: 'RHS',
+                   KEY_LACEDCOL_SEC_PROFILE_OPTIONS[2]: 'CHS'}.get(self.sec_profile)
+        if trial_sections and profile is not None:
+            classification = classify_column_sections(trial_properties, trial_fy, profile)
+
+        for k, trial_section in enumerate(trial_sections):
+            self.section_property = trial_properties[k]
+            if profile is not None:
+                self.flange_class = classification['flange_class'][k]
+                self.web_class = classification['web_class'][k]
+                self.section_class = classification['section_class'][k]
                 web_ratio = (self.section_property.depth - 2 * (
                             self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
                 flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-                # print(f"self.web_class{self.web_class}")
-            
-            if self.flange_class == 'Slender' or self.web_class == 'Slender':
-                self.section_class = 'Slender'
             else:
-                if self.flange_class == 'Plastic' and self.web_class == 'Plastic':
-                    self.section_class = 'Plastic'
-                elif self.flange_class == 'Plastic' and self.web_class == 'Compact':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Plastic' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Plastic':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Compact':
-                    self.section_class = 'Compact'
-                elif self.flange_class == 'Compact' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Plastic':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Compact':
-                    self.section_class = 'Semi-Compact'
-                elif self.flange_class == 'Semi-Compact' and self.web_class == 'Semi-Compact':
-                    self.section_class = 'Semi-Compact'
+                self.flange_class = self.web_class = self.section_class = None
+                web_ratio = flange_ratio = None
 
             # 2.2 - Effective length
             self.effective_length_zz = IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(
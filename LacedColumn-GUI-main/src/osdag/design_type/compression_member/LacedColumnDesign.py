@@ -1,10 +1,19 @@
 import math
 import logging
+import sqlite3
+
+import numpy as np
+
 from ...Common import *
 from ...utils.common.component import ISection, Material
+from ...utils.common.design_cache import database_version
 
 logger = logging.getLogger("Osdag.LacedColumnDesign")
 
+# flats searched for the lacing (width, thickness in mm), IS 1730 sizes
+LACING_FLATS = [(b, t) for b in (25, 32, 40, 45, 50, 55, 60, 65, 70, 75, 80, 90, 100)
+                for t in (5, 6, 8, 10, 12, 14, 16) if t <= b / 4]
+
 class LacedColumnDesign:
     """
     A class to design laced columns according to IS 800:2007.
@@ -27,7 +36,11 @@ class LacedColumnDesign:
         result (dict): Dictionary to store design results
         Ae (float): Effective area of the section
         weld_strength (float): Design strength of weld
+        lacing_profile_table (dict): Lacing profiles searched by optimise_lacing, read once
+        lacing_profile_version: version of the database the lacing profiles were read from
     """
+    lacing_profile_table = None
+    lacing_profile_version = None
 
     def __init__(self, design_dict):
         self.design_dict = design_dict
@@ -35,6 +48,7 @@ class LacedColumnDesign:
         self.result = {}
         self.Ae = 0
         self.weld_strength = 0
+        self.E = 2e5  # Young's modulus for steel
 
     def set_logger(self):
         logger = logging.getLogger('Osdag.LacedColumnDesign')
@@ -196,73 +210,163 @@ class LacedColumnDesign:
         }
 
     def update_lacing(self):
-        pattern = self.design_dict.get(KEY_LACING_PATTERN, "single").lower()
         S = float(self.design_dict.get(KEY_CHANNEL_SPACING, 0))
         g = float(self.design_dict.get(KEY_GAP, 20))
         Dt = float(self.design_dict.get(KEY_TIE_PLATE_DEPTH, 0))
         rmin_input = self.design_dict.get(KEY_LACING_RMIN, None)
-        rmin = float(rmin_input) if rmin_input else None
+        r_component = float(rmin_input) if rmin_input else self.r
 
-        for try_lace in range(5):  # Try up to 5 lacing configurations
-            L0i = self.initial_lacing_spacing(S, g)
-            NL = self.number_of_lacings(self.L, Dt, L0i)
-            if NL < 2:
-                self.logger.warning("Invalid number of lacings")
-                continue
+        lacing = self.optimise_lacing(self.axial_load, S, g, Dt, self.L, self.lambda_e, r_component,
+                                      self.fy, self.fu, self.gamma_m0, self.gamma_m1)
+        if lacing is None:
+            return self.fail_response("No valid lacing configuration passed all checks")
+        return self.success_response(lacing)
 
-            L0 = self.actual_lacing_spacing(self.L, Dt, NL)
-            theta = math.degrees(math.atan(2 * (S + 2 * g) / L0))
+    def lacing_profiles(self):
+        """Return the lacing profiles - the flats of LACING_FLATS and the angles of the database - as a dictionary of
+        arrays sorted by mass: designation, type, width (mm, connected width), t (mm), area (mm2), r_min (mm) and mass (kg/m)
 
-            if not self.lacing_angle_check(L0, S, g):
-                self.logger.warning("Lacing angle out of range (40°–70°)")
-                continue
+        The angles are read from the database once, and the table is kept in lacing_profile_table until the database
+        changes.
+        """
+        version = database_version()
+        if LacedColumnDesign.lacing_profile_table is None or LacedColumnDesign.lacing_profile_version != version:
+            rows = [("Flat {} x {}".format(b, t), "Flat", b, t, b * t, t / math.sqrt(12), 7.85e-3 * b * t)
+                    for b, t in LACING_FLATS]
+            conn = sqlite3.connect(PATH_TO_DATABASE)
+            for designation, mass, area, a, b, t, r_v in conn.execute(
+                    "SELECT Designation, Mass, Area, a, b, t, rvmin FROM Angles"):
+                rows.append((designation, "Angle", max(a, b), t, area * 100, r_v * 10, mass))
+            conn.close()
+            rows.sort(key=lambda row: row[-1])
+            columns = list(zip(*rows))
+            LacedColumnDesign.lacing_profile_version = version
+            LacedColumnDesign.lacing_profile_table = {
+                "designation": np.array(columns[0], dtype=object),
+                "type": np.array(columns[1], dtype=object),
+                "width": np.array(columns[2], dtype=float),
+                "t": np.array(columns[3], dtype=float),
+                "area": np.array(columns[4], dtype=float),
+                "r_min": np.array(columns[5], dtype=float),
+                "mass": np.array(columns[6], dtype=float),
+            }
+        return LacedColumnDesign.lacing_profile_table
+
+    def lacing_spacings(self, L, Dt, S, g, r_component, lambda_e):
+        """Return the numbers of lacing points NL for which the lacing angle is within 40 to 70 degrees (Cl 7.6.4) and the
+        slenderness of the main components between the lacing points is within min(50, 0.7 x slenderness of the column)
+        (Cl 7.6.5.1)
+        """
+        L_clear = L - 2 * Dt - 80
+        a = S + 2 * g
+        if L_clear <= 0 or a <= 0:
+            return []
+        L0_min = 2 * a / math.tan(math.radians(70))
+        L0_max = min(2 * a / math.tan(math.radians(40)), min(50, 0.7 * lambda_e) * r_component)
+        if L0_max < L0_min:
+            return []
+        return [NL for NL in range(max(2, math.ceil(L_clear / L0_max + 1)), math.floor(L_clear / L0_min + 1) + 1)
+                if L0_min <= self.actual_lacing_spacing(L, Dt, NL) <= L0_max]
+
+    def optimise_lacing(self, axial_load, S, g, Dt, L, lambda_e, r_component, fy, fu, gamma_m0, gamma_m1,
+                        patterns=("single", "double"), profile_types=("Flat", "Angle"), connection="bolt", bolt_dia=16):
+        """Find the lightest lacing of a laced column as per IS 800:2007 Cl 7.6
+
+        The lacing pattern, the number of lacing points (which sets the lacing spacing L0 and the lacing angle) and the
+        lacing profile are searched together. The spacings are pruned on the lacing angle and the slenderness of the
+        main components (lacing_spacings), then for each pattern and spacing the profiles are pruned on the slenderness
+        of the lacing (Cl 7.6.6.3), the thickness of flats (Cl 7.6.2) and the width needed for the bolts (Cl 7.6.3),
+        and checked for the force from the transverse shear of 2.5% of the axial load (Cl 7.6.6.1), in compression and
+        in tension, all profiles at once.
 
-            if rmin is None:
-                rmin = 5.0  # Conservative fallback
+        Args:
+            axial_load: factored axial load on the column (N)
+            S: spacing between the main components (mm)
+            g: gauge from the edge of a component to the lacing line (mm)
+            Dt: depth of the tie plates (mm)
+            L: length of the column (mm)
+            lambda_e: effective slenderness ratio of the column
+            r_component: minimum radius of gyration of a main component (mm)
+            fy, fu: yield and ultimate strength of the lacing (N/mm2)
+            gamma_m0, gamma_m1: partial safety factors
+            patterns: lacing patterns to search ("single", "double")
+            profile_types: lacing profiles to search ("Flat", "Angle")
+            connection: "bolt" or "weld", connection of the lacing to the main components
+            bolt_dia: diameter of the bolts of a bolted lacing (mm)
+
+        Returns: dictionary of the lightest lacing, None if no lacing passes all the checks
+        """
+        profiles = self.lacing_profiles()
+        allowed = np.isin(profiles["type"], list(profile_types))
+        bolted = connection == "bolt"
+        if bolted:
+            # width of the lacing at least three times the bolt diameter (Cl 7.6.3), net area deducting one hole
+            allowed &= profiles["width"] >= 3 * bolt_dia
+            net_area = profiles["area"] - (bolt_dia + 2) * profiles["t"]
+        else:
+            net_area = profiles["area"]
+        flat = profiles["type"] == "Flat"
+        a = S + 2 * g
+
+        best = None
+        for pattern in patterns:
+            for NL in self.lacing_spacings(L, Dt, S, g, r_component, lambda_e):
+                L0 = self.actual_lacing_spacing(L, Dt, NL)
+                theta = math.degrees(math.atan(2 * a / L0))
+                # transverse shear shared by the lacing of the two faces, and by the two bars of a double lacing
+                Vt = self.transverse_shear_in_single_laced(axial_load)
+                if pattern == "single":
+                    Pcal = self.force_on_lacing(Vt, 2, theta)
+                    t_min = self.lacing_thickness_single_laced(self.effective_length_lacing(S, g, theta))
+                    K = 1.0 if bolted else 0.7
+                    bars = 4 * (NL - 1)
+                else:
+                    Pcal = self.force_on_lacing(Vt, 4, theta)
+                    t_min = self.lacing_thickness_double_laced(self.effective_length_lacing(S, g, theta))
+                    K = 0.7
+                    bars = 8 * (NL - 1)
+                length = self.effective_length_lacing(S, g, theta)
+                effective_len = K * length
+
+                # pruning: slenderness of the lacing, thickness of flats, yield capacity as a bound on both strengths
+                lambda_lacing = effective_len / profiles["r_min"]
+                candidates = allowed & (lambda_lacing <= 145) & (~flat | (profiles["t"] >= t_min)) & \
+                    (profiles["area"] * fy / gamma_m0 >= Pcal)
+                if not candidates.any():
+                    continue
 
-            if not self.check_lacing_slenderness(L0, rmin, self.lambda_e):
-                self.logger.warning("Lacing slenderness exceeds limits")
-                continue
+                # compression (buckling class c) and tension (yield and rupture)
+                fcc = (math.pi ** 2 * self.E) / lambda_lacing ** 2
+                lambda_nondim = np.sqrt(fy / fcc)
+                phi = 0.5 * (1 + 0.49 * (lambda_nondim - 0.2) + lambda_nondim ** 2)
+                fcd = np.minimum(fy / (gamma_m0 * (phi + np.sqrt(phi ** 2 - lambda_nondim ** 2))), fy / gamma_m0)
+                Tdn = 0.9 * net_area * fu / gamma_m1
+                candidates &= (profiles["area"] * fcd >= Pcal) & (Tdn >= Pcal)
+                if not candidates.any():
+                    continue
 
-            if pattern == "single":
-                Vt = self.transverse_shear_in_single_laced(self.axial_load)
-                Pcal = self.compressive_force_in_single_laced(Vt, theta)
-            else:
-                Vt = self.transverse_shear_in_double_laced(self.axial_load)
-                Pcal = self.compressive_force_in_double_laced(Vt, theta)
-
-            effective_len = self.effective_length_lacing(S, g, theta)
-            t = self.lacing_thickness_single_laced(effective_len) if pattern == "single" else self.lacing_thickness_double_laced(effective_len)
-
-            rmin = self.min_radius_of_gyration(t)
-            lambda_lacing = self.effective_slenderness_ratio(effective_len, rmin)
-            fcc = self.euler_buckling_stress(self.E, lambda_lacing)
-            lambda_nondim = self.nondimensional_slenderness(self.fy, fcc)
-            fcd = self.compressive_design_stress(self.fy, self.gamma_m0, self.alpha, lambda_nondim)
-
-            if not self.compressive_strength_check(self.Ae, fcd, Pcal):
-                self.logger.warning("Lacing section fails compressive strength check")
-                continue
-
-            if not self.tension_yield_check(self.Ae, self.fy, self.gamma_m0, Pcal):
-                self.logger.warning("Lacing section fails tension yield check")
-                continue
-
-            # Success
-            return self.success_response({
-                "lacing_pattern": pattern,
-                "lacing_angle": round(theta, 2),
-                "spacing_L0": round(L0, 1),
-                "compressive_force": round(Pcal, 1),
-                "effective_len": round(effective_len, 1),
-                "lacing_thickness": round(t, 2),
-                "lambda_lacing": round(lambda_lacing, 1),
-                "fcc_lacing": round(fcc, 1),
-                "NL": NL,
-                "design_safe": True
-            })
-
-        return self.fail_response("No valid lacing configuration passed all checks")
+                # the profiles are sorted by mass: the first passing profile is the lightest for this layout
+                i = int(np.argmax(candidates))
+                mass = float(bars * length * 1e-3 * profiles["mass"][i])
+                if best is None or mass < best["lacing_mass"]:
+                    best = {
+                        "lacing_pattern": pattern,
+                        "lacing_profile": profiles["type"][i],
+                        "lacing_section": profiles["designation"][i],
+                        "lacing_angle": round(theta, 2),
+                        "spacing_L0": round(L0, 1),
+                        "transverse_shear": round(Vt, 1),
+                        "compressive_force": round(Pcal, 1),
+                        "effective_len": round(effective_len, 1),
+                        "lacing_thickness": float(profiles["t"][i]),
+                        "lambda_lacing": round(float(lambda_lacing[i]), 1),
+                        "fcc_lacing": round(float(fcc[i]), 1),
+                        "lacing_capacity": round(float(profiles["area"][i] * fcd[i]), 1),
+                        "lacing_mass": round(mass, 2),
+                        "NL": NL,
+                        "design_safe": True
+                    }
+        return best
 
     def success_response(self, lacing_dict):
         """Compile all calculated values into final design result"""
@@ -11,12 +11,11 @@ Reference:
 import logging
 import math
 import numpy as np
-from PyQt5.QtWidgets import QTextEdit, QMessageBox, QLineEdit, QComboBox, QDialog, QVBoxLayout, QListWidget, QDialogButtonBox, QLabel
-from PyQt5.QtCore import QObject, pyqtSignal
 from ...Common import *
 from ..connection.moment_connection import MomentConnection
 from ...utils.common.material import *
 from ...utils.common.load import Load
+from ...utils.common.load_cases import LoadCases
 from ...utils.common.component import ISection, Material
 from ...utils.common.component import *
 from ..member import Member
@@ -24,18 +23,42 @@ from ...Report_functions import *
 from ...utils.common.common_calculation import *
 from ...utils.common import is800_2007
 from ...design_report.reportGenerator_latex import CreateLatex
+from ...utils.common.section_classification import classify_column_sections
+from ...utils.common.design_stages import DesignStage, run_stage, new_design
+from ...utils.common.section_results import SectionResults
+from ...utils.common.instrumentation import timed, timer, trace
 from ...Common import TYPE_TAB_4, TYPE_TAB_5 
-from PyQt5.QtWidgets import QLineEdit, QMainWindow, QMessageBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QValidator, QDoubleValidator
-from PyQt5.QtWidgets import QComboBox
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QFormLayout, QTableWidget, QTableWidgetItem, QListWidget, QHBoxLayout
-from PyQt5.QtWidgets import QDialogButtonBox
 import os
 import traceback
 from ...utils.common.material import Material
 from ...Common import KEY_LACING_SECTION_DIM
 
+# stages of the design, with the attributes each stage reads and sets: the classification depends only on the sections,
+# the material and the lengths/end conditions (slenderness limit), the capacity sweep also on the design preferences, and
+# the utilization ratio and ranking (design_column) on the load
+CLASSIFICATION_STAGE = DesignStage(
+    'classification',
+    inputs=['sec_profile', 'sec_list', 'material', 'allowed_sections', 'length_zz', 'length_yy', 'end_1_z', 'end_2_z',
+            'end_1_y', 'end_2_y'],
+    outputs=['input_section_list', 'input_section_classification', 'allowed_sections', 'section_property',
+             'section_class', 'flange_class', 'web_class', 'effective_length_zz', 'effective_length_yy',
+             'effective_sr_zz', 'effective_sr_yy', 'failed_reason'])
+CAPACITY_STAGE = DesignStage(
+    'capacity',
+    inputs=['sec_profile', 'material', 'input_section_list', 'input_section_classification', 'length_zz', 'length_yy',
+            'end_1_z', 'end_2_z', 'end_1_y', 'end_2_y', 'effective_area_factor', 'steel_cost_per_kg', 'gamma_m0',
+            'spacing_mode', 'bolt_diameter'],
+    outputs=[])
+# attributes set by the capacity sweep for each section
+CAPACITY_ATTRIBUTES = ['section_property', 'epsilon', 'section_class', 'effective_area', 'buckling_class_zz',
+                       'buckling_class_yy', 'imperfection_factor_zz', 'imperfection_factor_yy', 'result_IF_zz',
+                       'result_IF_yy', 'effective_length_zz', 'effective_length_yy', 'effective_sr_zz', 'effective_sr_yy',
+                       'euler_bs_zz', 'euler_bs_yy', 'result_ebs_zz', 'result_ebs_yy', 'non_dim_eff_sr_zz',
+                       'non_dim_eff_sr_yy', 'phi_zz', 'phi_yy', 'stress_reduction_factor_zz',
+                       'stress_reduction_factor_yy', 'f_cd_1_zz', 'f_cd_1_yy', 'f_cd_2', 'f_cd_zz', 'f_cd_yy', 'f_cd',
+                       'section_capacity', 'cost', 'tie_plate_d', 'tie_plate_t', 'tie_plate_l',
+                       'spacing_between_channels', 'lacing_angle']
+
 class LacedColumn(Member):
     def reset_output_state(self):
         self.effective_length_yy = None
@@ -64,7 +87,7 @@ class LacedColumn(Member):
         self.result_fcd_2 = None
         self.result_cost = None
         self.result = {}
-        self.optimum_section_ur_results = {}
+        self.section_results = SectionResults()
         # Any other custom/calculated fields should be reset here as well
     def __init__(self):
         super().__init__()
@@ -95,24 +118,18 @@ class LacedColumn(Member):
             KEY_DISP_LACEDCOL_WELD_SIZE: "5mm",
             KEY_DISP_LACEDCOL_BOLT_DIAMETER: "16mm",
             KEY_DISP_LACEDCOL_EFFECTIVE_AREA: "1.0",
-            KEY_DISP_LACEDCOL_ALLOWABLE_UR: "1.0"
+            KEY_DISP_LACEDCOL_ALLOWABLE_UR: "1.0",
+            KEY_DISP_LACEDCOL_SPACING_MODE: "Fixed"
         }
         self.design_pref = {}  # Ensure design_pref is always defined
-        # Define input line edits for unsupported lengths and axial load
-        self.unsupported_length_yy_lineedit = QLineEdit()
-        self.unsupported_length_zz_lineedit = QLineEdit()
-        self.axial_load_lineedit = QLineEdit()
-        # Define combo boxes for dropdowns
-        self.material_combo = QComboBox()
-        self.connection_combo = QComboBox()
-        self.lacing_pattern_combo = QComboBox()
-        self.section_profile_combo = QComboBox()
-        self.section_designation_combo = QComboBox()
         self.flange_class = None
         self.web_class = None
         self.gamma_m0 = 1.1  # As per IS 800:2007, Table 5 for yield stress
+        self.spacing_mode = KEY_LACEDCOL_SPACING_MODE_OPTIONS[0]  # 'Fixed': the input spacing ('Optimised' searches it)
+        self.bolt_diameter = 16.0  # bolts of the lacing (mm)
         self.optimum_section_cost_results = {}  # Initialize to avoid AttributeError
         self.optimum_section_cost = []  # For cost-based optimization, as in other modules
+        self.section_results = SectionResults()  # results of every trial section
 
 ###############################################
 # Design Preference Functions Start
@@ -137,7 +154,8 @@ class LacedColumn(Member):
             (KEY_DISP_LACEDCOL_EFFECTIVE_AREA, "Effective Area Parameter", TYPE_COMBOBOX, ["1.0", "0.9", "0.8", "0.7", "0.6", "0.5", "0.4", "0.3", "0.2", "0.1"], True, 'No Validator'),
             (KEY_DISP_LACEDCOL_ALLOWABLE_UR, "Allowable Utilization Ratio", TYPE_COMBOBOX, ["1.0", "0.95", "0.9", "0.85"], True, 'No Validator'),
             (KEY_DISP_LACEDCOL_BOLT_DIAMETER, "Bolt Diameter", TYPE_COMBOBOX, ["16mm", "20mm", "24mm", "27mm"], True, 'No Validator'),
-            (KEY_DISP_LACEDCOL_WELD_SIZE, "Weld Size", TYPE_COMBOBOX, ["4mm", "5mm", "6mm", "8mm"], True, 'No Validator')
+            (KEY_DISP_LACEDCOL_WELD_SIZE, "Weld Size", TYPE_COMBOBOX, ["4mm", "5mm", "6mm", "8mm"], True, 'No Validator'),
+            (KEY_DISP_LACEDCOL_SPACING_MODE, "Spacing of Components", TYPE_COMBOBOX, KEY_LACEDCOL_SPACING_MODE_OPTIONS, True, 'No Validator')
         ]
 
     def tab_value_changed(self):
@@ -198,7 +216,8 @@ class LacedColumn(Member):
                 KEY_DISP_LACEDCOL_EFFECTIVE_AREA,
                 KEY_DISP_LACEDCOL_ALLOWABLE_UR,
                 KEY_DISP_LACEDCOL_BOLT_DIAMETER,
-                KEY_DISP_LACEDCOL_WELD_SIZE
+                KEY_DISP_LACEDCOL_WELD_SIZE,
+                KEY_DISP_LACEDCOL_SPACING_MODE
             ], '')
         design_input.append(t2)
 
@@ -234,6 +253,7 @@ class LacedColumn(Member):
             KEY_DISP_LACEDCOL_ALLOWABLE_UR: "1.0",
             KEY_DISP_LACEDCOL_BOLT_DIAMETER: "16mm",
             KEY_DISP_LACEDCOL_WELD_SIZE: "5mm",
+            KEY_DISP_LACEDCOL_SPACING_MODE: "Fixed",
             KEY_SEC_FU: fu,
             KEY_SEC_FY: fy,
             KEY_SEC_MATERIAL: design_dictionary.get(KEY_MATERIAL, 'Select Material')
@@ -310,9 +330,9 @@ class LacedColumn(Member):
             section_list = self.fn_profile_section(profile)
             if not section_list:
                 return []
-            
-            if dialog.exec_() == QDialog.Accepted:
-                selected = dialog.get_selected()
+            current_selected = getattr(self, 'sec_list', None)
+            selected = self.open_section_designation_dialog(profile, current_selected)
+            if selected is not None:
                 if not isinstance(selected, list):
                     selected = [selected] if selected else []
                 # self.logger.info(f"Section designation (Customized) selected: {selected}")
@@ -324,6 +344,8 @@ class LacedColumn(Member):
             return []
 
     def open_section_designation_dialog(self, selected_profile, current_selected=None, disabled_values=None):
+        from PyQt5.QtWidgets import QDialog
+        from ...gui.design_dialogs import SectionDesignationDialog
         if disabled_values is None:
             disabled_values = []
         section_list = connectdb(selected_profile, call_type="popup")
@@ -460,7 +482,7 @@ class LacedColumn(Member):
             args = args[0]
         end1 = args[0] if args else None
         end2 = args[1] if len(args) > 1 else None
-        print("end 1 and end 2 are {}".format((end1, end2)))
+        trace.debug("end 1 and end 2 are %s", (end1, end2))
         if end1 == 'Fixed':
             if end2 == 'Fixed':
                 return str(files("osdag.data.ResourceFiles.images").joinpath("6.RRRR.PNG"))
@@ -507,12 +529,11 @@ class LacedColumn(Member):
         return lst
 
     def output_values(self, flag):
-        # --- DEBUG: Print effective_length_yy and key results at the start of output_values ---
-        print("[DEBUG][output_values] self.effective_length_yy:", getattr(self, 'effective_length_yy', None))
-        print("[DEBUG][output_values] self.result_IF_yy:", getattr(self, 'result_IF_yy', None))
-        print("[DEBUG][output_values] self.result_ebs_yy:", getattr(self, 'result_ebs_yy', None))
+        trace.debug("output_values: effective_length_yy %s, result_IF_yy %s, result_ebs_yy %s",
+                    getattr(self, 'effective_length_yy', None), getattr(self, 'result_IF_yy', None),
+                    getattr(self, 'result_ebs_yy', None))
         if not hasattr(self, 'effective_length_yy') or self.effective_length_yy is None:
-            print("[WARNING][output_values] self.effective_length_yy is missing or None at output dock refresh!")
+            trace.debug("output_values: effective_length_yy is missing or None at output dock refresh")
         def get_numeric(val):
             try:
                 if val is None or val == '' or val in ['a', 'A']:
@@ -586,10 +607,9 @@ class LacedColumn(Member):
                 eff_len_zz = safe_display(vnum)
             except (TypeError, ValueError):
                 pass
-        # Fallback to optimum_section_ur_results if still not found, only if numeric
-        if (not eff_len_yy or not eff_len_zz) and hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-            best_ur = min(self.optimum_section_ur_results.keys())
-            best_result = self.optimum_section_ur_results[best_ur]
+        # Fallback to the results of the selected section if still not found, only if numeric
+        if (not eff_len_yy or not eff_len_zz) and self.section_results:
+            best_result = self.selected_result()
             if not eff_len_yy:
                 for k in ['Effective_length_yy', 'Effective Length YY', 'effective_length_yy']:
                     v = best_result.get(k, None)
@@ -638,10 +658,9 @@ class LacedColumn(Member):
         if flag:
             slender_yy_val = None
             slender_zz_val = None
-            # 1. Try optimum_section_ur_results best result FIRST (most reliable)
-            if hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            # 1. Try the results of the selected section FIRST (most reliable)
+            if self.section_results:
+                best_result = self.selected_result()
                 for k in ['Effective_sr_yy', 'Slenderness YY', 'effective_sr_yy', 'Slenderness_yy']:
                     if k in best_result:
                         try:
@@ -683,16 +702,12 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_fcd') and self.result_fcd is not None:
                 fcd = safe_display(self.result_fcd)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    fcd = safe_display(self.optimum_section_ur_results[best_ur].get('FCD', ''))
+            elif self.section_results:
+                fcd = safe_display(self.selected_result().get('FCD', ''))
             if hasattr(self, 'result_capacity') and self.result_capacity is not None:
                 design_compressive = safe_display(self.result_capacity)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    design_compressive = safe_display(self.optimum_section_ur_results[best_ur].get('Capacity', ''))
+            elif self.section_results:
+                design_compressive = safe_display(self.selected_result().get('Capacity', ''))
         out_list.append((KEY_FCD, "Design Compressive Stress (fcd)", TYPE_TEXTBOX, fcd, True))
         out_list.append((KEY_DESIGN_COMPRESSIVE, "Design Compressive Strength", TYPE_TEXTBOX, design_compressive, True))
         
@@ -702,10 +717,8 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_UR') and self.result_UR is not None:
                 ur_value = safe_display(self.result_UR)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    ur_value = safe_display(best_ur)
+            elif self.section_results:
+                ur_value = safe_display(self.selected_result().get('UR', ''))
         out_list.append(("utilization_ratio", "Utilization Ratio", TYPE_TEXTBOX, ur_value, True))
         
         # Section Classification (show as Plastic, Semi-Compact, etc.)
@@ -721,10 +734,9 @@ class LacedColumn(Member):
             # Fallback to attribute
             if not section_class and hasattr(self, 'result_section_class') and self.result_section_class not in [None, '', 'a', 'A']:
                 section_class = str(self.result_section_class)
-            # Fallback to optimum_section_ur_results if still not found
-            if not section_class and hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            # Fallback to the results of the selected section if still not found
+            if not section_class and self.section_results:
+                best_result = self.selected_result()
                 for k in ['Section class', 'section_class', 'Section_class', 'sectionClass']:
                     if k in best_result and best_result[k] not in [None, '', 'a', 'A']:
                         section_class = str(best_result[k])
@@ -737,10 +749,8 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_effective_area') and self.result_effective_area is not None:
                 effective_area = safe_display(self.result_effective_area)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    effective_area = safe_display(self.optimum_section_ur_results[best_ur].get('Effective area', ''))
+            elif self.section_results:
+                effective_area = safe_display(self.selected_result().get('Effective area', ''))
         out_list.append(("effective_area", "Effective Area (mm²)", TYPE_TEXTBOX, effective_area, True))
         
         # Buckling Curve Classification
@@ -763,10 +773,9 @@ class LacedColumn(Member):
                 bc_yy = str(self.result_bc_yy)
             if not bc_zz and hasattr(self, 'result_bc_zz') and self.result_bc_zz not in [None, '', 'a', 'A']:
                 bc_zz = str(self.result_bc_zz)
-            # Fallback to optimum_section_ur_results if still not found
-            if (not bc_yy or not bc_zz) and hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            # Fallback to the results of the selected section if still not found
+            if (not bc_yy or not bc_zz) and self.section_results:
+                best_result = self.selected_result()
                 if not bc_yy:
                     for k in ['Buckling_curve_yy', 'Buckling Curve YY', 'buckling_curve_yy']:
                         if k in best_result and best_result[k] not in [None, '', 'a', 'A']:
@@ -796,12 +805,10 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_IF_yy') and self.result_IF_yy is not None and is_numeric(self.result_IF_yy):
                 if_yy = safe_display(self.result_IF_yy)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    val = self.optimum_section_ur_results[best_ur].get('IF_yy', '')
-                    if is_numeric(val):
-                        if_yy = safe_display(val)
+            elif self.section_results:
+                val = self.selected_result().get('IF_yy', '')
+                if is_numeric(val):
+                    if_yy = safe_display(val)
             # FINAL FALLBACK: use self.result dict if still blank
             if (not if_yy or if_yy == '') and hasattr(self, 'result') and isinstance(self.result, dict):
                 val = self.result.get('imperfection_factor_yy', '')
@@ -809,12 +816,10 @@ class LacedColumn(Member):
                     if_yy = safe_display(val)
             if hasattr(self, 'result_IF_zz') and self.result_IF_zz is not None and is_numeric(self.result_IF_zz):
                 if_zz = safe_display(self.result_IF_zz)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    val = self.optimum_section_ur_results[best_ur].get('IF_zz', '')
-                    if is_numeric(val):
-                        if_zz = safe_display(val)
+            elif self.section_results:
+                val = self.selected_result().get('IF_zz', '')
+                if is_numeric(val):
+                    if_zz = safe_display(val)
             if (not if_zz or if_zz == '') and hasattr(self, 'result') and isinstance(self.result, dict):
                 val = self.result.get('imperfection_factor_zz', '')
                 if is_numeric(val):
@@ -829,24 +834,20 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_ebs_yy') and self.result_ebs_yy is not None and is_numeric(self.result_ebs_yy):
                 ebs_yy = safe_display(self.result_ebs_yy)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    val = self.optimum_section_ur_results[best_ur].get('EBS_yy', '')
-                    if is_numeric(val):
-                        ebs_yy = safe_display(val)
+            elif self.section_results:
+                val = self.selected_result().get('EBS_yy', '')
+                if is_numeric(val):
+                    ebs_yy = safe_display(val)
             if (not ebs_yy or ebs_yy == '') and hasattr(self, 'result') and isinstance(self.result, dict):
                 val = self.result.get('euler_buckling_stress_yy', '')
                 if is_numeric(val):
                     ebs_yy = safe_display(val)
             if hasattr(self, 'result_ebs_zz') and self.result_ebs_zz is not None and is_numeric(self.result_ebs_zz):
                 ebs_zz = safe_display(self.result_ebs_zz)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    val = self.optimum_section_ur_results[best_ur].get('EBS_zz', '')
-                    if is_numeric(val):
-                        ebs_zz = safe_display(val)
+            elif self.section_results:
+                val = self.selected_result().get('EBS_zz', '')
+                if is_numeric(val):
+                    ebs_zz = safe_display(val)
             if (not ebs_zz or ebs_zz == '') and hasattr(self, 'result') and isinstance(self.result, dict):
                 val = self.result.get('euler_buckling_stress_zz', '')
                 if is_numeric(val):
@@ -874,10 +875,9 @@ class LacedColumn(Member):
                 nd_esr_yy = safe_display(self.result_nd_esr_yy)
             if not nd_esr_zz and hasattr(self, 'result_nd_esr_zz') and self.result_nd_esr_zz not in [None, '', 'a', 'A']:
                 nd_esr_zz = safe_display(self.result_nd_esr_zz)
-            # Fallback to optimum_section_ur_results if still not found
-            if (not nd_esr_yy or not nd_esr_zz) and hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            # Fallback to the results of the selected section if still not found
+            if (not nd_esr_yy or not nd_esr_zz) and self.section_results:
+                best_result = self.selected_result()
                 if not nd_esr_yy:
                     for k in ['ND_ESR_yy', 'nd_esr_yy', 'ND ESR YY']:
                         if k in best_result and best_result[k] not in [None, '', 'a', 'A']:
@@ -898,16 +898,12 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_phi_yy') and self.result_phi_yy is not None:
                 phi_yy = safe_display(self.result_phi_yy)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    phi_yy = safe_display(self.optimum_section_ur_results[best_ur].get('phi_yy', ''))
+            elif self.section_results:
+                phi_yy = safe_display(self.selected_result().get('phi_yy', ''))
             if hasattr(self, 'result_phi_zz') and self.result_phi_zz is not None:
                 phi_zz = safe_display(self.result_phi_zz)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    phi_zz = safe_display(self.optimum_section_ur_results[best_ur].get('phi_zz', ''))
+            elif self.section_results:
+                phi_zz = safe_display(self.selected_result().get('phi_zz', ''))
         out_list.append(("phi_yy", "Phi (YY)", TYPE_TEXTBOX, phi_yy, True))
         out_list.append(("phi_zz", "Phi (ZZ)", TYPE_TEXTBOX, phi_zz, True))
         
@@ -918,16 +914,12 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_srf_yy') and self.result_srf_yy is not None:
                 srf_yy = safe_display(self.result_srf_yy)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    srf_yy = safe_display(self.optimum_section_ur_results[best_ur].get('SRF_yy', ''))
+            elif self.section_results:
+                srf_yy = safe_display(self.selected_result().get('SRF_yy', ''))
             if hasattr(self, 'result_srf_zz') and self.result_srf_zz is not None:
                 srf_zz = safe_display(self.result_srf_zz)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    srf_zz = safe_display(self.optimum_section_ur_results[best_ur].get('SRF_zz', ''))
+            elif self.section_results:
+                srf_zz = safe_display(self.selected_result().get('SRF_zz', ''))
         out_list.append(("stress_reduction_factor_yy", "SRF (YY)", TYPE_TEXTBOX, srf_yy, True))
         out_list.append(("stress_reduction_factor_zz", "SRF (ZZ)", TYPE_TEXTBOX, srf_zz, True))
         
@@ -939,22 +931,16 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result_fcd_1_yy') and self.result_fcd_1_yy is not None:
                 fcd_1_yy = safe_display(self.result_fcd_1_yy)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    fcd_1_yy = safe_display(self.optimum_section_ur_results[best_ur].get('FCD_1_yy', ''))
+            elif self.section_results:
+                fcd_1_yy = safe_display(self.selected_result().get('FCD_1_yy', ''))
             if hasattr(self, 'result_fcd_1_zz') and self.result_fcd_1_zz is not None:
                 fcd_1_zz = safe_display(self.result_fcd_1_zz)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    fcd_1_zz = safe_display(self.optimum_section_ur_results[best_ur].get('FCD_1_zz', ''))
+            elif self.section_results:
+                fcd_1_zz = safe_display(self.selected_result().get('FCD_1_zz', ''))
             if hasattr(self, 'result_fcd_2') and self.result_fcd_2 is not None:
                 fcd_2 = safe_display(self.result_fcd_2)
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    fcd_2 = safe_display(self.optimum_section_ur_results[best_ur].get('FCD_2', ''))
+            elif self.section_results:
+                fcd_2 = safe_display(self.selected_result().get('FCD_2', ''))
         out_list.append(("fcd_1_yy", "FCD_1 (YY)", TYPE_TEXTBOX, fcd_1_yy, True))
         out_list.append(("fcd_1_zz", "FCD_1 (ZZ)", TYPE_TEXTBOX, fcd_1_zz, True))
         out_list.append(("fcd_2", "FCD_2", TYPE_TEXTBOX, fcd_2, True))
@@ -965,10 +951,8 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result') and self.result.get('channel_spacing') is not None:
                 spacing_channels = safe_display(self.result.get('channel_spacing'))
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    spacing_channels = safe_display(self.optimum_section_ur_results[best_ur].get('channel_spacing', ''))
+            elif self.section_results:
+                spacing_channels = safe_display(self.selected_result().get('channel_spacing', ''))
         out_list.append(("channel_spacing", "Spacing Between Channels (mm)", TYPE_TEXTBOX, spacing_channels, True))
 
         # --- Tie Plate Section ---
@@ -979,22 +963,16 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result') and self.result.get('tie_plate_d') is not None:
                 tie_plate_d = safe_display(self.result.get('tie_plate_d'))
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    tie_plate_d = safe_display(self.optimum_section_ur_results[best_ur].get('tie_plate_d', ''))
+            elif self.section_results:
+                tie_plate_d = safe_display(self.selected_result().get('tie_plate_d', ''))
             if hasattr(self, 'result') and self.result.get('tie_plate_t') is not None:
                 tie_plate_t = safe_display(self.result.get('tie_plate_t'))
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    tie_plate_t = safe_display(self.optimum_section_ur_results[best_ur].get('tie_plate_t', ''))
+            elif self.section_results:
+                tie_plate_t = safe_display(self.selected_result().get('tie_plate_t', ''))
             if hasattr(self, 'result') and self.result.get('tie_plate_l') is not None:
                 tie_plate_l = safe_display(self.result.get('tie_plate_l'))
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    tie_plate_l = safe_display(self.optimum_section_ur_results[best_ur].get('tie_plate_l', ''))
+            elif self.section_results:
+                tie_plate_l = safe_display(self.selected_result().get('tie_plate_l', ''))
         out_list.append(("tie_plate_d", "Tie Plate Depth D (mm)", TYPE_TEXTBOX, tie_plate_d, True))
         out_list.append(("tie_plate_t", "Tie Plate Thickness t (mm)", TYPE_TEXTBOX, tie_plate_t, True))
         out_list.append(("tie_plate_l", "Tie Plate Length L (mm)", TYPE_TEXTBOX, tie_plate_l, True))
@@ -1005,20 +983,20 @@ class LacedColumn(Member):
         if flag:
             if hasattr(self, 'result') and self.result.get('lacing_spacing') is not None:
                 lacing_spacing = safe_display(self.result.get('lacing_spacing'))
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys()) if self.optimum_section_ur_results else None
-                if best_ur:
-                    lacing_spacing = safe_display(self.optimum_section_ur_results[best_ur].get('lacing_spacing', ''))
+            elif self.section_results:
+                lacing_spacing = safe_display(self.selected_result().get('lacing_spacing', ''))
         out_list.append(("lacing_spacing", "Lacing Spacing (L0) (mm)", TYPE_TEXTBOX, lacing_spacing, True))
 
         return out_list
     def set_input_values(self, design_dictionary):
         # self.logger.info(f"set_input_values called with: {design_dictionary}")
         super(Member, self).set_input_values(design_dictionary)
+        new_design(self)
         # section properties
         self.module = design_dictionary.get(KEY_DISP_LACEDCOL, "")
         self.mainmodule = 'Columns with known support conditions'
         self.sec_profile = design_dictionary.get(KEY_LACEDCOL_SEC_PROFILE, "")
+        self.beam_designations = None  # designations of the beams table, read with the first girder
         self.sec_list = design_dictionary.get(KEY_SECSIZE, [])
         # Coerce sec_list to a list if it's a string
         if isinstance(self.sec_list, str):
@@ -1078,6 +1056,13 @@ class LacedColumn(Member):
             self.design_status = False
             return
         self.load = Load(axial_force=axial_force, shear_force=0.0, moment=0.0, moment_minor=0.0, unit_kNm=True)
+        # load cases: every check of the column increases with the axial force, so the case of the largest axial force
+        # governs the design of every section
+        self.load_cases = LoadCases.from_design_dictionary(design_dictionary, shear_key=None, moment_key=None)
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.envelope_load()
+            self.logger.info(f"The governing load case is {self.load_cases.governing_cases()['axial']} "
+                             f"(axial force: {round(self.load.axial_force / 1000, 2)} kN).")
         # design preferences
         try:
             self.allowable_utilization_ratio = float(design_dictionary.get(KEY_ALLOW_UR, 1.0))
@@ -1095,6 +1080,11 @@ class LacedColumn(Member):
             self.steel_cost_per_kg = float(design_dictionary[KEY_STEEL_COST])
         except:
             self.steel_cost_per_kg = 50
+        self.spacing_mode = design_dictionary.get(KEY_DISP_LACEDCOL_SPACING_MODE, KEY_LACEDCOL_SPACING_MODE_OPTIONS[0])
+        try:
+            self.bolt_diameter = float(str(design_dictionary.get(KEY_DISP_LACEDCOL_BOLT_DIAMETER, "16mm")).replace('mm', ''))
+        except:
+            self.bolt_diameter = 16.0
         self.allowed_sections = ['Plastic', 'Compact', 'Semi-Compact', 'Slender']
 
         # Defensive: Only run if section list and material are valid
@@ -1120,6 +1110,27 @@ class LacedColumn(Member):
 
     # Simulation starts here
     def section_classification(self):
+        """Classify the sections, reusing the last classification when the sections, material and lengths are unchanged"""
+        # Deduplicate section list to avoid repeated processing
+        self.sec_list = list(dict.fromkeys(self.sec_list))
+        with timer('laced_column.classification', sections=len(self.sec_list)):
+            flag = run_stage(self, CLASSIFICATION_STAGE, self.classify_section_list)
+        if not flag:
+            self.design_status = False
+        return flag
+
+    def component_section(self, designation):
+        """Return the section properties of one component of the column: a Channel for the two channel profiles, else an
+        ISection read from the table of beams or of columns that has the designation
+        """
+        if self.sec_profile in KEY_LACEDCOL_SEC_PROFILE_OPTIONS[:2]:  # channels
+            return Channel(designation=designation, material_grade=self.material)
+        if getattr(self, "beam_designations", None) is None:
+            self.beam_designations = set(connectdb("Beams", call_type="popup"))
+        table = "Beams" if designation in self.beam_designations else "Columns"
+        return ISection(designation=designation, material_grade=self.material, table=table)
+
+    def classify_section_list(self):
         # Defensive: ensure material_property is set
         if not hasattr(self, 'material_property') or self.material_property is None:
             if hasattr(self, 'material') and self.material:
@@ -1142,6 +1153,9 @@ class LacedColumn(Member):
         slender_sections = []
         accepted_sections = []
         rejected_sections = []  # Track all rejected sections with reasons
+        trial_sections = []
+        trial_properties = []
+        trial_fy = []
         for section in self.sec_list:
             trial_section = section.strip("'")
 
@@ -1150,22 +1164,13 @@ class LacedColumn(Member):
             web_ratio = None
             
             # fetching the section properties
-            if self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]:  # Beams and columns
-                try:
-                    result = Beam(designation=trial_section, material_grade=self.material)
-                except:
-                    result = Column(designation=trial_section, material_grade=self.material)
-                self.section_property = result
-            elif self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]:  # RHS and SHS
-                try:
-                    result = RHS(designation=trial_section, material_grade=self.material)
-                except:
-                    result = SHS(designation=trial_section, material_grade=self.material)
-                self.section_property = result
-            elif self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[2] and isinstance(self.section_property, CHS):  # CHS
-                self.section_property = CHS(designation=trial_section, material_grade=self.material)
-            else:
-                self.section_property = Column(designation=trial_section, material_grade=self.material)
+            try:
+                with timer('laced_column.section_load', section=trial_section):
+                    self.section_property = self.component_section(trial_section)
+            except (TypeError, ValueError):
+                self.logger.warning(f"Section {trial_section} is not found in the database.")
+                rejected_sections.append((trial_section, 'Section not found in the database'))
+                continue
 
             # updating the material property based on thickness of the thickest element
             # Defensive checks and logging
@@ -1217,47 +1222,33 @@ class LacedColumn(Member):
                 rejected_sections.append((trial_section, 'Material properties not found'))
                 continue
 
-            # section classification
-            if self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]:  # Beams and Columns
-                if self.section_property.type == 'Rolled':
-                    self.flange_class = IS800_2007.Table2_i((self.section_property.flange_width / 2), self.section_property.flange_thickness,
-                                                            self.material_property.fy, self.section_property.type)[0]
-                else:
-                    self.flange_class = IS800_2007.Table2_i(((self.section_property.flange_width / 2) - (self.section_property.web_thickness / 2)),
-                                                            self.section_property.flange_thickness, self.section_property.fy,
-                                                            self.section_property.type)[0]
-                # FIX: Use 'Neutral axis at mid-depth' for web_class
-                self.web_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                       self.section_property.web_thickness, self.material_property.fy,
-                                                       classification_type='Axial compression')
-                
-                # Calculate ratios for I-sections
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-
-            elif self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]:  # RHS and SHS
-                self.flange_class = IS800_2007.Table2_iii((self.section_property.depth - (2 * self.section_property.flange_thickness)),
-                                                          self.section_property.flange_thickness, self.material_property.fy,
-                                                          classification_type='Axial compression')
-                self.web_class = self.flange_class
-                
-                # Calculate ratios for RHS/SHS
+            trial_sections.append(trial_section)
+            trial_properties.append(self.section_property)
+            trial_fy.append(self.material_property.fy)
+
+        # section classification of all the sections at once
+        profile = {KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]: 'Channel', KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]: 'Channel',
+                   KEY_LACEDCOL_SEC_PROFILE_OPTIONS[2]: 'I'}.get(self.sec_profile)
+        classified = list(range(len(trial_properties))) if profile is not None else []
+        if classified:
+            classification = classify_column_sections([trial_properties[k] for k in classified],
+                                                      [trial_fy[k] for k in classified], profile)
+        classified_row = {k: row for row, k in enumerate(classified)}
+
+        for k, trial_section in enumerate(trial_sections):
+            self.section_property = trial_properties[k]
+            if k in classified_row:
+                self.flange_class = classification['flange_class'][classified_row[k]]
+                self.web_class = classification['web_class'][classified_row[k]]
                 web_ratio = (self.section_property.depth - 2 * (
                             self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-
-            elif self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[2] and isinstance(self.section_property, CHS):  # CHS
-                self.flange_class = IS800_2007.Table2_x(self.section_property.out_diameter, self.section_property.flange_thickness,
-                                                        self.material_property.fy, load_type='axial compression')
-                self.web_class = self.flange_class
-                # For CHS, use diameter to thickness ratio
-                web_ratio = self.section_property.out_diameter / self.section_property.flange_thickness
-                flange_ratio = web_ratio  # Same ratio for circular sections
+                # the outstand of a channel flange is its full width
+                outstand = self.section_property.flange_width if profile == 'Channel' else self.section_property.flange_width / 2
+                flange_ratio = outstand / self.section_property.flange_thickness
             else:
                 self.flange_class = self.web_class = None
                 web_ratio = flange_ratio = None
-            
+
             # Smart classification logic
             if self.flange_class == 'Slender' and self.web_class == 'Slender':
                 self.section_class = 'Slender'
@@ -1286,7 +1277,7 @@ class LacedColumn(Member):
                 self.length_yy,
                 end_1=self.end_1_y,
                 end_2=self.end_2_y)
-            print(f"[DEBUG] Calculated effective_length_yy: {self.effective_length_yy}")
+            trace.debug("Calculated effective_length_yy of %s: %s", trial_section, self.effective_length_yy)
 
             # 2.3 - Effective slenderness ratio
             self.effective_sr_zz = self.effective_length_zz / self.section_property.rad_of_gy_z
@@ -1332,6 +1323,7 @@ class LacedColumn(Member):
         return local_flag
 
 
+    @timed('laced_column.design')
     def design_column(self):
         try:
             summary_lines = []
@@ -1353,281 +1345,58 @@ class LacedColumn(Member):
                 self.design_status_list.append(self.design_status)
 
             self.epsilon = math.sqrt(250 / self.material_property.fy)
-            self.optimum_section_ur_results = {}
+            self.section_results = SectionResults()
             self.optimum_section_ur = []
             self.flag = self.section_classification()
             # Remove duplicate sections to avoid repeated calculations
             self.input_section_list = list(dict.fromkeys(self.input_section_list))
             if self.flag:
-                for section in self.input_section_list:
-                    ur_class = None
-                    if section in self.input_section_classification:
-                        ur_class = self.input_section_classification[section]
-                    ur_value = None
-                    for ur in self.optimum_section_ur_results:
-                        if self.optimum_section_ur_results[ur].get('Designation') == section:
-                            ur_value = ur
-                            break
-                for section in self.input_section_list:  # iterating the design over each section to find the most optimum section
-
-                    # fetching the section properties of the selected section
-                    if self.sec_profile == VALUES_SEC_PROFILE[0]:  # Beams and columns
-                        try:
-                            result = Beam(designation=section, material_grade=self.material)
-                        except:
-                            result = Column(designation=section, material_grade=self.material)
-                        self.section_property = result
-                    elif self.sec_profile == VALUES_SEC_PROFILE[1]:  # RHS and SHS
-                        try:
-                            result = RHS(designation=section, material_grade=self.material)
-                        except:
-                            result = SHS(designation=section, material_grade=self.material)
-                        self.section_property = result
-
-                    elif self.sec_profile == VALUES_SEC_PROFILE[2]:  # CHS
-                        self.section_property = CHS(designation=section, material_grade=self.material)
-                        self.section_property.designation = section
-                    else:   #Why?
-                        self.section_property = Column(designation=section, material_grade=self.material)
-
-                    self.material_property.connect_to_database_to_get_fy_fu(self.material, max(self.section_property.flange_thickness,
-                                                                                            self.section_property.web_thickness))
-                    self.epsilon = math.sqrt(250 / self.material_property.fy)
-                    
-
-                    # initialize lists for updating the results dictionary
-                    self.list_zz = []
-                    self.list_yy = []
-
-                    self.list_zz.append(section)
-                    self.list_yy.append(section)
-
-                    # Step 1 - computing the effective sectional area
-                    self.section_class = self.input_section_classification[section][0]
-
-                    if self.section_class == 'Slender':
-                        if (self.sec_profile == VALUES_SEC_PROFILE[0]):  # Beams and Columns
-                            self.effective_area = (2 * ((31.4 * self.epsilon * self.section_property.flange_thickness) *
-                                                        self.section_property.flange_thickness)) + \
-                                                (2 * ((21 * self.epsilon * self.section_property.web_thickness) * self.section_property.web_thickness))
-                        elif (self.sec_profile == VALUES_SEC_PROFILE[1]):
-                            self.effective_area = (2 * 21 * self.epsilon * self.section_property.flange_thickness) * 2
-                    else:
-                        self.effective_area = self.section_property.area  # mm2
-
-
-                    if self.effective_area_factor < 1.0:
-                        self.effective_area = round(self.effective_area * self.effective_area_factor, 2)
-
-                    self.list_zz.append(self.section_class)
-                    self.list_yy.append(self.section_class)
-
-                    self.list_zz.append(self.effective_area)
-                    self.list_yy.append(self.effective_area)
-
-                    # Step 2 - computing the design compressive stress
-
-                    # 2.1 - Buckling curve classification and Imperfection factor
-                    if (self.sec_profile == VALUES_SEC_PROFILE[0]):  # Beams and Columns
-
-                        if self.section_property.type == 'Rolled':
-                            self.buckling_class_zz = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
-                                                                                                        self.section_property.depth,
-                                                                                                        self.section_property.flange_thickness,
-                                                                                                        cross_section='Rolled I-sections',
-                                                                                                        section_type='Hot rolled')['z-z']
-                            self.buckling_class_yy = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
-                                                                                                        self.section_property.depth,
-                                                                                                        self.section_property.flange_thickness,
-                                                                                                        cross_section='Rolled I-sections',
-                                                                                                        section_type='Hot rolled')['y-y']
-                        else:
-                            self.buckling_class_zz = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
-                                                                                                        self.section_property.depth,
-                                                                                                        self.section_property.flange_thickness,
-                                                                                                        cross_section='Welded I-section',
-                                                                                                        section_type='Hot rolled')['z-z']
-                            self.buckling_class_yy = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
-                                                                                                        self.section_property.depth,
-                                                                                                        self.section_property.flange_thickness,
-                                                                                                        cross_section='Welded I-section',
-                                                                                                        section_type='Hot rolled')['y-y']
-                    else:
-                        self.buckling_class_zz = 'a'
-                        self.buckling_class_yy = 'a'
-
-                    self.imperfection_factor_zz = IS800_2007.cl_7_1_2_1_imperfection_factor(buckling_class=self.buckling_class_zz)
-                    self.imperfection_factor_yy = IS800_2007.cl_7_1_2_1_imperfection_factor(buckling_class=self.buckling_class_yy)
-
-                    self.list_zz.append(self.buckling_class_zz)
-                    self.list_yy.append(self.buckling_class_yy)
-
-                    self.list_zz.append(self.imperfection_factor_zz)
-                    self.list_yy.append(self.imperfection_factor_yy)
-
-                    # Store imperfection factors for output
-                    self.result_IF_zz = float(self.imperfection_factor_zz) if self.imperfection_factor_zz is not None else None
-                    self.result_IF_yy = float(self.imperfection_factor_yy) if self.imperfection_factor_yy is not None else None
+                with timer('laced_column.capacity', sections=len(self.input_section_list)):
+                    self.section_capacities = run_stage(self, CAPACITY_STAGE, self.section_capacity_sweep)
+                for section, capacity in zip(self.input_section_list, self.section_capacities):
+                    for name in CAPACITY_ATTRIBUTES:
+                        setattr(self, name, capacity[name])
+                    self.material_property.fy, self.material_property.fu = capacity['fy'], capacity['fu']
+
+                    # Store imperfection factors and euler buckling stress for output
                     self.result['imperfection_factor_yy'] = self.result_IF_yy
                     self.result['imperfection_factor_zz'] = self.result_IF_zz
-
-                    # 2.2 - Effective length
-                    self.effective_length_zz = IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(self.length_zz ,
-                                                                                                                    end_1=self.end_1_z,
-                                                                                                                    end_2=self.end_2_z)  # mm
-                    self.effective_length_yy = IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(self.length_yy ,
-                                                                                                                    end_1=self.end_1_y,
-                                                                                                                    end_2=self.end_2_y)  # mm
-
-                    self.list_zz.append(self.effective_length_zz)
-                    self.list_yy.append(self.effective_length_yy)
-
-                    # 2.3 - Effective slenderness ratio
-                    self.effective_sr_zz = self.effective_length_zz / self.section_property.rad_of_gy_z
-                    self.effective_sr_yy = self.effective_length_yy / self.section_property.rad_of_gy_y
-
-                    self.list_zz.append(self.effective_sr_zz)
-                    self.list_yy.append(self.effective_sr_yy)
-
-                    # 2.4 - Euler buckling stress
-                    self.euler_bs_zz = (math.pi ** 2 * self.section_property.modulus_of_elasticity) / self.effective_sr_zz ** 2
-                    self.euler_bs_yy = (math.pi ** 2 * self.section_property.modulus_of_elasticity) / self.effective_sr_yy ** 2
-
-                    self.list_zz.append(self.euler_bs_zz)
-                    self.list_yy.append(self.euler_bs_yy)
-
-                    # Store euler buckling stress for output
-                    self.result_ebs_zz = float(self.euler_bs_zz) if self.euler_bs_zz is not None else None
-                    self.result_ebs_yy = float(self.euler_bs_yy) if self.euler_bs_yy is not None else None
                     self.result['euler_buckling_stress_yy'] = self.result_ebs_yy
                     self.result['euler_buckling_stress_zz'] = self.result_ebs_zz
 
-                    # 2.5 - Non-dimensional effective slenderness ratio
-                    self.non_dim_eff_sr_zz = math.sqrt(self.material_property.fy / self.euler_bs_zz)
-                    self.non_dim_eff_sr_yy = math.sqrt(self.material_property.fy / self.euler_bs_yy)
-
-
-                    self.list_zz.append(self.non_dim_eff_sr_zz)
-                    self.list_yy.append(self.non_dim_eff_sr_yy)
-
-                    # 2.5 - phi
-                    self.phi_zz = 0.5 * (1 + (self.imperfection_factor_zz * (self.non_dim_eff_sr_zz - 0.2)) + self.non_dim_eff_sr_zz ** 2)
-                    self.phi_yy = 0.5 * (1 + (self.imperfection_factor_yy * (self.non_dim_eff_sr_yy - 0.2)) + self.non_dim_eff_sr_yy ** 2)
-
-
-                    self.list_zz.append(self.phi_zz)
-                    self.list_yy.append(self.phi_yy)
-
-                    # 2.6 - Design compressive stress
-                    self.stress_reduction_factor_zz = 1 / (self.phi_zz + (self.phi_zz ** 2 - self.non_dim_eff_sr_zz ** 2) ** 0.5)
-                    self.stress_reduction_factor_yy = 1 / (self.phi_yy + (self.phi_yy ** 2 - self.non_dim_eff_sr_yy ** 2) ** 0.5)
-
-                    self.list_zz.append(self.stress_reduction_factor_zz)
-                    self.list_yy.append(self.stress_reduction_factor_yy)
-
-                    self.f_cd_1_zz = (self.stress_reduction_factor_zz * self.material_property.fy) / self.gamma_m0
-                    self.f_cd_1_yy = (self.stress_reduction_factor_yy * self.material_property.fy) / self.gamma_m0
-                    self.f_cd_2 = self.material_property.fy / self.gamma_m0
-
-                    self.f_cd_zz = min(self.f_cd_1_zz, self.f_cd_2)
-                    self.f_cd_yy = min(self.f_cd_1_yy, self.f_cd_2)
-
-                    self.f_cd = min(self.f_cd_zz, self.f_cd_yy)
-
-                    self.list_zz.append(self.f_cd_1_zz)
-                    self.list_yy.append(self.f_cd_1_yy)
-
-                    self.list_zz.append(self.f_cd_2)
-                    self.list_yy.append(self.f_cd_2)
-
-                    self.list_zz.append(self.f_cd_zz)
-                    self.list_yy.append(self.f_cd_yy)
-
-                    self.list_zz.append(self.f_cd)
-                    self.list_yy.append(self.f_cd)
-
-                    # 2.7 - Capacity of the section
-
-                    self.section_capacity = self.f_cd * self.effective_area  # N
-
-                    self.list_zz.append(self.section_capacity)
-                    self.list_yy.append(self.section_capacity)
-
                     # 2.8 - UR
                     self.ur = round(self.load.axial_force / self.section_capacity, 3)
-
-                    self.list_zz.append(self.ur)
-                    self.list_yy.append(self.ur)
                     self.optimum_section_ur.append(self.ur)
-                    
-                    # --- Tie Plate, Spacing, and Lacing Angle Calculations ---
-                    tie_plate_d = round(2 * self.section_property.depth / 3, 2)         # mm
-                    tie_plate_t = round(self.section_property.web_thickness, 2)          # mm
-                    tie_plate_l = round(self.section_property.depth / 2, 2)              # mm
-                    spacing_between_channels = round(self.section_property.depth + 2 * tie_plate_t, 2)  # mm
-                    lacing_angle = round(math.degrees(math.atan(spacing_between_channels / (2 * tie_plate_l))), 2)  # degrees
+
+                    self.list_zz = [section, self.section_class, self.effective_area, self.buckling_class_zz,
+                                    self.imperfection_factor_zz, self.effective_length_zz, self.effective_sr_zz,
+                                    self.euler_bs_zz, self.non_dim_eff_sr_zz, self.phi_zz,
+                                    self.stress_reduction_factor_zz, self.f_cd_1_zz, self.f_cd_2, self.f_cd_zz, self.f_cd,
+                                    self.section_capacity, self.ur, self.tie_plate_d, self.tie_plate_t, self.tie_plate_l,
+                                    self.spacing_between_channels, self.lacing_angle]
+                    self.list_yy = [section, self.section_class, self.effective_area, self.buckling_class_yy,
+                                    self.imperfection_factor_yy, self.effective_length_yy, self.effective_sr_yy,
+                                    self.euler_bs_yy, self.non_dim_eff_sr_yy, self.phi_yy,
+                                    self.stress_reduction_factor_yy, self.f_cd_1_yy, self.f_cd_2, self.f_cd_yy, self.f_cd,
+                                    self.section_capacity, self.ur, self.tie_plate_d, self.tie_plate_t, self.tie_plate_l,
+                                    self.spacing_between_channels, self.lacing_angle]
 
                     # Store in self.result for output dock (for the last/selected section)
-                    self.result['tie_plate_d'] = tie_plate_d
-                    self.result['tie_plate_t'] = tie_plate_t
-                    self.result['tie_plate_l'] = tie_plate_l
-                    self.result['channel_spacing'] = spacing_between_channels
-                    self.result['lacing_spacing'] = lacing_angle
-
-                    # Store in optimum_section_ur_results for output dock (for each section)
-                    ur = self.ur
-                    if ur in self.optimum_section_ur_results:
-                        self.optimum_section_ur_results[ur]['tie_plate_d'] = tie_plate_d
-                        self.optimum_section_ur_results[ur]['tie_plate_t'] = tie_plate_t
-                        self.optimum_section_ur_results[ur]['tie_plate_l'] = tie_plate_l
-                        self.optimum_section_ur_results[ur]['channel_spacing'] = spacing_between_channels
-                        self.optimum_section_ur_results[ur]['lacing_spacing'] = lacing_angle
-
-                    # Calculate and store cost for this section (needed for cost-based optimization)
-                    self.cost = (self.section_property.unit_mass * self.section_property.area * 1e-4) * min(self.length_zz, self.length_yy) * self.steel_cost_per_kg
-                    self.optimum_section_cost.append(self.cost)
+                    self.result['tie_plate_d'] = self.tie_plate_d
+                    self.result['tie_plate_t'] = self.tie_plate_t
+                    self.result['tie_plate_l'] = self.tie_plate_l
+                    self.result['channel_spacing'] = self.spacing_between_channels
+                    self.result['lacing_spacing'] = self.lacing_angle
 
-                    #tieplate
-                    # 2.X - Tie Plate Dimensions
-                    self.tie_plate_d = round(2 * self.section_property.depth / 3, 2)         # mm
-                    self.tie_plate_t = round(self.section_property.web_thickness, 2)         # mm
-                    self.tie_plate_l = round(self.section_property.depth / 2, 2)             # mm
-                    self.list_zz.append(self.tie_plate_d)
-                    self.list_yy.append(self.tie_plate_d)
-                    self.list_zz.append(self.tie_plate_t)
-                    self.list_yy.append(self.tie_plate_t)
-                    self.list_zz.append(self.tie_plate_l)
-                    self.list_yy.append(self.tie_plate_l)
-
-# 2.X - Lacing Spacing Between Channels
-                    self.spacing_between_channels = round(self.section_property.depth + 2 * self.tie_plate_t, 2)  # mm
-                    self.list_zz.append(self.spacing_between_channels)
-                    self.list_yy.append(self.spacing_between_channels)
-
-# 2.X - Lacing Angle
-                    self.lacing_angle = round(math.degrees(math.atan(self.spacing_between_channels / (2 * self.tie_plate_l))), 2)  # degrees
-                    self.list_zz.append(self.lacing_angle) 
-                    self.list_yy.append(self.lacing_angle)
-                    self.store_additional_outputs(
-                        d=self.tie_plate_d,
-                        t=self.tie_plate_t,
-                        l=self.tie_plate_l,
-                        spacing=self.lacing_angle,
-                        c_spacing=self.spacing_between_channels
-                        )
-                
+                    self.optimum_section_cost.append(self.cost)
 
-                    # Step 3 - Storing the optimum results to a list in descending order
+                    # Step 3 - Storing the results of the section, one row per section
                     list_1 = [
                         'Designation', 'Section class', 'Effective area', 'Buckling_curve_zz', 'IF_zz', 'Effective_length_zz', 'Effective_SR_zz',
                         'EBS_zz', 'ND_ESR_zz', 'phi_zz', 'SRF_zz', 'FCD_1_zz', 'FCD_2', 'FCD_zz', 'FCD', 'Capacity', 'UR', 'Cost', 'Designation',
                         'Section class', 'Effective area', 'Buckling_curve_yy', 'IF_yy', 'Effective_length_yy', 'Effective_SR_yy', 'EBS_yy',
                         'ND_ESR_yy', 'phi_yy', 'SRF_yy', 'FCD_1_yy', 'FCD_2', 'FCD_yy', 'FCD', 'Capacity', 'UR', 'Cost'
                     ]
-
-            try:
-                for section in self.input_section_list:
-                    # perform all calculations for this section (assumed already done)
                     section_result = {
                         'Designation': section,
                         'Section class': self.section_class,
@@ -1657,14 +1426,26 @@ class LacedColumn(Member):
                         'SRF_yy': self.stress_reduction_factor_yy,
                         'FCD_1_yy': self.f_cd_1_yy,
                         'FCD_yy': self.f_cd_yy,
-                        'tie_plate_d': self.tie_plate_d,
-                        'tie_plate_t': self.tie_plate_t,
-                        'tie_plate_l': self.tie_plate_l,
-                        'channel_spacing': self.spacing_between_channels,
-                        'lacing_spacing': self.lacing_angle,
                     }
-                    self.optimum_section_ur_results[self.ur] = section_result
+                    index = self.section_results.add(section, self.ur, capacity=self.section_capacity,
+                                                     section_class=self.section_class,
+                                                     mass=self.section_property.mass, cost=self.cost,
+                                                     details=section_result)
+                    self.store_additional_outputs(
+                        d=self.tie_plate_d,
+                        t=self.tie_plate_t,
+                        l=self.tie_plate_l,
+                        spacing=self.lacing_angle,
+                        c_spacing=self.spacing_between_channels,
+                        index=index
+                        )
+                # the outputs of the selected section, not of the last section of the loop (the spacing of the
+                # components differs from section to section in the Optimised spacing mode)
+                self.result.update({name: value for name, value in self.selected_result().items()
+                                    if name in ('tie_plate_d', 'tie_plate_t', 'tie_plate_l', 'lacing_spacing',
+                                                'channel_spacing')})
 
+            try:
                 # 2- Based on optimum cost
                 self.optimum_section_cost_results[self.cost] = {}
                 list_2 = self.list_zz + self.list_yy
@@ -1684,20 +1465,17 @@ class LacedColumn(Member):
 
             best_ur = None
             best_section_results = None
-            if self.optimum_section_ur:
-                best_ur = round(min(self.optimum_section_ur, key=lambda x: abs(x-1.0)), 3)
-                best_section_results = self.optimum_section_ur_results.get(best_ur)
-                if best_section_results is None:
-                    # fallback: find the closest key within a small tolerance
-                    if self.optimum_section_ur_results:
-                        closest_key = min(self.optimum_section_ur_results.keys(), key=lambda k: abs(k - best_ur))
-                        if abs(closest_key - best_ur) < 1e-3:
-                            best_section_results = self.optimum_section_ur_results[closest_key]
-                    if best_section_results is None:
-                        self.logger.error(f"Result UR {best_ur} not found in optimum_section_ur_results. No valid design result to display.")
-                        return
+            alternatives = []
+            if self.section_results:
+                ranking = self.section_results.rank(limit=min(self.allowable_utilization_ratio, 1.0))
+                best = ranking['top'][0] if ranking['top'] else ranking['least_failing']
+                if best is not None:
+                    best_section_results = self.section_results[best]
+                    best_ur = best_section_results['UR']
+                alternatives = [self.section_results[index]['Designation'] for index in ranking['top'][1:]]
                 summary_lines.append(f"Best UR: {best_ur}")
                 summary_lines.append(f"Best Section Results: {best_section_results}")
+                summary_lines.append(f"Alternatives: {alternatives}")
 
             summary_lines.append("======================")
             summary_text = "\n".join(summary_lines)
@@ -1707,6 +1485,7 @@ class LacedColumn(Member):
                 'optimum_section_ur': self.optimum_section_ur,
                 'best_ur': best_ur,
                 'best_section_results': best_section_results,
+                'alternatives': alternatives,
                 'summary_text': summary_text
             }
         except Exception as e:
@@ -1717,33 +1496,211 @@ class LacedColumn(Member):
             self.failed_design_dict = {}
             return
 
-    def store_additional_outputs(self, d=None, t=None, l=None, spacing=None, c_spacing=None, ur=None):
+    def section_capacity_sweep(self):
+        """Calculate the design compressive strength of every section of the input section list
+
+        Returns: list of dictionaries (one per section) of the attributes in CAPACITY_ATTRIBUTES and the fy and fu of the
+                 section material
+        """
+        capacities = []
+        for section in self.input_section_list:
+            # fetching the section properties of the selected section
+            with timer('laced_column.section_load', section=section):
+                self.section_property = self.component_section(section)
+            channels = self.sec_profile in KEY_LACEDCOL_SEC_PROFILE_OPTIONS[:2]
+            self.material_property.connect_to_database_to_get_fy_fu(self.material, max(self.section_property.flange_thickness,
+                                                                                    self.section_property.web_thickness))
+            self.epsilon = math.sqrt(250 / self.material_property.fy)
+
+            # Step 1 - computing the effective sectional area
+            self.section_class = self.input_section_classification[section][0]
+            if self.section_class == 'Slender':
+                # flange outstands of 15.7 epsilon t (two per flange of a girder, one of a channel) and the web
+                flange_width = 15.7 if channels else 31.4
+                self.effective_area = (2 * ((flange_width * self.epsilon * self.section_property.flange_thickness) *
+                                            self.section_property.flange_thickness)) + \
+                                    (2 * ((21 * self.epsilon * self.section_property.web_thickness) * self.section_property.web_thickness))
+            else:
+                self.effective_area = self.section_property.area  # mm2
+            if self.effective_area_factor < 1.0:
+                self.effective_area = round(self.effective_area * self.effective_area_factor, 2)
+            built_up = self.spacing_mode == KEY_LACEDCOL_SPACING_MODE_OPTIONS[1]
+            if built_up:
+                # two components
+                self.effective_area = 2 * self.effective_area
+
+            # Step 2 - computing the design compressive stress
+            # 2.1 - Buckling curve classification and Imperfection factor
+            if channels:  # channels, any axis (Table 10)
+                self.buckling_class_zz = 'c'
+                self.buckling_class_yy = 'c'
+            elif self.section_property.type == 'Rolled':  # girders
+                self.buckling_class_zz = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
+                                                                                            self.section_property.depth,
+                                                                                            self.section_property.flange_thickness,
+                                                                                            cross_section='Rolled I-sections',
+                                                                                            section_type='Hot rolled')['z-z']
+                self.buckling_class_yy = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
+                                                                                            self.section_property.depth,
+                                                                                            self.section_property.flange_thickness,
+                                                                                            cross_section='Rolled I-sections',
+                                                                                            section_type='Hot rolled')['y-y']
+            else:  # welded girders
+                self.buckling_class_zz = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
+                                                                                            self.section_property.depth,
+                                                                                            self.section_property.flange_thickness,
+                                                                                            cross_section='Welded I-section',
+                                                                                            section_type='Hot rolled')['z-z']
+                self.buckling_class_yy = IS800_2007.cl_7_1_2_2_buckling_class_of_crosssections(self.section_property.flange_width,
+                                                                                            self.section_property.depth,
+                                                                                            self.section_property.flange_thickness,
+                                                                                            cross_section='Welded I-section',
+                                                                                            section_type='Hot rolled')['y-y']
+            self.imperfection_factor_zz = IS800_2007.cl_7_1_2_1_imperfection_factor(buckling_class=self.buckling_class_zz)
+            self.imperfection_factor_yy = IS800_2007.cl_7_1_2_1_imperfection_factor(buckling_class=self.buckling_class_yy)
+            self.result_IF_zz = float(self.imperfection_factor_zz) if self.imperfection_factor_zz is not None else None
+            self.result_IF_yy = float(self.imperfection_factor_yy) if self.imperfection_factor_yy is not None else None
+
+            # 2.2 - Effective length
+            self.effective_length_zz = IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(self.length_zz ,
+                                                                                                            end_1=self.end_1_z,
+                                                                                                            end_2=self.end_2_z)  # mm
+            self.effective_length_yy = IS800_2007.cl_7_2_2_effective_length_of_prismatic_compression_members(self.length_yy ,
+                                                                                                            end_1=self.end_1_y,
+                                                                                                            end_2=self.end_2_y)  # mm
+
+            # 2.3 - Effective slenderness ratio
+            if built_up:
+                self.spacing_between_channels, r_zz, r_yy = self.optimum_component_spacing()
+                self.effective_sr_zz = self.effective_length_zz / r_zz
+                self.effective_sr_yy = 1.05 * self.effective_length_yy / r_yy  # Cl 7.6.1.5
+            else:
+                self.effective_sr_zz = self.effective_length_zz / self.section_property.rad_of_gy_z
+                self.effective_sr_yy = self.effective_length_yy / self.section_property.rad_of_gy_y
+
+            # 2.4 - Euler buckling stress
+            self.euler_bs_zz = (math.pi ** 2 * self.section_property.modulus_of_elasticity) / self.effective_sr_zz ** 2
+            self.euler_bs_yy = (math.pi ** 2 * self.section_property.modulus_of_elasticity) / self.effective_sr_yy ** 2
+            self.result_ebs_zz = float(self.euler_bs_zz) if self.euler_bs_zz is not None else None
+            self.result_ebs_yy = float(self.euler_bs_yy) if self.euler_bs_yy is not None else None
+
+            # 2.5 - Non-dimensional effective slenderness ratio
+            self.non_dim_eff_sr_zz = math.sqrt(self.material_property.fy / self.euler_bs_zz)
+            self.non_dim_eff_sr_yy = math.sqrt(self.material_property.fy / self.euler_bs_yy)
+
+            # 2.5 - phi
+            self.phi_zz = 0.5 * (1 + (self.imperfection_factor_zz * (self.non_dim_eff_sr_zz - 0.2)) + self.non_dim_eff_sr_zz ** 2)
+            self.phi_yy = 0.5 * (1 + (self.imperfection_factor_yy * (self.non_dim_eff_sr_yy - 0.2)) + self.non_dim_eff_sr_yy ** 2)
+
+            # 2.6 - Design compressive stress
+            self.stress_reduction_factor_zz = 1 / (self.phi_zz + (self.phi_zz ** 2 - self.non_dim_eff_sr_zz ** 2) ** 0.5)
+            self.stress_reduction_factor_yy = 1 / (self.phi_yy + (self.phi_yy ** 2 - self.non_dim_eff_sr_yy ** 2) ** 0.5)
+            self.f_cd_1_zz = (self.stress_reduction_factor_zz * self.material_property.fy) / self.gamma_m0
+            self.f_cd_1_yy = (self.stress_reduction_factor_yy * self.material_property.fy) / self.gamma_m0
+            self.f_cd_2 = self.material_property.fy / self.gamma_m0
+            self.f_cd_zz = min(self.f_cd_1_zz, self.f_cd_2)
+            self.f_cd_yy = min(self.f_cd_1_yy, self.f_cd_2)
+            self.f_cd = min(self.f_cd_zz, self.f_cd_yy)
+
+            # 2.7 - Capacity of the section
+            self.section_capacity = self.f_cd * self.effective_area  # N
+
+            # Calculate the cost of this section (needed for cost-based optimization)
+            self.cost = (self.section_property.unit_mass * self.section_property.area * 1e-4) * min(self.length_zz, self.length_yy) * self.steel_cost_per_kg
+            if built_up:
+                self.cost = 2 * self.cost
+
+            # 2.X - Tie Plate Dimensions
+            self.tie_plate_d = round(2 * self.section_property.depth / 3, 2)         # mm
+            self.tie_plate_t = round(self.section_property.web_thickness, 2)         # mm
+            self.tie_plate_l = round(self.section_property.depth / 2, 2)             # mm
+
+            # 2.X - Lacing Spacing Between Channels
+            if not built_up:
+                self.spacing_between_channels = round(self.section_property.depth + 2 * self.tie_plate_t, 2)  # mm
+
+            # 2.X - Lacing Angle
+            self.lacing_angle = round(math.degrees(math.atan(self.spacing_between_channels / (2 * self.tie_plate_l))), 2)  # degrees
+
+            capacity = {name: getattr(self, name) for name in CAPACITY_ATTRIBUTES}
+            capacity['fy'], capacity['fu'] = self.material_property.fy, self.material_property.fu
+            capacities.append(capacity)
+        return capacities
+
+    def optimum_component_spacing(self, step=5.0, grid=40):
+        """Find the clear spacing of the two components of the built-up column beyond which buckling about the y-y axis
+        (the axis between the components) no longer governs, i.e. the least spacing at which the column reaches its z-z
+        capacity
+
+        The spacing that equalises the slenderness ratios, 1.05 KLy/ryy = KLz/rzz (Cl 7.6.1.5), is solved in closed form
+        from Iyy = 2 (Iy + A (S/2 + c)^2), c being the distance from the centroid of a component to its inner face, and is
+        then refined on a grid of step mm, since the buckling classes of the two axes may differ. The spacing is at least
+        the width of the lacing bars, three times the bolt diameter (Cl 7.6.2), so that the lacing can be connected.
+
+        Returns: spacing (mm), rzz and ryy (mm) of the built-up section at that spacing
+        """
+        section = self.section_property
+        r_z, r_y = section.rad_of_gy_z, section.rad_of_gy_y
+        if self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[0]:  # back-to-back channels
+            c = section.Cy
+        elif self.sec_profile == KEY_LACEDCOL_SEC_PROFILE_OPTIONS[1]:  # toe-to-toe channels
+            c = section.flange_width - section.Cy
+        else:  # girders
+            c = section.flange_width / 2
+        min_spacing = math.ceil(3 * self.bolt_diameter / step) * step
+
+        # closed form: ryy of the built-up section that balances the slenderness ratios
+        r_target = 1.05 * self.effective_length_yy * r_z / self.effective_length_zz
+        spacing = 2 * (math.sqrt(max(r_target ** 2 - r_y ** 2, 0.0)) - c)
+
+        # grid around the closed form spacing: the least spacing with f_cd_yy >= f_cd_zz
+        spacings = max(math.floor(spacing / step) * step - 4 * step, min_spacing) + step * np.arange(grid)
+        r_yy = np.sqrt(r_y ** 2 + (spacings / 2 + c) ** 2)
+
+        def f_cd(alpha, slenderness):
+            non_dim = np.sqrt(self.material_property.fy / (math.pi ** 2 * section.modulus_of_elasticity / slenderness ** 2))
+            phi = 0.5 * (1 + alpha * (non_dim - 0.2) + non_dim ** 2)
+            return self.material_property.fy / (self.gamma_m0 * (phi + np.sqrt(phi ** 2 - non_dim ** 2)))
+
+        balanced = f_cd(self.imperfection_factor_yy, 1.05 * self.effective_length_yy / r_yy) >= \
+            f_cd(self.imperfection_factor_zz, self.effective_length_zz / r_z)
+        i = int(np.argmax(balanced)) if balanced.any() else grid - 1
+        return round(float(spacings[i]), 2), r_z, float(r_yy[i])
+
+    def store_additional_outputs(self, d=None, t=None, l=None, spacing=None, c_spacing=None, index=None):
         """
-        Store additional calculated outputs for tie plate, lacing, and channel spacing in self.result and, if ur is provided, in self.optimum_section_ur_results[ur].
+        Store additional calculated outputs for tie plate, lacing, and channel spacing in self.result and, if index is provided, in the results of that section (row of self.section_results).
         """
+        outputs = {}
         if d is not None:
-            self.result['tie_plate_d'] = d
+            outputs['tie_plate_d'] = d
         if t is not None:
-            self.result['tie_plate_t'] = t
+            outputs['tie_plate_t'] = t
         if l is not None:
-            self.result['tie_plate_l'] = l
+            outputs['tie_plate_l'] = l
         if spacing is not None:
-            self.result['lacing_spacing'] = spacing
+            outputs['lacing_spacing'] = spacing
         if c_spacing is not None:
-            self.result['channel_spacing'] = c_spacing
-        # Also store in optimum_section_ur_results[ur] if ur is provided
-        if ur is not None and hasattr(self, 'optimum_section_ur_results') and ur in self.optimum_section_ur_results:
-            if d is not None:
-                self.optimum_section_ur_results[ur]['tie_plate_d'] = d
-            if t is not None:
-                self.optimum_section_ur_results[ur]['tie_plate_t'] = t
-            if l is not None:
-                self.optimum_section_ur_results[ur]['tie_plate_l'] = l
-            if spacing is not None:
-                self.optimum_section_ur_results[ur]['lacing_spacing'] = spacing
-            if c_spacing is not None:
-                self.optimum_section_ur_results[ur]['channel_spacing'] = c_spacing
-                
+            outputs['channel_spacing'] = c_spacing
+        self.result.update(outputs)
+        if index is not None:
+            self.section_results.update(index, **outputs)
+
+    def selected_result(self):
+        """Return the results of the selected section: the section shown in the output dock, or until a section is
+        selected the optimum section (the least failing section if no section passes); {} if no section was designed
+        """
+        if not self.section_results:
+            return {}
+        limit = min(getattr(self, 'allowable_utilization_ratio', 1.0), 1.0)
+        index = self.section_results.index(getattr(self, 'result_designation', None))
+        for select in (self.section_results.most_utilised, self.section_results.least_failing):
+            if index is None:
+                index = select(limit)
+        if index is None:
+            index = self.section_results.least_utilised()
+        return self.section_results[index] if index is not None else {}
+
     def calculate(self, design_dictionary):
         self.reset_state_for_new_design()
         # --- PATCH: Ensure end condition values are always present and correct in design_dictionary ---
@@ -1806,8 +1763,9 @@ class LacedColumn(Member):
         if end2 and isinstance(end2, str):
             design_dictionary['End Condition 2'] = end2
             design_dictionary['End_2'] = end2
-        for k in design_dictionary:
-            print(f"    {k!r}: {design_dictionary[k]!r}")
+        if trace.isEnabledFor(logging.DEBUG):
+            for k in design_dictionary:
+                trace.debug("    %r: %r", k, design_dictionary[k])
 
         # --- Patch: Calculate and assign effective length YY using IS 800:2007 Table 11 logic ---
         try:
@@ -1824,10 +1782,10 @@ class LacedColumn(Member):
             if isinstance(end2, list):
                 end2 = None
             if not end1:
-                print("[DEBUG][calculate] MISSING: end1 is not set or empty!")
+                trace.debug("calculate: end1 is not set or empty")
                 pass
             if not end2:
-                print("[DEBUG][calculate] MISSING: end2 is not set or empty!")
+                trace.debug("calculate: end2 is not set or empty")
                 pass
             if not unsupported_length_yy:
                 pass
@@ -1840,17 +1798,16 @@ class LacedColumn(Member):
                     self.result['effective_length_yy'] = eff_len_yy_calc
                     self.result['Effective_length_yy'] = eff_len_yy_calc
                     self.result['Effective Length YY'] = eff_len_yy_calc
-                    print(f"[DEBUG] Calculated effective_length_yy: {eff_len_yy_calc}")
+                    trace.debug("Calculated effective_length_yy: %s", eff_len_yy_calc)
                 except Exception as e:
-                    print('[DEBUG] Could not calculate effective_length_yy:', e)
+                    trace.debug("Could not calculate effective_length_yy: %s", e)
                 pass
             # --- Buckling Curve ZZ ---
             bc_zz_val = None
             if hasattr(self, 'result_bc_zz') and self.result_bc_zz:
                 bc_zz_val = self.result_bc_zz
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            elif self.section_results:
+                best_result = self.selected_result()
                 for k in ['Buckling_curve_zz', 'Buckling Curve ZZ', 'buckling_curve_zz']:
                     if k in best_result:
                         bc_zz_val = best_result[k]
@@ -1864,9 +1821,8 @@ class LacedColumn(Member):
             nd_esr_yy_val = None
             if hasattr(self, 'result_nd_esr_yy') and self.result_nd_esr_yy is not None:
                 nd_esr_yy_val = self.result_nd_esr_yy
-            elif hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            elif self.section_results:
+                best_result = self.selected_result()
                 for k in ['ND_ESR_yy', 'nd_esr_yy', 'ND ESR YY']:
                     if k in best_result:
                         nd_esr_yy_val = best_result[k]
@@ -1877,7 +1833,7 @@ class LacedColumn(Member):
                 self.result['ND ESR YY'] = nd_esr_yy_val
                 self.result_nd_esr_yy = nd_esr_yy_val
         except Exception as e:
-            print('[DEBUG] Error in effective_length_yy/buckling_curve_zz/nd_esr_yy patch:', e)
+            trace.debug("Error in effective_length_yy/buckling_curve_zz/nd_esr_yy patch: %s", e)
         """
         Perform all calculations for the laced column based on user input and assign results to output fields.
         This method is called explicitly from the UI after user input is collected.
@@ -1888,26 +1844,9 @@ class LacedColumn(Member):
             self.section_classification()
             # Print all section results for debug/verification
             self.print_all_section_results()
-            # For the best section (lowest UR), extract and assign all output fields
-            if hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                # Find the best section (lowest UR) with all required results
-                best_ur = None
-                for ur in sorted(self.optimum_section_ur_results.keys()):
-                    res = self.optimum_section_ur_results[ur]
-                    # Check if all required keys are present and not None
-                    required_keys = [
-                        'Effective Length YY', 'Effective Length ZZ', 'Slenderness YY', 'Slenderness ZZ', 'FCD', 'Capacity',
-                        'Section class', 'Effective area', 'Buckling_curve_yy', 'Buckling_curve_zz', 'IF_yy', 'IF_zz',
-                        'EBS_yy', 'EBS_zz', 'ND_ESR_yy', 'ND_ESR_zz', 'phi_yy', 'phi_zz', 'SRF_yy', 'SRF_zz',
-                        'FCD_1_yy', 'FCD_1_zz', 'FCD_2', 'Cost', 'channel_spacing', 'tie_plate_d', 'tie_plate_t', 'tie_plate_l', 'lacing_spacing'
-                    ]
-                    if all(k in res and res[k] is not None for k in required_keys):
-                        best_ur = ur
-                        break
-                if best_ur is None:
-                    # Fallback: just pick the lowest UR
-                    best_ur = min(self.optimum_section_ur_results.keys())
-                best_result = self.optimum_section_ur_results[best_ur]
+            # For the selected section, extract and assign all output fields
+            best_result = self.selected_result()
+            if best_result:
                 # Assign all output fields for UI/terminal
                 # Only assign actual calculated values for effective length and slenderness, never allow 'mpc' or similar text
                 def get_numeric_value(keys):
@@ -1934,7 +1873,7 @@ class LacedColumn(Member):
                 self.effective_sr_zz = get_numeric_value(['Effective_sr_zz', 'Slenderness ZZ', 'effective_sr_zz', 'Slenderness_zz'])
                 self.result_fcd = best_result.get('FCD')
                 self.result_capacity = best_result.get('Capacity')
-                self.result_UR = best_ur
+                self.result_UR = best_result.get('UR')
                 self.result_section_class = best_result.get('Section class')
                 self.result_effective_area = best_result.get('Effective area')
                 self.result_bc_yy = best_result.get('Buckling_curve_yy')
@@ -1958,22 +1897,23 @@ class LacedColumn(Member):
                 self.result_tie_plate_t = best_result.get('tie_plate_t')
                 self.result_tie_plate_l = best_result.get('tie_plate_l')
                 self.result_lacing_spacing = best_result.get('lacing_spacing')
-                # Print all calculated values for debug/verification
-                print("\n[DEBUG] All calculated values for best section:")
-                for k, v in best_result.items():
-                    print(f"  {k}: {v}")
-                print("\n[DEBUG] Attribute values set on self:")
-                attrs = [
-                    'effective_length_yy', 'effective_length_zz', 'effective_sr_yy', 'effective_sr_zz', 'result_fcd', 'result_capacity',
-                    'result_UR', 'result_section_class', 'result_effective_area', 'result_bc_yy', 'result_bc_zz', 'result_IF_yy', 'result_IF_zz',
-                    'result_ebs_yy', 'result_ebs_zz', 'result_nd_esr_yy', 'result_nd_esr_zz', 'result_phi_yy', 'result_phi_zz', 'result_srf_yy',
-                    'result_srf_zz', 'result_fcd_1_yy', 'result_fcd_1_zz', 'result_fcd_2', 'result_cost', 'result_channel_spacing',
-                    'result_tie_plate_d', 'result_tie_plate_t', 'result_tie_plate_l', 'result_lacing_spacing'
-                ]
-                for attr in attrs:
-                    print(f"  {attr}: {getattr(self, attr, None)}")
+                # Log all calculated values for debug/verification
+                if trace.isEnabledFor(logging.DEBUG):
+                    trace.debug("All calculated values for best section:")
+                    for k, v in best_result.items():
+                        trace.debug("  %s: %s", k, v)
+                    trace.debug("Attribute values set on self:")
+                    attrs = [
+                        'effective_length_yy', 'effective_length_zz', 'effective_sr_yy', 'effective_sr_zz', 'result_fcd', 'result_capacity',
+                        'result_UR', 'result_section_class', 'result_effective_area', 'result_bc_yy', 'result_bc_zz', 'result_IF_yy', 'result_IF_zz',
+                        'result_ebs_yy', 'result_ebs_zz', 'result_nd_esr_yy', 'result_nd_esr_zz', 'result_phi_yy', 'result_phi_zz', 'result_srf_yy',
+                        'result_srf_zz', 'result_fcd_1_yy', 'result_fcd_1_zz', 'result_fcd_2', 'result_cost', 'result_channel_spacing',
+                        'result_tie_plate_d', 'result_tie_plate_t', 'result_tie_plate_l', 'result_lacing_spacing'
+                    ]
+                    for attr in attrs:
+                        trace.debug("  %s: %s", attr, getattr(self, attr, None))
         except Exception as e:
-            print(traceback.format_exc())
+            trace.exception("Error in calculate: %s", e)
                 
     def results(self):
         # Prevent duplicate logs in a single calculation
@@ -2001,83 +1941,53 @@ class LacedColumn(Member):
             if self.failed_design_dict and isinstance(self.failed_design_dict, dict) and len(self.failed_design_dict) > 0:
                 self.logger.info("The details for the best section provided is being shown")
                 self.result_UR = self.failed_design_dict.get('UR', None)
-                self.common_result(
-                    list_result=self.failed_design_dict,
-                    result_type=None,
-                )
+                self.common_result(self.failed_design_dict)
                 self.logger.warning("Re-define the list of sections or check the Design Preferences option and re-design.")
                 return
             self.failed_design_dict = {}  # Always a dict for downstream code
             return
 
-        _ = [i for i in self.optimum_section_ur if i > 1.0]
-
-        if len(_)==1:
-            temp = _[0]
-        elif len(_)==0:
-            temp = None
-        else:
-            temp = sorted(_)[0]
-        self.failed_design_dict = self.optimum_section_ur_results[temp] if temp is not None else None
+        limit = min(self.allowable_utilization_ratio, 1.0)
+        failed = self.section_results.least_failing(1.0)
+        self.failed_design_dict = self.section_results[failed] if failed is not None else None
 
         # results based on UR
         if self.optimization_parameter == 'Utilization Ratio':
-            
-            filter_UR = filter(lambda x: x <= min(self.allowable_utilization_ratio, 1.0), self.optimum_section_ur)
-            self.optimum_section_ur = list(filter_UR)
-            self.optimum_section_ur.sort()
+
+            self.optimum_section_ur = sorted(ur for ur in self.optimum_section_ur if ur <= limit)
 
             # selecting the section with most optimum UR
-            if len(self.optimum_section_ur) == 0:  # no design was successful
+            selected = self.section_results.most_utilised(limit)
+            if selected is None:  # no design was successful
                 error_msg = f"The sections selected by the solver from the defined list of sections did not satisfy the Utilization Ratio (UR) criteria. Allowable UR: {self.allowable_utilization_ratio}"
                 self.failed_reason = error_msg
                 self.design_status = False
-                
+
                 # Fallback: If we have results but they were filtered out, show the best one anyway
-                if hasattr(self, 'optimum_section_ur_results') and self.optimum_section_ur_results:
-                    self.logger.info("Showing best available result despite UR filter failure")
-                    best_ur = min(self.optimum_section_ur_results.keys())
-                    self.result_UR = best_ur
-                    self.common_result(
-                        list_result=self.optimum_section_ur_results,
-                        result_type=best_ur,
-                    )
-                    return
-                
-                if self.failed_design_dict and isinstance(self.failed_design_dict, dict) and len(self.failed_design_dict) > 0:
-                    self.logger.info(
-                    "The details for the best section provided is being shown"
-                )
-                    self.result_UR = self.failed_design_dict.get('UR', None) #temp  
-                    self.common_result(
-                        list_result=self.failed_design_dict,
-                        result_type=None,
-                    )
-                    self.logger.warning(
-                    "Re-define the list of sections or check the Design Preferences option and re-design."
-                )
+                best = self.section_results.least_failing(limit)
+                if best is not None:
+                    self.logger.info("The details for the best section provided is being shown")
+                    self.result_UR = self.section_results[best]['UR']
+                    self.common_result(self.section_results[best])
+                    self.logger.warning("Re-define the list of sections or check the Design Preferences option and re-design.")
                     return
 
-            self.failed_design_dict = {}
-            self.result_UR = self.optimum_section_ur[-1]  # optimum section which passes the UR check
-
-            self.design_status = True
-            if self.result_UR in self.optimum_section_ur_results:
-                self.common_result(
-                    list_result=self.optimum_section_ur_results,
-                    result_type=self.result_UR,
-                )
             else:
-                error_msg = f"Result UR {self.result_UR} not found in optimum_section_ur_results. No valid design result to display."
-                self.logger.error(error_msg)
-                self.failed_reason = error_msg
-                self.design_status = False
+                self.failed_design_dict = {}
+                self.result_UR = self.section_results[selected]['UR']  # optimum section which passes the UR check
+                self.design_status = True
+                self.common_result(self.section_results[selected])
         else:  # results based on cost
-            self.optimum_section_cost.sort()
-
-            # selecting the section with most optimum cost
-            self.result_cost = self.optimum_section_cost[0]
-            self.design_status = True
+            # selecting the passing section with most optimum cost
+            selected = self.section_results.cheapest(limit)
+            if selected is None:
+                self.failed_reason = "None of the sections selected by the solver from the defined list of sections is adequate"
+                self.design_status = False
+            else:
+                self.result_UR = self.section_results[selected]['UR']
+                self.result_cost = self.section_results[selected]['Cost']
+                self.design_status = True
+                self.common_result(self.section_results[selected])
 
         for status in self.design_status_list:
             if status is False:
@@ -2086,9 +1996,10 @@ class LacedColumn(Member):
             else:
                 self.design_status = True
 
-    def common_result(self, list_result, result_type):
-        # Defensive: handle None or wrong type for list_result
-        if not isinstance(list_result, dict) or not list_result:
+    def common_result(self, section_result):
+        """Set the result attributes from the results of a section (a row of self.section_results)"""
+        # Defensive: handle None or wrong type for section_result
+        if not isinstance(section_result, dict) or not section_result:
             self.logger.error("No valid results to display. Calculation did not yield any results.")
             # Set all result attributes to None or a safe default
             self.result_designation = None
@@ -2121,23 +2032,9 @@ class LacedColumn(Member):
             self.result_cost = None
             return
 
-        # Defensive: handle None or missing result_type
-        if result_type is None:
-            # Try to get the first key if possible
-            if list_result:
-                result_type = next(iter(list_result.keys()))
-            else:
-                self.logger.error("No result type found in results.")
-                return
-
-        # Defensive: check if result_type exists in list_result
-        if result_type not in list_result:
-            self.logger.error(f"Result type '{result_type}' not found in results.")
-            return
-
         # Now safe to access
         try:
-            self.result_designation = list_result[result_type].get('Designation', None)
+            self.result_designation = section_result.get('Designation', None)
             self.section_class = self.input_section_classification.get(self.result_designation, [None])[0]
 
             if self.section_class == 'Slender':
@@ -2167,32 +2064,32 @@ class LacedColumn(Member):
                         classification[2] if len(classification) > 2 else 'Unknown', web_value
                     ))
 
-            self.result_section_class = list_result[result_type].get('Section class', None)
-            self.result_effective_area = list_result[result_type].get('Effective area', None)
-            self.result_bc_zz = list_result[result_type].get('Buckling_curve_zz', None)
-            self.result_bc_yy = list_result[result_type].get('Buckling_curve_yy', None)
-            self.result_IF_zz = list_result[result_type].get('IF_zz', None)
-            self.result_IF_yy = list_result[result_type].get('IF_yy', None)
-            self.result_eff_len_zz = list_result[result_type].get('Effective_length_zz', None)
-            self.result_eff_len_yy = list_result[result_type].get('Effective_length_yy', None)
-            self.result_eff_sr_zz = list_result[result_type].get('Effective_SR_zz', None)
-            self.result_eff_sr_yy = list_result[result_type].get('Effective_SR_yy', None)
-            self.result_ebs_zz = list_result[result_type].get('EBS_zz', None)
-            self.result_ebs_yy = list_result[result_type].get('EBS_yy', None)
-            self.result_nd_esr_zz = list_result[result_type].get('ND_ESR_zz', None)
-            self.result_nd_esr_yy = list_result[result_type].get('ND_ESR_yy', None)
-            self.result_phi_zz = list_result[result_type].get('phi_zz', None)
-            self.result_phi_yy = list_result[result_type].get('phi_yy', None)
-            self.result_srf_zz = list_result[result_type].get('SRF_zz', None)
-            self.result_srf_yy = list_result[result_type].get('SRF_yy', None)
-            self.result_fcd_1_zz = list_result[result_type].get('FCD_1_zz', None)
-            self.result_fcd_1_yy = list_result[result_type].get('FCD_1_yy', None)
-            self.result_fcd_2 = list_result[result_type].get('FCD_2', None)
-            self.result_fcd_zz = list_result[result_type].get('FCD_zz', None)
-            self.result_fcd_yy = list_result[result_type].get('FCD_yy', None)
-            self.result_fcd = list_result[result_type].get('FCD', None)
-            self.result_capacity = list_result[result_type].get('Capacity', None)
-            self.result_cost = list_result[result_type].get('Cost', None)
+            self.result_section_class = section_result.get('Section class', None)
+            self.result_effective_area = section_result.get('Effective area', None)
+            self.result_bc_zz = section_result.get('Buckling_curve_zz', None)
+            self.result_bc_yy = section_result.get('Buckling_curve_yy', None)
+            self.result_IF_zz = section_result.get('IF_zz', None)
+            self.result_IF_yy = section_result.get('IF_yy', None)
+            self.result_eff_len_zz = section_result.get('Effective_length_zz', None)
+            self.result_eff_len_yy = section_result.get('Effective_length_yy', None)
+            self.result_eff_sr_zz = section_result.get('Effective_SR_zz', None)
+            self.result_eff_sr_yy = section_result.get('Effective_SR_yy', None)
+            self.result_ebs_zz = section_result.get('EBS_zz', None)
+            self.result_ebs_yy = section_result.get('EBS_yy', None)
+            self.result_nd_esr_zz = section_result.get('ND_ESR_zz', None)
+            self.result_nd_esr_yy = section_result.get('ND_ESR_yy', None)
+            self.result_phi_zz = section_result.get('phi_zz', None)
+            self.result_phi_yy = section_result.get('phi_yy', None)
+            self.result_srf_zz = section_result.get('SRF_zz', None)
+            self.result_srf_yy = section_result.get('SRF_yy', None)
+            self.result_fcd_1_zz = section_result.get('FCD_1_zz', None)
+            self.result_fcd_1_yy = section_result.get('FCD_1_yy', None)
+            self.result_fcd_2 = section_result.get('FCD_2', None)
+            self.result_fcd_zz = section_result.get('FCD_zz', None)
+            self.result_fcd_yy = section_result.get('FCD_yy', None)
+            self.result_fcd = section_result.get('FCD', None)
+            self.result_capacity = section_result.get('Capacity', None)
+            self.result_cost = section_result.get('Cost', None)
         except Exception as e:
             # Set all result attributes to None or a safe default
             self.result_designation = None
@@ -2222,6 +2119,7 @@ class LacedColumn(Member):
             self.result_fcd_yy = None
             self.result_fcd = None
 
+    @timed('laced_column.report')
     def save_design(self, popup_summary):
         # Safe rounding function for all round operations
         def safe_round(value, decimals=2):
@@ -2272,6 +2170,7 @@ class LacedColumn(Member):
                                         KEY_REPORT_ZPY: round(self.section_property.plast_sec_mod_y * 1e-3, 2)}
                 else:
                     #Update for section profiles RHS and SHS, CHS by making suitable elif condition.
+                    self.section_property = self.component_section(self.result_designation)
                     self.report_column = {KEY_DISP_COLSEC_REPORT: getattr(self.section_property, 'designation', None),
                                         KEY_DISP_MATERIAL: getattr(self.section_property, 'material', ''),
                                         #                                 KEY_DISP_APPLIED_AXIAL_FORCE: getattr(self.section_property, 'applied_axial_force', ''),
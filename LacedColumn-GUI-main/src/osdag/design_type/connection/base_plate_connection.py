@@ -2818,6 +2818,124 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
         # grout thickness fixed at 50 mm
         self.grout_thk = 50  # mm
 
+    def anchor_bearing_detailing(self, anchor_dia):
+        """ compute the end/edge distance, pitch and washer size for an anchor of the given diameter outside the column flange
+
+        Args:
+            anchor_dia: diameter of the anchor bolt in mm (int)
+
+        Returns: end/edge distance, pitch distance and washer details (tuple)
+        """
+        end_distance = self.cl_10_2_4_2_min_edge_end_dist(anchor_dia, self.dp_anchor_hole_out, self.dp_detail_edge_type)
+        end_distance = round_up(1.5 * end_distance, 5)
+        washer_details = IS6649.square_washer_dimensions(anchor_dia)
+        end_distance = max(end_distance, washer_details['side'])
+
+        # pitch increased to accommodate the end plate at the end of anchor inside footing
+        pitch_distance = round_up(1.5 * self.cl_10_2_2_min_spacing(anchor_dia), 5)
+
+        return end_distance, pitch_distance, washer_details
+
+    def anchor_bearing_search(self):
+        """ find the smallest anchor configuration (number of anchors on each side and diameter) outside the column flange
+        which satisfies the bearing check on the concrete footing/pedestal
+
+        Args:
+
+        Returns: bearing stress check (str) - 'Pass' or 'Fail'
+
+        Note: The candidate configurations are sorted in the order the connection would be improvised, i.e. 2, 3, 4 and 6 anchors on
+              each side and increasing diameters for each case. The neutral axis depth (y), anchor tension and bearing stress of all
+              the candidates are evaluated at once and the first passing candidate is selected.
+        """
+        anchor_nos_list = [2, 3, 4, 6]
+        if self.anchors_outside_flange in anchor_nos_list:
+            anchor_nos_list = anchor_nos_list[anchor_nos_list.index(self.anchors_outside_flange):]
+
+        # detailing parameters depend on the anchor diameter only
+        detailing = {dia: self.anchor_bearing_detailing(dia) for dia in self.anchor_dia_list_out}
+
+        candidates = [(nos, dia) for nos in anchor_nos_list for dia in self.anchor_dia_list_out
+                      if (nos != self.anchors_outside_flange) or (dia >= self.anchor_dia_provided_outside_flange)]
+        if not candidates:
+            return 'Fail'
+
+        nos = np.array([c[0] for c in candidates], dtype=float)
+        end_distance = np.array([detailing[c[1]][0] for c in candidates], dtype=float)
+        pitch_distance = np.array([detailing[c[1]][1] for c in candidates], dtype=float)
+        anchor_area = np.array([self.bolt_area(c[1])[0] for c in candidates], dtype=float)
+
+        # bp dimensions, one column of anchors for 2 or 3 anchors and two columns for 4 or 6 anchors on each side
+        bolt_columns = np.where(nos <= 3, 1, 2)
+        bp_length = np.ceil((self.column_D + (2 * (2 * end_distance)) + ((bolt_columns - 1) * 2 * pitch_distance)) / 5) * 5
+        bp_width = np.ceil(((0.85 * self.column_bf) + (2 * (2 * end_distance))) / 5) * 5
+        bp_length = np.maximum(bp_length, round_up(self.column_D + (2 * 100), 5))
+        bp_width = np.maximum(bp_width, round_up(self.column_bf + (2 * 100), 5))
+
+        anchor_area_tension = anchor_area * nos
+        f = (bp_length / 2) - end_distance
+        k1 = 3 * (self.eccentricity_zz - (bp_length / 2))
+        k2 = ((6 * self.n * anchor_area_tension) / bp_width) * (f + self.eccentricity_zz)
+        k3 = ((bp_length / 2) + f) * -k2
+
+        # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
+        y = np.round(cubic_max_real_root(k1, k2, k3))  # mm
+
+        tension_demand = np.abs(self.load_axial_compression * (((bp_length / 2) - (y / 3) - self.eccentricity_zz) /
+                                                               ((bp_length / 2) - (y / 3) + f)))  # N
+        tension_demand = np.round(tension_demand / 1000, 2)  # kN
+
+        bearing_stress = np.abs((tension_demand * 1000 * y) / ((anchor_area_tension * self.n) * ((bp_length / 2) - y + f)))  # N/mm^2
+        passed = bearing_stress <= self.bearing_strength_concrete
+
+        for anchor_nos in anchor_nos_list:
+            if passed[nos == anchor_nos].any():
+                break
+            logger.warning("[Concrete Bearing Check] The compressive stress on the concrete footing/pedestal is greater than the allowable "
+                           "bearing strength of the concrete ({} N/mm2) with {} numbers of anchors".
+                           format(round(self.bearing_strength_concrete, 3), 2 * anchor_nos))
+
+        if not passed.any():
+            self.max_bearing_stress = float(bearing_stress[-1])
+            self.anchors_outside_flange = 8  # exceeds the maximum number of anchors allowed on each side
+            self.anchor_dia_provided_outside_flange = self.anchor_dia_list_out[0]
+            return 'Fail'
+
+        i = int(np.argmax(passed))
+        self.anchors_outside_flange = candidates[i][0]
+        self.anchor_dia_provided_outside_flange = candidates[i][1]
+        self.bolt_columns_outside_flange = int(bolt_columns[i])
+
+        self.end_distance_out = float(end_distance[i])
+        self.edge_distance_out = self.end_distance_out
+        self.plate_washer_details_out = detailing[candidates[i][1]][2]
+        self.plate_washer_dim_out = self.plate_washer_details_out['side']
+        if self.bolt_columns_outside_flange == 2:
+            self.pitch_distance_out = float(pitch_distance[i])
+            self.gauge_distance_out = self.pitch_distance_out
+
+        self.bp_length_provided = float(bp_length[i])
+        self.bp_width_provided = float(bp_width[i])
+        self.anchor_area_tension = float(anchor_area_tension[i])
+        self.f = float(f[i])
+        self.k1 = float(k1[i])
+        self.k2 = float(k2[i])
+        self.k3 = float(k3[i])
+        self.y = int(y[i])
+        self.tension_demand_anchor = float(tension_demand[i])
+        self.max_bearing_stress = float(bearing_stress[i])
+
+        # detailing check on the selected anchor
+        end_distance_min = max(self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange, self.dp_anchor_hole_out,
+                                                                  self.dp_detail_edge_type), self.plate_washer_dim_out)
+        if (0.85 * self.column_bf) < (2 * end_distance_min):
+            self.safe = False
+            logger.warning("[Detailing Check] The detailing checks are not satisfied with anchor bolts of {} mm diameter".
+                           format(self.anchor_dia_provided_outside_flange))
+            logger.info("Re-designing the connection with lesser anchor bolts of higher diameter and grade combination")
+
+        return 'Pass'
+
     def bp_analyses(self):
         """ perform stress analyses of the base plate
 
@@ -3019,12 +3137,7 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
                 self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
 
                 # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                r_1 = roots[0]
-                r_2 = roots[1]
-                r_3 = roots[2]
-                r = max(r_1, r_2, r_3)
-                r = r.real  # separating the imaginary part
+                r = cubic_max_real_root(self.k1, self.k2, self.k3)  # largest real root of the equation
 
                 self.y = round(r)  # mm
 
@@ -3379,12 +3492,7 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
                     self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
 
                     # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                    roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                    r_1 = roots[0]
-                    r_2 = roots[1]
-                    r_3 = roots[2]
-                    r = max(r_1, r_2, r_3)
-                    r = r.real  # separating the imaginary part
+                    r = cubic_max_real_root(self.k1, self.k2, self.k3)  # largest real root of the equation
 
                     self.y = round(r)  # mm
 
@@ -3411,1167 +3519,8 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
                 # anchor_bolt_list = self.anchor_dia_out
 
                 # revise bolt design if the bearing check fails (increasing the number/area of bolts will reduce the bearing stress)
-                # First iteration - with 2 bolts
-                if (self.anchors_outside_flange == 2) and (bearing_stress_check == 'Fail'):
-                    # self.anchor_area_tension = self.bolt_area(self.anchor_dia_outside_flange)[0] * self.anchors_outside_flange
-                    self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                              ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                    self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                    n = 1
-                    while self.max_bearing_stress > self.bearing_strength_concrete:
-                        itr = len(self.anchor_dia_list_out) + 1
-                        sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange <= x <= 72, self.anchor_dia_list_out)
-                        for i in sort_bolt:
-                            min_bolt_dia = i
-                            break
-
-                        bolt_index = self.anchor_dia_list_out.index(min_bolt_dia)
-                        bolt_list = self.anchor_dia_list_out[bolt_index:]
-
-                        for i in bolt_list:
-                            self.anchor_dia_provided_outside_flange = i  # updating anchor dia to check for bearing stress
-                            break
-
-                        self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                        ### update design to check bearing stress ###
-                        self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange, self.dp_anchor_hole_out,
-                                                                                   self.dp_detail_edge_type)
-                        self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                        self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                        self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                        if self.end_distance_out < self.plate_washer_dim_out:
-                            self.end_distance_out = self.plate_washer_dim_out
-                        self.edge_distance_out = self.end_distance_out
-
-                        # fixing bp size and parameters calculations after the iteration checks
-                        if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                            self.bolt_columns_outside_flange = 1
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                        elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                            self.bolt_columns_outside_flange = 2
-                            # provide pitch and gauge
-                            self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.pitch_distance_out < self.plate_washer_dim_out:
-                                self.pitch_distance_out = self.pitch_distance_out
-                            self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            self.gauge_distance_out = self.pitch_distance_out
-
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                               5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                        # recalculating the parameters with updated dimensions
-                        # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                        self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                        self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                        self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                        self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                        # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                        roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                        r_1 = roots[0]
-                        r_2 = roots[1]
-                        r_3 = roots[2]
-                        r = max(r_1, r_2, r_3)
-                        r = r.real  # separating the imaginary part
-                        self.y = round(r)  # mm
-
-                        self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                        self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                        self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                        ### end of update check ###
-                        self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                  ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                        self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        n += 1
-                        # selecting higher dia if the max bearing stress exceeds the limit
-                        if self.max_bearing_stress > self.bearing_strength_concrete:
-                            sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange < x <= 72, self.anchor_dia_list_out)
-                            for i in sort_bolt:
-                                self.anchor_dia_provided_outside_flange = i
-                                break
-
-                        if self.anchor_dia_provided_outside_flange == 72:
-                            self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                      ((self.anchor_area_tension * self.n) * (
-                                                                  (self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                            self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        if ((self.anchor_dia_provided_outside_flange == 72) and (self.max_bearing_stress > self.bearing_strength_concrete)) or \
-                                ((n > itr) and (self.max_bearing_stress > self.bearing_strength_concrete)):
-                            bearing_stress_check = 'Fail'
-                            logger.warning("[Concrete Bearing Check] The compressive stress on the concrete footing/pedestal ({} N/mm2) is greater "
-                                           "than the allowable bearing strength of the concrete ({} N/mm2)".format(round(self.max_bearing_stress, 3),
-                                                                                                           round(self.bearing_strength_concrete, 3)))
-                            logger.info("The check fails with {} numbers of anchors".format(2 * self.anchors_outside_flange))
-                            logger.info("Re-designing the connection with more or higher diameter anchor bolts to reduce the bearing stress")
-
-                            self.anchor_dia_provided_outside_flange = self.anchor_dia_list_out[0]  # initialise with least dia for next iteration
-                            self.anchors_outside_flange = 3  # increase number of bolts if check with 2 bolts fails
-                            self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            break
-
-                # Second iteration
-                if (self.anchors_outside_flange == 3) and (bearing_stress_check == 'Fail'):
-                    # self.anchor_area_tension = self.bolt_area(self.anchor_dia_outside_flange)[0] * self.anchors_outside_flange
-
-                    self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                              ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                    self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                    n = 1
-                    while self.max_bearing_stress > self.bearing_strength_concrete:
-                        itr = len(self.anchor_dia_list_out) + 1
-                        sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange <= x <= 72, self.anchor_dia_list_out)
-                        for i in sort_bolt:
-                            min_bolt_dia = i
-                            break
-
-                        bolt_index = self.anchor_dia_list_out.index(min_bolt_dia)
-                        bolt_list = self.anchor_dia_list_out[bolt_index:]
-
-                        for i in bolt_list:
-                            self.anchor_dia_provided_outside_flange = i  # updating anchor dia to check for bearing stress
-                            break
-
-                        self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                        ### update design to check bearing stress ###
-                        self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange, self.dp_anchor_hole_out,
-                                                                                   self.dp_detail_edge_type)
-                        self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                        self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                        self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                        if self.end_distance_out < self.plate_washer_dim_out:
-                            self.end_distance_out = self.plate_washer_dim_out
-                        self.edge_distance_out = self.end_distance_out
-
-                        # fixing bp size and parameters calculations after the iteration checks
-                        if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                            self.bolt_columns_outside_flange = 1
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                        elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                            self.bolt_columns_outside_flange = 2
-                            # provide pitch and gauge
-                            self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.pitch_distance_out < self.plate_washer_dim_out:
-                                self.pitch_distance_out = self.pitch_distance_out
-                            self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            self.gauge_distance_out = self.pitch_distance_out
-
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                               5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                        # recalculating the parameters with updated dimensions
-                        # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                        self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                        self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                        self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                        self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                        # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                        roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                        r_1 = roots[0]
-                        r_2 = roots[1]
-                        r_3 = roots[2]
-                        r = max(r_1, r_2, r_3)
-                        r = r.real  # separating the imaginary part
-                        self.y = round(r)  # mm
-
-                        self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                        self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                        self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                        ### end of update check ###
-                        self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                  ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                        self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        n += 1
-                        # selecting higher dia if the max bearing stress exceeds the limit
-                        if self.max_bearing_stress > self.bearing_strength_concrete:
-                            sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange < x <= 72, self.anchor_dia_list_out)
-                            for i in sort_bolt:
-                                self.anchor_dia_provided_outside_flange = i
-                                break
-
-                        if self.anchor_dia_provided_outside_flange == 72:
-                            self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                      ((self.anchor_area_tension * self.n) * (
-                                                                  (self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                            self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        if ((self.anchor_dia_provided_outside_flange == 72) and (self.max_bearing_stress > self.bearing_strength_concrete)) or \
-                                ((n > itr) and (self.max_bearing_stress > self.bearing_strength_concrete)):
-                            bearing_stress_check = 'Fail'
-                            logger.warning("[Concrete Bearing Check] The compressive stress on the concrete footing/pedestal ({} N/mm2) is greater "
-                                           "than the allowable bearing strength of the concrete ({} N/mm2)".format(round(self.max_bearing_stress, 3),
-                                                                                                           round(self.bearing_strength_concrete, 3)))
-                            logger.info("The check fails with {} numbers of anchors".format(2 * self.anchors_outside_flange))
-                            logger.info("Re-designing the connection with more or higher diameter anchor bolts to reduce the bearing stress")
-
-                            self.anchor_dia_provided_outside_flange = self.anchor_dia_list_out[0]  # initialise with least dia for next iteration
-                            self.anchors_outside_flange = 4  # increase number of bolts if check fails
-                            self.bolt_columns_outside_flange = 2
-
-                            # # pitch and gauge
-                            # self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            # self.pitch_distance_out = 1.5 * self.pitch_distance_out  # pitch increased to accommodate the end plate at the end of anchor inside footing
-                            #
-                            # self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            # self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            #
-                            # if self.pitch_distance_out < self.plate_washer_dim_out:
-                            #     self.pitch_distance_out = self.pitch_distance_out
-                            #
-                            # self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            # self.gauge_distance_out = self.pitch_distance_out
-                            #
-                            # # updating the bp dimension
-                            # self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                            #                                    5)  # mm
-                            # self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            #
-                            # self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            # self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            #
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            # self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            # self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            # self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            # self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            # r_1 = roots[0]
-                            # r_2 = roots[1]
-                            # r_3 = roots[2]
-                            # r = max(r_1, r_2, r_3)
-                            # r = r.real  # separating the imaginary part
-                            # self.y = round(r)  # mm
-                            #
-                            # self.tension_demand_anchor = (- self.load_axial_compression) * (
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            # if self.tension_demand_anchor < 0:
-                            #     self.tension_demand_anchor = (- 1 * self.tension_demand_anchor)
-                            #
-                            # self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            break
-                        else:  # check for detailing
-                            # updating the end/edge and pitch/gauge distance (if the anchor diameter or numbers is improvised in the above loop(s))
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-
-                            self.edge_distance_out = self.end_distance_out
-
-                            if (0.85 * self.column_bf) < (2 * self.edge_distance_out):
-                                self.safe = False
-                                logger.warning("[Detailing Check] The detailing checks are not satisfied with anchor bolts of {} mm diameter".
-                                               format(self.anchor_dia_provided_outside_flange))
-                                logger.info("Re-designing the connection with lesser anchor bolts of higher diameter and grade combination")
-
-                # Third iteration
-                if (self.anchors_outside_flange == 4) and (bearing_stress_check == 'Fail'):
-                    # self.anchor_area_tension = self.bolt_area(self.anchor_dia_outside_flange)[0] * self.anchors_outside_flange
-
-                    self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                              ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                    self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                    n = 1
-                    while self.max_bearing_stress > self.bearing_strength_concrete:
-                        itr = len(self.anchor_dia_list_out) + 1
-                        sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange <= x <= 72, self.anchor_dia_list_out)
-                        for i in sort_bolt:
-                            min_bolt_dia = i
-                            break
-
-                        bolt_index = self.anchor_dia_list_out.index(min_bolt_dia)
-                        bolt_list = self.anchor_dia_list_out[bolt_index:]
-
-                        for i in bolt_list:
-                            self.anchor_dia_provided_outside_flange = i  # updating anchor dia to check for bearing stress
-                            break
-
-                        self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                        ### update design to check bearing stress ###
-                        self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange, self.dp_anchor_hole_out,
-                                                                                   self.dp_detail_edge_type)
-                        self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                        self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                        self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                        if self.end_distance_out < self.plate_washer_dim_out:
-                            self.end_distance_out = self.plate_washer_dim_out
-                        self.edge_distance_out = self.end_distance_out
-
-                        # fixing bp size and parameters calculations after the iteration checks
-                        if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                            self.bolt_columns_outside_flange = 1
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                        elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                            self.bolt_columns_outside_flange = 2
-                            # provide pitch and gauge
-                            self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.pitch_distance_out < self.plate_washer_dim_out:
-                                self.pitch_distance_out = self.pitch_distance_out
-                            self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            self.gauge_distance_out = self.pitch_distance_out
-
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                               5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                        # recalculating the parameters with updated dimensions
-                        # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                        self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                        self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                        self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                        self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                        # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                        roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                        r_1 = roots[0]
-                        r_2 = roots[1]
-                        r_3 = roots[2]
-                        r = max(r_1, r_2, r_3)
-                        r = r.real  # separating the imaginary part
-                        self.y = round(r)  # mm
-
-                        self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                        self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                        self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                        ### end of update check ###
-                        self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                  ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                        self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        n += 1
-                        # selecting higher dia if the max bearing stress exceeds the limit
-                        if self.max_bearing_stress > self.bearing_strength_concrete:
-                            sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange < x <= 72, self.anchor_dia_list_out)
-                            for i in sort_bolt:
-                                self.anchor_dia_provided_outside_flange = i
-                                break
-
-                        if self.anchor_dia_provided_outside_flange == 72:
-                            self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                      ((self.anchor_area_tension * self.n) * (
-                                                                  (self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                            self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        if ((self.anchor_dia_provided_outside_flange == 72) and (self.max_bearing_stress > self.bearing_strength_concrete)) or \
-                                ((n > itr) and (self.max_bearing_stress > self.bearing_strength_concrete)):
-                            bearing_stress_check = 'Fail'
-                            logger.warning("[Concrete Bearing Check] The compressive stress on the concrete footing/pedestal ({} N/mm2) is greater "
-                                           "than the allowable bearing strength of the concrete ({} N/mm2)".format(round(self.max_bearing_stress, 3),
-                                                                                                           round(self.bearing_strength_concrete, 3)))
-                            logger.info("The check fails with {} numbers of anchors".format(2 * self.anchors_outside_flange))
-                            logger.info("Re-designing the connection with more or higher diameter anchor bolts to reduce the bearing stress")
-
-                            self.anchor_dia_provided_outside_flange = self.anchor_dia_list_out[0]  # initialise with least dia for next iteration
-                            self.anchors_outside_flange = 6  # increase number of bolts if check fails
-                            self.bolt_columns_outside_flange = 2
-
-                            # # provide pitch and gauge
-                            # self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            # self.pitch_distance_out = 1.5 * self.pitch_distance_out  # pitch increased to accommodate the end plate at the end of anchor inside footing
-                            #
-                            # self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            # self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            #
-                            # if self.pitch_distance_out < self.plate_washer_dim_out:
-                            #     self.pitch_distance_out = self.pitch_distance_out
-                            #
-                            # self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            # self.gauge_distance_out = self.pitch_distance_out
-                            #
-                            # # updating the bp dimension
-                            # self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                            #                                    5)  # mm
-                            # self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            #
-                            # self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            # self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            #
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            # self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            # self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            # self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            # self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            # r_1 = roots[0]
-                            # r_2 = roots[1]
-                            # r_3 = roots[2]
-                            # r = max(r_1, r_2, r_3)
-                            # r = r.real  # separating the imaginary part
-                            # self.y = round(r)  # mm
-                            #
-                            # self.tension_demand_anchor = (- self.load_axial_compression) * (
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            # if self.tension_demand_anchor < 0:
-                            #     self.tension_demand_anchor = (- 1 * self.tension_demand_anchor)
-                            #
-                            # self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            break
-
-                # Fourth iteration
-                if (self.anchors_outside_flange == 6) and (bearing_stress_check == 'Fail'):
-                    # self.anchor_area_tension = self.bolt_area(self.anchor_dia_outside_flange)[0] * self.anchors_outside_flange
-
-                    self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                              ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                    self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                    n = 1
-                    while self.max_bearing_stress > self.bearing_strength_concrete:
-                        itr = len(self.anchor_dia_list_out) + 1
-                        sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange <= x <= 72, self.anchor_dia_list_out)
-                        for i in sort_bolt:
-                            min_bolt_dia = i
-                            break
-
-                        bolt_index = self.anchor_dia_list_out.index(min_bolt_dia)
-                        bolt_list = self.anchor_dia_list_out[bolt_index:]
-                        # print(len(bolt_list))
-
-                        for i in bolt_list:
-                            self.anchor_dia_provided_outside_flange = i  # updating anchor dia to check for bearing stress
-                            break
-
-                        self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                        ### update design to check bearing stress ###
-                        self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange, self.dp_anchor_hole_out,
-                                                                                   self.dp_detail_edge_type)
-                        self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                        self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                        self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                        if self.end_distance_out < self.plate_washer_dim_out:
-                            self.end_distance_out = self.plate_washer_dim_out
-                        self.edge_distance_out = self.end_distance_out
-
-                        # fixing bp size and parameters calculations after the iteration checks
-                        if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                            self.bolt_columns_outside_flange = 1
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                        elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                            self.bolt_columns_outside_flange = 2
-                            # provide pitch and gauge
-                            self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.pitch_distance_out < self.plate_washer_dim_out:
-                                self.pitch_distance_out = self.pitch_distance_out
-                            self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            self.gauge_distance_out = self.pitch_distance_out
-
-                            # updating the bp dimension
-                            self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                               5)  # mm
-                            self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                        # recalculating the parameters with updated dimensions
-                        # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                        self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                        self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                        self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                        self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                        # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                        roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                        r_1 = roots[0]
-                        r_2 = roots[1]
-                        r_3 = roots[2]
-                        r = max(r_1, r_2, r_3)
-                        r = r.real  # separating the imaginary part
-                        self.y = round(r)  # mm
-
-                        self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                        self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                        self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                        ### end of update check ###
-                        self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                  ((self.anchor_area_tension * self.n) * ((self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                        self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        n += 1
-                        # selecting higher dia if the max bearing stress exceeds the limit
-                        if self.max_bearing_stress > self.bearing_strength_concrete:
-                            sort_bolt = filter(lambda x: self.anchor_dia_provided_outside_flange < x <= 72, self.anchor_dia_list_out)
-                            for i in sort_bolt:
-                                self.anchor_dia_provided_outside_flange = i
-                                break
-
-                        if self.anchor_dia_provided_outside_flange == 72:
-                            self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            self.max_bearing_stress = (self.tension_demand_anchor * 1000 * self.y) / \
-                                                      ((self.anchor_area_tension * self.n) * (
-                                                                  (self.bp_length_provided / 2) - self.y + self.f))  # N/mm^2
-                            self.max_bearing_stress = abs(self.max_bearing_stress)
-
-                        if ((self.anchor_dia_provided_outside_flange == 72) and (self.max_bearing_stress > self.bearing_strength_concrete)) or \
-                                ((n > itr) and (self.max_bearing_stress > self.bearing_strength_concrete)):
-                            bearing_stress_check = 'Fail'
-                            logger.warning("[Concrete Bearing Check] The compressive stress on the concrete footing/pedestal ({} N/mm2) is greater "
-                                           "than the allowable bearing strength of the concrete ({} N/mm2)".format(round(self.max_bearing_stress, 3),
-                                                                                                           round(self.bearing_strength_concrete, 3)))
-                            logger.info("The check fails with {} numbers of anchors".format(2 * self.anchors_outside_flange))
-                            logger.info("Re-designing the connection with more or higher diameter anchor bolts to reduce the bearing stress")
-
-                            self.anchor_dia_provided_outside_flange = self.anchor_dia_list_out[0]  # initialise with least dia for next iteration
-                            self.anchors_outside_flange = 8
-                            self.bolt_columns_outside_flange = 2
-
-                            # # provide pitch and gauge
-                            # self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                            # self.pitch_distance_out = 1.5 * self.pitch_distance_out  # pitch increased to accommodate the end plate at the end of anchor inside footing
-                            #
-                            # self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            # self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            #
-                            # if self.pitch_distance_out < self.plate_washer_dim_out:
-                            #     self.pitch_distance_out = self.pitch_distance_out
-                            #
-                            # self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                            # self.gauge_distance_out = self.pitch_distance_out
-                            #
-                            # # updating the bp dimension
-                            # self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                            #                                    5)  # mm
-                            # self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                            #
-                            # self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                            # self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            #
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            # self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            # self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            # self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            # self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            # r_1 = roots[0]
-                            # r_2 = roots[1]
-                            # r_3 = roots[2]
-                            # r = max(r_1, r_2, r_3)
-                            # r = r.real  # separating the imaginary part
-                            # self.y = round(r)  # mm
-                            #
-                            # self.tension_demand_anchor = (- self.load_axial_compression) * (
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                            #         ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            # if self.tension_demand_anchor < 0:
-                            #     self.tension_demand_anchor = (- 1 * self.tension_demand_anchor)
-                            #
-                            # self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-                            ### update design to check bearing stress ###
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-                            self.end_distance_out = round_up(1.5 * self.end_distance_out, 5)
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-                            self.edge_distance_out = self.end_distance_out
-
-                            # fixing bp size and parameters calculations after the iteration checks
-                            if (self.anchors_outside_flange == 2) or (self.anchors_outside_flange == 3):
-                                self.bolt_columns_outside_flange = 1
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)), 5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-                            elif (self.anchors_outside_flange == 4) or (self.anchors_outside_flange == 6):
-                                self.bolt_columns_outside_flange = 2
-                                # provide pitch and gauge
-                                self.pitch_distance_out = self.cl_10_2_2_min_spacing(self.anchor_dia_provided_outside_flange)  # mm
-                                self.pitch_distance_out = 1.5 * self.pitch_distance_out
-
-                                self.plate_washer_details_out = IS6649.square_washer_dimensions(
-                                    self.anchor_dia_provided_outside_flange)  # outside flange
-                                self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                                if self.pitch_distance_out < self.plate_washer_dim_out:
-                                    self.pitch_distance_out = self.pitch_distance_out
-                                self.pitch_distance_out = round_up(self.pitch_distance_out, 5)
-                                self.gauge_distance_out = self.pitch_distance_out
-
-                                # updating the bp dimension
-                                self.bp_length_provided = round_up(self.column_D + (2 * (2 * self.end_distance_out)) + (2 * self.pitch_distance_out),
-                                                                   5)  # mm
-                                self.bp_width_provided = round_up((0.85 * self.column_bf) + (2 * (2 * self.edge_distance_out)), 5)  # mm
-                                self.bp_length_provided = max(self.bp_length_provided, round_up(self.column_D + (2 * 100), 5))
-                                self.bp_width_provided = max(self.bp_width_provided, round_up(self.column_bf + (2 * 100), 5))
-
-                            # recalculating the parameters with updated dimensions
-                            # self.anchor_area_tension = self.bolt_area(self.anchor_dia_provided_outside_flange)[0] * self.anchors_outside_flange
-                            self.f = (self.bp_length_provided / 2) - self.end_distance_out  # mm
-                            self.k1 = 3 * (self.eccentricity_zz - (self.bp_length_provided / 2))
-                            self.k2 = ((6 * self.n * self.anchor_area_tension) / self.bp_width_provided) * (self.f + self.eccentricity_zz)
-                            self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
-                            # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                            roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                            r_1 = roots[0]
-                            r_2 = roots[1]
-                            r_3 = roots[2]
-                            r = max(r_1, r_2, r_3)
-                            r = r.real  # separating the imaginary part
-                            self.y = round(r)  # mm
-
-                            self.tension_demand_anchor = (- self.load_axial_compression) * (
-                                    ((self.bp_length_provided / 2) - (self.y / 3) - self.eccentricity_zz) /
-                                    ((self.bp_length_provided / 2) - (self.y / 3) + self.f))  # N
-                            self.tension_demand_anchor = abs(self.tension_demand_anchor)
-                            self.tension_demand_anchor = round(self.tension_demand_anchor / 1000, 2)  # kN
-
-                            ### end of update check ###
-                            break
-                        else:  # check for detailing
-                            # updating the end/edge and pitch/gauge distance (if the anchor diameter or numbers is improvised in the above loop(s))
-                            self.end_distance_out = self.cl_10_2_4_2_min_edge_end_dist(self.anchor_dia_provided_outside_flange,
-                                                                                       self.dp_anchor_hole_out,
-                                                                                       self.dp_detail_edge_type)
-
-                            self.plate_washer_details_out = IS6649.square_washer_dimensions(self.anchor_dia_provided_outside_flange)  # outside flange
-                            self.plate_washer_dim_out = self.plate_washer_details_out['side']  # outside flange, mm
-
-                            if self.end_distance_out < self.plate_washer_dim_out:
-                                self.end_distance_out = self.plate_washer_dim_out
-
-                            self.edge_distance_out = self.end_distance_out
-
-                            if (0.85 * self.column_bf) < (2 * self.edge_distance_out):
-                                self.safe = False
-                                logger.warning("[Detailing Check] The detailing checks are not satisfied with anchor bolts of {} mm diameter".
-                                               format(self.anchor_dia_provided_outside_flange))
-                                logger.info("Re-designing the connection with lesser anchor bolts of higher diameter and grade combination")
+                if bearing_stress_check == 'Fail':
+                    bearing_stress_check = self.anchor_bearing_search()
 
                 # maximum allowed bolts is 6
                 if (self.anchors_outside_flange >= 8) and (bearing_stress_check == 'Fail'):
@@ -4652,12 +3601,7 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
                 self.k3 = ((self.bp_length_provided / 2) + self.f) * -self.k2
 
                 # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                r_1 = roots[0]
-                r_2 = roots[1]
-                r_3 = roots[2]
-                r = max(r_1, r_2, r_3)
-                r = r.real  # separating the imaginary part
+                r = cubic_max_real_root(self.k1, self.k2, self.k3)  # largest real root of the equation
 
                 self.y = round(r)  # mm
 
@@ -4785,12 +3729,7 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
                 self.k3 = round(((self.bp_length_provided / 2) + self.f) * -self.k2, 2)
 
                 # equation for finding 'y' is: y^3 + k1*y^2 + k2*y + k3 = 0
-                roots = np.roots([1, self.k1, self.k2, self.k3])  # finding roots of the equation
-                r_1 = roots[0]
-                r_2 = roots[1]
-                r_3 = roots[2]
-                r = max(r_1, r_2, r_3)
-                r = r.real  # separating the imaginary part
+                r = cubic_max_real_root(self.k1, self.k2, self.k3)  # largest real root of the equation
 
                 self.y = round(r)  # mm
 
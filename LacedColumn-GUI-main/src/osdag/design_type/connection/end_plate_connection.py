@@ -1143,37 +1143,16 @@ class EndPlateConnection(ShearConnection):
 
     def design_weld(self,available_welds):
         self.weld.design_status = False
-        self.weld.size = available_welds[0]
+        force_h = self.load.shear_force * 1000
+        force_l = self.load.axial_force * 1000
         while self.plate.height <= self.max_plate_height:
             self.weld.length = self.plate.height
-            self.weld.throat_tk = IS800_2007.cl_10_5_3_2_fillet_weld_effective_throat_thickness(
-                fillet_size=self.weld.size, fusion_face_angle=90)
-            self.weld.eff_length = IS800_2007.cl_10_5_4_1_fillet_weld_effective_length(
-                fillet_size=self.weld.size, available_length=self.weld.length)
-            self.weld.get_weld_strength(connecting_fu=[self.plate.fu, self.supported_section.fu,self.weld.fu],
-                                                weld_fabrication=self.weld.fabrication,
-                                                t_weld=self.weld.size, weld_angle=90)
-            self.beta_lw = IS800_2007.cl_10_5_7_3_weld_long_joint(self.weld.eff_length, self.weld.throat_tk)
-            self.weld.strength = self.weld.strength * self.beta_lw
-            force_h = self.load.shear_force * 1000
-            force_l = self.load.axial_force * 1000
-            # force_t = self.plate.moment_demand
-            self.weld.get_weld_stress(force_h, force_l, l_weld=2*self.weld.eff_length, weld_twist= 0.0, Ip_weld=0.0, y_max=0.0,
-                                                        x_max=0.0)
-            if self.weld.strength > self.weld.stress:
+            if self.weld.design_size(available_welds, connecting_fu=[self.plate.fu, self.supported_section.fu, self.weld.fu],
+                                     weld_shear=force_h, weld_axial=force_l, weld_angle=90, long_joint=True):
                 break
-            else:
-                t_weld_req = self.weld.size * self.weld.stress / self.weld.strength
-                print(t_weld_req)
-                available_welds_updated = list([x for x in available_welds if (t_weld_req <= x)])
-                print(available_welds_updated)
-                if not available_welds_updated:
-                    self.plate.height += 10
-                    self.weld.size = available_welds[0]
-                    logger.warning('Weld stress is guiding plate height, trying with a length of %2.2f mm' % self.plate.height)
-                else:
-                    self.weld.size = available_welds_updated[0]
-        print(self.weld.size, self.weld.length)
+            self.plate.height += 10
+            logger.warning('Weld stress is guiding plate height, trying with a length of %2.2f mm' % self.plate.height)
+        self.beta_lw = self.weld.beta_lw
         if self.weld.strength < self.weld.stress:
             self.weld.t_weld_req = self.weld.size * self.weld.stress / self.weld.strength
             self.weld.design_status = False
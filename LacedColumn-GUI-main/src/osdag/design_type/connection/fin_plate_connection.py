@@ -929,23 +929,9 @@ class FinPlateConnection(ShearConnection):
         force_w = self.load.axial_force*1000
         force_t = self.plate.moment_demand
 
-        for self.weld.size in available_welds:
-            self.weld.eff_length = IS800_2007.cl_10_5_4_1_fillet_weld_effective_length(
-                fillet_size=self.weld.size, available_length=self.weld.length)
-            self.weld.throat_tk = IS800_2007.cl_10_5_3_2_fillet_weld_effective_throat_thickness(
-                fillet_size=self.weld.size, fusion_face_angle=90)
-            Ip_weld = 2 * self.weld.eff_length ** 3 / 12
-            y_max = self.weld.eff_length / 2
-            x_max = 0
-            self.weld.get_weld_strength(connecting_fu=[self.supporting_section.fu, self.plate.fu, self.weld.fu],
-                                        weld_fabrication=self.weld.fabrication,
-                                        t_weld=self.weld.size, weld_angle=90)
-            self.weld.get_weld_stress(weld_axial=force_w, weld_shear=force_l, weld_twist=force_t, Ip_weld=Ip_weld,
-                                      y_max=y_max,
-                                      x_max=x_max, l_weld=2 * self.weld.eff_length)
-            if self.weld.strength > self.weld.stress:
-                self.weld.design_status = True
-                break
+        if self.weld.design_size(available_welds, connecting_fu=[self.supporting_section.fu, self.plate.fu, self.weld.fu],
+                                 weld_shear=force_l, weld_axial=force_w, weld_twist=force_t, weld_angle=90):
+            self.weld.design_status = True
 
         if self.weld.strength < self.weld.stress:
             self.weld.design_status = False
@@ -33,8 +33,13 @@ from ...utils.common.common_calculation import *
 from ..tension_member import *
 from ...utils.common.Section_Properties_Calculator import BBAngle_Properties
 from ...utils.common import is800_2007
+from ...utils.common.flexure_sweep import section_columns, elastic_lateral_torsional_buckling_moment, \
+    non_dimensional_slenderness_lt, beam_strength_envelope
+from ...utils.common.load_cases import LoadCases
+from ...utils.common.section_classification import classify_sections
+from ...utils.common.section_results import SectionResults
+from ...utils.common.instrumentation import count, timed, trace
 from ...utils.common.component import *
-from osdag.cad.items.plate import Plate
 
 class Flexure(Member):
 
@@ -309,7 +314,7 @@ class Flexure(Member):
             return list(set(res1 + res2))
 
     def fn_torsion_warping(self):
-        print( 'Inside fn_torsion_warping', self)
+        trace.debug('Inside fn_torsion_warping %s', self)
         if self[0] == Torsion_Restraint1:
             return Warping_Restraint_list
         elif self[0] == Torsion_Restraint2:
@@ -319,7 +324,7 @@ class Flexure(Member):
 
 
     def fn_supp_image(self):
-        print( 'Inside fn_supp_image', self)
+        trace.debug('Inside fn_supp_image %s', self)
         if self[0] == KEY_DISP_SUPPORT1:
             return Simply_Supported_img
         else:
@@ -327,7 +332,7 @@ class Flexure(Member):
 
     def axis_bending_change(self):
         design = self[0]
-        print( 'Inside fn_supp_image', self)
+        trace.debug('Inside fn_supp_image %s', self)
         if self[0] == KEY_DISP_DESIGN_TYPE_FLEXURE:
             return ['NA']
         else:
@@ -431,7 +436,7 @@ class Flexure(Member):
         return lst
 
     def warning_majorbending(self):
-        print(self)
+        trace.debug('%s', self)
         if self[0] == VALUES_SUPP_TYPE_temp[2]:
             return True
         # elif self[0] == VALUES_SUPP_TYPE_temp[0] or self[0] == VALUES_SUPP_TYPE_temp[1] :
@@ -440,7 +445,7 @@ class Flexure(Member):
             return False
 
     def output_modifier(self):
-        print(self)
+        trace.debug('%s', self)
         if self[0] == VALUES_SUPP_TYPE_temp[2]:
             return False
         # elif self[0] == VALUES_SUPP_TYPE_temp[0] or self[0] == VALUES_SUPP_TYPE_temp[1] :
@@ -449,7 +454,7 @@ class Flexure(Member):
             return True
 
     def Design_pref_modifier(self):
-        print("Design_pref_modifier",self)
+        trace.debug('Design_pref_modifier %s', self)
 
 
     def output_values(self, flag):
@@ -664,7 +669,7 @@ class Flexure(Member):
 
         return spacing
     def func_for_validation(self, design_dictionary):
-        print(f"func_for_validation here")
+        trace.debug('func_for_validation here')
         all_errors = []
         self.design_status = False
         flag = False
@@ -674,9 +679,7 @@ class Flexure(Member):
         flag3 = False
         option_list = self.input_values(self)
         missing_fields_list = []
-        print(f'func_for_validation option_list {option_list}'
-            f"\n  design_dictionary {design_dictionary}"
-              )
+        trace.debug('func_for_validation option_list %s   design_dictionary %s', option_list, design_dictionary)
         for option in option_list:
             if option[2] == TYPE_TEXTBOX or option[0] == KEY_LENGTH or option[0] == KEY_SHEAR or option[0] == KEY_MOMENT:
                 try:
@@ -685,7 +688,7 @@ class Flexure(Member):
                         continue
                     if option[0] == KEY_LENGTH:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
 
@@ -693,14 +696,14 @@ class Flexure(Member):
                             flag1 = True
                     elif option[0] == KEY_SHEAR:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
                         else:
                             flag2 = True
                     elif option[0] == KEY_MOMENT:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
                         else:
@@ -726,7 +729,7 @@ class Flexure(Member):
             flag = True
 
         if flag and flag1 and flag2 and flag3:
-            print(f"\n design_dictionary{design_dictionary}")
+            trace.debug('design_dictionary%s', design_dictionary)
             self.set_input_values(self, design_dictionary)
             if self.design_status ==False and len(self.failed_design_dict)>0:
                 logger.error(
@@ -781,8 +784,8 @@ class Flexure(Member):
         self.mainmodule = KEY_Flexure_Member_MAIN_MODULE
         self.sec_profile = design_dictionary[KEY_SEC_PROFILE]
         self.sec_list = design_dictionary[KEY_SECSIZE]
-        print(f"\n Inside set_input_values{self.sec_profile}")
-        print(f"\n sec_profile{self.sec_list}")
+        trace.debug('Inside set_input_values%s', self.sec_profile)
+        trace.debug('sec_profile%s', self.sec_list)
         self.main_material = design_dictionary[KEY_MATERIAL]
         self.material = design_dictionary[KEY_SEC_MATERIAL]
 
@@ -817,6 +820,11 @@ class Flexure(Member):
             moment=design_dictionary[KEY_MOMENT],
             unit_kNm=True,
         )
+        # load cases of the design (the forces of the input dock without a table of cases); every section is checked
+        # under all the cases
+        self.load_cases = LoadCases.from_design_dictionary(design_dictionary, axial_key=None)
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.envelope_load()
 
         # design preferences
         # self.allowable_utilization_ratio = float(design_dictionary[KEY_ALLOW_UR])
@@ -833,16 +841,16 @@ class Flexure(Member):
         if self.allow_class == "Yes":
             self.allowed_sections == KEY_SemiCompact
 
-        print(f"self.allowed_sections {self.allowed_sections}")
-        print("==================")
+        trace.debug('self.allowed_sections %s', self.allowed_sections)
+        trace.debug('==================')
         # print(f"self.load_type {self.load_type}")
 
-        print(f"self.module{self.module}")
-        print(f"self.sec_list {self.sec_list}")
-        print(f"self.material {self.material}")
-        print(f"self.length {self.length}")
-        print(f"self.load {self.load}")
-        print("==================")
+        trace.debug('self.module%s', self.module)
+        trace.debug('self.sec_list %s', self.sec_list)
+        trace.debug('self.material %s', self.material)
+        trace.debug('self.length %s', self.length)
+        trace.debug('self.load %s', self.load)
+        trace.debug('==================')
 
         # safety factors
         self.gamma_m0 = IS800_2007.cl_5_4_1_Table_5["gamma_m0"]["yielding"]
@@ -851,7 +859,7 @@ class Flexure(Member):
         self.fyf = self.material_property.fy
         self.fyw = self.material_property.fy
 
-        print(f"self.material_property {self.material_property}]")
+        trace.debug('self.material_property %s]', self.material_property)
         # print( "self.material_property",self.material_property.fy)
         # initialize the design status
         self.design_status_list = []
@@ -886,7 +894,7 @@ class Flexure(Member):
         '''
         TODO add button to give user option to take Tension holes or not
         '''
-        print(f"\n Inside optimization_tab_check")
+        trace.debug('Inside optimization_tab_check')
         self.latex_tension_zone = False
         if (self.effective_area_factor <= 0.10) or (self.effective_area_factor > 1.0):
             logger.error(
@@ -915,7 +923,7 @@ class Flexure(Member):
                     pass
                 else:
                     self.latex_tension_zone = True
-                    print(f'self.latex_tension_zone: {self.latex_tension_zone}')
+                    trace.debug('self.latex_tension_zone: %s', self.latex_tension_zone)
                 # self.effective_area_factor = (
                 #     self.material_property.fy
                 #     * self.gamma_m0
@@ -929,7 +937,7 @@ class Flexure(Member):
 
     def input_modifier(self):
         """Classify the sections based on Table 2 of IS 800:2007"""
-        print(f"Inside input_modifier")
+        trace.debug('Inside input_modifier')
         local_flag = True
         self.input_modified = []
         self.input_section_list = []
@@ -940,7 +948,7 @@ class Flexure(Member):
             self.section_property = self.section_connect_database(self, section)
 
             self.Zp_req = self.load.moment * self.gamma_m0 / self.material_property.fy
-            print('Inside input_modifier not allow_class',self.allow_class,self.load.moment, self.gamma_m0, self.material_property.fy)
+            trace.debug('Inside input_modifier not allow_class %s %s %s %s', self.allow_class, self.load.moment, self.gamma_m0, self.material_property.fy)
             if self.section_property.plast_sec_mod_z >= self.Zp_req:
 
                 self.input_modified.append(section)
@@ -952,11 +960,12 @@ class Flexure(Member):
                 # logger.warning(
                 #     f"Required self.Zp_req = {round(self.Zp_req* 10**-3,2)} x 10^3 mm^3 and Zp of section {self.section_property.designation} = {round(self.section_property.plast_sec_mod_z* 10**-3,2)} x 10^3 mm^3.Section dosen't satisfy Min self.Zp_req value")
         # logger.info("")
-        print("self.input_modified", self.input_modified)
+        trace.debug('self.input_modified %s', self.input_modified)
 
+    @timed('flexure.section_load')
     def section_connect_database(self, section):
-        print(f"section_connect_database{section}")
-        print(section)
+        trace.debug('section_connect_database%s', section)
+        trace.debug('%s', section)
         # print(self.sec_profile)
         if (
             self.sec_profile == VALUES_SECTYPE[1]
@@ -968,13 +977,14 @@ class Flexure(Member):
             self.material_property.connect_to_database_to_get_fy_fu(
                 self.material, max(self.section_property.flange_thickness, self.section_property.web_thickness)
             )
-            print(f"section_connect_database material_property.fy{self.material_property.fy}")
+            trace.debug('section_connect_database material_property.fy%s', self.material_property.fy)
             self.epsilon = math.sqrt(250 / self.material_property.fy)
         return self.section_property
 
+    @timed('flexure.design')
     def design_beam(self, design_dictionary):
         # 1- Based on optimum UR
-        self.optimum_section_ur_results = {}
+        self.section_results = SectionResults()
         self.optimum_section_ur = []
 
         # 2 - Based on optimum cost
@@ -984,7 +994,7 @@ class Flexure(Member):
         # 1 - section classification
         self.flag = self.section_classification(self,design_dictionary)
 
-        print('self.flag:',self.flag)
+        trace.debug('self.flag: %s', self.flag)
         if self.effective_area_factor < 1.0:
             logger.warning(
                 "Reducing the effective sectional area as per the definition in the Design Preferences tab."
@@ -994,29 +1004,16 @@ class Flexure(Member):
                 "The effective sectional area is taken as 100% of the cross-sectional area [Reference: Cl. 7.3.2, IS 800:2007]."
             )
         # Effective length
-        print(
-            f"self.effective_length {self.effective_length} \n self.input_section_classification{self.input_section_classification} ")
-        print('self.input_section_list:',self.input_section_list)
+        trace.debug('self.effective_length %s   self.input_section_classification%s', self.effective_length, self.input_section_classification)
+        trace.debug('self.input_section_list: %s', self.input_section_list)
         if self.flag:
-            for section in self.input_section_list:
+            # shear and bending strength of all the sections, evaluated at once
+            self.strength_sweep = self.beam_strength_sweep(self, design_dictionary)
+            for i, section in enumerate(self.input_section_list):
                 # initialize lists for updating the results dictionary
-                self.section_property = self.section_connect_database(self, section)
-                if self.section_property.type == 'Rolled':
-                    self.effective_depth = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius))
-                else:
-                    self.effective_depth = (self.section_property.depth - 2 *self.section_property.flange_thickness )
-                print('self.section_property.type:',self.section_property.type, self.bending_type)
-
-                if self.sec_profile == 'Beams' or self.sec_profile == 'Columns' or self.sec_profile == VALUES_SECTYPE[1]:
-                    if self.section_property.type == "Rolled" and self.bending_type == KEY_DISP_BENDING1:
-                        self.shear_area = self.section_property.depth * self.section_property.web_thickness
-                    elif self.section_property.type != "Rolled" and self.bending_type == KEY_DISP_BENDING1:
-                        self.shear_area = self.effective_depth * self.section_property.web_thickness
-                    elif self.bending_type == KEY_DISP_BENDING2:
-                        self.shear_area = 2 * self.section_property.flange_width * self.section_property.flange_thickness
-
-                self.effective_length_beam(self, design_dictionary, self.length)  # mm
+                self.beam_strength_row(self, self.strength_sweep, i)
+                count('flexure.sections_checked')
+                trace.debug('self.section_property.type: %s %s', self.section_property.type, self.bending_type)
 
                 # Step 1.1 - computing the effective sectional area
                 self.effective_area = self.section_property.area
@@ -1027,7 +1024,7 @@ class Flexure(Member):
                 list_1 = []
                 list_result.append(section)
                 self.section_class = self.input_section_classification[section][0]
-                print(f"Inside design_beam self.design_type:{self.design_type}")
+                trace.debug('Inside design_beam self.design_type:%s', self.design_type)
 
                 if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
                      self.It = self.input_section_classification[section][ 5 ]
@@ -1037,35 +1034,19 @@ class Flexure(Member):
                      self.beta_b_lt = self.input_section_classification[section][ 9 ]
                      self.lambda_lt = self.input_section_classification[section][ 10 ]
                      self.fcrb = self.input_section_classification[section][ 11 ]
-                     print('self.design_type:',self.design_type, self.It,
-                            self.hf,
-                            self.Iw,
-                            self.M_cr,
-                            self.beta_b_lt,
-                            self.lambda_lt)
-
-                self.beam_web_buckling(self)
-                if self.web_buckling_check:
-                    self.web_not_buckling_steps(self)
-
-                    # self.shear_strength = IS800_2007.cl_8_4_design_shear_strength(
-                    #     self.shear_area,
-                    #     self.material_property.fy
-                    # ) / 10 ** 3
-                    # self.high_shear_check = IS800_2007.cl_8_2_1_2_high_shear_check(
-                    #     self.load.shear_force / 1000, self.shear_strength
-                    # )
-                    # self.bending_strength_section = self.bending_strength() / 10 ** 6
-
-                    # self.web_buckling_steps(self)
-                    # self.high_shear_check = False
-                    # self.bending_strength_section = self.bending_strength_girder(self) / 10 ** 6
+                     trace.debug('self.design_type: %s %s %s %s %s %s %s', self.design_type, self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, self.lambda_lt)
+
+                self.web_buckling_check = IS800_2007.cl_8_2_1_web_buckling(
+                    d=self.effective_depth,
+                    tw=self.section_property.web_thickness,
+                    e=self.epsilon,
+                )
 
                 # print(f"Common result {list_result, self.section_class, self.V_d, self.high_shear_check, self.bending_strength_section}")
-                print('self.bending_strength_section',self.bending_strength_section,'self.shear_strength',self.shear_strength, 'self.load.moment',self.load.moment,'self.load.shear_force',self.load.shear_force)
+                trace.debug('self.bending_strength_section %s self.shear_strength %s self.load.moment %s self.load.shear_force %s', self.bending_strength_section, self.shear_strength, self.load.moment, self.load.shear_force)
                 # 2.8 - UR
-                self.ur = max((self.load.moment / self.bending_strength_section * 10 ** -6),(self.load.shear_force / self.shear_strength * 10 ** -3))# ( +  round(self.load.axial_force / self.section_capacity, 3)
-                print("UR", self.ur)
+                self.ur = float(self.strength_sweep['ur'][i])
+                trace.debug('UR %s', self.ur)
                 # 2.9 - Cost of the section in INR
                 self.cost = (
                         (
@@ -1080,7 +1061,7 @@ class Flexure(Member):
                 self.web_buckling = False  # When Bearing length is provided
 
                 if self.bearing_length != 'NA': #and self.web_crippling
-                    print(f"Check for Web Buckling")
+                    trace.debug('Check for Web Buckling')
                     try:
                         self.bearing_length = float(design_dictionary[KEY_BEARING_LENGTH])
                         self.web_buckling = True  # WEB BUCKLING
@@ -1098,10 +1079,9 @@ class Flexure(Member):
                                 self.design_compressive_stress * (
                                     self.bearing_length + self.section_property.depth / 2) * self.section_property.web_thickness
                                 * 10 ** -3)  # N
-                        print(self.design_compressive_stress, self.bearing_length, self.section_property.depth,
-                            self.section_property.web_thickness)
+                        trace.debug('%s %s %s %s', self.design_compressive_stress, self.bearing_length, self.section_property.depth, self.section_property.web_thickness)
 
-                        print(self.bending_strength_section, self.shear_strength, self.section_capacity)
+                        trace.debug('%s %s %s', self.bending_strength_section, self.shear_strength, self.section_capacity)
 
                         self.F_wb = (self.bearing_length + 2.5 * (
                                     self.section_property.root_radius + self.section_property.flange_thickness)) * self.section_property.web_thickness * self.material_property.fy / (
@@ -1122,7 +1102,7 @@ class Flexure(Member):
                         self.bearing_length = 'NA'
                         self.web_buckling = False
                         # 2.8 - UR
-                        print(self.bending_strength_section, self.shear_strength)
+                        trace.debug('%s %s', self.bending_strength_section, self.shear_strength)
                         if self.bending_strength_section > self.load.moment * 10 ** -6 and self.shear_strength > self.load.shear_force * 10 ** -3:
                             list_result, list_1 = self.list_changer(self, change='', check=True,list=list_result, list_name=list_1)
                             self.optimum_section_ur.append(self.ur)
@@ -1139,7 +1119,7 @@ class Flexure(Member):
                 else:
                     self.web_buckling = False
                     # 2.8 - UR
-                    print(self.bending_strength_section, self.shear_strength)
+                    trace.debug('%s %s', self.bending_strength_section, self.shear_strength)
                     if self.bending_strength_section > self.load.moment * 10**-6 and self.shear_strength > self.load.shear_force * 10**-3:
 
                         self.optimum_section_ur.append(self.ur)
@@ -1153,23 +1133,23 @@ class Flexure(Member):
 
                         # Step 3 - Storing the optimum results to a list in a descending order
                         self.common_checks_1(self, section, 5, list_result, list_1)
-                print('self.optimum_section_ur', self.optimum_section_ur)
+                trace.debug('self.optimum_section_ur %s', self.optimum_section_ur)
 
     def beam_web_buckling(self):
 
-        print(f"Working web_buckling_check")
+        trace.debug('Working web_buckling_check')
         # 3 - web buckling under shear
         self.web_buckling_check = IS800_2007.cl_8_2_1_web_buckling(
             d=self.effective_depth,
             tw=self.section_property.web_thickness,
             e=self.epsilon,
         )
-        print(self.web_buckling_check, self.section_property.designation)
+        trace.debug('%s %s', self.web_buckling_check, self.section_property.designation)
 
         if not self.web_buckling_check:
             self.web_not_buckling_steps(self)
     def web_buckling_steps(self):
-        print(f"Not using web_buckling_steps")
+        trace.debug('Not using web_buckling_steps')
         # logger.info(f"Considering  {self.support_cndition_shear_buckling}")
         # 5 - Web Buckling check(when high shear) -If user wants then only
         # if web_buckling:
@@ -1199,15 +1179,15 @@ class Flexure(Member):
                                                      self.load.moment / (
                                                              self.section_property.depth - self.section_property.flange_thickness),
                                                      self.gamma_m0)
-            print('MFr', self.Mfr)
+            trace.debug('MFr %s', self.Mfr)
             if self.Mfr > 0:
-                print('Starting loop', int(round(self.effective_length*10**4/self.effective_depth,-1)/10))
+                trace.debug('Starting loop %s', int(round(self.effective_length * 10 ** 4 / self.effective_depth, -1) / 10))
                 # for c_d in range(3,self.effective_length/self.result_eff_d):
                 for c_d in reversed(list(range(3,int(round(self.effective_length * 1000/self.effective_depth,-1))))):
-                    print('c_d',c_d,'c/d',self.effective_length * 1000/self.effective_depth)
+                    trace.debug('c_d %s c/d %s', c_d, self.effective_length * 1000 / self.effective_depth)
                     c_d = c_d/10 + 0.1
                     self.c = round(c_d * self.effective_depth, -1)
-                    print('c',self.c)
+                    trace.debug('c %s', self.c)
                     self.K_v = IS800_2007.cl_8_4_2_2_K_v_Simple_postcritical('many support', self.c, self.effective_depth)
                     self.plate_girder_strength2(self)
 
@@ -1221,7 +1201,7 @@ class Flexure(Member):
             else:
                 self.shear_strength = 0.1
     def web_not_buckling_steps(self):
-        print(f"Working web_not_buckling_steps")
+        trace.debug('Working web_not_buckling_steps')
         self.V_d = IS800_2007.cl_8_4_design_shear_strength(
             self.shear_area,
             self.material_property.fy
@@ -1230,14 +1210,92 @@ class Flexure(Member):
         self.high_shear_check = IS800_2007.cl_8_2_1_2_high_shear_check(
             self.load.shear_force / 1000, self.V_d
         )
-        print(f"self.V_d {self.V_d},{self.section_property.depth* self.section_property.web_thickness}, {self.material_property.fy}")
+        trace.debug('self.V_d %s,%s, %s', self.V_d, self.section_property.depth * self.section_property.web_thickness, self.material_property.fy)
         # 4 -  design bending strength
         self.bending_strength_section = self.bending_strength(self) / 10 ** 6
 
 
 
+    @timed('flexure.capacity')
+    def beam_strength_sweep(self, design_dictionary):
+        """Shear and bending strength of all the sections of input_section_list, evaluated at once
+        [Reference: Cl. 8.2 and 8.4, IS 800:2007]"""
+        sweep = {'section_property': [], 'fy': [], 'epsilon': [], 'effective_depth': [], 'shear_area': [],
+                 'effective_length': []}
+        for section in self.input_section_list:
+            self.section_property = self.section_connect_database(self, section)
+            if self.section_property.type == 'Rolled':
+                self.effective_depth = (self.section_property.depth - 2 * (
+                        self.section_property.flange_thickness + self.section_property.root_radius))
+            else:
+                self.effective_depth = (self.section_property.depth - 2 *self.section_property.flange_thickness )
+
+            if self.sec_profile == 'Beams' or self.sec_profile == 'Columns' or self.sec_profile == VALUES_SECTYPE[1]:
+                if self.section_property.type == "Rolled" and self.bending_type == KEY_DISP_BENDING1:
+                    self.shear_area = self.section_property.depth * self.section_property.web_thickness
+                elif self.section_property.type != "Rolled" and self.bending_type == KEY_DISP_BENDING1:
+                    self.shear_area = self.effective_depth * self.section_property.web_thickness
+                elif self.bending_type == KEY_DISP_BENDING2:
+                    self.shear_area = 2 * self.section_property.flange_width * self.section_property.flange_thickness
+            self.effective_length_beam(self, design_dictionary, self.length)  # mm
+
+            sweep['section_property'].append(self.section_property)
+            sweep['fy'].append(self.material_property.fy)
+            sweep['epsilon'].append(self.epsilon)
+            sweep['effective_depth'].append(self.effective_depth)
+            sweep['shear_area'].append(self.shear_area)
+            sweep['effective_length'].append(self.effective_length)
+
+        columns = section_columns(sweep['section_property'],
+                                  ['plast_sec_mod_z', 'elast_sec_mod_z', 'depth', 'web_thickness'])
+        plastic = [self.input_section_classification[section][0] in (KEY_Plastic, KEY_Compact)
+                   for section in self.input_section_list]
+        lambda_lt = None
+        alpha_lt = None
+        if self.design_type != KEY_DISP_DESIGN_TYPE_FLEXURE:
+            lambda_lt = np.array([self.input_section_classification[section][10] for section in self.input_section_list])
+            alpha_lt = np.array([0.21 if section_property.type == "Rolled" else 0.49
+                                 for section_property in sweep['section_property']])
+            sweep['alpha_lt'] = alpha_lt
+        sweep.update(beam_strength_envelope(columns['plast_sec_mod_z'], columns['elast_sec_mod_z'], columns['depth'],
+                                         columns['web_thickness'], np.array(sweep['fy'], dtype=float),
+                                         np.array(sweep['shear_area'], dtype=float), plastic, self.load_cases.moment,
+                                         self.load_cases.shear, self.support, self.gamma_m0, lambda_lt, alpha_lt))
+        return sweep
+
+    def beam_strength_row(self, sweep, i):
+        """Set the section, material and strength attributes of the i-th section of the sweep"""
+        self.section_property = sweep['section_property'][i]
+        self.material_property.fy = sweep['fy'][i]
+        self.epsilon = sweep['epsilon'][i]
+        self.effective_depth = sweep['effective_depth'][i]
+        self.shear_area = sweep['shear_area'][i]
+        self.effective_length = sweep['effective_length'][i]
+
+        self.V_d = float(sweep['V_d'][i])
+        self.shear_strength = self.V_d
+        self.high_shear_check = bool(sweep['high_shear'][i])
+        self.M_d = float(sweep['M_d'][i])
+        self.beta_b_lt = float(sweep['beta_b'][i])
+        if sweep['reduced'][i]:
+            self.bending_strength_section_reducedby = float(sweep['M_fd'][i])
+            self.beta_reduced = float(sweep['beta_reduced'][i])
+        if 'X_lt' in sweep:
+            self.alpha_lt = float(sweep['alpha_lt'][i])
+            self.phi_lt = float(sweep['phi_lt'][i])
+            self.X_lt = float(sweep['X_lt'][i])
+            self.fbd_lt = float(sweep['f_bd'][i])
+            self.lateral_tb = self.input_section_classification[self.input_section_list[i]][8] * 10**-6
+        self.bending_strength_section_reduced = float(sweep['M_b'][i])
+        self.bending_strength_section = float(sweep['bending_strength'][i])
+        self.load_case = int(sweep['case'][i])
+        self.load_moment_case = int(sweep['moment_case'][i])
+        self.load_shear_case = int(sweep['shear_case'][i])
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.load(self.load_case)
+
     def bending_strength(self):
-        print('Inside bending_strength ','\n self.section_class', self.section_class)
+        trace.debug('Inside bending_strength    self.section_class %s', self.section_class)
         # 4 - design bending strength
         M_d = IS800_2007.cl_8_2_1_2_design_bending_strength(
             self.section_class,
@@ -1251,7 +1309,7 @@ class Flexure(Member):
             self.beta_b_lt = 1
         else :
             self.beta_b_lt = self.section_property.elast_sec_mod_z/self.section_property.plast_sec_mod_z
-            print('self.beta_b_lt: ',self.beta_b_lt)
+            trace.debug('self.beta_b_lt:  %s', self.beta_b_lt)
         self.M_d = M_d
         if self.design_type == KEY_DISP_DESIGN_TYPE_FLEXURE:
             if self.high_shear_check:
@@ -1265,14 +1323,9 @@ class Flexure(Member):
                     )
             else:
                 bending_strength_section = M_d
-            print('Inside bending_strength 1', M_d, self.high_shear_check, bending_strength_section)
+            trace.debug('Inside bending_strength 1 %s %s %s', M_d, self.high_shear_check, bending_strength_section)
         else:
-            print('self.design_type:',self.design_type, self.It,
-                            self.hf,
-                            self.Iw,
-                            self.M_cr,
-                            self.beta_b_lt,
-                            self.lambda_lt, self.fcrb)
+            trace.debug('self.design_type: %s %s %s %s %s %s %s %s', self.design_type, self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, self.lambda_lt, self.fcrb)
             # self.It = (
             #     2
             #     * self.section_property.flange_width
@@ -1332,7 +1385,7 @@ class Flexure(Member):
             self.X_lt = X_lt
             self.fbd_lt = fbd
             self.lateral_tb = self.M_cr * 10**-6
-            print('Inside bending_strength 2.1', fbd, self.section_property.plast_sec_mod_z )
+            trace.debug('Inside bending_strength 2.1 %s %s', fbd, self.section_property.plast_sec_mod_z)
             if self.high_shear_check:
                 if self.section_class == KEY_Plastic or self.section_class == KEY_Compact:
                     bending_strength_section = self.bending_strength_reduction(self,Md=bending_strength_section
@@ -1343,11 +1396,11 @@ class Flexure(Member):
                         * self.section_property.plast_sec_mod_z
                         * fbd
                     )
-            print('Inside bending_strength 2',self.It,self.hf,self.Iw,self.M_cr ,self.beta_b_lt,alpha_lt,self.lambda_lt,phi_lt,X_lt,fbd,bending_strength_section)
+            trace.debug('Inside bending_strength 2 %s %s %s %s %s %s %s %s %s %s %s', self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, alpha_lt, self.lambda_lt, phi_lt, X_lt, fbd, bending_strength_section)
         self.bending_strength_section_reduced = bending_strength_section
         return bending_strength_section
     def bending_strength_girder(self):
-        print('Inside bending_strength of girder ')
+        trace.debug('Inside bending_strength of girder')
         web_class = IS800_2007.Table2_i(
             (self.section_property.flange_width - self.section_property.web_thickness)/2,
             self.section_property.flange_thickness,
@@ -1409,7 +1462,7 @@ class Flexure(Member):
                     )
             else:
                 bending_strength_section = M_d
-            print('Inside bending_strength 1', M_d, self.high_shear_check, bending_strength_section)
+            trace.debug('Inside bending_strength 1 %s %s %s', M_d, self.high_shear_check, bending_strength_section)
         else:
             # self.It = (
             #     2
@@ -1465,7 +1518,7 @@ class Flexure(Member):
             self.X_lt = X_lt
             self.fbd_lt = fbd
             self.lateral_tb = self.fcrb * 10**-6
-            print('Inside bending_strength 2.1', fbd, self.section_property.plast_sec_mod_z )
+            trace.debug('Inside bending_strength 2.1 %s %s', fbd, self.section_property.plast_sec_mod_z)
             if self.high_shear_check:
                 if self.section_class_girder == KEY_Plastic or self.section_class_girder == KEY_Compact:
                     bending_strength_section = self.bending_strength_reduction(self,Md=bending_strength_section
@@ -1476,7 +1529,7 @@ class Flexure(Member):
                         * self.section_property.plast_sec_mod_z
                         * fbd
                     )
-            print('Inside bending_strength 2',self.It,self.hf,self.Iw,self.fcrb ,self.beta_b_lt,alpha_lt,lambda_lt,phi_lt,X_lt,fbd,bending_strength_section)
+            trace.debug('Inside bending_strength 2 %s %s %s %s %s %s %s %s %s %s %s', self.It, self.hf, self.Iw, self.fcrb, self.beta_b_lt, alpha_lt, lambda_lt, phi_lt, X_lt, fbd, bending_strength_section)
         self.bending_strength_section_reduced = bending_strength_section
         return bending_strength_section
     def bending_strength_reduction(self, Md):
@@ -1487,7 +1540,7 @@ class Flexure(Member):
         Mfd = Zfd * self.material_property.fy / self.gamma_m0
         beta = ((2 * self.load.shear_force / (self.shear_strength * 10**3)) - 1) ** 2
         Mdv = (Md - beta * (Md - Mfd))
-        print('Inside bending_strength_reduction',Mdv, Md, beta, Mfd, Zfd)
+        trace.debug('Inside bending_strength_reduction %s %s %s %s %s', Mdv, Md, beta, Mfd, Zfd)
         self.bending_strength_section_reducedby = Mfd
         self.beta_reduced = beta
         if (
@@ -1507,156 +1560,109 @@ class Flexure(Member):
             )
 
 
+    @timed('flexure.classification')
     def section_classification(self, design_dictionary,trial_section=""):
         """Classify the sections based on Table 2 of IS 800:2007"""
-        print(f"Inside section_classification")
+        trace.debug('Inside section_classification')
         local_flag = True
         self.input_modified = []
         self.input_section_list = []
         self.input_section_classification = {}
         lambda_check = False
+        trial_sections = []
+        trial_classification = []
+        trial_properties = []
+        trial_fy = []
+        trial_effective_length = []
         for trial_section in self.sec_list:
             trial_section = trial_section.strip("'")
             self.section_property = self.section_connect_database(self, trial_section)
-            print(f"Type of section{self.section_property.designation}")
-            if self.section_property.type == "Rolled":
-                web_class = IS800_2007.Table2_iii(
-                    self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius),
-                    self.section_property.web_thickness,
-                    self.material_property.fy,
-                )
-                flange_class = IS800_2007.Table2_i(
-                    self.section_property.flange_width / 2,
-                    self.section_property.flange_thickness,
-                    self.material_property.fy,self.section_property.type
-                )[0]
-                web_ratio = (self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2  /self.section_property.flange_thickness
-            else:
-                flange_class = IS800_2007.Table2_i(
-                    (
-                        (self.section_property.flange_width / 2)
-                        # - (self.section_property.web_thickness / 2)
-                    ),
-                    self.section_property.flange_thickness,
-                    self.section_property.fy,
-                    self.section_property.type,
-                )[0]
-
-                web_class = IS800_2007.Table2_iii(
-                    (
-                        self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)
-                    ),
-                    self.section_property.web_thickness,
-                    self.material_property.fy, # classification_type="Axial compression",
-                )
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-            print(f"\n \n \n flange_class {flange_class} \n web_class{web_class} \n \n")
-            if flange_class == "Slender" or web_class == "Slender":
-                self.section_class = "Slender"
-            else:
-                if flange_class == KEY_Plastic and web_class == KEY_Plastic:
-                    self.section_class = KEY_Plastic
-                elif flange_class == KEY_Plastic and web_class == KEY_Compact:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Plastic and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_Compact and web_class == KEY_Plastic:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Compact and web_class == KEY_Compact:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Compact and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_Plastic:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_Compact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-
+            trace.debug('Type of section%s', self.section_property.designation)
             self.Zp_req = self.load.moment * self.gamma_m0 / self.material_property.fy
             self.effective_length_beam(self, design_dictionary, self.length)  # mm
 
-            print( 'self.allow_class', self.allow_class)
+            trace.debug('self.allow_class %s', self.allow_class)
             if self.section_property.plast_sec_mod_z >= self.Zp_req:
-                print( 'self.section_property.plast_sec_mod_z More than Requires')
+                trace.debug('self.section_property.plast_sec_mod_z More than Requires')
+                trial_sections.append(trial_section)
+                trial_properties.append(self.section_property)
+                trial_fy.append(self.material_property.fy)
+                trial_effective_length.append(self.effective_length)
+
+        if trial_sections:
+            # Table 2 classification of all the sections at once
+            columns = section_columns(trial_properties, ['flange_width', 'flange_thickness', 'depth', 'web_thickness',
+                                                         'root_radius'])
+            section_type = np.array([section_property.type for section_property in trial_properties])
+            classification = classify_sections(
+                columns['flange_width'] / 2, columns['flange_thickness'],
+                columns['depth'] - 2 * (columns['flange_thickness'] + columns['root_radius']), columns['web_thickness'],
+                np.array(trial_fy, dtype=float), section_type,
+                flange_f_y=np.where(section_type == "Rolled", trial_fy, [section_property.fy for section_property in trial_properties]))
+            for k in range(len(trial_sections)):
+                trial_classification.append([classification['section_class'][k], classification['flange_class'][k],
+                                             classification['web_class'][k], float(classification['flange_ratio'][k]),
+                                             float(classification['web_ratio'][k])])
+
+        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE and trial_sections:
+            # elastic lateral torsional buckling moment and non-dimensional slenderness of all the sections at once
+            columns = section_columns(trial_properties, ['mom_inertia_y', 'It', 'Iw', 'plast_sec_mod_z', 'elast_sec_mod_z',
+                                                         'depth', 'flange_thickness', 'rad_of_gy_y'])
+            plastic = np.array([classification[0] in (KEY_Plastic, KEY_Compact) for classification in trial_classification])
+            beta_b = np.where(plastic, 1.0, columns['elast_sec_mod_z'] / columns['plast_sec_mod_z'])
+            hf = columns['depth'] - columns['flange_thickness']
+            M_cr, fcrb = elastic_lateral_torsional_buckling_moment(
+                self.material_property.modulus_of_elasticity, 0.3, columns['mom_inertia_y'], columns['It'], columns['Iw'],
+                np.array(trial_effective_length, dtype=float) * 1e3, beta_b, columns['plast_sec_mod_z'], hf,
+                columns['rad_of_gy_y'], columns['flange_thickness'])
+            lambda_lt_all = non_dimensional_slenderness_lt(beta_b, columns['plast_sec_mod_z'], columns['elast_sec_mod_z'],
+                                                           np.array(trial_fy, dtype=float), M_cr)
+
+        for k, trial_section in enumerate(trial_sections):
+            self.section_class, flange_class, web_class, flange_ratio, web_ratio = trial_classification[k]
+            if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                self.It = trial_properties[k].It
+                self.hf = float(hf[k])
+                self.Iw = trial_properties[k].Iw
+                self.beta_b_lt = float(beta_b[k])
+                self.M_cr = float(M_cr[k])
+                self.fcrb = float(fcrb[k])
+                lambda_lt = float(lambda_lt_all[k])
+                if lambda_lt < 0.4:
+                    lambda_check = True
+                    continue
+            if self.allow_class != 'No':
+                if (
+                    self.section_class == KEY_SemiCompact
+                    or self.section_class == KEY_Compact
+                    or self.section_class == KEY_Plastic
+                ):
+
+                    self.input_section_list.append(trial_section)
+                    if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt,self.fcrb]})
+                    else:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
 
-                if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                    self.It = self.section_property.It
-                    # (
-                    #                   2
-                    #                   * self.section_property.flange_width
-                    #                   * self.section_property.flange_thickness ** 3
-                    #           ) / 3 + (
-                    #                   (self.section_property.depth - self.section_property.flange_thickness)
-                    #                   * self.section_property.web_thickness ** 3
-                    #           ) / 3
-                    self.hf = self.section_property.depth - self.section_property.flange_thickness
-                    self.Iw = self.section_property.Iw
-                    # 0.5 ** 2 * self.section_property.mom_inertia_y * self.hf ** 2
-
-
-                    if self.section_class == KEY_Plastic or self.section_class == KEY_Compact:
-                        self.beta_b_lt = 1.0
+                elif self.section_class == "Slender":
+                    logger.warning(f"The section.{trial_section} is Slender. Ignoring")
+            else:
+                if self.section_class == KEY_Compact or self.section_class == KEY_Plastic:
+                    self.input_section_list.append(trial_section)
+                    if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt, self.fcrb]})
                     else:
-                        self.beta_b_lt = (
-                                self.section_property.elast_sec_mod_z
-                                / self.section_property.plast_sec_mod_z
-                        )
-                    _ = IS800_2007.cl_8_2_2_Unsupported_beam_bending_non_slenderness(
-                        self.material_property.modulus_of_elasticity,
-                        0.3,
-                        self.section_property.mom_inertia_y,
-                        self.It,
-                        self.Iw,
-                        self.effective_length * 1e3, self.beta_b_lt, self.section_property.plast_sec_mod_z, self.hf, self.section_property.rad_of_gy_y, self.section_property.flange_thickness
-                    )
-                    self.M_cr = _[0]
-                    self.fcrb = _[1]
-                    lambda_lt = IS800_2007.cl_8_2_2_1_elastic_buckling_moment(
-                        self.beta_b_lt,
-                        self.section_property.plast_sec_mod_z,
-                        self.section_property.elast_sec_mod_z,
-                        self.material_property.fy,
-                        self.M_cr
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
+                elif self.section_class == "Slender":
+                    logger.warning(f"The section.{trial_section} is Slender. Ignoring")
+                    # self.design_status = False
+                    # self.design_status_list.append(self.design_status)
+                elif self.section_class == KEY_SemiCompact:
+                    logger.warning(
+                        f"The section.{trial_section} is Semi-Compact. Ignoring"
                     )
-                    if lambda_lt < 0.4:
-                        lambda_check = True
-                        continue
-                if self.allow_class != 'No':
-                    if (
-                        self.section_class == KEY_SemiCompact
-                        or self.section_class == KEY_Compact
-                        or self.section_class == KEY_Plastic
-                    ):
-
-                        self.input_section_list.append(trial_section)
-                        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt,self.fcrb]})
-                        else:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
-
-                    elif self.section_class == "Slender":
-                        logger.warning(f"The section.{trial_section} is Slender. Ignoring")
-                else:
-                    if self.section_class == KEY_Compact or self.section_class == KEY_Plastic:
-                        self.input_section_list.append(trial_section)
-                        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt, self.fcrb]})
-                        else:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
-                    elif self.section_class == "Slender":
-                        logger.warning(f"The section.{trial_section} is Slender. Ignoring")
-                        # self.design_status = False
-                        # self.design_status_list.append(self.design_status)
-                    elif self.section_class == KEY_SemiCompact:
-                        logger.warning(
-                            f"The section.{trial_section} is Semi-Compact. Ignoring"
-                        )
-                        # self.design_status = False
-                        # self.design_status_list.append(self.design_status)
+                    # self.design_status = False
+                    # self.design_status_list.append(self.design_status)
         if lambda_check:
             logger.info("After checking Non-dimensional slenderness ratio for given sections, some sections maybe be ignored by Osdag.[Ref IS 8.2.2] ")
         if len(self.input_section_list) == 0:
@@ -1666,7 +1672,7 @@ class Flexure(Member):
         return local_flag
 
     def effective_length_beam(self, design_dictionary, length):
-        print(f"Inside effective_length_beam")
+        trace.debug('Inside effective_length_beam')
         self.Loading = design_dictionary[KEY_LOAD]  # 'Normal'or 'Destabilizing'
         # self.Latex_length = design_dictionary[KEY_LENGTH_OVERWRITE]
         if design_dictionary[KEY_LENGTH_OVERWRITE] == 'NA':
@@ -1680,7 +1686,7 @@ class Flexure(Member):
                     depth=(self.section_property.depth/1000),
                     load=self.Loading,
                 )
-                print(f"Working 1 {self.effective_length}")
+                trace.debug('Working 1 %s', self.effective_length)
             elif self.support == KEY_DISP_SUPPORT2:
                 self.Support = design_dictionary[KEY_SUPPORT_TYPE]
                 self.Top = design_dictionary[KEY_SUPPORT_TYPE2]
@@ -1690,7 +1696,7 @@ class Flexure(Member):
                     length=length,
                     load=self.Loading,
                 )
-                print(f"Working 2 {self.effective_length}")
+                trace.debug('Working 2 %s', self.effective_length)
         else:
             if self.support == KEY_DISP_SUPPORT1:
                 self.Torsional_res = design_dictionary[KEY_TORSIONAL_RES]
@@ -1707,15 +1713,15 @@ class Flexure(Member):
                     length = length * float(design_dictionary[KEY_LENGTH_OVERWRITE])
 
                 self.effective_length = length
-                print(f"Working 3 {self.effective_length}")
+                trace.debug('Working 3 %s', self.effective_length)
             except:
-                print(f"Inside effective_length_beam",type(design_dictionary[KEY_LENGTH_OVERWRITE]))
+                trace.debug('Inside effective_length_beam %s', type(design_dictionary[KEY_LENGTH_OVERWRITE]))
                 logger.warning("Invalid Effective Length Parameter.")
                 logger.info('Effective Length Parameter is set to default: 1.0')
                 design_dictionary[KEY_LENGTH_OVERWRITE] = '1.0'
                 self.effective_length_beam(self, design_dictionary, length)
-                print(f"Working 4 {self.effective_length}")
-        print(f"Inside effective_length_beam",self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
+                trace.debug('Working 4 %s', self.effective_length)
+        trace.debug('Inside effective_length_beam %s %s', self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
 
 
     def lambda_lt_check_member_type(self, Mcr=0, fcrb=0, Zp=0, f_y=0, Ze=0, beta_b=0):
@@ -1729,7 +1735,7 @@ class Flexure(Member):
 
     def common_checks_1(self, section, step=1, list_result=[], list_1=[]):
         if step == 1:
-            print(f"Working correct here")
+            trace.debug('Working correct here')
         elif step == 2:
             # reduction of the area based on the connection requirements (input from design preferences)
             if self.effective_area_factor < 1.0:
@@ -1747,14 +1753,7 @@ class Flexure(Member):
                                                                                 )
         elif step == 4:
             # self.slenderness = self.effective_length / min(self.section_property.rad_of_gy_z, self.section_property.rad_of_gy_y) * 1000
-            print(
-                f"\n data sent "
-                f" self.material_property.fy {self.material_property.fy}"
-                f"self.gamma_m0 {self.gamma_m0}"
-                f"self.slenderness {self.slenderness}"
-                f" self.imperfection_factor {self.imperfection_factor}"
-                f"self.section_property.modulus_of_elasticity {self.section_property.modulus_of_elasticity}"
-            )
+            trace.debug('data sent  self.material_property.fy %sself.gamma_m0 %sself.slenderness %s self.imperfection_factor %sself.section_property.modulus_of_elasticity %s', self.material_property.fy, self.gamma_m0, self.slenderness, self.imperfection_factor, self.section_property.modulus_of_elasticity)
 
             list_cl_7_1_2_1_design_compressisive_stress = (
                 IS800_2007.cl_7_1_2_1_design_compressisive_stress(
@@ -1767,7 +1766,7 @@ class Flexure(Member):
                 )
             )
             for x in list_cl_7_1_2_1_design_compressisive_stress:
-                print(f"x {x} ")
+                trace.debug('x %s', x)
             self.euler_buckling_stress = list_cl_7_1_2_1_design_compressisive_stress[0]
             self.nondimensional_effective_slenderness_ratio = (
                 list_cl_7_1_2_1_design_compressisive_stress[1]
@@ -1786,16 +1785,13 @@ class Flexure(Member):
                 list_cl_7_1_2_1_design_compressisive_stress[6]
             )
         elif step == 5:
-            # 1- Based on optimum UR
-            self.optimum_section_ur_results[self.ur] = {}
-            list_2 = list_result.copy()
-            for j in list_1:
-                # k = 0
-                for k in list_2:
-                    self.optimum_section_ur_results[self.ur][j] = k
-                    # k += 1
-                    list_2.pop(0)
-                    break
+            # 1- Based on optimum UR: one row per section
+            index = self.section_results.add(section, self.ur, capacity=self.bending_strength_section,
+                                             section_class=self.section_class, mass=self.section_property.mass,
+                                             cost=self.cost, details=dict(zip(list_1, list_result)))
+            self.section_results.update(index, **{"Load case": self.load_case,
+                                                  "Load case.moment": self.load_moment_case,
+                                                  "Load case.shear": self.load_shear_case})
 
             # 2- Based on optimum cost
             self.optimum_section_cost_results[self.cost] = {}
@@ -1806,10 +1802,7 @@ class Flexure(Member):
                     self.optimum_section_cost_results[self.cost][j] = k
                     list_2.pop(0)
                     break
-            print(
-                f"\n self.optimum_section_cost_results {self.optimum_section_cost_results}"
-                f"\n self.optimum_section_ur_results {self.optimum_section_ur_results}"
-            )
+            trace.debug('self.optimum_section_cost_results %s  self.section_results %s', self.optimum_section_cost_results, self.section_results.table)
         elif step == 6:
             self.single_result[self.sec_profile] = {}
             list_2 = list_result.copy()
@@ -1820,7 +1813,7 @@ class Flexure(Member):
                     # k += 1
                     list_2.pop(0)
                     break
-            print(f"\n self.single_result {self.single_result}")
+            trace.debug('self.single_result %s', self.single_result)
 
     def list_changer(self, change, list,list_name, check = True):
         list_name.extend([
@@ -1960,7 +1953,7 @@ class Flexure(Member):
         self.lambda_w = IS800_2007.cl_8_4_2_2_lambda_w_Simple_postcritical(self.fyw,self.tau_crc)
         self.tau_b = IS800_2007.cl_8_4_2_2_tau_b_Simple_postcritical(self.lambda_w, self.fyw)
         self.V_cr = IS800_2007.cl_8_4_2_2_Vcr_Simple_postcritical(self.tau_b, self.effective_depth * self.section_property.web_thickness) / 10**3
-        print('\n plate_girder_strength', '\n tau_crc',self.tau_crc,'\n self.lambda_w',self.lambda_w,'\n self.tau_b',self.tau_b,'\n self.V_cr',self.V_cr)
+        trace.debug('plate_girder_strength   tau_crc %s   self.lambda_w %s   self.tau_b %s   self.V_cr %s', self.tau_crc, self.lambda_w, self.tau_b, self.V_cr)
     def plate_girder_strength2(self):
 
             self.plate_girder_strength(self)
@@ -1973,16 +1966,9 @@ class Flexure(Member):
 
 
     def results(self, design_dictionary):
-        _ = [i for i in self.optimum_section_ur if i > 1.0]
-        print( '_ ',_)
-        if len(_)==1:
-            temp = _[0]
-        elif len(_)==0:
-            temp = None
-        else:
-            temp = sorted(_)[0]
-        self.failed_design_dict = self.optimum_section_ur_results[temp] if temp is not None else None
-        print('self.failed_design_dict ',self.failed_design_dict)
+        failed = self.section_results.least_failing(1.0)
+        self.failed_design_dict = self.section_results[failed] if failed is not None else None
+        trace.debug('self.failed_design_dict  %s', self.failed_design_dict)
 
         # sorting results from the dataset
         # if len(self.input_section_list) > 1:
@@ -1995,7 +1981,7 @@ class Flexure(Member):
             self.optimum_section_ur = list(filter_UR)
 
             self.optimum_section_ur.sort()
-            print(f"self.optimum_section_ur{self.optimum_section_ur} \n self.optimum_section_ur_results{self.optimum_section_ur_results}")
+            trace.debug('self.optimum_section_ur%s   self.section_results%s', self.optimum_section_ur, self.section_results.table)
             # print(f"self.result_UR{self.result_UR}")
 
             # selecting the section with most optimum UR
@@ -2031,13 +2017,14 @@ class Flexure(Member):
 
             else:
                 self.failed_design_dict = None
-                self.result_UR = self.optimum_section_ur[-1]  # optimum section which passes the UR check
-                print(f"self.result_UR{self.result_UR}")
+                selected = self.section_results.most_utilised(min(self.allowable_utilization_ratio, 1.0))
+                self.result_UR = float(self.section_results.table['ur'][selected])  # optimum section which passes the UR check
+                trace.debug('self.result_UR%s', self.result_UR)
                 self.design_status = True
                 self.common_result(
                     self,
-                    list_result=self.optimum_section_ur_results,
-                    result_type=self.result_UR,
+                    list_result=self.section_results,
+                    result_type=selected,
                 )
 
         else:  # results based on cost
@@ -2117,16 +2104,30 @@ class Flexure(Member):
         #         print(f"design_status_list2{self.design_status}")
         self.design_status_list.append(self.design_status)
         for status in self.design_status_list:
-            print('status list', status)
+            trace.debug('status list %s', status)
             if status is False:
                 self.design_status = False
                 break
             else:
                 self.design_status = True
 
+    def load_case_result(self, result):
+        """Set the forces of the governing load case of a result, and report the case"""
+        if len(self.load_cases) == 1:
+            return
+        self.load = self.load_cases.load(result.get("Load case", 0))
+        logger.info(
+            "The governing load case of the section is {} (bending moment: {}, shear force: {}).".format(
+                self.load_cases.names[result.get("Load case", 0)],
+                self.load_cases.names[result.get("Load case.moment", 0)],
+                self.load_cases.names[result.get("Load case.shear", 0)],
+            )
+        )
+
     def common_result(self, list_result, result_type, flag=1):
         try:
             self.result_designation = list_result[result_type]["Designation"] # TODO debug
+            self.load_case_result(self, list_result[result_type])
             logger.info(
             "The section is {}. The {} section  has  {} flange({}) and  {} web({}).  [Reference: Cl 3.7, IS 800:2007].".format(
                 self.input_section_classification[self.result_designation][0] ,
@@ -2357,6 +2358,7 @@ class Flexure(Member):
                 self.result_Md= list_result["M_d"]
 
     ### start writing save_design from here!
+    @timed('flexure.report')
     def save_design(self, popup_summary):
         # print('self.design_status', self.design_status,'len(self.failed_design_dict)', len(self.failed_design_dict))
         if (self.design_status and self.failed_design_dict is None) or (not self.design_status and len(self.failed_design_dict)>0):# TODO @Rutvik
@@ -3082,7 +3084,7 @@ class Flexure(Member):
         Disp_2d_image = []
         Disp_3D_image = "/ResourceFiles/images/3d.png"
 
-        print(sys.path[0])
+        trace.debug('%s', sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = os.path.abspath(".") # TEMP
         rel_path = rel_path.replace("\\", "/")
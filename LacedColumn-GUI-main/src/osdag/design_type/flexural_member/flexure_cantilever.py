@@ -34,6 +34,11 @@ from ...utils.common.common_calculation import *
 from ..tension_member import *
 from ...utils.common.Section_Properties_Calculator import BBAngle_Properties
 from ...utils.common import is800_2007
+from ...utils.common.flexure_sweep import section_columns, elastic_lateral_torsional_buckling_moment, \
+    non_dimensional_slenderness_lt, beam_strength_envelope
+from ...utils.common.load_cases import LoadCases
+from ...utils.common.section_classification import classify_sections
+from ...utils.common.section_results import SectionResults
 from ...utils.common.component import *
 
 # TODO DEBUG
@@ -731,6 +736,11 @@ class Flexure_Cantilever(Member):
             moment=design_dictionary[KEY_MOMENT],
             unit_kNm=True,
         )
+        # load cases of the design (the forces of the input dock without a table of cases); every section is checked
+        # under all the cases
+        self.load_cases = LoadCases.from_design_dictionary(design_dictionary, axial_key=None)
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.envelope_load()
 
         # design preferences
         # self.allowable_utilization_ratio = float(design_dictionary[KEY_ALLOW_UR])
@@ -888,7 +898,7 @@ class Flexure_Cantilever(Member):
     def design_beam(self, design_dictionary):
         print(f"Inside design_beam")
         # 1- Based on optimum UR
-        self.optimum_section_ur_results = {}
+        self.section_results = SectionResults()
         self.optimum_section_ur = []
 
         # 2 - Based on optimum cost
@@ -913,23 +923,13 @@ class Flexure_Cantilever(Member):
             f"self.effective_length {self.effective_length} \n self.input_section_classification{self.input_section_classification} ")
 
         if self.flag:
-            for section in self.input_section_list:
+            # shear and bending strength of all the sections, evaluated at once
+            self.strength_sweep = self.beam_strength_sweep(self, design_dictionary)
+            for i, section in enumerate(self.input_section_list):
                 # initialize lists for updating the results dictionary
-                self.section_property = self.section_connect_database(self, section)
-                if self.section_property.type == 'Rolled':
-                    self.effective_depth = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius))
-                else:
-                    self.effective_depth = (self.section_property.depth - 2 *self.section_property.flange_thickness )
+                self.beam_strength_row(self, self.strength_sweep, i)
                 print('self.section_property.type:',self.section_property.type, self.bending_type)
 
-                if self.sec_profile == 'Beams' or self.sec_profile == 'Columns' or self.sec_profile == VALUES_SECTYPE[1]:
-                    if self.section_property.type == "Rolled" and self.bending_type == KEY_DISP_BENDING1:
-                        self.shear_area = self.section_property.depth * self.section_property.web_thickness
-                    elif self.section_property.type != "Rolled" and self.bending_type == KEY_DISP_BENDING1:
-                        self.shear_area = self.effective_depth * self.section_property.web_thickness
-                    elif self.bending_type == KEY_DISP_BENDING2:
-                        self.shear_area = 2 * self.section_property.flange_width * self.section_property.flange_thickness
                 # Step 1.1 - computing the effective sectional area
                 self.effective_area = self.section_property.area
                 self.common_checks_1(self, section, step=2)
@@ -954,19 +954,16 @@ class Flexure_Cantilever(Member):
                             self.beta_b_lt,
                             self.lambda_lt)
 
-                self.beam_web_buckling(self)
-                if self.web_buckling_check:
-                    self.web_not_buckling_steps(self)
-                    # if not check:
-                    #     continue
-                    # else:
-                    # self.high_shear_check = False
-                    # self.bending_strength_section = self.bending_strength_girder(self) / 10 ** 6
+                self.web_buckling_check = IS800_2007.cl_8_2_1_web_buckling(
+                    d=self.effective_depth,
+                    tw=self.section_property.web_thickness,
+                    e=self.epsilon,
+                )
 
                 # print(f"Common result {list_result, self.section_class, self.V_d, self.high_shear_check, self.bending_strength_section}")
                 print('self.bending_strength_section',self.bending_strength_section,'self.shear_strength',self.shear_strength, 'self.load.moment',self.load.moment,'self.load.shear_force',self.load.shear_force)
                 # 2.8 - UR
-                self.ur = max((self.load.moment / self.bending_strength_section * 10 ** -6),(self.load.shear_force / self.shear_strength * 10 ** -3))# ( +  round(self.load.axial_force / self.section_capacity, 3)
+                self.ur = float(self.strength_sweep['ur'][i])
                 print("UR", self.ur)
                 # 2.9 - Cost of the section in INR
                 self.cost = (
@@ -1138,6 +1135,82 @@ class Flexure_Cantilever(Member):
 
 
 
+    def beam_strength_sweep(self, design_dictionary):
+        """Shear and bending strength of all the sections of input_section_list, evaluated at once
+        [Reference: Cl. 8.2 and 8.4, IS 800:2007]"""
+        sweep = {'section_property': [], 'fy': [], 'epsilon': [], 'effective_depth': [], 'shear_area': [],
+                 'effective_length': []}
+        for section in self.input_section_list:
+            self.section_property = self.section_connect_database(self, section)
+            if self.section_property.type == 'Rolled':
+                self.effective_depth = (self.section_property.depth - 2 * (
+                        self.section_property.flange_thickness + self.section_property.root_radius))
+            else:
+                self.effective_depth = (self.section_property.depth - 2 *self.section_property.flange_thickness )
+
+            if self.sec_profile == 'Beams' or self.sec_profile == 'Columns' or self.sec_profile == VALUES_SECTYPE[1]:
+                if self.section_property.type == "Rolled" and self.bending_type == KEY_DISP_BENDING1:
+                    self.shear_area = self.section_property.depth * self.section_property.web_thickness
+                elif self.section_property.type != "Rolled" and self.bending_type == KEY_DISP_BENDING1:
+                    self.shear_area = self.effective_depth * self.section_property.web_thickness
+                elif self.bending_type == KEY_DISP_BENDING2:
+                    self.shear_area = 2 * self.section_property.flange_width * self.section_property.flange_thickness
+
+            sweep['section_property'].append(self.section_property)
+            sweep['fy'].append(self.material_property.fy)
+            sweep['epsilon'].append(self.epsilon)
+            sweep['effective_depth'].append(self.effective_depth)
+            sweep['shear_area'].append(self.shear_area)
+            sweep['effective_length'].append(self.effective_length)
+
+        columns = section_columns(sweep['section_property'],
+                                  ['plast_sec_mod_z', 'elast_sec_mod_z', 'depth', 'web_thickness'])
+        plastic = [self.input_section_classification[section][0] in (KEY_Plastic, KEY_Compact)
+                   for section in self.input_section_list]
+        lambda_lt = None
+        alpha_lt = None
+        if self.design_type != KEY_DISP_DESIGN_TYPE_FLEXURE:
+            lambda_lt = np.array([self.input_section_classification[section][10] for section in self.input_section_list])
+            alpha_lt = np.array([0.21 if section_property.type == "Rolled" else 0.49
+                                 for section_property in sweep['section_property']])
+            sweep['alpha_lt'] = alpha_lt
+        sweep.update(beam_strength_envelope(columns['plast_sec_mod_z'], columns['elast_sec_mod_z'], columns['depth'],
+                                         columns['web_thickness'], np.array(sweep['fy'], dtype=float),
+                                         np.array(sweep['shear_area'], dtype=float), plastic, self.load_cases.moment,
+                                         self.load_cases.shear, self.support, self.gamma_m0, lambda_lt, alpha_lt))
+        return sweep
+
+    def beam_strength_row(self, sweep, i):
+        """Set the section, material and strength attributes of the i-th section of the sweep"""
+        self.section_property = sweep['section_property'][i]
+        self.material_property.fy = sweep['fy'][i]
+        self.epsilon = sweep['epsilon'][i]
+        self.effective_depth = sweep['effective_depth'][i]
+        self.shear_area = sweep['shear_area'][i]
+        self.effective_length = sweep['effective_length'][i]
+
+        self.V_d = float(sweep['V_d'][i])
+        self.shear_strength = self.V_d
+        self.high_shear_check = bool(sweep['high_shear'][i])
+        self.M_d = float(sweep['M_d'][i])
+        self.beta_b_lt = float(sweep['beta_b'][i])
+        if sweep['reduced'][i]:
+            self.bending_strength_section_reducedby = float(sweep['M_fd'][i])
+            self.beta_reduced = float(sweep['beta_reduced'][i])
+        if 'X_lt' in sweep:
+            self.alpha_lt = float(sweep['alpha_lt'][i])
+            self.phi_lt = float(sweep['phi_lt'][i])
+            self.X_lt = float(sweep['X_lt'][i])
+            self.fbd_lt = float(sweep['f_bd'][i])
+            self.lateral_tb = self.input_section_classification[self.input_section_list[i]][8] * 10**-6
+        self.bending_strength_section_reduced = float(sweep['M_b'][i])
+        self.bending_strength_section = float(sweep['bending_strength'][i])
+        self.load_case = int(sweep['case'][i])
+        self.load_moment_case = int(sweep['moment_case'][i])
+        self.load_shear_case = int(sweep['shear_case'][i])
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.load(self.load_case)
+
     def bending_strength(self):
         print('Inside bending_strength ','\n self.section_class', self.section_class)
         # 4 - design bending strength
@@ -1417,148 +1490,100 @@ class Flexure_Cantilever(Member):
         self.input_section_list = []
         self.input_section_classification = {}
         lambda_check = False
+        trial_sections = []
+        trial_classification = []
+        trial_properties = []
+        trial_fy = []
+        trial_effective_length = []
         for trial_section in self.sec_list:
             trial_section = trial_section.strip("'")
             self.section_property = self.section_connect_database(self, trial_section)
             print(f"Type of section{self.section_property.designation}")
-            if self.section_property.type == "Rolled":
-                web_class = IS800_2007.Table2_iii(
-                    self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius),
-                    self.section_property.web_thickness,
-                    self.material_property.fy,
-                )
-                flange_class = IS800_2007.Table2_i(
-                    self.section_property.flange_width / 2,
-                    self.section_property.flange_thickness,
-                    self.material_property.fy,self.section_property.type
-                )[0]
-                web_ratio = (self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2  /self.section_property.flange_thickness
-            else:
-                flange_class = IS800_2007.Table2_i(
-                    (
-                        (self.section_property.flange_width / 2)
-                        # - (self.section_property.web_thickness / 2)
-                    ),
-                    self.section_property.flange_thickness,
-                    self.section_property.fy,
-                    self.section_property.type,
-                )[0]
-
-                web_class = IS800_2007.Table2_iii(
-                    (
-                        self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)
-                    ),
-                    self.section_property.web_thickness,
-                    self.material_property.fy, # classification_type="Axial compression",
-                )
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-            print(f"\n \n \n flange_class {flange_class} \n web_class{web_class} \n \n")
-            if flange_class == "Slender" or web_class == "Slender":
-                self.section_class = "Slender"
-            else:
-                if flange_class == KEY_Plastic and web_class == KEY_Plastic:
-                    self.section_class = KEY_Plastic
-                elif flange_class == KEY_Plastic and web_class == KEY_Compact:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Plastic and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_Compact and web_class == KEY_Plastic:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Compact and web_class == KEY_Compact:
-                    self.section_class = KEY_Compact
-                elif flange_class == KEY_Compact and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_Plastic:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_Compact:
-                    self.section_class = KEY_SemiCompact
-                elif flange_class == KEY_SemiCompact and web_class == KEY_SemiCompact:
-                    self.section_class = KEY_SemiCompact
-
             self.Zp_req = self.load.moment * self.gamma_m0 / self.material_property.fy
             self.effective_length_beam(self, design_dictionary, self.length)  # mm
 
             print( 'self.allow_class', self.allow_class)
             if self.section_property.plast_sec_mod_z >= self.Zp_req:
                 print( 'self.section_property.plast_sec_mod_z More than Requires')
+                trial_sections.append(trial_section)
+                trial_properties.append(self.section_property)
+                trial_fy.append(self.material_property.fy)
+                trial_effective_length.append(self.effective_length)
+
+        if trial_sections:
+            # Table 2 classification of all the sections at once
+            columns = section_columns(trial_properties, ['flange_width', 'flange_thickness', 'depth', 'web_thickness',
+                                                         'root_radius'])
+            section_type = np.array([section_property.type for section_property in trial_properties])
+            classification = classify_sections(
+                columns['flange_width'] / 2, columns['flange_thickness'],
+                columns['depth'] - 2 * (columns['flange_thickness'] + columns['root_radius']), columns['web_thickness'],
+                np.array(trial_fy, dtype=float), section_type,
+                flange_f_y=np.where(section_type == "Rolled", trial_fy, [section_property.fy for section_property in trial_properties]))
+            for k in range(len(trial_sections)):
+                trial_classification.append([classification['section_class'][k], classification['flange_class'][k],
+                                             classification['web_class'][k], float(classification['flange_ratio'][k]),
+                                             float(classification['web_ratio'][k])])
+
+        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE and trial_sections:
+            # elastic lateral torsional buckling moment and non-dimensional slenderness of all the sections at once
+            columns = section_columns(trial_properties, ['mom_inertia_y', 'It', 'Iw', 'plast_sec_mod_z', 'elast_sec_mod_z',
+                                                         'depth', 'flange_thickness', 'rad_of_gy_y'])
+            plastic = np.array([classification[0] in (KEY_Plastic, KEY_Compact) for classification in trial_classification])
+            beta_b = np.where(plastic, 1.0, columns['elast_sec_mod_z'] / columns['plast_sec_mod_z'])
+            hf = columns['depth'] - columns['flange_thickness']
+            M_cr, fcrb = elastic_lateral_torsional_buckling_moment(
+                self.material_property.modulus_of_elasticity, 0.3, columns['mom_inertia_y'], columns['It'], columns['Iw'],
+                np.array(trial_effective_length, dtype=float) * 1e3, beta_b, columns['plast_sec_mod_z'], hf,
+                columns['rad_of_gy_y'], columns['flange_thickness'])
+            lambda_lt_all = non_dimensional_slenderness_lt(beta_b, columns['plast_sec_mod_z'], columns['elast_sec_mod_z'],
+                                                           np.array(trial_fy, dtype=float), M_cr)
+
+        for k, trial_section in enumerate(trial_sections):
+            self.section_class, flange_class, web_class, flange_ratio, web_ratio = trial_classification[k]
+            if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                self.It = trial_properties[k].It
+                self.hf = float(hf[k])
+                self.Iw = trial_properties[k].Iw
+                self.beta_b_lt = float(beta_b[k])
+                self.M_cr = float(M_cr[k])
+                self.fcrb = float(fcrb[k])
+                lambda_lt = float(lambda_lt_all[k])
+                if lambda_lt < 0.4:
+                    lambda_check = True
+                    continue
+            if self.allow_class != 'No':
+                if (
+                    self.section_class == KEY_SemiCompact
+                    or self.section_class == KEY_Compact
+                    or self.section_class == KEY_Plastic
+                ):
+
+                    self.input_section_list.append(trial_section)
+                    if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt,self.fcrb]})
+                    else:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
 
-                if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                    self.It = self.section_property.It
-                    # (
-                    #                   2
-                    #                   * self.section_property.flange_width
-                    #                   * self.section_property.flange_thickness ** 3
-                    #           ) / 3 + (
-                    #                   (self.section_property.depth - self.section_property.flange_thickness)
-                    #                   * self.section_property.web_thickness ** 3
-                    #           ) / 3
-                    self.hf = self.section_property.depth - self.section_property.flange_thickness
-                    self.Iw = self.section_property.Iw
-                    # 0.5 ** 2 * self.section_property.mom_inertia_y * self.hf ** 2
-
-
-                    if self.section_class == KEY_Plastic or self.section_class == KEY_Compact:
-                        self.beta_b_lt = 1.0
+                elif self.section_class == "Slender":
+                    logger.warning(f"The section.{trial_section} is Slender. Ignoring")
+            else:
+                if self.section_class == KEY_Compact or self.section_class == KEY_Plastic:
+                    self.input_section_list.append(trial_section)
+                    if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt, self.fcrb]})
                     else:
-                        self.beta_b_lt = (
-                                self.section_property.elast_sec_mod_z
-                                / self.section_property.plast_sec_mod_z
-                        )
-                    _ = IS800_2007.cl_8_2_2_Unsupported_beam_bending_non_slenderness(
-                        self.material_property.modulus_of_elasticity,
-                        0.3,
-                        self.section_property.mom_inertia_y,
-                        self.It,
-                        self.Iw,
-                        self.effective_length * 1e3, self.beta_b_lt, self.section_property.plast_sec_mod_z, self.hf, self.section_property.rad_of_gy_y, self.section_property.flange_thickness
-                    )
-                    self.M_cr = _[0]
-                    self.fcrb = _[1]
-                    lambda_lt = IS800_2007.cl_8_2_2_1_elastic_buckling_moment(
-                        self.beta_b_lt,
-                        self.section_property.plast_sec_mod_z,
-                        self.section_property.elast_sec_mod_z,
-                        self.material_property.fy,
-                        self.M_cr
+                        self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
+                elif self.section_class == "Slender":
+                    logger.warning(f"The section.{trial_section} is Slender. Ignoring")
+                    # self.design_status = False
+                    # self.design_status_list.append(self.design_status)
+                elif self.section_class == KEY_SemiCompact:
+                    logger.warning(
+                        f"The section.{trial_section} is Semi-Compact. Ignoring"
                     )
-                    if lambda_lt < 0.4:
-                        lambda_check = True
-                        continue
-                if self.allow_class != 'No':
-                    if (
-                        self.section_class == KEY_SemiCompact
-                        or self.section_class == KEY_Compact
-                        or self.section_class == KEY_Plastic
-                    ):
-
-                        self.input_section_list.append(trial_section)
-                        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt,self.fcrb]})
-                        else:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
-
-                    elif self.section_class == "Slender":
-                        logger.warning(f"The section.{trial_section} is Slender. Ignoring")
-                else:
-                    if self.section_class == KEY_Compact or self.section_class == KEY_Plastic:
-                        self.input_section_list.append(trial_section)
-                        if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio,self.It,self.hf,self.Iw,self.M_cr,self.beta_b_lt,lambda_lt, self.fcrb]})
-                        else:
-                            self.input_section_classification.update({trial_section: [self.section_class, flange_class, web_class, flange_ratio, web_ratio]})
-                    elif self.section_class == "Slender":
-                        logger.warning(f"The section.{trial_section} is Slender. Ignoring")
-                        # self.design_status = False
-                        # self.design_status_list.append(self.design_status)
-                    elif self.section_class == KEY_SemiCompact:
-                        logger.warning(
-                            f"The section.{trial_section} is Semi-Compact. Ignoring"
-                        )
-                        # self.design_status = False
-                        # self.design_status_list.append(self.design_status)
+                    # self.design_status = False
+                    # self.design_status_list.append(self.design_status)
         if lambda_check:
             logger.info("After checking Non-dimensional slenderness ratio for given sections, some sections maybe be ignored by Osdag.[Ref IS 8.2.2] ")
         if len(self.input_section_list) == 0:
@@ -1688,16 +1713,13 @@ class Flexure_Cantilever(Member):
                 list_cl_7_1_2_1_design_compressisive_stress[6]
             )
         elif step == 5:
-            # 1- Based on optimum UR
-            self.optimum_section_ur_results[self.ur] = {}
-            list_2 = list_result.copy()
-            for j in list_1:
-                # k = 0
-                for k in list_2:
-                    self.optimum_section_ur_results[self.ur][j] = k
-                    # k += 1
-                    list_2.pop(0)
-                    break
+            # 1- Based on optimum UR: one row per section
+            index = self.section_results.add(section, self.ur, capacity=self.bending_strength_section,
+                                             section_class=self.section_class, mass=self.section_property.mass,
+                                             cost=self.cost, details=dict(zip(list_1, list_result)))
+            self.section_results.update(index, **{"Load case": self.load_case,
+                                                  "Load case.moment": self.load_moment_case,
+                                                  "Load case.shear": self.load_shear_case})
 
             # 2- Based on optimum cost
             self.optimum_section_cost_results[self.cost] = {}
@@ -1710,7 +1732,7 @@ class Flexure_Cantilever(Member):
                     break
             print(
                 f"\n self.optimum_section_cost_results {self.optimum_section_cost_results}"
-                f"\n self.optimum_section_ur_results {self.optimum_section_ur_results}"
+                f"\n self.section_results {self.section_results.table}"
             )
         elif step == 6:
             self.single_result[self.sec_profile] = {}
@@ -1875,15 +1897,8 @@ class Flexure_Cantilever(Member):
 
 
     def results(self, design_dictionary):
-        _ = [i for i in self.optimum_section_ur if i > 1.0]
-        print( '_ ',_)
-        if len(_)==1:
-            temp = _[0]
-        elif len(_)==0:
-            temp = None
-        else:
-            temp = sorted(_)[0]
-        self.failed_design_dict = self.optimum_section_ur_results[temp] if temp is not None else None
+        failed = self.section_results.least_failing(1.0)
+        self.failed_design_dict = self.section_results[failed] if failed is not None else None
         print('self.failed_design_dict ',self.failed_design_dict)
 
         # sorting results from the dataset
@@ -1897,7 +1912,7 @@ class Flexure_Cantilever(Member):
             self.optimum_section_ur = list(filter_UR)
 
             self.optimum_section_ur.sort()
-            print(f"self.optimum_section_ur{self.optimum_section_ur} \n self.optimum_section_ur_results{self.optimum_section_ur_results}")
+            print(f"self.optimum_section_ur{self.optimum_section_ur} \n self.section_results{self.section_results.table}")
             # print(f"self.result_UR{self.result_UR}")
 
             # selecting the section with most optimum UR
@@ -1933,15 +1948,14 @@ class Flexure_Cantilever(Member):
 
             else:
                 self.failed_design_dict = None
-                self.result_UR = self.optimum_section_ur[
-                    -1
-                ]  # optimum section which passes the UR check
+                selected = self.section_results.most_utilised(min(self.allowable_utilization_ratio, 1.0))
+                self.result_UR = float(self.section_results.table['ur'][selected])  # optimum section which passes the UR check
                 print(f"self.result_UR{self.result_UR}")
                 self.design_status = True
                 self.common_result(
                     self,
-                    list_result=self.optimum_section_ur_results,
-                    result_type=self.result_UR,
+                    list_result=self.section_results,
+                    result_type=selected,
                 )
 
         else:  # results based on cost
@@ -2028,9 +2042,23 @@ class Flexure_Cantilever(Member):
             else:
                 self.design_status = True
 
+    def load_case_result(self, result):
+        """Set the forces of the governing load case of a result, and report the case"""
+        if len(self.load_cases) == 1:
+            return
+        self.load = self.load_cases.load(result.get("Load case", 0))
+        logger.info(
+            "The governing load case of the section is {} (bending moment: {}, shear force: {}).".format(
+                self.load_cases.names[result.get("Load case", 0)],
+                self.load_cases.names[result.get("Load case.moment", 0)],
+                self.load_cases.names[result.get("Load case.shear", 0)],
+            )
+        )
+
     def common_result(self, list_result, result_type, flag=1):
         try:
             self.result_designation = list_result[result_type]["Designation"] # TODO debug
+            self.load_case_result(self, list_result[result_type])
             logger.info(
             "The section is {}. The {} section  has  {} flange({}) and  {} web({}).  [Reference: Cl 3.7, IS 800:2007].".format(
                 self.input_section_classification[self.result_designation][0] ,
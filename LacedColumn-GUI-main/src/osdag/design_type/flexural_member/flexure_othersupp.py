@@ -33,6 +33,11 @@ from ...utils.common.common_calculation import *
 from ..tension_member import *
 from ...utils.common.Section_Properties_Calculator import BBAngle_Properties
 from ...utils.common import is800_2007
+from ...utils.common.flexure_sweep import section_columns, elastic_lateral_torsional_buckling_moment, \
+    non_dimensional_slenderness_lt, beam_strength_envelope
+from ...utils.common.load_cases import LoadCases
+from ...utils.common.section_classification import classify_sections
+from ...utils.common.section_results import SectionResults
 from ...utils.common.component import *
 
 
@@ -598,6 +603,11 @@ class Flexure_Misc(Member):
             moment=design_dictionary[KEY_MOMENT],
             unit_kNm=True,
         )
+        # load cases of the design (the forces of the input dock without a table of cases); every section is checked
+        # under all the cases
+        self.load_cases = LoadCases.from_design_dictionary(design_dictionary, axial_key=None)
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.envelope_load()
 
         # design preferences
         # self.allowable_utilization_ratio = float(design_dictionary[KEY_ALLOW_UR])
@@ -749,7 +759,7 @@ class Flexure_Misc(Member):
     def design_beam(self, design_dictionary):
         print(f"Inside design_beam")
         # 1- Based on optimum UR
-        self.optimum_section_ur_results = {}
+        self.section_results = SectionResults()
         self.optimum_section_ur = []
 
         # 2 - Based on optimum cost
@@ -772,9 +782,11 @@ class Flexure_Misc(Member):
             f"self.effective_length {self.effective_length} \n self.input_section_classification{self.input_section_classification} ")
 
         if flag:
-            for section in self.input_section_list:
+            # shear and bending strength of all the sections, evaluated at once
+            self.strength_sweep = self.beam_strength_sweep(self)
+            for i, section in enumerate(self.input_section_list):
                 # initialize lists for updating the results dictionary
-                self.section_property = self.section_conect_database(self, section)
+                self.beam_strength_row(self, self.strength_sweep, i)
 
                 # Step 1.1 - computing the effective sectional area
                 self.effective_area = self.section_property.area
@@ -786,18 +798,13 @@ class Flexure_Misc(Member):
                 list_result.append(section)
                 self.section_class = self.input_section_classification[section][0]
 
-                if self.design_type == KEY_DISP_DESIGN_TYPE_FLEXURE:
-                    self.laterally_supported(self)
-                    if self.web_buckling_check:
-                        continue
-                else:
-                    self.web_not_buckling_steps(self)
+                if self.design_type == KEY_DISP_DESIGN_TYPE_FLEXURE and self.web_buckling_check:
+                    self.web_buckling_steps(self)
+                    continue
                 print(f"Common result {list_result, self.section_class, self.V_d, self.high_shear_check, self.bending_strength_section}")
 
                 # 2.8 - UR
-                self.ur = round(
-                    max((self.load.moment / self.bending_strength_section * 10 ** -6),(self.load.shear_force / self.V_d * 10 ** -3)),
-                    2)  # ( +  round(self.load.axial_force / self.section_capacity, 3)
+                self.ur = round(float(self.strength_sweep['ur'][i]), 2)
                 print("UR", self.ur)
                 # 2.9 - Cost of the section in INR
                 self.cost = (
@@ -867,6 +874,82 @@ class Flexure_Misc(Member):
                         # Step 3 - Storing the optimum results to a list in a descending order
                         self.common_checks_1(self, section, 5, list_result, list_1)
 
+    def beam_strength_sweep(self):
+        """Shear and bending strength of all the sections of input_section_list, evaluated at once
+        [Reference: Cl. 8.2 and 8.4, IS 800:2007]"""
+        sweep = {'section_property': [], 'fy': [], 'epsilon': [], 'web_buckling_check': []}
+        for section in self.input_section_list:
+            self.section_property = self.section_conect_database(self, section)
+            sweep['section_property'].append(self.section_property)
+            sweep['fy'].append(self.material_property.fy)
+            sweep['epsilon'].append(self.epsilon)
+            sweep['web_buckling_check'].append(IS800_2007.cl_8_2_1_web_buckling(
+                d=self.section_property.depth,
+                tw=self.section_property.web_thickness,
+                e=self.epsilon,
+            ))
+
+        columns = section_columns(sweep['section_property'],
+                                  ['plast_sec_mod_z', 'elast_sec_mod_z', 'depth', 'web_thickness', 'flange_width',
+                                   'flange_thickness', 'mom_inertia_y', 'rad_of_gy_y'])
+        fy = np.array(sweep['fy'], dtype=float)
+        plastic = np.array([self.input_section_classification[section][0] in (KEY_Plastic, KEY_Compact)
+                            for section in self.input_section_list])
+        lambda_lt = None
+        alpha_lt = None
+        if self.design_type != KEY_DISP_DESIGN_TYPE_FLEXURE:
+            sweep['It'] = (2 * columns['flange_width'] * columns['flange_thickness'] ** 3) / 3 + (
+                    (columns['depth'] - columns['flange_thickness']) * columns['web_thickness'] ** 3) / 3
+            hf = columns['depth'] - columns['flange_thickness']
+            sweep['Iw'] = 0.5 ** 2 * columns['mom_inertia_y'] * hf ** 2
+            beta_b = np.where(plastic, 1.0, columns['elast_sec_mod_z'] / columns['plast_sec_mod_z'])
+            sweep['M_cr'] = elastic_lateral_torsional_buckling_moment(
+                self.material_property.modulus_of_elasticity, 0.3, columns['mom_inertia_y'], sweep['It'], sweep['Iw'],
+                self.effective_length * 1e3, beta_b, columns['plast_sec_mod_z'], hf, columns['rad_of_gy_y'],
+                columns['flange_thickness'])[0]
+            lambda_lt = non_dimensional_slenderness_lt(beta_b, columns['plast_sec_mod_z'], columns['elast_sec_mod_z'], fy,
+                                                       sweep['M_cr'])
+            alpha_lt = np.array([0.21 if section_property.type == "Rolled" else 0.49
+                                 for section_property in sweep['section_property']])
+            sweep['lambda_lt'] = lambda_lt
+            sweep['alpha_lt'] = alpha_lt
+        sweep.update(beam_strength_envelope(columns['plast_sec_mod_z'], columns['elast_sec_mod_z'], columns['depth'],
+                                         columns['web_thickness'], fy, columns['depth'] * columns['web_thickness'],
+                                         plastic, self.load_cases.moment, self.load_cases.shear, self.support, self.gamma_m0,
+                                         lambda_lt, alpha_lt))
+        return sweep
+
+    def beam_strength_row(self, sweep, i):
+        """Set the section, material and strength attributes of the i-th section of the sweep"""
+        self.section_property = sweep['section_property'][i]
+        self.material_property.fy = sweep['fy'][i]
+        self.epsilon = sweep['epsilon'][i]
+        self.web_buckling_check = sweep['web_buckling_check'][i]
+
+        self.V_d = float(sweep['V_d'][i])
+        self.high_shear_check = bool(sweep['high_shear'][i])
+        self.M_d = float(sweep['M_d'][i])
+        self.beta_b_lt = float(sweep['beta_b'][i])
+        if sweep['reduced'][i]:
+            self.bending_strength_section_reducedby = float(sweep['M_fd'][i])
+            self.beta_reduced = float(sweep['beta_reduced'][i])
+        if 'X_lt' in sweep:
+            self.It = float(sweep['It'][i])
+            self.Iw = float(sweep['Iw'][i])
+            self.alpha_lt = float(sweep['alpha_lt'][i])
+            self.lambda_lt = float(sweep['lambda_lt'][i])
+            self.phi_lt = float(sweep['phi_lt'][i])
+            self.X_lt = float(sweep['X_lt'][i])
+            self.fbd_lt = float(sweep['f_bd'][i])
+            self.lateral_tb = float(sweep['M_cr'][i]) * 10**-6
+        self.bending_strength_section_reduced = float(sweep['M_b'][i])
+        self.bending_strength_section = float(sweep['bending_strength'][i])
+        self.load_case = int(sweep['case'][i])
+        self.load_moment_case = int(sweep['moment_case'][i])
+        self.load_shear_case = int(sweep['shear_case'][i])
+        if len(self.load_cases) > 1:
+            self.load = self.load_cases.load(self.load_case)
+
     def laterally_supported(self):
 
         print(f"Working laterally_supported")
@@ -1050,67 +1133,34 @@ class Flexure_Misc(Member):
         self.input_section_list = []
         self.input_section_classification = {}
 
+        trial_properties = []
+        trial_fy = []
         for trial_section in self.input_modified:
             self.section_property = self.section_conect_database(self, trial_section)
             print(f"Type of section{self.section_property.designation}")
-            if self.section_property.type == "Rolled":
-                web_class = IS800_2007.Table2_iii(
-                    self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius),
-                    self.section_property.web_thickness,
-                    self.material_property.fy,
-                )
-                flange_class = IS800_2007.Table2_i(
-                    self.section_property.flange_width / 2,
-                    self.section_property.flange_thickness,
-                    self.material_property.fy,
-                )[0]
-                web_ratio = (self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2  /self.section_property.flange_thickness
-            else:
-                """Need to check below formula"""
-                flange_class = IS800_2007.Table2_i(
-                    (
-                        (self.section_property.flange_width / 2)
-                        # - (self.section_property.web_thickness / 2)
-                    ),
-                    self.section_property.flange_thickness,
-                    self.section_property.fy,
-                    self.section_property.type,
-                )[0]
-
-                web_class = IS800_2007.Table2_iii(
-                    (
-                        self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius)
-                    ),
-                    self.section_property.web_thickness,
-                    self.material_property.fy,
-                    classification_type="Axial compression",
-                )
-                web_ratio = (self.section_property.depth - 2 * (
-                            self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
-                flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
+            trial_properties.append(self.section_property)
+            trial_fy.append(self.material_property.fy)
+
+        if self.input_modified:
+            # Table 2 classification of all the sections at once
+            # need to check the formula for the flange and web of welded sections
+            columns = section_columns(trial_properties, ['flange_width', 'flange_thickness', 'depth', 'web_thickness',
+                                                         'root_radius'])
+            section_type = np.array([section_property.type for section_property in trial_properties])
+            classification = classify_sections(
+                columns['flange_width'] / 2, columns['flange_thickness'],
+                columns['depth'] - 2 * (columns['flange_thickness'] + columns['root_radius']), columns['web_thickness'],
+                np.array(trial_fy, dtype=float), section_type,
+                np.where(section_type == "Rolled", 'Neutral axis at mid-depth', 'Axial compression'),
+                flange_f_y=np.where(section_type == "Rolled", trial_fy, [section_property.fy for section_property in trial_properties]))
+
+        for k, trial_section in enumerate(self.input_modified):
+            self.section_class = classification['section_class'][k]
+            flange_class = classification['flange_class'][k]
+            web_class = classification['web_class'][k]
+            flange_ratio = float(classification['flange_ratio'][k])
+            web_ratio = float(classification['web_ratio'][k])
             print(f"\n \n \n flange_class {flange_class} \n web_class{web_class} \n \n")
-            if flange_class == "Slender" or web_class == "Slender":
-                self.section_class = "Slender"
-            else:
-                if flange_class == "Plastic" and web_class == "Plastic":
-                    self.section_class = "Plastic"
-                elif flange_class == "Plastic" and web_class == "Compact":
-                    self.section_class = "Compact"
-                elif flange_class == "Plastic" and web_class == "Semi-Compact":
-                    self.section_class = "Semi-Compact"
-                elif flange_class == "Compact" and web_class == "Plastic":
-                    self.section_class = "Compact"
-                elif flange_class == "Compact" and web_class == "Compact":
-                    self.section_class = "Compact"
-                elif flange_class == "Compact" and web_class == "Semi-Compact":
-                    self.section_class = "Semi-Compact"
-                elif flange_class == "Semi-Compact" and web_class == "Plastic":
-                    self.section_class = "Semi-Compact"
-                elif flange_class == "Semi-Compact" and web_class == "Compact":
-                    self.section_class = "Semi-Compact"
-                elif flange_class == "Semi-Compact" and web_class == "Semi-Compact":
-                    self.section_class = "Semi-Compact"
 
             # logger.info(
             #     "The section is {}. The {} section  has  {} flange({}) and  {} web({}).  [Reference: Cl 3.7, IS 800:2007].".format(
@@ -1262,16 +1312,13 @@ class Flexure_Misc(Member):
                 list_cl_7_1_2_1_design_compressisive_stress[6]
             )
         elif step == 5:
-            # 1- Based on optimum UR
-            self.optimum_section_ur_results[self.ur] = {}
-            list_2 = list_result.copy()
-            for j in list_1:
-                # k = 0
-                for k in list_2:
-                    self.optimum_section_ur_results[self.ur][j] = k
-                    # k += 1
-                    list_2.pop(0)
-                    break
+            # 1- Based on optimum UR: one row per section
+            index = self.section_results.add(section, self.ur, capacity=self.bending_strength_section,
+                                             section_class=self.section_class, mass=self.section_property.mass,
+                                             cost=self.cost, details=dict(zip(list_1, list_result)))
+            self.section_results.update(index, **{"Load case": self.load_case,
+                                                  "Load case.moment": self.load_moment_case,
+                                                  "Load case.shear": self.load_shear_case})
 
             # 2- Based on optimum cost
             self.optimum_section_cost_results[self.cost] = {}
@@ -1284,7 +1331,7 @@ class Flexure_Misc(Member):
                     break
             print(
                 f"\n self.optimum_section_cost_results {self.optimum_section_cost_results}"
-                f"\n self.optimum_section_ur_results {self.optimum_section_ur_results}"
+                f"\n self.section_results {self.section_results.table}"
             )
         elif step == 6:
             self.single_result[self.sec_profile] = {}
@@ -1408,9 +1455,8 @@ class Flexure_Misc(Member):
                 self.design_status_list.append(self.design_status)
 
             else:
-                self.result_UR = self.optimum_section_ur[
-                    -1
-                ]  # optimum section which passes the UR check
+                selected = self.section_results.most_utilised(min(self.allowable_utilization_ratio, 1.0))
+                self.result_UR = float(self.section_results.table['ur'][selected])  # optimum section which passes the UR check
                 print(f"self.result_UR{self.result_UR}")
                 self.design_status = True
 
@@ -1439,8 +1485,8 @@ class Flexure_Misc(Member):
             if self.optimization_parameter == "Utilization Ratio":
                 self.common_result(
                     self,
-                    list_result=self.optimum_section_ur_results,
-                    result_type=self.result_UR,
+                    list_result=self.section_results,
+                    result_type=selected,
                 )
             else:
                 self.result_UR = self.optimum_section_cost_results[
@@ -1496,8 +1542,22 @@ class Flexure_Misc(Member):
             else:
                 self.design_status = True
 
+    def load_case_result(self, result):
+        """Set the forces of the governing load case of a result, and report the case"""
+        if len(self.load_cases) == 1:
+            return
+        self.load = self.load_cases.load(result.get("Load case", 0))
+        logger.info(
+            "The governing load case of the section is {} (bending moment: {}, shear force: {}).".format(
+                self.load_cases.names[result.get("Load case", 0)],
+                self.load_cases.names[result.get("Load case.moment", 0)],
+                self.load_cases.names[result.get("Load case.shear", 0)],
+            )
+        )
+
     def common_result(self, list_result, result_type, flag=1):
         self.result_designation = list_result[result_type]["Designation"]
+        self.load_case_result(self, list_result[result_type])
         logger.info(
             "The section is {}. The {} section  has  {} flange({}) and  {} web({}).  [Reference: Cl 3.7, IS 800:2007].".format(
                 self.input_section_classification[self.result_designation][0] ,
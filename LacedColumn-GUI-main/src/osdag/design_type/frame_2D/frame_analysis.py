@@ -0,0 +1,386 @@
+"""Linear elastic analysis of plane frames.
+
+Frame2D holds the nodes, members and load cases of a frame in the x-y plane: three degrees of freedom per node (ux, uy,
+rz), members rigidly connected at their ends and bending about the major axis (z-z) of their section, with the area
+and moment of inertia of the section read from the section tables of the database (Beams, Columns, Channels, Angles,
+SHS, RHS, CHS).
+
+The stiffness matrices of all the members are computed at once as arrays and assembled into a sparse (CSR) global
+stiffness matrix. The matrix of the free degrees of freedom is factorised once (scipy.sparse.linalg.splu) and the loads
+of all the load cases are solved with that factorisation, as the columns of one right hand side.
+
+FrameResults holds the displacements, reactions and member end forces of every case, and design_forces() returns the
+forces of a member as the load keys of a design dictionary (KEY_AXIAL, KEY_SHEAR, KEY_MOMENT and the table of load
+cases KEY_LOAD_CASES, in kN and kNm), the input of the flexure and compression member modules.
+
+Units: N and mm (distributed loads in N/mm, moments in N-mm).
+"""
+import logging
+import math
+import sqlite3
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from ...Common import PATH_TO_DATABASE, KEY_AXIAL, KEY_SHEAR, KEY_MOMENT, KEY_LOAD_CASES, KEY_LOAD_CASE_NAME
+from ...utils.common.design_cache import database_version
+
+logger = logging.getLogger("Osdag.Frame2D")
+
+# columns of the area (cm2) and the major axis moment of inertia (cm4) in the section tables
+SECTION_TABLES = {
+    'Beams': ('Area', 'Iz'),
+    'Columns': ('Area', 'Iz'),
+    'Channels': ('Area', 'Iz'),
+    'Angles': ('Area', 'Iz'),
+    'SHS': ('A', 'Izz'),
+    'RHS': ('A', 'Izz'),
+    'CHS': ('A', 'I'),
+}
+
+# degrees of freedom of a node
+DOF = 3
+
+# area and moment of inertia of the sections read from the database, by (table, designation), and the version of the
+# database they were read from: the cache is emptied when the database changes (e.g. sections are imported)
+_section_cache = {}
+_section_cache_version = None
+
+
+def section_properties(designations, table='Beams'):
+    """Read the area (mm2) and the major axis moment of inertia (mm4) of sections from the database
+
+    Args:
+        designations: designations of the sections
+        table: section table of the database (a key of SECTION_TABLES)
+
+    Returns: dictionary {designation: (area, moment of inertia)}
+    """
+    global _section_cache_version
+    if table not in SECTION_TABLES:
+        raise ValueError("Unknown section table {}".format(table))
+    version = database_version()
+    if version != _section_cache_version:
+        _section_cache.clear()
+        _section_cache_version = version
+    missing = sorted({designation for designation in designations if (table, designation) not in _section_cache})
+    if missing:
+        area, inertia = SECTION_TABLES[table]
+        conn = sqlite3.connect(PATH_TO_DATABASE)
+        try:
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = conn.execute("SELECT Designation, {}, {} FROM {} WHERE Designation IN ({})".format(
+                    area, inertia, table, ', '.join('?' * len(chunk))), chunk)
+                for designation, A, I in rows:
+                    _section_cache[(table, designation)] = (A * 100, I * 10000)
+        finally:
+            conn.close()
+    properties = {}
+    for designation in designations:
+        if (table, designation) not in _section_cache:
+            raise ValueError("Section {} not found in the {} table".format(designation, table))
+        properties[designation] = _section_cache[(table, designation)]
+    return properties
+
+
+class Frame2D(object):
+    """A plane frame: nodes, members and load cases
+
+    Attributes:
+        E: modulus of elasticity of the members (N/mm2)
+        coordinates: coordinates of the nodes (list of (x, y), mm)
+        restraints: restrained degrees of freedom of the nodes (list of (ux, uy, rz) booleans)
+        members: nodes of the members (list of (node i, node j))
+        sections: area (mm2) and moment of inertia (mm4) of the members (list)
+        designations: sections of the members (list)
+        cases: names of the load cases
+    """
+
+    def __init__(self, E=2e5):
+        self.E = E
+        self.coordinates = []
+        self.restraints = []
+        self.members = []
+        self.sections = []
+        self.designations = []
+        self.cases = []
+        self._nodal_loads = []      # (case, node, fx, fy, mz)
+        self._distributed_loads = []    # (case, member, qx, qy), local axes, N/mm
+        self._point_loads = []      # (case, member, px, py, a), local axes, a from node i
+
+    def add_node(self, x, y, restraints=(False, False, False)):
+        """Add a node, restrained in the degrees of freedom (ux, uy, rz) marked True, and return its index"""
+        self.coordinates.append((float(x), float(y)))
+        self.restraints.append(tuple(bool(restraint) for restraint in restraints))
+        return len(self.coordinates) - 1
+
+    def support(self, node, restraints=(True, True, True)):
+        """Restrain a node: fixed by default, (True, True, False) for a pin, (False, True, False) for a roller"""
+        self.restraints[node] = tuple(bool(restraint) for restraint in restraints)
+
+    def add_member(self, node_i, node_j, designation, table='Beams', area=None, inertia=None):
+        """Add a member between two nodes and return its index
+
+        Args:
+            node_i, node_j: nodes of the ends of the member
+            designation: section of the member, read from table unless area (mm2) and inertia (mm4) are given
+            table: section table of the database
+        """
+        if area is None or inertia is None:
+            area, inertia = section_properties([designation], table)[designation]
+        self.members.append((int(node_i), int(node_j)))
+        self.sections.append((float(area), float(inertia)))
+        self.designations.append(designation)
+        return len(self.members) - 1
+
+    def add_members(self, connectivity, designations, table='Beams'):
+        """Add members in bulk, reading their sections from the database in one query
+
+        Args:
+            connectivity: nodes of the ends of the members (sequence of (node i, node j))
+            designations: sections of the members (one designation, or one per member)
+            table: section table of the database
+
+        Returns: indices of the members (list)
+        """
+        connectivity = [tuple(nodes) for nodes in connectivity]
+        if isinstance(designations, str):
+            designations = [designations] * len(connectivity)
+        if len(designations) != len(connectivity):
+            raise ValueError("Give one section per member")
+        properties = section_properties(designations, table)
+        first = len(self.members)
+        for (node_i, node_j), designation in zip(connectivity, designations):
+            self.members.append((int(node_i), int(node_j)))
+            self.sections.append(properties[designation])
+            self.designations.append(designation)
+        return list(range(first, len(self.members)))
+
+    def add_load_case(self, name):
+        """Add a load case and return its index"""
+        self.cases.append(str(name))
+        return len(self.cases) - 1
+
+    def nodal_load(self, case, node, fx=0.0, fy=0.0, mz=0.0):
+        """Apply forces (N) and a moment (N-mm) at a node, in the global axes"""
+        self._nodal_loads.append((case, node, fx, fy, mz))
+
+    def member_load(self, case, member, w, direction='global'):
+        """Apply a uniformly distributed load (N/mm of the length of the member) on a member
+
+        Args:
+            w: intensity of the load, positive along the y axis (gravity loads are negative)
+            direction: 'global' for a load along the global y axis, 'local' for a load perpendicular to the member
+        """
+        c, s = self.direction_cosines(member)
+        if direction == 'global':
+            self._distributed_loads.append((case, member, w * s, w * c))
+        else:
+            self._distributed_loads.append((case, member, 0.0, w))
+
+    def member_point_load(self, case, member, p, a, direction='global'):
+        """Apply a concentrated load (N) on a member, at a distance a (mm) from its node i
+
+        Args:
+            p: load, positive along the y axis
+            direction: 'global' for a load along the global y axis, 'local' for a load perpendicular to the member
+        """
+        c, s = self.direction_cosines(member)
+        if not 0 <= a <= self.length(member):
+            raise ValueError("The load is not on member {}".format(member))
+        if direction == 'global':
+            self._point_loads.append((case, member, p * s, p * c, a))
+        else:
+            self._point_loads.append((case, member, 0.0, p, a))
+
+    def length(self, member):
+        (xi, yi), (xj, yj) = (self.coordinates[node] for node in self.members[member])
+        return math.hypot(xj - xi, yj - yi)
+
+    def direction_cosines(self, member):
+        (xi, yi), (xj, yj) = (self.coordinates[node] for node in self.members[member])
+        L = math.hypot(xj - xi, yj - yi)
+        return (xj - xi) / L, (yj - yi) / L
+
+    def member_arrays(self):
+        """Return the lengths, direction cosines, local stiffness matrices, transformation matrices and degrees of
+        freedom of all the members (arrays, one entry per member)
+        """
+        xy = np.array(self.coordinates, dtype=float).reshape(-1, 2)
+        ends = np.array(self.members, dtype=int).reshape(-1, 2)
+        A, I = np.array(self.sections, dtype=float).reshape(-1, 2).T
+        d = xy[ends[:, 1]] - xy[ends[:, 0]]
+        L = np.hypot(d[:, 0], d[:, 1])
+        if np.any(L == 0):
+            raise ValueError("Members {} have no length".format(np.flatnonzero(L == 0).tolist()))
+        c, s = d[:, 0] / L, d[:, 1] / L
+
+        m = len(L)
+        EA, EI = self.E * A / L, self.E * I
+        k = np.zeros((m, 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = EA
+        k[:, 0, 3] = k[:, 3, 0] = -EA
+        k[:, 1, 1] = k[:, 4, 4] = 12 * EI / L ** 3
+        k[:, 1, 4] = k[:, 4, 1] = -12 * EI / L ** 3
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = 6 * EI / L ** 2
+        k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -6 * EI / L ** 2
+        k[:, 2, 2] = k[:, 5, 5] = 4 * EI / L
+        k[:, 2, 5] = k[:, 5, 2] = 2 * EI / L
+
+        T = np.zeros((m, 6, 6))
+        for offset in (0, 3):
+            T[:, offset, offset] = T[:, offset + 1, offset + 1] = c
+            T[:, offset, offset + 1] = s
+            T[:, offset + 1, offset] = -s
+            T[:, offset + 2, offset + 2] = 1
+
+        dofs = (DOF * ends[:, :, np.newaxis] + np.arange(DOF)).reshape(m, 6)
+        return L, c, s, k, T, dofs
+
+    def fixed_end_forces(self, L):
+        """Return the end forces of the members fixed at both ends under the member loads, in the local axes (array of
+        cases x members x 6)
+        """
+        fef = np.zeros((len(self.cases), len(L), 6))
+        if self._distributed_loads:
+            case, member, qx, qy = (np.array(column) for column in zip(*self._distributed_loads))
+            member = member.astype(int)
+            Lm = L[member]
+            forces = np.stack([-qx * Lm / 2, -qy * Lm / 2, -qy * Lm ** 2 / 12,
+                               -qx * Lm / 2, -qy * Lm / 2, qy * Lm ** 2 / 12], axis=1)
+            np.add.at(fef, (case.astype(int), member), forces)
+        if self._point_loads:
+            case, member, px, py, a = (np.array(column) for column in zip(*self._point_loads))
+            member = member.astype(int)
+            Lm = L[member]
+            b = Lm - a
+            forces = np.stack([-px * b / Lm, -py * b ** 2 * (3 * a + b) / Lm ** 3, -py * a * b ** 2 / Lm ** 2,
+                               -px * a / Lm, -py * a ** 2 * (a + 3 * b) / Lm ** 3, py * a ** 2 * b / Lm ** 2], axis=1)
+            np.add.at(fef, (case.astype(int), member), forces)
+        return fef
+
+    def analyse(self):
+        """Analyse the frame under all the load cases
+
+        Returns: FrameResults
+        """
+        if not self.cases:
+            self.add_load_case('Load case 1')
+        n_dof = DOF * len(self.coordinates)
+        n_cases = len(self.cases)
+        L, c, s, k, T, dofs = self.member_arrays()
+
+        # global stiffness matrix, assembled from the member matrices in the global axes
+        k_global = np.einsum('mji,mjk,mkl->mil', T, k, T)
+        rows = np.repeat(dofs, 6, axis=1).ravel()
+        cols = np.tile(dofs, (1, 6)).ravel()
+        K = sparse.coo_matrix((k_global.ravel(), (rows, cols)), shape=(n_dof, n_dof)).tocsr()
+
+        # loads: nodal loads and the equivalent nodal loads of the member loads
+        F = np.zeros((n_dof, n_cases))
+        for case, node, fx, fy, mz in self._nodal_loads:
+            F[DOF * node:DOF * node + DOF, case] += (fx, fy, mz)
+        fef = self.fixed_end_forces(L)
+        equivalent = -np.einsum('mji,cmj->cmi', T, fef)
+        for case in range(n_cases):
+            np.add.at(F[:, case], dofs.ravel(), equivalent[case].ravel())
+
+        # solve the free degrees of freedom, one factorisation for all the cases
+        free = ~np.array(self.restraints, dtype=bool).ravel()
+        U = np.zeros((n_dof, n_cases))
+        if free.any():
+            try:
+                lu = splu(K[free][:, free].tocsc())
+            except RuntimeError:
+                raise ValueError("The frame is unstable: check the supports and the connectivity of the members")
+            U[free] = lu.solve(F[free]).reshape(-1, n_cases)
+            if not np.all(np.isfinite(U)):
+                raise ValueError("The frame is unstable: check the supports and the connectivity of the members")
+
+        reactions = K @ U - F
+        reactions[free] = 0.0
+
+        u_local = np.einsum('mij,cmj->cmi', T, U.T[:, dofs])
+        end_forces = np.einsum('mij,cmj->cmi', k, u_local) + fef
+        return FrameResults(self, L, U.T.reshape(n_cases, -1, DOF), reactions.T.reshape(n_cases, -1, DOF), end_forces)
+
+
+class FrameResults(object):
+    """Results of the analysis of a Frame2D
+
+    Attributes:
+        displacements: displacements (ux, uy in mm, rz in rad) of the nodes (array of cases x nodes x 3)
+        reactions: reactions (N, N-mm) at the restrained degrees of freedom of the nodes (array of cases x nodes x 3)
+        end_forces: forces on the ends of the members in their local axes, [N_i, V_i, M_i, N_j, V_j, M_j] (N, N-mm)
+                    (array of cases x members x 6)
+    """
+
+    def __init__(self, frame, lengths, displacements, reactions, end_forces):
+        self.frame = frame
+        self.lengths = lengths
+        self.displacements = displacements
+        self.reactions = reactions
+        self.end_forces = end_forces
+
+    def member_forces(self, member, case):
+        """Return the design forces of a member in a load case
+
+        Returns: dictionary of the axial force (N, tension positive), the largest shear force (N) and bending moment
+                 (N-mm, sagging positive) along the member and its end moments
+        """
+        N_i, V_i, M_i, N_j, V_j, M_j = self.end_forces[case, member]
+        L = self.lengths[member]
+        qx = qy = 0.0
+        for load_case, load_member, load_qx, load_qy in self.frame._distributed_loads:
+            if load_case == case and load_member == member:
+                qx, qy = qx + load_qx, qy + load_qy
+        points = [(a, py) for load_case, load_member, px, py, a in self.frame._point_loads
+                  if load_case == case and load_member == member]
+
+        # shear and moment along the member: V(x) = V_i + qy x + sum P, M(x) = -M_i + V_i x + qy x^2 / 2 + sum P (x - a)
+        stations = [0.0, L] + [a for a, _ in points]
+        if qy != 0 and 0 < -V_i / qy < L:
+            stations.append(-V_i / qy)   # zero shear
+
+        def moment(x):
+            return -M_i + V_i * x + qy * x ** 2 / 2 + sum(p * (x - a) for a, p in points if x > a)
+
+        def shear(x, before=False):
+            return V_i + qy * x + sum(p for a, p in points if (a < x if before else a <= x))
+
+        moments = [moment(x) for x in stations]
+        shears = [shear(x) for x in stations] + [shear(x, before=True) for x in stations]
+        return {
+            'axial': float(max(-N_i, N_j, key=abs)),
+            'shear': float(max(abs(v) for v in shears)),
+            'moment': float(max(moments, key=abs)),
+            'moment_i': float(-M_i),
+            'moment_j': float(M_j),
+        }
+
+    def design_forces(self, member, tension=False):
+        """Return the forces of a member in all the load cases as the load keys of a design dictionary
+
+        Args:
+            member: index of the member
+            tension: True for the tension of the member (tension member design), False for its compression
+
+        Returns: dictionary of KEY_AXIAL, KEY_SHEAR and KEY_MOMENT (kN and kNm, the largest of the cases) and
+                 KEY_LOAD_CASES, the forces of every case
+        """
+        cases = []
+        for case, name in enumerate(self.frame.cases):
+            forces = self.member_forces(member, case)
+            axial = forces['axial'] if tension else -forces['axial']
+            cases.append({
+                KEY_LOAD_CASE_NAME: name,
+                KEY_AXIAL: str(round(max(axial, 0.0) / 1e3, 3)),
+                KEY_SHEAR: str(round(forces['shear'] / 1e3, 3)),
+                KEY_MOMENT: str(round(abs(forces['moment']) / 1e6, 3)),
+            })
+        design_forces = {key: max(cases, key=lambda case: float(case[key]))[key]
+                         for key in (KEY_AXIAL, KEY_SHEAR, KEY_MOMENT)}
+        design_forces[KEY_LOAD_CASES] = cases
+        return design_forces
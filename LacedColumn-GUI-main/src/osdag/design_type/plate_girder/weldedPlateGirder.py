@@ -36,8 +36,8 @@ from ..tension_member import *
 from ...utils.common.Section_Properties_Calculator import BBAngle_Properties
 from ...utils.common import is800_2007
 from ...utils.common.component import *
-from osdag.cad.items.plate import Plate
 from ...utils.common.Unsymmetrical_Section_Properties import Unsymmetrical_I_Section_Properties
+from ...utils.common.instrumentation import timed, trace
 class PlateGirderWelded(Member):
 
 
@@ -302,7 +302,7 @@ class PlateGirderWelded(Member):
     # Setting up logger and Input and Output Docks
     ####################################
     def module_name(self):
-        print('in module')
+        trace.debug('in module')
         return KEY_DISP_PLATE_GIRDER_WELDED
 
 
@@ -437,7 +437,7 @@ class PlateGirderWelded(Member):
         return options_list
 
     def fn_torsion_warping(self):
-        print( 'Inside fn_torsion_warping', self)
+        trace.debug('Inside fn_torsion_warping %s', self)
         if self[0] == Torsion_Restraint1:
             return Warping_Restraint_list
         elif self[0] == Torsion_Restraint2:
@@ -447,7 +447,7 @@ class PlateGirderWelded(Member):
 
     def axis_bending_change(self):
         design = self[0]
-        print( 'Inside fn_supp_image', self)
+        trace.debug('Inside fn_supp_image %s', self)
         if self[0] == KEY_DISP_DESIGN_TYPE_FLEXURE:
             return ['NA']
         else:
@@ -596,7 +596,7 @@ class PlateGirderWelded(Member):
         return lst
 
     def warning_majorbending(self):
-        print(self)
+        trace.debug('%s', self)
         if self[0] == VALUES_SUPP_TYPE_temp[2]:
             return True
         # elif self[0] == VALUES_SUPP_TYPE_temp[0] or self[0] == VALUES_SUPP_TYPE_temp[1] :
@@ -605,7 +605,7 @@ class PlateGirderWelded(Member):
             return False
 
     def output_modifier(self):
-        print(self)
+        trace.debug('%s', self)
         if self[0] == VALUES_SUPP_TYPE_temp[2]:
             return False
         # elif self[0] == VALUES_SUPP_TYPE_temp[0] or self[0] == VALUES_SUPP_TYPE_temp[1] :
@@ -614,7 +614,7 @@ class PlateGirderWelded(Member):
             return True
 
     def Design_pref_modifier(self):
-        print("Design_pref_modifier",self)
+        trace.debug('Design_pref_modifier %s', self)
 
 
     def output_values(self, flag):
@@ -791,7 +791,7 @@ class PlateGirderWelded(Member):
         return spacing
 
     def func_for_validation(self, design_dictionary):
-        print(f"func_for_validation here")
+        trace.debug('func_for_validation here')
         all_errors = []
         self.design_status = False
         flag = False
@@ -801,9 +801,7 @@ class PlateGirderWelded(Member):
         flag3 = False
         option_list = self.input_values(self)
         missing_fields_list = []
-        print(f'func_for_validation option_list {option_list}'
-            f"\n  design_dictionary {design_dictionary}"
-              )
+        trace.debug('func_for_validation option_list %s   design_dictionary %s', option_list, design_dictionary)
         for option in option_list:
             if option[2] == TYPE_TEXTBOX or option[0] == KEY_LENGTH or option[0] == KEY_SHEAR or option[0] == KEY_MOMENT:
                 try:
@@ -820,7 +818,7 @@ class PlateGirderWelded(Member):
                             continue
                     if option[0] == KEY_LENGTH:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
 
@@ -828,14 +826,14 @@ class PlateGirderWelded(Member):
                             flag1 = True
                     elif option[0] == KEY_SHEAR:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
                         else:
                             flag2 = True
                     elif option[0] == KEY_MOMENT:
                         if float(design_dictionary[option[0]]) <= 0.0:
-                            print("Input value(s) cannot be equal or less than zero.")
+                            trace.debug('Input value(s) cannot be equal or less than zero.')
                             error = "Input value(s) cannot be equal or less than zero."
                             all_errors.append(error)
                         else:
@@ -851,9 +849,9 @@ class PlateGirderWelded(Member):
             flag = True
 
         if flag and flag1 and flag2 and flag3:
-            print(f"\n design_dictionary{design_dictionary}")
+            trace.debug('design_dictionary%s', design_dictionary)
             self.set_input_values(self, design_dictionary)
-            print("WORKING VALIDATION")
+            trace.debug('WORKING VALIDATION')
             # if self.design_status ==False and len(self.failed_design_dict)>0:
             #     logger.error(
             #         "Design Failed, Check Design Report"
@@ -1021,6 +1019,7 @@ class PlateGirderWelded(Member):
 
 
     # Simulation starts here
+    @timed('plate_girder.design')
     def section_classification(self,design_dictionary):
         # for self.web_thickness in self.web_thickness_list:
         #     for self.top_flange_thickness in self.top_flange_thickness_list:
@@ -1031,7 +1030,7 @@ class PlateGirderWelded(Member):
         web_ratio = (self.total_depth - (self.top_flange_thickness + self.bottom_flange_thickness)) / self.web_thickness
         flange_ratio_top = self.top_flange_width / (2 *self.top_flange_thickness)
         flange_ratio_bottom = self.bottom_flange_width / (2 *self.bottom_flange_thickness)
-        print("fafafafafafafafaf",flange_class_top, flange_class_bottom,web_class,web_ratio,flange_ratio_top,flange_ratio_bottom)
+        trace.debug('Top flange, bottom flange and web classes %s %s %s, web ratio %s, flange ratios %s %s', flange_class_top, flange_class_bottom, web_class, web_ratio, flange_ratio_top, flange_ratio_bottom)
         if flange_class_bottom == "Slender" or web_class == "Slender" or flange_class_top == 'Slender':
                 self.section_class = "Slender"
         else:
@@ -1053,34 +1052,34 @@ class PlateGirderWelded(Member):
                 self.section_class = KEY_SemiCompact
             elif flange_class_bottom == KEY_SemiCompact and web_class == KEY_SemiCompact and flange_class_top == KEY_SemiCompact:
                 self.section_class = KEY_SemiCompact
-        print("fafafahjahfhabnfahf", self.section_class)
+        trace.debug('Section class %s', self.section_class)
         self.Zp_req = self.load.moment * self.gamma_m0 / self.material.fy
         self.effective_length_beam(self, design_dictionary, self.length)
 
-        print( 'self.allow_class', self.allow_class)
+        trace.debug('self.allow_class %s', self.allow_class)
         self.plast_sec_mod_z = Unsymmetrical_I_Section_Properties.calc_PlasticModulusZ(self,self.total_depth,self.top_flange_width,self.bottom_flange_width,
                                                     self.web_thickness,self.top_flange_thickness,self.bottom_flange_thickness)
         self.elast_sec_mod_z =Unsymmetrical_I_Section_Properties.calc_ElasticModulusZz(self,self.total_depth,self.top_flange_width,self.bottom_flange_width,
                                                     self.web_thickness,self.top_flange_thickness,self.bottom_flange_thickness)
         self.Zp_req = self.load.moment * self.gamma_m0 / self.material.fy
         if self.plast_sec_mod_z >= self.Zp_req:
-            print( 'self.section_property.plast_sec_mod_z More than Requires',self.plast_sec_mod_z,self.Zp_req)
+            trace.debug('self.section_property.plast_sec_mod_z More than Requires %s %s', self.plast_sec_mod_z, self.Zp_req)
             if self.section_class == KEY_Plastic or self.section_class == KEY_Compact:
                 self.beta_b_lt = 1.0
             else:
                 self.beta_b_lt = (self.elast_sec_mod_z/ self.plast_sec_mod_z)
-        print("Fafavsfqf",self.beta_b_lt)  
+        trace.debug('beta_b_lt %s', self.beta_b_lt)  
         A_vg = (self.total_depth - self.top_flange_thickness - self.bottom_flange_thickness) * self.web_thickness    
         self.V_d = ((A_vg * self.material.fy) / (math.sqrt(3) * self.gamma_m0))
-        print("Shear check",self.V_d)
-        print("shear force ",self.load.shear_force)  #V value self.load.shear_force
+        trace.debug('Shear check %s', self.V_d)
+        trace.debug('shear force  %s', self.load.shear_force)  #V value self.load.shear_force
         if IS800_2007.cl_8_2_1_2_high_shear_check(self.load.shear_force,self.V_d): #high shear
             if self.support_type == 'Major Laterally Supported':
                 if self.web_philosophy == 'Thick Web without ITS':
                     if IS800_2007.cl_8_6_1_1_plate_girder_minimum_web_a(self.total_depth,self.web_thickness,self.epsilon,self.top_flange_thickness,self.bottom_flange_thickness):
                         self.Mdv = self.calc_Mdv(self,self.load.shear_force,self.V_d, self.plast_sec_mod_z,self.elast_sec_mod_z, self.material.fy, self.gamma_m0, self.total_depth, self.web_thickness, self.top_flange_thickness, self.bottom_flange_thickness)
                         self.web_buckling_check(self)
-                        print("fafafamfm a",self.Mdv)
+                        trace.debug('Mdv %s', self.Mdv)
                         self.eff_depth = self.total_depth - (self.top_flange_thickness + self.bottom_flange_thickness)
                         dataframe = IS800_2007.cl_7_1_2_1_design_compressisive_stress_fcd_buckling_class_c()
                         n1 = self.eff_depth / 2
@@ -1089,16 +1088,16 @@ class PlateGirderWelded(Member):
                         interp_val = self.interpolate_value(self,slenderness_input, self.material.fy,dataframe)
                         if interp_val != None:
                             self.fcd = round(interp_val, 2)
-                            print("Web Buckling at ")
-                            print(f"fcd: {self.fcd}N/mm2")
+                            trace.debug('Web Buckling at')
+                            trace.debug('fcd: %sN/mm2', self.fcd)
                             Critical_buckling_load = round(Ac * self.fcd / 1000, 2)
-                            print(f"Critical buckling load: {Critical_buckling_load}kN")
+                            trace.debug('Critical buckling load: %skN', Critical_buckling_load)
 
                             #Web Crippling
-                            print("Web Crippling")
+                            trace.debug('Web Crippling')
                             n2= 2.5*self.top_flange_thickness
                             Critical_crippling_load= round((self.b1+n2)*self.web_thickness*self.material.fy/(1.1*1000),2)
-                            print(f"Critical crippling load: {Critical_crippling_load}kN")
+                            trace.debug('Critical crippling load: %skN', Critical_crippling_load)
                         else:
                             logger.error("Change materrial grade. Minimum Grade is E 250")
 
@@ -1108,9 +1107,9 @@ class PlateGirderWelded(Member):
                             if design_dictionary[KEY_IntermediateStiffener_spacing] != 'NA':
                                 c = float(design_dictionary[KEY_IntermediateStiffener_spacing])
                             if self.shear_buckling_check_simple_postcritical(self,self.eff_depth,A_vg,self.load.shear_force,c):
-                                print("Check passed")
+                                trace.debug('Check passed')
                             else:
-                                print("Check Failed")
+                                trace.debug('Check Failed')
                         else:
                             pass
 
@@ -1131,9 +1130,9 @@ class PlateGirderWelded(Member):
                             logger.error("Intermediate Stiffner Spacing cannot be 'NA'")
                         c = float(design_dictionary[KEY_IntermediateStiffener_spacing])
                         if self.shear_buckling_check_tension_field(self,self.eff_depth,A_vg,c,Nf):
-                            print("Check passed")
+                            trace.debug('Check passed')
                         else:
-                            print("Check Failed")
+                            trace.debug('Check Failed')
                     
             else: #unsupported
                 if self.web_philosophy == 'Thick Web without ITS':
@@ -1145,16 +1144,16 @@ class PlateGirderWelded(Member):
                     interp_val = self.interpolate_value(self,slenderness_input, self.material.fy,dataframe)
                     if interp_val != None:
                         self.fcd = round(interp_val, 2)
-                        print("Web Buckling at ")
-                        print(f"fcd: {self.fcd}N/mm2")
+                        trace.debug('Web Buckling at')
+                        trace.debug('fcd: %sN/mm2', self.fcd)
                         Critical_buckling_load = round(Ac * self.fcd / 1000, 2)
-                        print(f"Critical buckling load: {Critical_buckling_load}kN")
+                        trace.debug('Critical buckling load: %skN', Critical_buckling_load)
 
                         #Web Crippling
-                        print("Web Crippling")
+                        trace.debug('Web Crippling')
                         n2= 2.5*self.top_flange_thickness
                         Critical_crippling_load= round((self.b1+n2)*self.web_thickness*self.material.fy/(1.1*1000),2)
-                        print(f"Critical crippling load: {Critical_crippling_load}kN")
+                        trace.debug('Critical crippling load: %skN', Critical_crippling_load)
                     else:
                         logger.error("Change materrial grade. Minimum Grade is E 250")
                 else: #thin web
@@ -1167,10 +1166,10 @@ class PlateGirderWelded(Member):
                 self.M_cr = self.calc_Mcr_LoadingCase(self,self.material.modulus_of_elasticity, G, Iy, It, Iw, self.effective_length, Kw, self.total_depth,
                             self.top_flange_thickness, self.bottom_flange_thickness, self.top_flange_width, self.bottom_flange_width,
                             self.loading_case, self.warping)
-                print("Input moment",self.load.moment)
-                print("MCR VAL",self.M_cr)
+                trace.debug('Input moment %s', self.load.moment)
+                trace.debug('MCR VAL %s', self.M_cr)
                 if self.M_cr < self.load.moment:
-                    print("Passed Moment check")
+                    trace.debug('Passed Moment check')
 
                 else:
                     logger.error("Moment check failed! Need to increase flange size")
@@ -1179,7 +1178,7 @@ class PlateGirderWelded(Member):
                 if self.web_philosophy == 'Thick Web without ITS':
                     if IS800_2007.cl_8_6_1_1_plate_girder_minimum_web_a(self.total_depth,self.web_thickness,self.epsilon,self.top_flange_thickness,self.bottom_flange_thickness):
                         self.Md =self.plast_sec_mod_z * self.material.fy / self.gamma_m0                                                                                            
-                        print("sefafafaf c",self.Md)
+                        trace.debug('Md %s', self.Md)
                         self.web_buckling_check(self)
                         self.eff_depth = self.total_depth - (self.top_flange_thickness + self.bottom_flange_thickness)
                         dataframe = IS800_2007.cl_7_1_2_1_design_compressisive_stress_fcd_buckling_class_c()
@@ -1189,16 +1188,16 @@ class PlateGirderWelded(Member):
                         interp_val = self.interpolate_value(self,slenderness_input, self.material.fy,dataframe)
                         if interp_val != None:
                             self.fcd = round(interp_val, 2)
-                            print("Web Buckling at ")
-                            print(f"fcd: {self.fcd}N/mm2")
+                            trace.debug('Web Buckling at')
+                            trace.debug('fcd: %sN/mm2', self.fcd)
                             Critical_buckling_load = round(Ac * self.fcd / 1000, 2)
-                            print(f"Critical buckling load: {Critical_buckling_load}kN")
+                            trace.debug('Critical buckling load: %skN', Critical_buckling_load)
 
                             #Web Crippling
-                            print("Web Crippling")
+                            trace.debug('Web Crippling')
                             n2= 2.5*self.top_flange_thickness
                             Critical_crippling_load= round((self.b1+n2)*self.web_thickness*self.material.fy/(1.1*1000),2)
-                            print(f"Critical crippling load: {Critical_crippling_load}kN")
+                            trace.debug('Critical crippling load: %skN', Critical_crippling_load)
                         else:
                             logger.error("Change materrial grade. Minimum Grade is E 250")
                         
@@ -1209,9 +1208,9 @@ class PlateGirderWelded(Member):
                             if design_dictionary[KEY_IntermediateStiffener_spacing] != 'NA':
                                 c = float(design_dictionary[KEY_IntermediateStiffener_spacing])
                             if self.shear_buckling_check_simple_postcritical(self,self.eff_depth,A_vg,self.load.shear_force,c):
-                                print("Check passed")
+                                trace.debug('Check passed')
                             else:
-                                print("Check Failed")
+                                trace.debug('Check Failed')
                         else:
                             pass
                     else:
@@ -1227,9 +1226,9 @@ class PlateGirderWelded(Member):
                             logger.error("Intermediate Stiffner Spacing cannot be 'NA'")
                         c = float(design_dictionary[KEY_IntermediateStiffener_spacing])
                         if self.shear_buckling_check_tension_field(self,self.eff_depth,A_vg,c,Nf):
-                            print("Check passed")
+                            trace.debug('Check passed')
                         else:
-                            print("Check Failed")
+                            trace.debug('Check Failed')
             
             else: #unsupported
                 if self.web_philosophy == 'Thick Web without ITS':
@@ -1241,16 +1240,16 @@ class PlateGirderWelded(Member):
                     interp_val = self.interpolate_value(self,slenderness_input, self.material.fy,dataframe)
                     if interp_val != None:
                         self.fcd = round(interp_val, 2)
-                        print("Web Buckling at ")
-                        print(f"fcd: {self.fcd}N/mm2")
+                        trace.debug('Web Buckling at')
+                        trace.debug('fcd: %sN/mm2', self.fcd)
                         Critical_buckling_load = round(Ac * self.fcd / 1000, 2)
-                        print(f"Critical buckling load: {Critical_buckling_load}kN")
+                        trace.debug('Critical buckling load: %skN', Critical_buckling_load)
 
                         #Web Crippling
-                        print("Web Crippling")
+                        trace.debug('Web Crippling')
                         n2= 2.5*self.top_flange_thickness
                         Critical_crippling_load= round((self.b1+n2)*self.web_thickness*self.material.fy/(1.1*1000),2)
-                        print(f"Critical crippling load: {Critical_crippling_load}kN")
+                        trace.debug('Critical crippling load: %skN', Critical_crippling_load)
                     else:
                         logger.error("Change materrial grade. Minimum Grade is E 250")
                 else: #thin web
@@ -1264,10 +1263,10 @@ class PlateGirderWelded(Member):
                 self.M_cr = self.calc_Mcr_LoadingCase(self,self.material.modulus_of_elasticity, G, Iy, It, Iw, self.effective_length, Kw, self.total_depth,
                             self.top_flange_thickness, self.bottom_flange_thickness, self.top_flange_width, self.bottom_flange_width,
                             self.loading_case, self.warping)
-                print("Input moment",self.load.moment)
-                print("MCR VAL",self.M_cr)
+                trace.debug('Input moment %s', self.load.moment)
+                trace.debug('MCR VAL %s', self.M_cr)
                 if self.M_cr > self.load.moment:
-                    print("Passed Moment check")
+                    trace.debug('Passed Moment check')
 
                 else:
                     logger.error("Moment check failed! Need to increase flange size")
@@ -1279,7 +1278,7 @@ class PlateGirderWelded(Member):
         if design_dictionary[KEY_LENGTH_OVERWRITE] == 'NA':
             self.effective_length = IS800_2007.cl_8_3_1_EffLen_Simply_Supported(Torsional=self.torsional_res,Warping=self.warping,
                                                                                 length=length,depth=(self.total_depth/1000),load=self.loading_condition)
-            print(f"Working 1 {self.effective_length}")
+            trace.debug('Working 1 %s', self.effective_length)
         else:
             try:
                 if float(design_dictionary[KEY_LENGTH_OVERWRITE]) <= 0:
@@ -1288,15 +1287,15 @@ class PlateGirderWelded(Member):
                     length = length * float(design_dictionary[KEY_LENGTH_OVERWRITE])
 
                 self.effective_length = length
-                print(f"Working 2 {self.effective_length}")
+                trace.debug('Working 2 %s', self.effective_length)
             except:
-                print(f"Inside effective_length_beam",type(design_dictionary[KEY_LENGTH_OVERWRITE]))
+                trace.debug('Inside effective_length_beam %s', type(design_dictionary[KEY_LENGTH_OVERWRITE]))
                 logger.warning("Invalid Effective Length Parameter.")
                 logger.info('Effective Length Parameter is set to default: 1.0')
                 design_dictionary[KEY_LENGTH_OVERWRITE] = '1.0'
                 self.effective_length_beam(self, design_dictionary, length)
-                print(f"Working 3 {self.effective_length}")
-        print(f"Inside effective_length_beam",self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
+                trace.debug('Working 3 %s', self.effective_length)
+        trace.debug('Inside effective_length_beam %s %s', self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
 
 
     
@@ -1305,7 +1304,7 @@ class PlateGirderWelded(Member):
             d=self.total_depth - (self.top_flange_thickness + self.bottom_flange_thickness),
             tw=self.web_thickness,
             e=self.epsilon,)
-        print("fafafajnafjkfmaf",self.web_buckling)
+        trace.debug('web_buckling %s', self.web_buckling)
 
         # if not self.web_buckling_check:
         #     self.web_not_buckling_steps(self)
@@ -1323,7 +1322,7 @@ class PlateGirderWelded(Member):
         lambda_w = IS800_2007.cl_8_4_2_2_lambda_w_Simple_postcritical(self.material.fy, tau_crc)
         tau_b = IS800_2007.cl_8_4_2_2_tau_b_Simple_postcritical(lambda_w, self.material.fy)
         V_cr = IS800_2007.cl_8_4_2_2_Vcr_Simple_postcritical(tau_b, A_vg)
-        print("V_cr value",V_cr)
+        trace.debug('V_cr value %s', V_cr)
         if V_cr > V:
             return True
         else:
@@ -1343,7 +1342,7 @@ class PlateGirderWelded(Member):
         lambda_w = IS800_2007.cl_8_4_2_2_lambda_w_Simple_postcritical(self.material.fy, tau_crc)
         tau_b = IS800_2007.cl_8_4_2_2_tau_b_Simple_postcritical(lambda_w, self.material.fy)
         phi,M_fr,s, w_tf,sai,fv,V_tf = IS800_2007.cl_8_4_2_2_TensionField( c, eff_depth, self.web_thickness, self.material.fy, self.top_flange_width,self.top_flange_thickness, self.material.fy,Nf, self.gamma_m0, A_vg,tau_b,self.load.shear_force)
-        print("vtf val",V_tf)
+        trace.debug('vtf val %s', V_tf)
         if V_tf >= self.load.shear_force:
             return True
         else:
@@ -1493,7 +1492,7 @@ class PlateGirderWelded(Member):
     #--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     def section_classification1(self, design_dictionary,trial_section=""):
         """Classify the sections based on Table 2 of IS 800:2007"""
-        print(f"Inside section_classification")
+        trace.debug('Inside section_classification')
         local_flag = True
         self.input_modified = []
         self.input_section_list = []
@@ -1502,7 +1501,7 @@ class PlateGirderWelded(Member):
         for trial_section in self.sec_list:
             trial_section = trial_section.strip("'")
             self.section_property = self.section_connect_database(self, trial_section)
-            print(f"Type of section{self.section_property.designation}")
+            trace.debug('Type of section%s', self.section_property.designation)
             if self.section_property.type == "Rolled":
                 web_class = IS800_2007.Table2_iii(
                     self.section_property.depth - 2*(self.section_property.flange_thickness + self.section_property.root_radius),
@@ -1537,7 +1536,7 @@ class PlateGirderWelded(Member):
                 web_ratio = (self.section_property.depth - 2 * (
                             self.section_property.flange_thickness + self.section_property.root_radius)) / self.section_property.web_thickness
                 flange_ratio = self.section_property.flange_width / 2 / self.section_property.flange_thickness
-            print(f"\n \n \n flange_class_bottom {flange_class_bottom} \n web_class{web_class} \n \n")
+            trace.debug('flange_class_bottom %s   web_class%s', flange_class_bottom, web_class)
             if flange_class_bottom == "Slender" or web_class == "Slender":
                 self.section_class = "Slender"
             else:
@@ -1563,9 +1562,9 @@ class PlateGirderWelded(Member):
             self.Zp_req = self.load.moment * self.gamma_m0 / self.material_property.fy
             self.effective_length_beam(self, design_dictionary, self.length)  # mm
 
-            print( 'self.allow_class', self.allow_class)
+            trace.debug('self.allow_class %s', self.allow_class)
             if self.section_property.plast_sec_mod_z >= self.Zp_req:
-                print( 'self.section_property.plast_sec_mod_z More than Requires')
+                trace.debug('self.section_property.plast_sec_mod_z More than Requires')
 
                 if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
                     self.It = self.section_property.It
@@ -1663,7 +1662,7 @@ class PlateGirderWelded(Member):
         '''
         TODO add button to give user option to take Tension holes or not
         '''
-        print(f"\n Inside optimization_tab_check")
+        trace.debug('Inside optimization_tab_check')
         self.latex_tension_zone = False
         if (self.effective_area_factor <= 0.10) or (self.effective_area_factor > 1.0):
             logger.error(
@@ -1692,7 +1691,7 @@ class PlateGirderWelded(Member):
                     pass
                 else:
                     self.latex_tension_zone = True
-                    print(f'self.latex_tension_zone: {self.latex_tension_zone}')
+                    trace.debug('self.latex_tension_zone: %s', self.latex_tension_zone)
                 # self.effective_area_factor = (
                 #     self.material_property.fy
                 #     * self.gamma_m0
@@ -1706,7 +1705,7 @@ class PlateGirderWelded(Member):
 
     def input_modifier(self):
         """Classify the sections based on Table 2 of IS 800:2007"""
-        print(f"Inside input_modifier")
+        trace.debug('Inside input_modifier')
         local_flag = True
         self.input_modified = []
         self.input_section_list = []
@@ -1717,7 +1716,7 @@ class PlateGirderWelded(Member):
             self.section_property = self.section_connect_database(self, section)
 
             self.Zp_req = self.load.moment * self.gamma_m0 / self.material_property.fy
-            print('Inside input_modifier not allow_class',self.allow_class,self.load.moment, self.gamma_m0, self.material_property.fy)
+            trace.debug('Inside input_modifier not allow_class %s %s %s %s', self.allow_class, self.load.moment, self.gamma_m0, self.material_property.fy)
             if self.section_property.plast_sec_mod_z >= self.Zp_req:
 
                 self.input_modified.append(section)
@@ -1729,11 +1728,11 @@ class PlateGirderWelded(Member):
                 # logger.warning(
                 #     f"Required self.Zp_req = {round(self.Zp_req* 10**-3,2)} x 10^3 mm^3 and Zp of section {self.section_property.designation} = {round(self.section_property.plast_sec_mod_z* 10**-3,2)} x 10^3 mm^3.Section dosen't satisfy Min self.Zp_req value")
         # logger.info("")
-        print("self.input_modified", self.input_modified)
+        trace.debug('self.input_modified %s', self.input_modified)
 
     def section_connect_database(self, section):
-        print(f"section_connect_database{section}")
-        print(section)
+        trace.debug('section_connect_database%s', section)
+        trace.debug('%s', section)
         # print(self.sec_profile)
         if (
             self.sec_profile == VALUES_SECTYPE[1]
@@ -1745,7 +1744,7 @@ class PlateGirderWelded(Member):
             self.material_property.connect_to_database_to_get_fy_fu(
                 self.material, max(self.section_property.flange_thickness, self.section_property.web_thickness)
             )
-            print(f"section_connect_database material_property.fy{self.material_property.fy}")
+            trace.debug('section_connect_database material_property.fy%s', self.material_property.fy)
             self.epsilon = math.sqrt(250 / self.material_property.fy)
         return self.section_property
 
@@ -1761,7 +1760,7 @@ class PlateGirderWelded(Member):
         # 1 - section classification
         self.flag = self.section_classification(self,design_dictionary)
 
-        print('self.flag:',self.flag)
+        trace.debug('self.flag: %s', self.flag)
         if self.effective_area_factor < 1.0:
             logger.warning(
                 "Reducing the effective sectional area as per the definition in the Design Preferences tab."
@@ -1771,9 +1770,8 @@ class PlateGirderWelded(Member):
                 "The effective sectional area is taken as 100% of the cross-sectional area [Reference: Cl. 7.3.2, IS 800:2007]."
             )
         # Effective length
-        print(
-            f"self.effective_length {self.effective_length} \n self.input_section_classification{self.input_section_classification} ")
-        print('self.input_section_list:',self.input_section_list)
+        trace.debug('self.effective_length %s   self.input_section_classification%s', self.effective_length, self.input_section_classification)
+        trace.debug('self.input_section_list: %s', self.input_section_list)
         if self.flag:
             for section in self.input_section_list:
                 # initialize lists for updating the results dictionary
@@ -1783,7 +1781,7 @@ class PlateGirderWelded(Member):
                             self.section_property.flange_thickness + self.section_property.root_radius))
                 else:
                     self.effective_depth = (self.section_property.depth - 2 *self.section_property.flange_thickness )
-                print('self.section_property.type:',self.section_property.type, self.bending_type)
+                trace.debug('self.section_property.type: %s %s', self.section_property.type, self.bending_type)
 
                 if self.sec_profile == 'Beams' or self.sec_profile == 'Columns' or self.sec_profile == VALUES_SECTYPE[1]:
                     if self.section_property.type == "Rolled" and self.bending_type == KEY_DISP_BENDING1:
@@ -1804,7 +1802,7 @@ class PlateGirderWelded(Member):
                 list_1 = []
                 list_result.append(section)
                 self.section_class = self.input_section_classification[section][0]
-                print(f"Inside design_beam self.design_type:{self.design_type}")
+                trace.debug('Inside design_beam self.design_type:%s', self.design_type)
 
                 if self.design_type == KEY_DISP_DESIGN_TYPE2_FLEXURE:
                      self.It = self.input_section_classification[section][ 5 ]
@@ -1814,12 +1812,7 @@ class PlateGirderWelded(Member):
                      self.beta_b_lt = self.input_section_classification[section][ 9 ]
                      self.lambda_lt = self.input_section_classification[section][ 10 ]
                      self.fcrb = self.input_section_classification[section][ 11 ]
-                     print('self.design_type:',self.design_type, self.It,
-                            self.hf,
-                            self.Iw,
-                            self.M_cr,
-                            self.beta_b_lt,
-                            self.lambda_lt)
+                     trace.debug('self.design_type: %s %s %s %s %s %s %s', self.design_type, self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, self.lambda_lt)
 
                 self.beam_web_buckling(self)
                 if self.web_buckling_check:
@@ -1839,10 +1832,10 @@ class PlateGirderWelded(Member):
                     # self.bending_strength_section = self.bending_strength_girder(self) / 10 ** 6
 
                 # print(f"Common result {list_result, self.section_class, self.V_d, self.high_shear_check, self.bending_strength_section}")
-                print('self.bending_strength_section',self.bending_strength_section,'self.shear_strength',self.shear_strength, 'self.load.moment',self.load.moment,'self.load.shear_force',self.load.shear_force)
+                trace.debug('self.bending_strength_section %s self.shear_strength %s self.load.moment %s self.load.shear_force %s', self.bending_strength_section, self.shear_strength, self.load.moment, self.load.shear_force)
                 # 2.8 - UR
                 self.ur = max((self.load.moment / self.bending_strength_section * 10 ** -6),(self.load.shear_force / self.shear_strength * 10 ** -3))# ( +  round(self.load.axial_force / self.section_capacity, 3)
-                print("UR", self.ur)
+                trace.debug('UR %s', self.ur)
                 # 2.9 - Cost of the section in INR
                 self.cost = (
                         (
@@ -1857,7 +1850,7 @@ class PlateGirderWelded(Member):
                 self.web_buckling = False  # When Bearing length is provided
 
                 if self.bearing_length != 'NA': #and self.web_crippling
-                    print(f"Check for Web Buckling")
+                    trace.debug('Check for Web Buckling')
                     try:
                         self.bearing_length = float(design_dictionary[KEY_BEARING_LENGTH])
                         self.web_buckling = True  # WEB BUCKLING
@@ -1875,10 +1868,9 @@ class PlateGirderWelded(Member):
                                 self.design_compressive_stress * (
                                     self.bearing_length + self.section_property.depth / 2) * self.section_property.web_thickness
                                 * 10 ** -3)  # N
-                        print(self.design_compressive_stress, self.bearing_length, self.section_property.depth,
-                            self.section_property.web_thickness)
+                        trace.debug('%s %s %s %s', self.design_compressive_stress, self.bearing_length, self.section_property.depth, self.section_property.web_thickness)
 
-                        print(self.bending_strength_section, self.shear_strength, self.section_capacity)
+                        trace.debug('%s %s %s', self.bending_strength_section, self.shear_strength, self.section_capacity)
 
                         self.F_wb = (self.bearing_length + 2.5 * (
                                     self.section_property.root_radius + self.section_property.flange_thickness)) * self.section_property.web_thickness * self.material_property.fy / (
@@ -1899,7 +1891,7 @@ class PlateGirderWelded(Member):
                         self.bearing_length = 'NA'
                         self.web_buckling = False
                         # 2.8 - UR
-                        print(self.bending_strength_section, self.shear_strength)
+                        trace.debug('%s %s', self.bending_strength_section, self.shear_strength)
                         if self.bending_strength_section > self.load.moment * 10 ** -6 and self.shear_strength > self.load.shear_force * 10 ** -3:
                             list_result, list_1 = self.list_changer(self, change='', check=True,list=list_result, list_name=list_1)
                             self.optimum_section_ur.append(self.ur)
@@ -1916,7 +1908,7 @@ class PlateGirderWelded(Member):
                 else:
                     self.web_buckling = False
                     # 2.8 - UR
-                    print(self.bending_strength_section, self.shear_strength)
+                    trace.debug('%s %s', self.bending_strength_section, self.shear_strength)
                     if self.bending_strength_section > self.load.moment * 10**-6 and self.shear_strength > self.load.shear_force * 10**-3:
 
                         self.optimum_section_ur.append(self.ur)
@@ -1930,23 +1922,23 @@ class PlateGirderWelded(Member):
 
                         # Step 3 - Storing the optimum results to a list in a descending order
                         self.common_checks_1(self, section, 5, list_result, list_1)
-                print('self.optimum_section_ur', self.optimum_section_ur)
+                trace.debug('self.optimum_section_ur %s', self.optimum_section_ur)
 
     def beam_web_buckling(self):
 
-        print(f"Working web_buckling_check")
+        trace.debug('Working web_buckling_check')
         # 3 - web buckling under shear
         self.web_buckling_check = IS800_2007.cl_8_2_1_web_buckling(
             d=self.effective_depth,
             tw=self.section_property.web_thickness,
             e=self.epsilon,
         )
-        print(self.web_buckling_check, self.section_property.designation)
+        trace.debug('%s %s', self.web_buckling_check, self.section_property.designation)
 
         if not self.web_buckling_check:
             self.web_not_buckling_steps(self)
     def web_buckling_steps(self):
-        print(f"Not using web_buckling_steps")
+        trace.debug('Not using web_buckling_steps')
         # logger.info(f"Considering  {self.support_cndition_shear_buckling}")
         # 5 - Web Buckling check(when high shear) -If user wants then only
         # if web_buckling:
@@ -1976,15 +1968,15 @@ class PlateGirderWelded(Member):
                                                      self.load.moment / (
                                                              self.section_property.depth - self.section_property.flange_thickness),
                                                      self.gamma_m0)
-            print('MFr', self.Mfr)
+            trace.debug('MFr %s', self.Mfr)
             if self.Mfr > 0:
-                print('Starting loop', int(round(self.effective_length*10**4/self.effective_depth,-1)/10))
+                trace.debug('Starting loop %s', int(round(self.effective_length * 10 ** 4 / self.effective_depth, -1) / 10))
                 # for c_d in range(3,self.effective_length/self.result_eff_d):
                 for c_d in reversed(list(range(3,int(round(self.effective_length * 1000/self.effective_depth,-1))))):
-                    print('c_d',c_d,'c/d',self.effective_length * 1000/self.effective_depth)
+                    trace.debug('c_d %s c/d %s', c_d, self.effective_length * 1000 / self.effective_depth)
                     c_d = c_d/10 + 0.1
                     self.c = round(c_d * self.effective_depth, -1)
-                    print('c',self.c)
+                    trace.debug('c %s', self.c)
                     self.K_v = IS800_2007.cl_8_4_2_2_K_v_Simple_postcritical('many support', self.c, self.effective_depth)
                     self.plate_girder_strength2(self)
 
@@ -1998,7 +1990,7 @@ class PlateGirderWelded(Member):
             else:
                 self.shear_strength = 0.1
     def web_not_buckling_steps(self):
-        print(f"Working web_not_buckling_steps")
+        trace.debug('Working web_not_buckling_steps')
         self.V_d = IS800_2007.cl_8_4_design_shear_strength(
             self.shear_area,
             self.material_property.fy
@@ -2007,14 +1999,14 @@ class PlateGirderWelded(Member):
         self.high_shear_check = IS800_2007.cl_8_2_1_2_high_shear_check(
             self.load.shear_force / 1000, self.V_d
         )
-        print(f"self.V_d {self.V_d},{self.section_property.depth* self.section_property.web_thickness}, {self.material_property.fy}")
+        trace.debug('self.V_d %s,%s, %s', self.V_d, self.section_property.depth * self.section_property.web_thickness, self.material_property.fy)
         # 4 -  design bending strength
         self.bending_strength_section = self.bending_strength(self) / 10 ** 6
 
 
 
     def bending_strength(self):
-        print('Inside bending_strength ','\n self.section_class', self.section_class)
+        trace.debug('Inside bending_strength    self.section_class %s', self.section_class)
         # 4 - design bending strength
         M_d = IS800_2007.cl_8_2_1_2_design_bending_strength(
             self.section_class,
@@ -2028,7 +2020,7 @@ class PlateGirderWelded(Member):
             self.beta_b_lt = 1
         else :
             self.beta_b_lt = self.section_property.elast_sec_mod_z/self.section_property.plast_sec_mod_z
-            print('self.beta_b_lt: ',self.beta_b_lt)
+            trace.debug('self.beta_b_lt:  %s', self.beta_b_lt)
         self.M_d = M_d
         if self.design_type == KEY_DISP_DESIGN_TYPE_FLEXURE:
             if self.high_shear_check:
@@ -2042,14 +2034,9 @@ class PlateGirderWelded(Member):
                     )
             else:
                 bending_strength_section = M_d
-            print('Inside bending_strength 1', M_d, self.high_shear_check, bending_strength_section)
+            trace.debug('Inside bending_strength 1 %s %s %s', M_d, self.high_shear_check, bending_strength_section)
         else:
-            print('self.design_type:',self.design_type, self.It,
-                            self.hf,
-                            self.Iw,
-                            self.M_cr,
-                            self.beta_b_lt,
-                            self.lambda_lt, self.fcrb)
+            trace.debug('self.design_type: %s %s %s %s %s %s %s %s', self.design_type, self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, self.lambda_lt, self.fcrb)
             # self.It = (
             #     2
             #     * self.section_property.flange_width
@@ -2109,7 +2096,7 @@ class PlateGirderWelded(Member):
             self.X_lt = X_lt
             self.fbd_lt = fbd
             self.lateral_tb = self.M_cr * 10**-6
-            print('Inside bending_strength 2.1', fbd, self.section_property.plast_sec_mod_z )
+            trace.debug('Inside bending_strength 2.1 %s %s', fbd, self.section_property.plast_sec_mod_z)
             if self.high_shear_check:
                 if self.section_class == KEY_Plastic or self.section_class == KEY_Compact:
                     bending_strength_section = self.bending_strength_reduction(self,Md=bending_strength_section
@@ -2120,11 +2107,11 @@ class PlateGirderWelded(Member):
                         * self.section_property.plast_sec_mod_z
                         * fbd
                     )
-            print('Inside bending_strength 2',self.It,self.hf,self.Iw,self.M_cr ,self.beta_b_lt,alpha_lt,self.lambda_lt,phi_lt,X_lt,fbd,bending_strength_section)
+            trace.debug('Inside bending_strength 2 %s %s %s %s %s %s %s %s %s %s %s', self.It, self.hf, self.Iw, self.M_cr, self.beta_b_lt, alpha_lt, self.lambda_lt, phi_lt, X_lt, fbd, bending_strength_section)
         self.bending_strength_section_reduced = bending_strength_section
         return bending_strength_section
     def bending_strength_girder(self):
-        print('Inside bending_strength of girder ')
+        trace.debug('Inside bending_strength of girder')
         web_class = IS800_2007.Table2_i(
             (self.section_property.flange_width - self.section_property.web_thickness)/2,
             self.section_property.flange_thickness,
@@ -2186,7 +2173,7 @@ class PlateGirderWelded(Member):
                     )
             else:
                 bending_strength_section = M_d
-            print('Inside bending_strength 1', M_d, self.high_shear_check, bending_strength_section)
+            trace.debug('Inside bending_strength 1 %s %s %s', M_d, self.high_shear_check, bending_strength_section)
         else:
             # self.It = (
             #     2
@@ -2242,7 +2229,7 @@ class PlateGirderWelded(Member):
             self.X_lt = X_lt
             self.fbd_lt = fbd
             self.lateral_tb = self.fcrb * 10**-6
-            print('Inside bending_strength 2.1', fbd, self.section_property.plast_sec_mod_z )
+            trace.debug('Inside bending_strength 2.1 %s %s', fbd, self.section_property.plast_sec_mod_z)
             if self.high_shear_check:
                 if self.section_class_girder == KEY_Plastic or self.section_class_girder == KEY_Compact:
                     bending_strength_section = self.bending_strength_reduction(self,Md=bending_strength_section
@@ -2253,7 +2240,7 @@ class PlateGirderWelded(Member):
                         * self.section_property.plast_sec_mod_z
                         * fbd
                     )
-            print('Inside bending_strength 2',self.It,self.hf,self.Iw,self.fcrb ,self.beta_b_lt,alpha_lt,lambda_lt,phi_lt,X_lt,fbd,bending_strength_section)
+            trace.debug('Inside bending_strength 2 %s %s %s %s %s %s %s %s %s %s %s', self.It, self.hf, self.Iw, self.fcrb, self.beta_b_lt, alpha_lt, lambda_lt, phi_lt, X_lt, fbd, bending_strength_section)
         self.bending_strength_section_reduced = bending_strength_section
         return bending_strength_section
     def bending_strength_reduction(self, Md):
@@ -2264,7 +2251,7 @@ class PlateGirderWelded(Member):
         Mfd = Zfd * self.material_property.fy / self.gamma_m0
         beta = ((2 * self.load.shear_force / (self.shear_strength * 10**3)) - 1) ** 2
         Mdv = (Md - beta * (Md - Mfd))
-        print('Inside bending_strength_reduction',Mdv, Md, beta, Mfd, Zfd)
+        trace.debug('Inside bending_strength_reduction %s %s %s %s %s', Mdv, Md, beta, Mfd, Zfd)
         self.bending_strength_section_reducedby = Mfd
         self.beta_reduced = beta
         if (
@@ -2288,7 +2275,7 @@ class PlateGirderWelded(Member):
 
 
     def effective_length_beam1(self, design_dictionary, length):
-        print(f"Inside effective_length_beam")
+        trace.debug('Inside effective_length_beam')
         self.Loading = design_dictionary[KEY_LOAD]  # 'Normal'or 'Destabilizing'
         # self.Latex_length = design_dictionary[KEY_LENGTH_OVERWRITE]
         if design_dictionary[KEY_LENGTH_OVERWRITE] == 'NA':
@@ -2302,7 +2289,7 @@ class PlateGirderWelded(Member):
                     depth=(self.section_property.depth/1000),
                     load=self.Loading,
                 )
-                print(f"Working 1 {self.effective_length}")
+                trace.debug('Working 1 %s', self.effective_length)
             elif self.support == KEY_DISP_SUPPORT2:
                 self.Support = design_dictionary[KEY_SUPPORT_TYPE]
                 self.Top = design_dictionary[KEY_SUPPORT_TYPE2]
@@ -2312,7 +2299,7 @@ class PlateGirderWelded(Member):
                     length=length,
                     load=self.Loading,
                 )
-                print(f"Working 2 {self.effective_length}")
+                trace.debug('Working 2 %s', self.effective_length)
         else:
             if self.support == KEY_DISP_SUPPORT1:
                 self.Torsional_res = design_dictionary[KEY_TORSIONAL_RES]
@@ -2329,15 +2316,15 @@ class PlateGirderWelded(Member):
                     length = length * float(design_dictionary[KEY_LENGTH_OVERWRITE])
 
                 self.effective_length = length
-                print(f"Working 3 {self.effective_length}")
+                trace.debug('Working 3 %s', self.effective_length)
             except:
-                print(f"Inside effective_length_beam",type(design_dictionary[KEY_LENGTH_OVERWRITE]))
+                trace.debug('Inside effective_length_beam %s', type(design_dictionary[KEY_LENGTH_OVERWRITE]))
                 logger.warning("Invalid Effective Length Parameter.")
                 logger.info('Effective Length Parameter is set to default: 1.0')
                 design_dictionary[KEY_LENGTH_OVERWRITE] = '1.0'
                 self.effective_length_beam(self, design_dictionary, length)
-                print(f"Working 4 {self.effective_length}")
-        print(f"Inside effective_length_beam",self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
+                trace.debug('Working 4 %s', self.effective_length)
+        trace.debug('Inside effective_length_beam %s %s', self.effective_length, design_dictionary[KEY_LENGTH_OVERWRITE])
 
 
     def lambda_lt_check_member_type(self, Mcr=0, fcrb=0, Zp=0, f_y=0, Ze=0, beta_b=0):
@@ -2351,7 +2338,7 @@ class PlateGirderWelded(Member):
 
     def common_checks_1(self, section, step=1, list_result=[], list_1=[]):
         if step == 1:
-            print(f"Working correct here")
+            trace.debug('Working correct here')
         elif step == 2:
             # reduction of the area based on the connection requirements (input from design preferences)
             if self.effective_area_factor < 1.0:
@@ -2369,14 +2356,7 @@ class PlateGirderWelded(Member):
                                                                                 )
         elif step == 4:
             # self.slenderness = self.effective_length / min(self.section_property.rad_of_gy_z, self.section_property.rad_of_gy_y) * 1000
-            print(
-                f"\n data sent "
-                f" self.material_property.fy {self.material_property.fy}"
-                f"self.gamma_m0 {self.gamma_m0}"
-                f"self.slenderness {self.slenderness}"
-                f" self.imperfection_factor {self.imperfection_factor}"
-                f"self.section_property.modulus_of_elasticity {self.section_property.modulus_of_elasticity}"
-            )
+            trace.debug('data sent  self.material_property.fy %sself.gamma_m0 %sself.slenderness %s self.imperfection_factor %sself.section_property.modulus_of_elasticity %s', self.material_property.fy, self.gamma_m0, self.slenderness, self.imperfection_factor, self.section_property.modulus_of_elasticity)
 
             list_cl_7_1_2_1_design_compressisive_stress = (
                 IS800_2007.cl_7_1_2_1_design_compressisive_stress(
@@ -2389,7 +2369,7 @@ class PlateGirderWelded(Member):
                 )
             )
             for x in list_cl_7_1_2_1_design_compressisive_stress:
-                print(f"x {x} ")
+                trace.debug('x %s', x)
             self.euler_buckling_stress = list_cl_7_1_2_1_design_compressisive_stress[0]
             self.nondimensional_effective_slenderness_ratio = (
                 list_cl_7_1_2_1_design_compressisive_stress[1]
@@ -2428,10 +2408,7 @@ class PlateGirderWelded(Member):
                     self.optimum_section_cost_results[self.cost][j] = k
                     list_2.pop(0)
                     break
-            print(
-                f"\n self.optimum_section_cost_results {self.optimum_section_cost_results}"
-                f"\n self.optimum_section_ur_results {self.optimum_section_ur_results}"
-            )
+            trace.debug('self.optimum_section_cost_results %s  self.optimum_section_ur_results %s', self.optimum_section_cost_results, self.optimum_section_ur_results)
         elif step == 6:
             self.single_result[self.sec_profile] = {}
             list_2 = list_result.copy()
@@ -2442,7 +2419,7 @@ class PlateGirderWelded(Member):
                     # k += 1
                     list_2.pop(0)
                     break
-            print(f"\n self.single_result {self.single_result}")
+            trace.debug('self.single_result %s', self.single_result)
 
     def list_changer(self, change, list,list_name, check = True):
         list_name.extend([
@@ -2582,7 +2559,7 @@ class PlateGirderWelded(Member):
         self.lambda_w = IS800_2007.cl_8_4_2_2_lambda_w_Simple_postcritical(self.fyw,self.tau_crc)
         self.tau_b = IS800_2007.cl_8_4_2_2_tau_b_Simple_postcritical(self.lambda_w, self.fyw)
         self.V_cr = IS800_2007.cl_8_4_2_2_Vcr_Simple_postcritical(self.tau_b, self.effective_depth * self.section_property.web_thickness) / 10**3
-        print('\n plate_girder_strength', '\n tau_crc',self.tau_crc,'\n self.lambda_w',self.lambda_w,'\n self.tau_b',self.tau_b,'\n self.V_cr',self.V_cr)
+        trace.debug('plate_girder_strength   tau_crc %s   self.lambda_w %s   self.tau_b %s   self.V_cr %s', self.tau_crc, self.lambda_w, self.tau_b, self.V_cr)
     def plate_girder_strength2(self):
 
             self.plate_girder_strength(self)
@@ -2596,7 +2573,7 @@ class PlateGirderWelded(Member):
 
     def results(self, design_dictionary):
         _ = [i for i in self.optimum_section_ur if i > 1.0]
-        print( '_ ',_)
+        trace.debug('_  %s', _)
         if len(_)==1:
             temp = _[0]
         elif len(_)==0:
@@ -2604,7 +2581,7 @@ class PlateGirderWelded(Member):
         else:
             temp = sorted(_)[0]
         self.failed_design_dict = self.optimum_section_ur_results[temp] if temp is not None else None
-        print('self.failed_design_dict ',self.failed_design_dict)
+        trace.debug('self.failed_design_dict  %s', self.failed_design_dict)
 
         # sorting results from the dataset
         # if len(self.input_section_list) > 1:
@@ -2617,7 +2594,7 @@ class PlateGirderWelded(Member):
             self.optimum_section_ur = list(filter_UR)
 
             self.optimum_section_ur.sort()
-            print(f"self.optimum_section_ur{self.optimum_section_ur} \n self.optimum_section_ur_results{self.optimum_section_ur_results}")
+            trace.debug('self.optimum_section_ur%s   self.optimum_section_ur_results%s', self.optimum_section_ur, self.optimum_section_ur_results)
             # print(f"self.result_UR{self.result_UR}")
 
             # selecting the section with most optimum UR
@@ -2654,7 +2631,7 @@ class PlateGirderWelded(Member):
             else:
                 self.failed_design_dict = None
                 self.result_UR = self.optimum_section_ur[-1]  # optimum section which passes the UR check
-                print(f"self.result_UR{self.result_UR}")
+                trace.debug('self.result_UR%s', self.result_UR)
                 self.design_status = True
                 self.common_result(
                     self,
@@ -2739,7 +2716,7 @@ class PlateGirderWelded(Member):
         #         print(f"design_status_list2{self.design_status}")
         self.design_status_list.append(self.design_status)
         for status in self.design_status_list:
-            print('status list', status)
+            trace.debug('status list %s', status)
             if status is False:
                 self.design_status = False
                 break
@@ -2979,6 +2956,7 @@ class PlateGirderWelded(Member):
                 self.result_Md= list_result["M_d"]
 
     ### start writing save_design from here!
+    @timed('plate_girder.report')
     def save_design(self, popup_summary):
         # print('self.design_status', self.design_status,'len(self.failed_design_dict)', len(self.failed_design_dict))
         if (self.design_status and self.failed_design_dict is None) or (not self.design_status and len(self.failed_design_dict)>0):# TODO @Rutvik
@@ -3704,7 +3682,7 @@ class PlateGirderWelded(Member):
         Disp_2d_image = []
         Disp_3D_image = "/ResourceFiles/images/3d.png"
 
-        print(sys.path[0])
+        trace.debug('%s', sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = os.path.abspath(".") # TEMP
         rel_path = rel_path.replace("\\", "/")
@@ -19,15 +19,26 @@ from ...utils.common.component import *
 from ...utils.common.material import *
 from ...Report_functions import *
 from ...utils.common.load import Load
+from ...utils.common.load_cases import LoadCases
 from ...utils.common.Section_Properties_Calculator import *
 
 import logging
+import math
+import numpy as np
 from ..member import Member
+from ...utils.common.bolt_group import long_joint_reduction, reduced_bolt_capacity
+from ...utils.common.section_results import SectionResults
+from ...utils.common.design_cache import database_version
 
 
 
 class Tension_bolted(Member):
 
+    # properties of the sizes read by section_sweep_table, for the version of the database given by
+    # design_cache.database_version: the cache is emptied when the database changes (e.g. sections are imported)
+    section_table_cache = {}
+    section_table_version = None
+
     def __init__(self):
         print(f'Entering Tension_bolted')
         super(Tension_bolted, self).__init__()
@@ -804,6 +815,12 @@ class Tension_bolted(Member):
         self.length = float(design_dictionary[KEY_LENGTH])
         # print(self.bolt)
         self.load = Load(shear_force="", axial_force=design_dictionary.get(KEY_AXIAL))
+        # load cases: the member and its connection are designed for the case of the largest axial force (kN)
+        self.load_cases = LoadCases.from_design_dictionary(design_dictionary, shear_key=None, moment_key=None)
+        if len(self.load_cases) > 1:
+            self.load = Load(shear_force="", axial_force=self.load_cases.envelope_load().axial_force / 1000)
+            logger.info(" : The governing load case is {} (axial force: {} kN).".format(
+                self.load_cases.governing_cases()['axial'], round(self.load.axial_force, 2)))
         self.efficiency = 0.0
         self.K = 1
         # self.previous_size = []
@@ -846,62 +863,57 @@ class Tension_bolted(Member):
         
         return self.section_size
 
-    def max_section(self, design_dictionary, sizelist):
+    def section_sweep_table(self, design_dictionary, sizelist):
 
-        "selecting components class based on the section passed "
-        sec_area = {}
-        sec_gyr = {}
-        sec_depth=[]
-        for section in sizelist:
-            if design_dictionary[KEY_SEC_PROFILE] in ['Angles']:
-                self.section = Angle(designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL])
-                self.min_rad_gyration_calc(self,designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL], key=design_dictionary[KEY_SEC_PROFILE],
-                                                            subkey=design_dictionary[KEY_LOCATION],D_a=self.section.a,B_b=self.section.b,T_t=self.section.thickness)
-                sec_gyr[self.section.designation] = self.min_radius_gyration
-                if self.loc == "Long Leg":
-                    sec_depth.append(self.section.max_leg)
-                else:
-                    sec_depth.append(self.section.min_leg)
+        "Section properties of the sizes in sizelist as arrays, used to pre-screen all the sizes in one pass"
 
-            elif design_dictionary[KEY_SEC_PROFILE] in ['Back to Back Angles', 'Star Angles']:
-                self.section = Angle(designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL])
-                self.min_rad_gyration_calc(self,designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL],
-                                           key=design_dictionary[KEY_SEC_PROFILE],
-                                           subkey=design_dictionary[KEY_LOCATION], D_a=self.section.a,
-                                           B_b=self.section.b, T_t=self.section.thickness)
+        "Properties of each size are read from the database once and kept in section_table_cache for re-checks and later designs"
 
-                sec_gyr[self.section.designation] = self.min_radius_gyration
-                if self.loc == "Long Leg":
-                    sec_depth.append(self.section.max_leg)
+        columns = ['area', 'fy', 'min_rad', 'depth', 'fit_depth', 'fit_offset', 'mass']
+        version = database_version()
+        if Tension_bolted.section_table_version != version:
+            Tension_bolted.section_table_cache.clear()
+            Tension_bolted.section_table_version = version
+        rows = []
+        for designation in sizelist:
+            key = (self.sec_profile, self.loc, self.material, designation)
+            if key not in self.section_table_cache:
+                section = self.select_section(self, design_dictionary, designation)
+                if self.sec_profile in ['Angles', 'Back to Back Angles', 'Star Angles']:
+                    self.min_rad_gyration_calc(self, designation=designation, material_grade=self.material,
+                                               key=self.sec_profile, subkey=self.loc, D_a=section.a, B_b=section.b,
+                                               T_t=section.thickness)
+                    leg = section.max_leg if self.loc == "Long Leg" else section.min_leg
+                    self.section_table_cache[key] = (section.area, section.fy, self.min_radius_gyration, leg, leg,
+                                                     section.root_radius + section.thickness, section.mass)
                 else:
-                    sec_depth.append(self.section.min_leg)
-
-            else:
-                self.section = Channel(designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL])
-                self.min_rad_gyration_calc(self,designation=section, material_grade=design_dictionary[KEY_SEC_MATERIAL],
-                                           key=design_dictionary[KEY_SEC_PROFILE],
-                                           subkey=design_dictionary[KEY_LOCATION], D_a=self.section.depth,
-                                           B_b=self.section.flange_width, T_t=self.section.flange_thickness,t = self.section.web_thickness)
-                sec_gyr[self.section.designation] = self.min_radius_gyration
-                sec_depth.append(self.section.depth)
-            sec_area[self.section.designation] = self.section.area
-
-
-        print(sec_gyr)
-        if len(sec_area)>=2:
-            self.max_area = max(sec_area, key=sec_area.get)
+                    self.min_rad_gyration_calc(self, designation=designation, material_grade=self.material,
+                                               key=self.sec_profile, subkey=self.loc, D_a=section.depth,
+                                               B_b=section.flange_width, T_t=section.flange_thickness,
+                                               t=section.web_thickness)
+                    self.section_table_cache[key] = (section.area, section.fy, self.min_radius_gyration, section.depth,
+                                                     section.max_plate_height(), 0.0, section.mass)
+            rows.append(self.section_table_cache[key])
+
+        table = dict(zip(columns, np.array(rows, dtype=float).reshape(-1, len(columns)).T))
+        table['designation'] = list(sizelist)
+        if self.sec_profile in ['Back to Back Angles', 'Star Angles', 'Back to Back Channels']:
+            table['cross_area'] = 2 * table['area']
+            table['cross_mass'] = 2 * table['mass']
         else:
-            self.max_area = self.section.designation
+            table['cross_area'] = table['area']
+            table['cross_mass'] = table['mass']
 
-        if len(sec_gyr) >= 2:
-            self.max_gyr = max(sec_gyr, key=sec_gyr.get)
-        else:
-            self.max_gyr = self.section.designation
+        return table
 
-        if len(sec_depth) >= 2:
-            self.depth_max = max(sec_depth)
-        else:
-            self.depth_max = max(sec_depth)
+    def max_section(self, design_dictionary, sizelist):
+
+        "selecting components class based on the section passed "
+
+        table = self.section_sweep_table(self, design_dictionary, sizelist)
+        self.max_area = table['designation'][int(np.argmax(table['area']))]
+        self.max_gyr = table['designation'][int(np.argmax(table['min_rad']))]
+        self.depth_max = max(table['depth'])
 
         return self.max_area,self.max_gyr,self.depth_max
 
@@ -1024,7 +1036,6 @@ class Tension_bolted(Member):
     def initial_member_capacity(self,design_dictionary,previous_size = None):
 
         "selection of member based on the yield capacity"
-        min_yield = 0
 
         if self.count == 0:
             self.max_section(self,design_dictionary,self.sizelist)
@@ -1034,7 +1045,7 @@ class Tension_bolted(Member):
             pass
 
         self.count = self.count + 1
-        "Loop checking each member from sizelist based on yield capacity"
+        "excluding previous section size which failed in rupture and selecting higher section based on the yield capacity "
         if (previous_size) == None:
             pass
         else:
@@ -1044,147 +1055,81 @@ class Tension_bolted(Member):
                 pass
 
         print(f" self.sizelist {self.sizelist}")
-        for selectedsize in self.sizelist:
-
-            self.section_size = self.select_section(self,design_dictionary,selectedsize)
-            self.bolt_diameter_min= min(self.bolt.bolt_diameter)
+        self.bolt_diameter_min= min(self.bolt.bolt_diameter)
 
-            self.edge_dist_min = IS800_2007.cl_10_2_4_2_min_edge_end_dist(self.bolt_diameter_min,self.bolt.bolt_hole_type,
-                                                                          'machine_flame_cut')
-            self.d_0_min = IS800_2007.cl_10_2_1_bolt_hole_size(self.bolt_diameter_min,
-                                                                          design_dictionary[KEY_DP_BOLT_HOLE_TYPE])
+        self.edge_dist_min = IS800_2007.cl_10_2_4_2_min_edge_end_dist(self.bolt_diameter_min,self.bolt.bolt_hole_type,
+                                                                      'machine_flame_cut')
+        self.d_0_min = IS800_2007.cl_10_2_1_bolt_hole_size(self.bolt_diameter_min,
+                                                           design_dictionary[KEY_DP_BOLT_HOLE_TYPE])
 
-            self.edge_dist_min_round = round_up(self.edge_dist_min, 5)
-            self.pitch_round = round_up((2.5*self.bolt_diameter_min), 5)
-            if design_dictionary[KEY_SEC_PROFILE] in ['Channels', 'Back to Back Channels']:
-                 self.max_depth = self.section_size_max.max_plate_height()
+        self.edge_dist_min_round = round_up(self.edge_dist_min, 5)
+        self.pitch_round = round_up((2.5*self.bolt_diameter_min), 5)
+        if design_dictionary[KEY_SEC_PROFILE] in ['Channels', 'Back to Back Channels']:
+            self.max_depth = self.section_size_max.max_plate_height()
+        else:
+            if self.loc == "Long Leg":
+                self.max_depth =self.section_size_max.max_leg - self.section_size_max.thickness - self.section_size_max.root_radius
             else:
-                if self.loc == "Long Leg":
-                    self.max_depth =self.section_size_max.max_leg - self.section_size_max.thickness - self.section_size_max.root_radius
-                else:
-                    self.max_depth =self.section_size_max.min_leg - self.section_size_max.thickness - self.section_size_max.root_radius
-
+                self.max_depth =self.section_size_max.min_leg - self.section_size_max.thickness - self.section_size_max.root_radius
+        self.K = 1.0
 
-            "selection of minimum member size required based on the miniumum size of bolt  in bolt diameter list "
+        "pre-screening of all the sizes in sizelist at once on the depth required for the minimum bolt diameter, yield capacity and slenderness"
 
-            if design_dictionary[KEY_LOCATION] == "Long Leg":
-               if self.section_size.max_leg < self.section_size.root_radius + self.section_size.thickness + (2 *self.edge_dist_min_round):
-                   continue
-            elif design_dictionary[KEY_LOCATION] == 'Short Leg':
-                if self.section_size.min_leg < self.section_size.root_radius + self.section_size.thickness + (2 * self.edge_dist_min_round ):
-                    continue
-            if design_dictionary[KEY_SEC_PROFILE] =='Channels':
-                self.max_plate_height = self.section_size.max_plate_height()
-                if self.max_plate_height < (self.pitch_round) + (2 * self.edge_dist_min_round):
-                    continue
-                else:
-                    self.cross_area = self.section_size.area
-
-            elif design_dictionary[KEY_SEC_PROFILE] == 'Back to Back Channels':
-                self.max_plate_height = self.section_size.max_plate_height()
-                if self.max_plate_height < (self.pitch_round) + (2 * self.edge_dist_min_round):
-                    continue
-                else:
-                    self.cross_area = self.section_size.area * 2
-
-            elif design_dictionary[KEY_SEC_PROFILE] =='Angles':
-                self.cross_area = self.section_size.area
+        table = self.section_sweep_table(self, design_dictionary, self.sizelist)
+        if design_dictionary[KEY_SEC_PROFILE] in ['Channels', 'Back to Back Channels']:
+            depth_req = self.pitch_round + 2 * self.edge_dist_min_round
+        else:
+            depth_req = table['fit_offset'] + 2 * self.edge_dist_min_round
+        fits = table['fit_depth'] >= depth_req
+        gamma_m0 = IS800_2007.cl_5_4_1_Table_5["gamma_m0"]['yielding']
+        # rounded as tension_member_yielding rounds the capacity of the full check
+        yield_capacity = np.round(table['cross_area'] * table['fy'] / gamma_m0, 2)
+        slenderness = np.round(self.K * float(design_dictionary[KEY_LENGTH]) / table['min_rad'], 2)
+        passing = fits & (yield_capacity >= self.load.axial_force*1000) & (slenderness < 400)
+        failure = np.where(~fits, 'Insufficient depth for the bolts', np.where(slenderness >= 400, 'Slenderness above 400',
+                           np.where(passing, '', 'Yield capacity below the tension force')))
+        with np.errstate(divide='ignore'):
+            ur = self.load.axial_force * 1000 / yield_capacity
+        self.section_results = SectionResults()
+        for i, designation in enumerate(table['designation']):
+            self.section_results.add(designation, ur[i], capacity=yield_capacity[i] / 1000, mass=table['cross_mass'][i],
+                                     failure=str(failure[i]), details={'slenderness': float(slenderness[i])})
+
+        "size with the minimum yield capacity (the most utilised size) passing the pre-screening is checked in full (bolts, rupture, block shear)"
+
+        "if it fails, member_recheck removes it from sizelist and the next size in ascending order of yield capacity is taken up"
+
+        if passing.any():
+            selected = self.section_results.most_utilised()
+            selectedsize = table['designation'][selected]
+            self.member_design_status = True
+            self.cross_area = table['cross_area'][selected]
+            self.section_size_1 = self.select_section(self, design_dictionary, selectedsize)
+            self.section_size_1.tension_member_yielding(A_g=self.cross_area, F_y=self.section_size_1.fy)
+            self.min_radius_gyration = table['min_rad'][selected]
+            self.section_size_1.design_check_for_slenderness(K=self.K, L=design_dictionary[KEY_LENGTH],
+                                                             r=self.min_radius_gyration)
 
-            else:
-                self.cross_area = self.section_size.area * 2
-
-            "excluding previous section size which failed in rupture and selecting higher section based on the cross section area "
-
-            self.section_size.tension_member_yielding(A_g = self.cross_area , F_y =self.section_size.fy)
-            self.K = 1.0
-            # print(self.section_size.rad_of_gy_z)
-            if design_dictionary[KEY_SEC_PROFILE] in ['Angles','Star Angles','Back to Back Angles']:
-                # print(selectedsize)
-                self.min_rad_gyration_calc(self,designation=self.section_size.designation, material_grade=self.material,
-                                           key=self.sec_profile, subkey=self.loc, D_a=self.section_size.a,
-                                           B_b=self.section_size.b, T_t=self.section_size.thickness)
-            else:
-                self.min_rad_gyration_calc(self,designation=self.section_size.designation, material_grade=self.material,
-                                           key=self.sec_profile, subkey=self.loc, D_a=self.section_size.depth,
-                                           B_b=self.section_size.flange_width, T_t=self.section_size.flange_thickness,
-                                           t=self.section_size.web_thickness)
-            # print(design_dictionary[KEY_SEC_PROFILE], design_dictionary[KEY_LOCATION], self.section_size.min_radius_gyration)
-            self.section_size.design_check_for_slenderness(K=self.K, L=design_dictionary[KEY_LENGTH],r=self.min_radius_gyration)
-                # print(self.section_size.tension_yielding_capacity)
-
-            "condition for yield and slenderness check "
-
-            if (self.section_size.tension_yielding_capacity >= self.load.axial_force*1000) and self.section_size.slenderness < 400:
-                min_yield_current = self.section_size.tension_yielding_capacity
-                self.member_design_status = True
-                if min_yield == 0:
-                    min_yield = min_yield_current
-                    self.section_size_1 = self.select_section(self, design_dictionary, selectedsize)
-                    self.section_size_1.tension_member_yielding(A_g=self.cross_area, F_y=self.section_size.fy)
-                    if design_dictionary[KEY_SEC_PROFILE] in ['Angles', 'Star Angles', 'Back to Back Angles']:
-                        self.min_rad_gyration_calc(self,designation=self.section_size_1.designation,
-                                                   material_grade=self.material,
-                                                   key=self.sec_profile, subkey=self.loc, D_a=self.section_size_1.a,
-                                                   B_b=self.section_size_1.b, T_t=self.section_size_1.thickness)
+            "condition to limit the sweep based on max force derived from max available size."
 
-                    else:
-                        self.min_rad_gyration_calc(self,designation=self.section_size_1.designation,
-                                                   material_grade=self.material,
-                                                   key=self.sec_profile, subkey=self.loc, D_a=self.section_size_1.depth,
-                                                   B_b=self.section_size_1.flange_width,
-                                                   T_t=self.section_size_1.flange_thickness,
-                                                   t=self.section_size_1.web_thickness)
-
-                    self.section_size_1.design_check_for_slenderness(K=self.K, L=design_dictionary[KEY_LENGTH],
-                                                               r=self.min_radius_gyration)
-
-                elif min_yield_current < min_yield:
-                    min_yield = min_yield_current
-                    self.section_size_1 = self.select_section(self, design_dictionary, selectedsize)
-                    self.section_size_1.tension_member_yielding(A_g=self.cross_area, F_y=self.section_size.fy)
-                    if design_dictionary[KEY_SEC_PROFILE] in ['Angles', 'Star Angles', 'Back to Back Angles']:
-                        self.min_rad_gyration_calc(self,designation=self.section_size_1.designation,
-                                                   material_grade=self.material,
-                                                   key=self.sec_profile, subkey=self.loc, D_a=self.section_size_1.a,
-                                                   B_b=self.section_size_1.b, T_t=self.section_size_1.thickness)
-                    else:
-                        self.min_rad_gyration_calc(self,designation=self.section_size_1.designation,
-                                                   material_grade=self.material,
-                                                   key=self.sec_profile, subkey=self.loc, D_a=self.section_size_1.depth,
-                                                   B_b=self.section_size_1.flange_width,
-                                                   T_t=self.section_size_1.flange_thickness,
-                                                   t=self.section_size_1.web_thickness)
-                self.section_size_1.design_check_for_slenderness(K=self.K, L=design_dictionary[KEY_LENGTH],
-                                                                 r=self.min_radius_gyration)
-
-                # print(self.section_size_1.slenderness)
-
-                "condition to limit loop based on max force derived from max available size."
-
-            elif (self.load.axial_force*1000 > self.force1) :
-                self.max_limit_status_1 = True
-                # self.design_status = False
-                logger.warning(" : The factored tension force ({} kN) exceeds the tension capacity ({} kN) with respect to the maximum available "
-                               "member size {}.".format(round(self.load.axial_force,2),round(self.force1/1000,2),self.max_area))
-                logger.info(" : Define member(s) with a higher cross sectional area.")
-                # logge r.error(": Design is not safe. \n ")
-                # logger.info(" :=========End Of design===========")
-                break
+        elif fits.any() and (self.load.axial_force*1000 > self.force1):
+            self.max_limit_status_1 = True
+            # self.design_status = False
+            logger.warning(" : The factored tension force ({} kN) exceeds the tension capacity ({} kN) with respect to the maximum available "
+                           "member size {}.".format(round(self.load.axial_force,2),round(self.force1/1000,2),self.max_area))
+            logger.info(" : Define member(s) with a higher cross sectional area.")
 
-                "condition to limit loop based on max length derived from max available size"
+            "condition to limit the sweep based on max length derived from max available size"
 
-            elif self.length > self.len2:
-                self.max_limit_status_2 = True
-                # self.design_status = False
-                logger.warning(" : The member length ({} mm) exceeds the maximum allowable length ({} mm) with respect to the maximum available "
-                               "member size {}.".format(self.length,round(self.len2,2),self.max_gyr))
-                logger.info(" : Select member(s) with a higher radius of gyration value.")
-                # logger.error(": Design is not safe. \n ")
-                # logger.info(" :=========End Of design===========")
-                break
+        elif fits.any() and self.length > self.len2:
+            self.max_limit_status_2 = True
+            # self.design_status = False
+            logger.warning(" : The member length ({} mm) exceeds the maximum allowable length ({} mm) with respect to the maximum available "
+                           "member size {}.".format(self.length,round(self.len2,2),self.max_gyr))
+            logger.info(" : Select member(s) with a higher radius of gyration value.")
 
-            else:
-                pass
+        else:
+            pass
 
         if self.member_design_status == False and self.max_limit_status_1!=True and self.max_limit_status_2!=True:
             logger.warning(" : The available depth of the member cannot accommodate the minimum available bolt diameter of {} mm considering the "
@@ -1205,7 +1150,7 @@ class Tension_bolted(Member):
     def select_bolt_dia(self,design_dictionary,dia_remove =None):
 
         "Selection of bolt (dia) from te available list of bolts based on the spacing limits and capacity"
-        "Loop checking each member from sizelist based on yield capacity"
+        "excluding previous section size which failed in rupture and selecting higher section based on the yield capacity "
         if (dia_remove) == None:
             pass
         else:
@@ -1511,87 +1456,130 @@ class Tension_bolted(Member):
 
 
 
+    def block_shear_areas(self, design_dictionary, pitch, bolt_line):
+
+        "gross and net areas of the member in shear and tension for block shear, for the given pitch and number of bolt lines"
+
+        bolts_one_line = self.plate.bolts_one_line
+        gauge = self.plate.gauge_provided
+        end_dist = self.plate.end_dist_provided
+        edge_dist = self.plate.edge_dist_provided
+        dia_hole = self.bolt.dia_hole
+
+        if design_dictionary[KEY_SEC_PROFILE] in ["Channels", "Back to Back Channels"] and design_dictionary[KEY_LOCATION] == "Web":
+            n = 2 if design_dictionary[KEY_SEC_PROFILE] == "Back to Back Channels" else 1
+            t = self.section_size_1.web_thickness
+            A_vg = ((pitch * (bolt_line - 1) + end_dist) * t) * 2 * n
+            A_vn = ((pitch * (bolt_line - 1) + end_dist) - ((bolt_line - 0.5) * dia_hole)) * t * 2 * n
+            A_tg = gauge * (bolts_one_line - 1) * t * n
+            A_tn = ((gauge * (bolts_one_line - 1)) - ((bolts_one_line - 1) * dia_hole)) * t * n
+        else:
+            n = 2 if design_dictionary[KEY_SEC_PROFILE] in ["Back to Back Angles", "Star Angles"] else 1
+            t = self.section_size_1.thickness
+            A_vg = ((pitch * (bolt_line - 1) + end_dist) * t) * n
+            A_vn = ((pitch * (bolt_line - 1) + end_dist - ((bolt_line - 0.5) * dia_hole)) * t) * n
+            A_tg = (gauge * (bolts_one_line - 1) + edge_dist) * t * n
+            A_tn = ((gauge * (bolts_one_line - 1) + edge_dist) - ((bolts_one_line - 0.5) * dia_hole)) * t * n
+
+        return A_vg, A_vn, A_tg, A_tn
+
+    def block_shear_limit(self, design_dictionary, pitch=None, bolt_line=None):
+
+        "pitch (bolt_line given) or number of bolt lines (pitch given) at which block shear capacity equals the tension force"
+
+        "T_db1 and T_db2 [Ref. Cl. 6.4.1, IS 800:2007] are linear in both, so each is evaluated at two points and solved for"
+
+        gamma_m0 = IS800_2007.cl_5_4_1_Table_5["gamma_m0"]['yielding']
+        gamma_m1 = IS800_2007.cl_5_4_1_Table_5["gamma_m1"]['ultimate_stress']
+        f_u = self.section_size_1.fu
+        f_y = self.section_size_1.fy
+
+        T_db = []
+        for x in [0.0, 1.0]:
+            if bolt_line is None:
+                A_vg, A_vn, A_tg, A_tn = self.block_shear_areas(self, design_dictionary, pitch, x)
+            else:
+                A_vg, A_vn, A_tg, A_tn = self.block_shear_areas(self, design_dictionary, x, bolt_line)
+            T_db.append([A_vg * f_y / (math.sqrt(3) * gamma_m0) + 0.9 * A_tn * f_u / gamma_m1,
+                         0.9 * A_vn * f_u / (math.sqrt(3) * gamma_m1) + A_tg * f_y / gamma_m0])
+
+        limit = -math.inf
+        for T_db_0, T_db_1 in zip(T_db[0], T_db[1]):
+            if T_db_1 > T_db_0:
+                limit = max(limit, (self.load.axial_force * 1000 - T_db_0) / (T_db_1 - T_db_0))
+            elif T_db_0 <= self.load.axial_force * 1000:
+                limit = math.inf
+
+        return limit
+
+    def required_bolt_lines(self, bolt_line, strict=True):
+
+        "minimum number of bolt lines, not less than bolt_line, for which the bolt force is within the reduced bolt capacity"
+
+        "bolt capacity is reduced for long joints [Ref. Cl. 10.3.3.1, IS 800:2007] by at most 0.75, which bounds the search"
+
+        bolt_capacity = self.bolt.bolt_capacity
+        beta_lg = self.bolt.beta_lg
+        bolt_capacity_min = 0.75 * bolt_capacity * (min(beta_lg, 0.75) if beta_lg != 1 else 1.0)
+        bolt_line_max = max(bolt_line, int(self.res_force // (self.plate.bolts_one_line * bolt_capacity_min)) + 1)
+
+        bolt_lines = np.arange(bolt_line, bolt_line_max + 1)
+        length_avail = np.maximum((self.plate.bolts_one_line - 1) * self.plate.gauge_provided,
+                                  (bolt_lines - 1) * self.plate.pitch_provided)
+        bolt_capacity_red, _ = reduced_bolt_capacity(bolt_capacity,
+                                                     long_joint_reduction(length_avail, self.bolt.bolt_diameter_provided),
+                                                     beta_lg)
+        bolt_force = self.res_force / (bolt_lines * self.plate.bolts_one_line)
+        passing = bolt_force < bolt_capacity_red if strict else bolt_force <= bolt_capacity_red
+
+        return int(bolt_lines[np.argmax(passing)]) if passing.any() else bolt_line_max
+
     def member_check(self,design_dictionary):
 
         "Checking selected section for block shear and rupture"
 
         "If failed in block shear either increased pitch or increase bolt line "
 
+        "pitch (or number of bolt lines) required for block shear is solved for directly and validated in the next pass"
+
         block_shear_check = False
-        capacity = False
 
         while block_shear_check == False:
-            if design_dictionary[KEY_SEC_PROFILE] == "Channels" and design_dictionary[KEY_LOCATION] == "Web":
-                member_Ag = self.section_size_1.area
-                member_An = member_Ag - (self.plate.bolts_one_line * self.bolt.dia_hole * self.section_size_1.web_thickness)
-                if self.plate.bolts_one_line >= 2:
-                    A_vg = ((self.plate.pitch_provided* (self.plate.bolt_line - 1) + self.plate.end_dist_provided) * self.section_size_1.web_thickness) * 2
-                    A_vn = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided) - (
-                                (self.plate.bolt_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.web_thickness * 2
-                    A_tg = self.plate.gauge_provided* (self.plate.bolts_one_line - 1) * self.section_size_1.web_thickness
-                    A_tn = ((self.plate.gauge_provided * (self.plate.bolts_one_line - 1)) - ((self.plate.bolts_one_line - 1) * self.bolt.dia_hole)) * self.section_size_1.web_thickness
-                    self.section_size_1.tension_blockshear_area_input(A_vg=A_vg, A_vn=A_vn, A_tg=A_tg, A_tn=A_tn,f_u=self.section_size_1.fu,f_y=self.section_size_1.fy)
-
-            elif design_dictionary[KEY_SEC_PROFILE]  == "Back to Back Channels" and design_dictionary[KEY_LOCATION] == "Web":
-                member_Ag = self.section_size_1.area*2
-                member_An = member_Ag - (self.plate.bolts_one_line * self.bolt.dia_hole * 2 * self.section_size_1.web_thickness)
-                if self.plate.bolts_one_line >= 2:
-                    A_vg = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided) * self.section_size_1.web_thickness) * 2 * 2
-                    A_vn = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided) - (
-                                (self.plate.bolt_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.web_thickness* 2 * 2
-                    A_tg = self.plate.gauge_provided * (self.plate.bolts_one_line - 1) * self.section_size_1.web_thickness * 2
-                    A_tn = ((self.plate.gauge_provided * (self.plate.bolts_one_line - 1)) - ((self.plate.bolts_one_line - 1) * self.bolt.dia_hole)) * self.section_size_1.web_thickness * 2
-                    self.section_size_1.tension_blockshear_area_input(A_vg=A_vg, A_vn=A_vn, A_tg=A_tg, A_tn=A_tn,
-                                                                      f_u=self.section_size_1.fu,
-                                                                      f_y=self.section_size_1.fy)
-
-            elif design_dictionary[KEY_SEC_PROFILE] == "Back to Back Angles" or design_dictionary[KEY_SEC_PROFILE]  == "Star Angles":
-                Member_Ag = self.section_size_1.area*2
-                member_An = Member_Ag - (self.plate.bolts_one_line * self.bolt.dia_hole * 2 * self.section_size_1.thickness)
-                A_vg = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided) * self.section_size_1.thickness) * 2
-                A_vn = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided - (
-                                (self.plate.bolt_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.thickness) * 2
-                A_tg = (self.plate.gauge_provided * (self.plate.bolts_one_line - 1) + self.plate.edge_dist_provided) * self.section_size_1.thickness * 2
-                A_tn = ((self.plate.gauge_provided * (self.plate.bolts_one_line - 1) + self.plate.edge_dist_provided) - ((self.plate.bolts_one_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.thickness * 2
-                self.section_size_1.tension_blockshear_area_input(A_vg=A_vg, A_vn=A_vn, A_tg=A_tg, A_tn=A_tn,
-                                                                  f_u=self.section_size_1.fu, f_y=self.section_size_1.fy)
-
-            else:
-                Member_Ag = self.section_size_1.area
-                member_An = Member_Ag - (self.plate.bolts_one_line * self.bolt.dia_hole * 2 * self.section_size_1.thickness)
-                A_vg = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided) * self.section_size_1.thickness)
-                A_vn = ((self.plate.pitch_provided * (self.plate.bolt_line - 1) + self.plate.end_dist_provided - ((self.plate.bolt_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.thickness)
-                A_tg = (self.plate.gauge_provided * (
-                            self.plate.bolts_one_line - 1) + self.plate.edge_dist_provided) * self.section_size_1.thickness
-                A_tn = ((self.plate.gauge_provided * (self.plate.bolts_one_line - 1) + self.plate.edge_dist_provided) - (
-                            (self.plate.bolts_one_line - 0.5) * self.bolt.dia_hole)) * self.section_size_1.thickness
-                self.section_size_1.tension_blockshear_area_input(A_vg=A_vg, A_vn=A_vn, A_tg=A_tg, A_tn=A_tn,
-                                                                  f_u=self.section_size_1.fu, f_y=self.section_size_1.fy)
+            A_vg, A_vn, A_tg, A_tn = self.block_shear_areas(self, design_dictionary, self.plate.pitch_provided,
+                                                            self.plate.bolt_line)
+            self.section_size_1.tension_blockshear_area_input(A_vg=A_vg, A_vn=A_vn, A_tg=A_tg, A_tn=A_tn,
+                                                              f_u=self.section_size_1.fu, f_y=self.section_size_1.fy)
 
             if self.section_size_1.block_shear_capacity_axial > self.load.axial_force *1000:
                 break
             else:
-                initial_pitch = self.plate.pitch_provided
+                pitch = self.plate.pitch_provided
                 length_avail = max(((self.plate.bolts_one_line - 1) * self.plate.gauge_provided), ((self.plate.bolt_line - 1) * self.plate.pitch_provided))
                 if self.plate.pitch_provided <= self.bolt.max_spacing_round and length_avail <= (15 * self.bolt.bolt_diameter_provided):
-                    self.plate.pitch_provided = self.plate.pitch_provided + 5
+                    "pitch increased in steps of 5 mm up to the first step beyond the maximum spacing and long joint limits"
+                    pitch_limit = self.bolt.max_spacing_round
+                    if self.plate.bolt_line > 1:
+                        pitch_limit = min(pitch_limit, 15 * self.bolt.bolt_diameter_provided / (self.plate.bolt_line - 1))
+                    pitch_max = pitch + 5 * (math.floor((pitch_limit - pitch) / 5) + 1)
+                    pitch_req = self.block_shear_limit(self, design_dictionary, bolt_line=self.plate.bolt_line)
+                    if pitch_req < pitch_max:
+                        self.plate.pitch_provided = pitch + 5 * max(math.floor((pitch_req - pitch) / 5) + 1, 1)
+                    else:
+                        self.plate.pitch_provided = pitch_max
                 else:
-                    # self.plate.bolt_line = self.plate.bolt_line + 1
-                    # self.plate.pitch_provided = initial_pitch
-                    capacity = False
-                    while capacity == False:
-                        self.plate.bolt_line = self.plate.bolt_line + 1
-                        self.plate.pitch_provided = initial_pitch
-                        self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
-                                                                               self.plate.gauge_provided,
-                                                                               self.plate.bolt_line,
-                                                                               self.plate.pitch_provided,
-                                                                               self.bolt.bolt_capacity,
-                                                                               self.bolt.bolt_diameter_provided,beta_lg=self.bolt.beta_lg)
-                        self.plate.bolt_force = self.res_force/(self.plate.bolt_line * self.plate.bolts_one_line)
-                        if self.plate.bolt_force < self.plate.bolt_capacity_red:
-                            capacity = True
-                            break
+                    "pitch can no longer be increased, bolt lines are added for bolt capacity and block shear"
+                    bolt_line_req = self.block_shear_limit(self, design_dictionary, pitch=pitch)
+                    bolt_line = self.plate.bolt_line + 1
+                    if bolt_line_req < math.inf:
+                        bolt_line = max(bolt_line, math.floor(bolt_line_req) + 1)
+                    self.plate.bolt_line = self.required_bolt_lines(self, bolt_line)
+                    self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
+                                                                           self.plate.gauge_provided,
+                                                                           self.plate.bolt_line,
+                                                                           self.plate.pitch_provided,
+                                                                           self.bolt.bolt_capacity,
+                                                                           self.bolt.bolt_diameter_provided,beta_lg=self.bolt.beta_lg)
+                    self.plate.bolt_force = self.res_force/(self.plate.bolt_line * self.plate.bolts_one_line)
 
 
         if design_dictionary[KEY_LOCATION] == 'Long Leg':
@@ -1871,29 +1859,19 @@ class Tension_bolted(Member):
 
             elif (8 * self.bolt.bolt_diameter_provided) > self.comb_thick:
                 print("bolt check")
-                status = False
-                while status == False:
-                    self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
-                                                                           self.plate.gauge_provided,
-                                                                           self.plate.bolt_line,
-                                                                           self.plate.pitch_provided,
-                                                                           self.bolt.bolt_capacity,
-                                                                           self.bolt.bolt_diameter_provided,
-                                                                           beta_lg=self.bolt.beta_lg)
-                    if self.plate.bolt_force > self.plate.bolt_capacity_red:
-                        self.plate.bolt_line = self.plate.bolt_line + 1
-                        self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
-                                                                               self.plate.gauge_provided,
-                                                                               self.plate.bolt_line,
-                                                                               self.plate.pitch_provided,
-                                                                               self.bolt.bolt_capacity,
-                                                                               self.bolt.bolt_diameter_provided,
-                                                                               beta_lg=self.bolt.beta_lg)
-                        self.plate.bolt_force = self.res_force / (self.plate.bolt_line * self.plate.bolts_one_line)
-                        self.plate.length = (self.plate.bolt_line - 1) * self.plate.pitch_provided + 2 * self.plate.end_dist_provided
-                    else:
-                        status = True
-                        self.status_pass(self, design_dictionary)
+                bolt_line = self.required_bolt_lines(self, self.plate.bolt_line, strict=False)
+                if bolt_line != self.plate.bolt_line:
+                    self.plate.bolt_line = bolt_line
+                    self.plate.bolt_force = self.res_force / (self.plate.bolt_line * self.plate.bolts_one_line)
+                    self.plate.length = (self.plate.bolt_line - 1) * self.plate.pitch_provided + 2 * self.plate.end_dist_provided
+                self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
+                                                                       self.plate.gauge_provided,
+                                                                       self.plate.bolt_line,
+                                                                       self.plate.pitch_provided,
+                                                                       self.bolt.bolt_capacity,
+                                                                       self.bolt.bolt_diameter_provided,
+                                                                       beta_lg=self.bolt.beta_lg)
+                self.status_pass(self, design_dictionary)
 
             elif (8 * self.bolt.bolt_diameter_provided) < self.comb_thick:
                 if len(self.sizelist) >= 2:
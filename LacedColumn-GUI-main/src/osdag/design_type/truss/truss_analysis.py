@@ -0,0 +1,190 @@
+"""Linear elastic analysis of plane pin-jointed trusses.
+
+Truss2D holds the nodes, members and load cases of a truss in the x-y plane: two degrees of freedom per node (ux, uy),
+members carrying axial force only, with the area of their section read from the section tables of the database (as for
+the plane frames of frame_2D.frame_analysis). The loads are applied at the nodes.
+
+The stiffness matrices of all the members are computed at once as arrays and assembled into a sparse (CSR) global
+stiffness matrix, which is factorised once (scipy.sparse.linalg.splu) for all the load cases. TrussResults holds the
+displacements, reactions and axial forces of the members in every case.
+
+Units: N and mm.
+"""
+import logging
+import math
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from ..frame_2D.frame_analysis import section_properties
+
+logger = logging.getLogger("Osdag.Truss2D")
+
+# degrees of freedom of a node
+DOF = 2
+
+
+class Truss2D(object):
+    """A plane pin-jointed truss: nodes, members and load cases
+
+    Attributes:
+        E: modulus of elasticity of the members (N/mm2)
+        coordinates: coordinates of the nodes (list of (x, y), mm)
+        restraints: restrained degrees of freedom of the nodes (list of (ux, uy) booleans)
+        members: nodes of the members (list of (node i, node j))
+        areas: areas of the members (list, mm2)
+        designations: sections of the members (list)
+        cases: names of the load cases
+    """
+
+    def __init__(self, E=2e5):
+        self.E = E
+        self.coordinates = []
+        self.restraints = []
+        self.members = []
+        self.areas = []
+        self.designations = []
+        self.cases = []
+        self._nodal_loads = []      # (case, node, fx, fy)
+
+    def add_node(self, x, y, restraints=(False, False)):
+        """Add a node, restrained in the degrees of freedom (ux, uy) marked True, and return its index"""
+        self.coordinates.append((float(x), float(y)))
+        self.restraints.append(tuple(bool(restraint) for restraint in restraints))
+        return len(self.coordinates) - 1
+
+    def support(self, node, restraints=(True, True)):
+        """Restrain a node: pinned by default, (False, True) for a roller"""
+        self.restraints[node] = tuple(bool(restraint) for restraint in restraints)
+
+    def add_member(self, node_i, node_j, designation, table='Angles', area=None):
+        """Add a member between two nodes and return its index
+
+        Args:
+            node_i, node_j: nodes of the ends of the member
+            designation: section of the member, read from table unless its area (mm2) is given (e.g. the area of two
+                         angles for a member of back to back angles)
+            table: section table of the database
+        """
+        if area is None:
+            area = section_properties([designation], table)[designation][0]
+        self.members.append((int(node_i), int(node_j)))
+        self.areas.append(float(area))
+        self.designations.append(designation)
+        return len(self.members) - 1
+
+    def add_members(self, connectivity, designations, table='Angles'):
+        """Add members in bulk, reading their sections from the database in one query
+
+        Args:
+            connectivity: nodes of the ends of the members (sequence of (node i, node j))
+            designations: sections of the members (one designation, or one per member)
+            table: section table of the database
+
+        Returns: indices of the members (list)
+        """
+        connectivity = [tuple(nodes) for nodes in connectivity]
+        if isinstance(designations, str):
+            designations = [designations] * len(connectivity)
+        if len(designations) != len(connectivity):
+            raise ValueError("Give one section per member")
+        properties = section_properties(designations, table)
+        first = len(self.members)
+        for (node_i, node_j), designation in zip(connectivity, designations):
+            self.members.append((int(node_i), int(node_j)))
+            self.areas.append(properties[designation][0])
+            self.designations.append(designation)
+        return list(range(first, len(self.members)))
+
+    def add_load_case(self, name):
+        """Add a load case and return its index"""
+        self.cases.append(str(name))
+        return len(self.cases) - 1
+
+    def nodal_load(self, case, node, fx=0.0, fy=0.0):
+        """Apply a force (N) at a node, in the global axes"""
+        self._nodal_loads.append((case, node, fx, fy))
+
+    def length(self, member):
+        (xi, yi), (xj, yj) = (self.coordinates[node] for node in self.members[member])
+        return math.hypot(xj - xi, yj - yi)
+
+    def analyse(self):
+        """Analyse the truss under all the load cases
+
+        Returns: TrussResults
+        """
+        if not self.cases:
+            self.add_load_case('Load case 1')
+        n_dof = DOF * len(self.coordinates)
+        n_cases = len(self.cases)
+
+        xy = np.array(self.coordinates, dtype=float).reshape(-1, 2)
+        ends = np.array(self.members, dtype=int).reshape(-1, 2)
+        d = xy[ends[:, 1]] - xy[ends[:, 0]]
+        L = np.hypot(d[:, 0], d[:, 1])
+        if np.any(L == 0):
+            raise ValueError("Members {} have no length".format(np.flatnonzero(L == 0).tolist()))
+        cs = d / L[:, np.newaxis]      # direction cosines (c, s)
+
+        # member stiffness in the global axes: EA/L [[g, -g], [-g, g]] with g = [[c c, c s], [s c, s s]]
+        g = (self.E * np.array(self.areas) / L)[:, np.newaxis, np.newaxis] * cs[:, :, np.newaxis] * cs[:, np.newaxis, :]
+        k_global = np.block([[g, -g], [-g, g]])
+        dofs = (DOF * ends[:, :, np.newaxis] + np.arange(DOF)).reshape(-1, 2 * DOF)
+        rows = np.repeat(dofs, 2 * DOF, axis=1).ravel()
+        cols = np.tile(dofs, (1, 2 * DOF)).ravel()
+        K = sparse.coo_matrix((k_global.ravel(), (rows, cols)), shape=(n_dof, n_dof)).tocsr()
+
+        F = np.zeros((n_dof, n_cases))
+        for case, node, fx, fy in self._nodal_loads:
+            F[DOF * node:DOF * node + DOF, case] += (fx, fy)
+
+        # solve the free degrees of freedom, one factorisation for all the cases
+        free = ~np.array(self.restraints, dtype=bool).ravel()
+        U = np.zeros((n_dof, n_cases))
+        if free.any():
+            try:
+                lu = splu(K[free][:, free].tocsc())
+            except RuntimeError:
+                raise ValueError("The truss is unstable: check the supports and the connectivity of the members")
+            U[free] = lu.solve(F[free]).reshape(-1, n_cases)
+            if not np.all(np.isfinite(U)):
+                raise ValueError("The truss is unstable: check the supports and the connectivity of the members")
+
+        reactions = K @ U - F
+        reactions[free] = 0.0
+
+        # axial force, tension positive: EA/L times the elongation of the member
+        u = U.T[:, dofs]
+        elongation = np.einsum('cmi,mi->cm', u[:, :, DOF:] - u[:, :, :DOF], cs)
+        forces = self.E * np.array(self.areas) / L * elongation
+        return TrussResults(self, L, U.T.reshape(n_cases, -1, DOF), reactions.T.reshape(n_cases, -1, DOF), forces)
+
+
+class TrussResults(object):
+    """Results of the analysis of a Truss2D
+
+    Attributes:
+        lengths: lengths of the members (array, mm)
+        displacements: displacements (ux, uy, mm) of the nodes (array of cases x nodes x 2)
+        reactions: reactions (N) at the restrained degrees of freedom of the nodes (array of cases x nodes x 2)
+        forces: axial forces of the members, tension positive (array of cases x members, N)
+    """
+
+    def __init__(self, truss, lengths, displacements, reactions, forces):
+        self.truss = truss
+        self.lengths = lengths
+        self.displacements = displacements
+        self.reactions = reactions
+        self.forces = forces
+
+    def tension(self):
+        """Return the largest tension of each member over the cases (array, N, 0 for a member never in tension)"""
+        return np.maximum(self.forces.max(axis=0), 0.0)
+
+    def compression(self):
+        """Return the largest compression of each member over the cases (array, N, 0 for a member never in
+        compression)
+        """
+        return np.maximum(-self.forces.min(axis=0), 0.0)
@@ -0,0 +1,216 @@
+"""Design of the members of a plane truss with the tension and compression member modules.
+
+TrussDesign takes the results of a Truss2D analysis and the design dictionaries of a tension member module (bolted or
+welded to the end gusset) and of the strut module, e.g. read from .osi files of those modules. It designs every member
+with the modules, in batch:
+
+1. The largest tension and compression of every member over the load cases are taken from the analysis.
+2. The members in tension and the members in compression are grouped: members whose lengths are within one length step
+   and whose forces are within a force tolerance of the largest force of the group share one design, for the largest
+   force and the longest member of the group. A truss with many members of similar forces (the panels of a chord, the
+   web members of a roof truss) then needs one design per group instead of one per member.
+3. Each group is designed with its module, through the design cache, so that groups with the same inputs (and the
+   groups of a truss designed again) are not calculated twice.
+4. A member in tension in some cases and in compression in others is designed for both, and takes the heavier of the two
+   sections if it is also adequate for the other force (a heavier unequal angle can have a smaller radius of gyration
+   and fail in compression), else the lighter one if it is. Its utilisation ratio is the larger of the two forces.
+   Members with no force in any case are not designed.
+"""
+import copy
+import logging
+import math
+import sqlite3
+import sys
+
+import numpy as np
+
+from ...Common import *
+from ...utils.common.design_cache import design_cache
+from ..compression_member.compression import Compression
+from ..tension_member.tension_bolted import Tension_bolted
+from ..tension_member.tension_welded import Tension_welded
+
+logger = logging.getLogger("Osdag.TrussDesign")
+
+# design modules of the members, by the module of their design dictionary
+MEMBER_MODULES = {
+    KEY_DISP_TENSION_BOLTED: Tension_bolted,
+    KEY_DISP_TENSION_WELDED: Tension_welded,
+    KEY_DISP_COMPRESSION_Strut: Compression,
+}
+
+TENSION = 'Tension'
+COMPRESSION = 'Compression'
+
+
+def group_members(forces, lengths, tolerance=0.1, length_step=500.0):
+    """Group the members of similar force and length
+
+    Args:
+        forces: design forces of the members (array, members with no force are left out)
+        lengths: lengths of the members (array, mm)
+        tolerance: largest difference of the force of a member from the largest force of its group, as a fraction of
+                   that force
+        length_step: width of the length bands of the groups (mm)
+
+    Returns: list of the groups, each an array of member indices, in decreasing order of force within a length band
+    """
+    forces = np.asarray(forces, dtype=float)
+    bands = np.ceil(np.asarray(lengths, dtype=float) / length_step)
+    groups = []
+    for band in np.unique(bands[forces > 0]):
+        members = np.flatnonzero((bands == band) & (forces > 0))
+        members = members[np.argsort(-forces[members], kind='stable')]
+        start = 0
+        while start < len(members):
+            # members sorted by decreasing force: the group ends at the first force below the tolerance band
+            floor = forces[members[start]] * (1 - tolerance)
+            end = start + int(np.searchsorted(-forces[members[start:]], -floor, side='right'))
+            groups.append(members[start:end])
+            start = end
+    return groups
+
+
+def profile_mass(designation, profile):
+    """Return the mass (kg/m) of a member of a section profile of the tension and strut modules (None if unknown)"""
+    table = 'Channels' if 'Channel' in profile else 'Angles'
+    count = 2 if ('Back to Back' in profile or 'Star' in profile) else 1
+    conn = sqlite3.connect(PATH_TO_DATABASE)
+    try:
+        row = conn.execute("SELECT Mass FROM {} WHERE Designation = ?".format(table), (designation,)).fetchone()
+    finally:
+        conn.close()
+    return count * row[0] if row else None
+
+
+class TrussDesign(object):
+    """Design of the members of a truss
+
+    Attributes:
+        results: TrussResults of the analysis of the truss
+        design_inputs: design dictionaries of the member modules, {TENSION: ..., COMPRESSION: ...}
+        groups: designs of the groups of members (list of dictionaries)
+        members: design of every member (list of dictionaries)
+    """
+
+    def __init__(self, results, tension_inputs, compression_inputs, tolerance=0.1, length_step=500.0):
+        """
+        Args:
+            results: TrussResults
+            tension_inputs: design dictionary of the tension member module (bolted or welded to the end gusset)
+            compression_inputs: design dictionary of the strut module
+            tolerance, length_step: grouping of the members, see group_members
+        """
+        self.results = results
+        self.design_inputs = {TENSION: tension_inputs, COMPRESSION: compression_inputs}
+        for kind, design_inputs in self.design_inputs.items():
+            if design_inputs.get(KEY_MODULE) not in MEMBER_MODULES:
+                raise ValueError("{} members: no member design module {}".format(kind, design_inputs.get(KEY_MODULE)))
+        self.tolerance = tolerance
+        self.length_step = length_step
+        self.groups = []
+        self.members = []
+
+    def design(self):
+        """Design all the members of the truss
+
+        Returns: list of the design of every member: dictionary of the member, its tension and compression (kN), length
+                 (mm), the groups it belongs to, the designation, utilisation ratio and status of its governing design
+        """
+        lengths = self.results.lengths
+        forces = {TENSION: self.results.tension(), COMPRESSION: self.results.compression()}
+        member_groups = [{} for _ in lengths]
+        self.groups = []
+        for kind in (TENSION, COMPRESSION):
+            for members in group_members(forces[kind], lengths, self.tolerance, self.length_step):
+                group = self.design_group(kind, float(forces[kind][members].max()), float(lengths[members].max()))
+                group['members'] = members.tolist()
+                for member in members:
+                    member_groups[member][kind] = len(self.groups)
+                self.groups.append(group)
+
+        self.members = []
+        reversal_designs = {}
+        for member, groups in enumerate(member_groups):
+            designs = [self.groups[index] for index in groups.values()]
+            if len(designs) == 2:
+                if tuple(groups.values()) not in reversal_designs:
+                    reversal_designs[tuple(groups.values())] = self.reversal_design(*designs)
+                governing = reversal_designs[tuple(groups.values())]
+            else:
+                governing = designs[0] if designs else None
+            self.members.append({
+                'member': member,
+                'tension': round(float(forces[TENSION][member]) / 1000, 3),
+                'compression': round(float(forces[COMPRESSION][member]) / 1000, 3),
+                'length': round(float(lengths[member]), 1),
+                'groups': groups,
+                'designation': governing['designation'] if governing else None,
+                'ur': governing['ur'] if governing else 0.0,
+                'design_status': governing['design_status'] if governing else True,
+            })
+        failed = [member['member'] for member in self.members if not member['design_status']]
+        logger.info("Truss: {} members designed with {} designs.".format(len(self.members), len(self.groups)))
+        if failed:
+            logger.warning("Truss: no adequate section for members {}.".format(failed))
+        return self.members
+
+    def reversal_design(self, *designs):
+        """Design of the members of a tension group and a compression group (members whose force reverses): the section
+        of one of the groups, checked for the force and length of the other group
+
+        The heavier section is tried first (see design). The utilisation ratio is the larger of the two forces.
+
+        Returns: dictionary of the designation, utilisation ratio and status of the design
+        """
+        designs = sorted(designs, key=lambda group: (not group['design_status'], group['mass'] or 0), reverse=True)
+        governing = None
+        for design, other in ((designs[0], designs[1]), (designs[1], designs[0])):
+            if not design['designation']:
+                continue
+            check = self.design_group(other['kind'], other['force'] * 1000, other['length'], design['designation'])
+            urs = [ur for ur in (design['ur'], check['ur']) if ur is not None]
+            result = {'designation': design['designation'], 'ur': max(urs) if urs else None,
+                      'design_status': design['design_status'] and check['design_status']}
+            if result['design_status']:
+                return result
+            governing = governing or result
+        return governing or designs[0]
+
+    def design_group(self, kind, force, length, designation=None):
+        """Design a group of members with the module of its kind, for its largest force (N) and length (mm)
+
+        Args:
+            designation: section to check, instead of the sections of the design dictionary (None to design)
+
+        Returns: dictionary of the kind, force (kN), length, designation, utilisation ratio, mass (kg/m) and status of
+                 the design
+        """
+        design_inputs = copy.deepcopy(self.design_inputs[kind])
+        design_inputs[KEY_AXIAL] = str(round(force / 1000, 2))
+        design_inputs[KEY_LENGTH] = str(int(math.ceil(length)))
+        if designation is not None:
+            design_inputs[KEY_SECSIZE] = [designation]
+        main = MEMBER_MODULES[design_inputs[KEY_MODULE]]
+        if getattr(sys.modules[main.__module__], 'logger', None) is None:
+            main.set_osdaglogger(None)   # the modules log through a module logger set up by set_osdaglogger
+
+        group = {'kind': kind, 'force': round(force / 1000, 2), 'length': int(math.ceil(length)), 'designation': None,
+                 'ur': None, 'mass': None, 'design_status': False}
+        try:
+            design_cache.design(main, design_inputs, lambda inputs: main.set_input_values(main, inputs))
+        except Exception as e:
+            logger.error("{} members of {} kN and {} mm: design failed ({})".format(kind, group['force'],
+                                                                                   group['length'], e))
+            return group
+
+        if main is Compression:
+            designation, ur = getattr(main, 'result_designation', None), getattr(main, 'result_UR', None)
+        else:
+            section = getattr(main, 'section_size_1', None)
+            designation, ur = getattr(section, 'designation', section), getattr(main, 'efficiency', None)
+        group.update(designation=designation, ur=float(ur) if ur is not None else None,
+                     design_status=bool(main.design_status and designation))
+        if designation:
+            group['mass'] = profile_mass(designation, design_inputs[KEY_SEC_PROFILE])
+        return group
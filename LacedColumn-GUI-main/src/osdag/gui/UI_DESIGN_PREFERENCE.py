@@ -9,6 +9,8 @@ from ..Common import *
 from ..utils.common.Section_Properties_Calculator import *
 from ..utils.common.component import *
 from ..utils.common.other_standards import *
+from ..utils.common.section_database import import_sections, export_sections, SectionImportError, \
+    NUMERIC_FIELDS
 from ..design_type.connection.fin_plate_connection import FinPlateConnection
 from ..design_type.connection.connection import Connection
 
@@ -1207,40 +1209,11 @@ class Ui_Form(QDialog):
     def download_Database(self, table, call_type="database"):
 
         fileName, _ = QFileDialog.getSaveFileName(QFileDialog(), "Download File", os.path.join(os.getcwd(), str(table+"_Details.xlsx")),
-                                                  "SectionDetails(*.xlsx)")
+                                                  "SectionDetails(*.xlsx);;SectionDetails(*.csv)")
         if not fileName:
             return
         try:
-            conn = sqlite3.connect(PATH_TO_DATABASE)
-            c = conn.cursor()
-            header = get_db_header(table)
-            wb = openpyxl.Workbook()
-            sheet = wb.create_sheet(table, 0)
-
-            col = 1
-            for head in header:
-                sheet.cell(row=1, column=col).value = head
-                col += 1
-            if call_type != "header":
-                if table == 'Columns':
-                    c.execute("SELECT * FROM Columns")
-                elif table == 'Beams':
-                    c.execute("SELECT * FROM Beams")
-                elif table == 'Angles':
-                    c.execute("SELECT * FROM Angles")
-                elif table == 'Channels':
-                    c.execute("SELECT * FROM Channels")
-                data = c.fetchall()
-                conn.commit()
-                c.close()
-                row = 2
-                for rows in data:
-                    col = 1
-                    for cols in range(len(header)):
-                        sheet.cell(row=row, column=col).value = rows[col - 1]
-                        col += 1
-                    row += 1
-            wb.save(fileName)
+            export_sections(fileName, [table], header_only=(call_type == "header"))
             QMessageBox.information(QMessageBox(), 'Information', 'Your File is Downloaded.')
 
         except IOError:
@@ -1256,117 +1229,33 @@ class Ui_Form(QDialog):
 
     def import_section(self, tab_name):
         fileName, _ = QFileDialog.getOpenFileName(QFileDialog(), "Open File", os.getcwd(),
-                                                  "SectionDetails(*.xlsx)")
+                                                  "SectionDetails(*.xlsx *.csv)")
         if not fileName:
             return
         try:
-            wb = openpyxl.load_workbook(fileName)
-            if tab_name in wb.sheetnames:
-                if wb.sheetnames.count(tab_name) > 1:
-                    QMessageBox.information(QMessageBox(), 'Information',
-                                            str(' File contains multiple ' + tab_name + ' Sheet.'))
-                    return
-
-                sheet = wb[tab_name]
-                header = []
-                for cell in sheet[1]:
-                    header.append(str(cell.value))
-                if header == get_db_header(tab_name):
-                    conn = sqlite3.connect(PATH_TO_DATABASE)
-                    discarded = []
-                    ignored = []
-                    values = {}
-                    for rows in range(2, sheet.max_row + 1):
-                        for cols in range(1, len(header)+1):
-                            key = header[cols - 1]
-                            val = sheet.cell(row=rows, column=cols).value
-                            if self.import_db_validation(tab_name, key, val):
-                                values.update({key: val})
-                            else:
-                                discarded.append(sheet[rows][1].value)
-                                break
-                        c = conn.cursor()
-                        if tab_name == 'Columns':
-                            c.execute("SELECT count(*) FROM Columns WHERE Designation = ?", (values['Designation'],))
-                        elif tab_name == 'Beams':
-                            c.execute("SELECT count(*) FROM Beams WHERE Designation = ?", (values['Designation'],))
-                        elif tab_name == 'Angles':
-                            c.execute("SELECT count(*) FROM Angles WHERE Designation = ?", (values['Designation'],))
-                        elif tab_name == 'Channels':
-                            c.execute("SELECT count(*) FROM Channels WHERE Designation = ?", (values['Designation'],))
-
-                        data = c.fetchone()[0]
-                        if data == 0:
-                            values['Source'] = 'Custom'
-                            if tab_name == 'Columns':
-                                c.execute('''INSERT INTO Columns (Designation,Mass,Area,D,B,tw,T,FlangeSlope,R1,R2,
-                                Iz,Iy,rz,ry,Zz,Zy,Zpz,Zpy,It,Iw,Source,Type) VALUES 
-                                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)''',
-                                          (values['Designation'], values['Mass'], values['Area'], values['D'],
-                                           values['B'], values['tw'], values['T'], values['FlangeSlope'],
-                                           values['R1'], values['R2'], values['Iz'], values['Iy'], values['rz'],
-                                           values['ry'], values['Zz'], values['Zy'], values['Zpz'], values['Zpy'],
-                                           values['It'], values['Iw'], values['Source'], values['Type']))
-                            elif tab_name == 'Beams':
-                                c.execute('''INSERT INTO Beams (Designation,Mass,Area,D,B,tw,T,FlangeSlope,R1,R2,
-                                Iz,Iy,rz,ry,Zz,Zy,Zpz,Zpy,It,Iw,Source,Type) VALUES
-                                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)''',
-                                          (values['Designation'], values['Mass'], values['Area'], values['D'],
-                                           values['B'], values['tw'], values['T'], values['FlangeSlope'],
-                                           values['R1'], values['R2'], values['Iz'], values['Iy'], values['rz'],
-                                           values['ry'], values['Zz'], values['Zy'], values['Zpz'], values['Zpy'],
-                                           values['It'], values['Iw'], values['Source'], values['Type']))
-                            elif tab_name == 'Angles':
-                                c.execute('''INSERT INTO Angles (Designation,Mass,Area,a,b,t,R1,R2,Cz,Cy,Iz,Iy,Iumax,
-                                Ivmin,rz,ry,rumax,rvmin,Zz,Zy,Zpz,Zpy,It,Source,Type) VALUES
-                                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)''',
-                                          (values['Designation'], values['Mass'], values['Area'], values['a'],
-                                           values['b'], values['t'], values['R1'], values['R2'], values['Cz'],
-                                           values['Cy'], values['Iz'], values['Iy'], values['Iumax'], values['Ivmin'],
-                                           values['rz'], values['ry'], values['rumax'], values['rvmin'], values['Zz'],
-                                           values['Zy'], values['Zpz'], values['Zpy'], values['It'], values['Source'],
-                                           values['Type']))
-                            elif tab_name == 'Channels':
-                                c.execute('''INSERT INTO Channels (Designation,Mass,Area,D,B,tw,T,FlangeSlope,R1,R2,Cy,
-                                Iz,Iy,rz,ry,Zz,Zy,Zpz,Zpy,Source,Type) VALUES
-                                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)''',
-                                          (values['Designation'], values['Mass'], values['Area'], values['D'],
-                                           values['B'], values['tw'], values['T'], values['FlangeSlope'], values['R1'],
-                                           values['R2'], values['Cy'], values['Iz'], values['Iy'], values['rz'],
-                                           values['ry'], values['Zz'], values['Zy'], values['Zpz'], values['Zpy'],
-                                           values['Source'], values['Type']))
-
-                            conn.commit()
-                            c.close()
-
-                        else:
-                            ignored.append(values['Designation'])
-
-                    conn.close()
-                    message = QMessageBox()
-                    message.setWindowTitle('Successful')
-                    message.addButton(message.Ok)
-                    message.setText('File data is imported successfully to the database.')
-                    if discarded or ignored:
-                        rejected = message.addButton('Rejected Sections', message.ActionRole)
-                        rejected.clicked.connect(lambda: self.import_validation_dialog(discarded, ignored))
-                    message.exec()
-                else:
-                    QMessageBox.information(QMessageBox(), 'Information',
-                                            str(str(tab_name) + ' Sheet has headers different than database.'))
-
-            else:
-                QMessageBox.information(QMessageBox(), 'Information', str(' File does not contain '+str(tab_name)+' Sheet.'))
-
+            result = import_sections(fileName, tab_name)
+        except SectionImportError as e:
+            QMessageBox.information(QMessageBox(), 'Information', str(e))
+            return
         except IOError:
             QMessageBox.information(QMessageBox(), "Unable to open file",
                                     "There was an error opening \"%s\"" % fileName)
             return
 
+        discarded = result.discarded
+        ignored = result.ignored
+        message = QMessageBox()
+        message.setWindowTitle('Successful')
+        message.addButton(message.Ok)
+        message.setText('File data is imported successfully to the database.\n' + result.summary())
+        if discarded or ignored:
+            rejected = message.addButton('Rejected Sections', message.ActionRole)
+            rejected.clicked.connect(lambda: self.import_validation_dialog(discarded, ignored))
+        message.exec()
+
     def import_db_validation(self, tab, key, value):
 
-        if key in ['Mass', 'Area', 'D', 'B', 'tw', 'T', 'FlangeSlope', 'R1', 'R2', 'Iz', 'Iy', 'rz', 'ry', 'Zz', 'Zy',
-                   'Zpz', 'Zpy', 'It', 'Iw']:
+        if key in NUMERIC_FIELDS:
             return isinstance(value, int) or isinstance(value, float)
         else:
             return True
@@ -0,0 +1,33 @@
+"""Dialogs opened by the design modules from the input dock.
+
+The design modules (design_type/) do not import PyQt5, so that they can be imported and run without the GUI (command
+line, batch designs, worker processes). The dialogs they open while the user fills the input dock live here, and are
+imported by the design modules only when the dialog is opened.
+"""
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QAbstractItemView, QDialog, QDialogButtonBox, QListWidget, QVBoxLayout
+
+
+class SectionDesignationDialog(QDialog):
+    """Select the section designations to design with, from the sections of a profile"""
+
+    def __init__(self, section_list, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Section Designation")
+        self.setModal(True)
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove help button
+
+        layout = QVBoxLayout(self)
+        self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.list_widget.addItems([str(section) for section in section_list])
+        layout.addWidget(self.list_widget)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_selected(self):
+        return [item.text() for item in self.list_widget.selectedItems()]
+
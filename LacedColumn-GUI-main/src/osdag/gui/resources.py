@@ -0,0 +1,180 @@
+"""Binary Qt resource bundles (.rcc), registered when the window using them is first set up.
+
+The icons of the GUI used to be compiled into the Python modules icons_rc.py and osdagMainPageIcons_rc.py, which were
+imported, and all their icons registered, when Osdag started. The icons are now split into bundles, by the windows
+using them:
+
+    main_page       the main page and its dialogs (about, tutorials, ask a question)
+    module_window   the windows of the design modules (input and output docks, view buttons)
+
+Each bundle is a binary resource file in osdag/data/resources, registered with QResource.registerResource() by
+load_resources() in the setupUi of the windows using it, so the module window icons are only read when a design module
+is opened. The bundles are built from the compiled resource modules, which remain the source of the icons:
+
+    python -m osdag.gui.resources
+
+If a bundle has not been built, load_resources() imports its source module instead.
+"""
+import ast
+import os
+import struct
+import sys
+from importlib import import_module
+from importlib.resources import files
+
+RESOURCE_PACKAGE = 'osdag.data.resources'
+
+# bundle: (resource module the icons are taken from, resource paths)
+BUNDLES = {
+    'main_page': ('osdagMainPageIcons_rc', [
+        '/newPrefix/images/Fossee_logo.png',
+        '/newPrefix/images/logoiitb.png',
+        '/newPrefix/images/Osdag.png',
+        '/newPrefix/images/image3487.png',
+    ]),
+    'module_window': ('icons_rc', [
+        '/newPrefix/images/Osdag.png',
+        '/newPrefix/images/input.png',
+        '/newPrefix/images/output.png',
+        '/newPrefix/images/X-Y.png',
+        '/newPrefix/images/Z-X.png',
+        '/newPrefix/images/Z-Y.png',
+    ]),
+}
+
+_registered = set()
+
+
+def load_resources(bundle):
+    """Register the icons of a bundle, once"""
+    if bundle in _registered:
+        return
+    from PyQt5.QtCore import QResource
+    path = files(RESOURCE_PACKAGE).joinpath(bundle + '.rcc')
+    if not (path.is_file() and QResource.registerResource(str(path))):
+        import_module('.' + BUNDLES[bundle][0], __package__)
+    _registered.add(bundle)
+
+
+############################ Bundle build ############################
+# Layout of the resource data, as written by Qt's rcc (format version 1):
+#   tree: one 14 byte node per directory or file, the children of a directory stored together, sorted by name hash
+#         directory: name offset (4), flags (2), child count (4), index of the first child (4)
+#         file:      name offset (4), flags (2), country (2), language (2), data offset (4)
+#   names: length (2), hash (4), UTF-16 name
+#   data: length (4), bytes (zlib compressed, with their uncompressed length first, if the node has the flag COMPRESSED)
+# A .rcc file holds the three blocks after a header: 'qres', version, tree offset, data offset, names offset.
+
+DIRECTORY = 0x02
+
+
+def qt_hash(name):
+    h = 0
+    for c in name:
+        h = (h << 4) + ord(c)
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+
+def read_resource_module(file_name):
+    """Read the files of a compiled resource module (pyrcc5 output)
+
+    Returns: dictionary of resource path to (flags, data as stored in the module)
+    """
+    blobs = {}
+    for node in ast.parse(open(file_name).read()).body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, bytes):
+            blobs[node.targets[0].id] = node.value.value
+    tree = blobs.get('qt_resource_struct') or blobs['qt_resource_struct_v1']
+    names, data = blobs['qt_resource_name'], blobs['qt_resource_data']
+
+    def name(offset):
+        length = struct.unpack('>H', names[offset:offset + 2])[0]
+        return names[offset + 6:offset + 6 + 2 * length].decode('utf-16-be')
+
+    resources = {}
+    stack = [(0, '')]
+    while stack:
+        index, path = stack.pop()
+        name_offset, flags = struct.unpack('>IH', tree[index * 14:index * 14 + 6])
+        if index:
+            path += '/' + name(name_offset)
+        if flags & DIRECTORY:
+            count, first = struct.unpack('>II', tree[index * 14 + 6:index * 14 + 14])
+            stack.extend((child, path) for child in range(first, first + count))
+        else:
+            offset = struct.unpack('>I', tree[index * 14 + 10:index * 14 + 14])[0]
+            size = struct.unpack('>I', data[offset:offset + 4])[0]
+            resources[path] = (flags, data[offset + 4:offset + 4 + size])
+    return resources
+
+
+def write_rcc(file_name, resources):
+    """Write a binary resource file
+
+    Args:
+        file_name: path of the .rcc file
+        resources: dictionary of resource path ('/prefix/folder/file.png') to (flags, data)
+    """
+    root = {}
+    for path, resource in resources.items():
+        parts = path.strip('/').split('/')
+        folder = root
+        for part in parts[:-1]:
+            folder = folder.setdefault(part, {})
+        folder[parts[-1]] = resource
+
+    tree, names, data = [], bytearray(), bytearray()
+    name_offsets = {}
+
+    def name_offset(name):
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            names.extend(struct.pack('>HI', len(name), qt_hash(name)) + name.encode('utf-16-be'))
+        return name_offsets[name]
+
+    # nodes breadth first, so that the children of a directory are stored together
+    tree.append(None)
+    queue = [(0, 0, root)]
+    while queue:
+        index, offset, folder = queue.pop(0)
+        children = sorted(folder.items(), key=lambda item: qt_hash(item[0]))
+        first = len(tree)
+        tree.extend([None] * len(children))
+        tree[index] = struct.pack('>IHII', offset, DIRECTORY, len(children), first)
+        for position, (name, child) in enumerate(children):
+            if isinstance(child, dict):
+                queue.append((first + position, name_offset(name), child))
+            else:
+                flags, content = child
+                tree[first + position] = struct.pack('>IHHHI', name_offset(name), flags, 0, 0, len(data))
+                data.extend(struct.pack('>I', len(content)) + content)
+
+    header_size = 20
+    tree_bytes = b''.join(tree)
+    with open(file_name, 'wb') as rcc:
+        rcc.write(b'qres' + struct.pack('>IIII', 1, header_size + len(data) + len(names), header_size,
+                                        header_size + len(data)))
+        rcc.write(data)
+        rcc.write(names)
+        rcc.write(tree_bytes)
+
+
+def build(output=None):
+    """Build the resource bundles into output (default: the osdag/data/resources folder)"""
+    gui = os.path.dirname(os.path.abspath(__file__))
+    output = output or os.path.join(os.path.dirname(gui), 'data', 'resources')
+    os.makedirs(output, exist_ok=True)
+    sources = {}
+    for bundle, (module, paths) in BUNDLES.items():
+        if module not in sources:
+            sources[module] = read_resource_module(os.path.join(gui, module + '.py'))
+        resources = {path: sources[module][path] for path in paths}
+        write_rcc(os.path.join(output, bundle + '.rcc'), resources)
+        print('{}: {} files, {} bytes'.format(bundle, len(resources), os.path.getsize(os.path.join(output, bundle + '.rcc'))))
+
+
+if __name__ == '__main__':
+    build(sys.argv[1] if len(sys.argv) > 1 else None)
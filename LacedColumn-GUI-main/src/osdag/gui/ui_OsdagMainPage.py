@@ -16,6 +16,7 @@ class Ui_MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
     def setupUi(self, MainWindow):
+        load_resources('main_page')
         MainWindow.setObjectName("MainWindow")
         MainWindow.setWindowModality(QtCore.Qt.NonModal)
         MainWindow.resize(1466, 857)
@@ -161,4 +162,4 @@ class Ui_MainWindow(QMainWindow):
         self.comboBox_help.setItemText(3, _translate("MainWindow", "Ask Us a Question"))
         self.comboBox_help.setItemText(4, _translate("MainWindow", "Check for Update"))
         self.comboBox_help.setItemText(5, _translate("MainWindow", "About Osdag"))
-from . import osdagMainPageIcons_rc
+from .resources import load_resources
@@ -10,6 +10,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 class Ui_AboutOsdag(object):
     def setupUi(self, Dialog):
+        load_resources('main_page')
         Dialog.setObjectName("Dialog")
         Dialog.resize(540, 393)
         self.gridLayout = QtWidgets.QGridLayout(Dialog)
@@ -50,7 +51,7 @@ class Ui_AboutOsdag(object):
 "<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:8pt; text-decoration: underline; color:#0000ff;\"><br /></p>\n"
 "<p align=\"justify\" style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-family:\'MS Shell Dlg 2\'; font-size:8pt; color:#8a8a8a;\">Osdag</span><span style=\" font-family:\'arial,sans-serif\'; font-size:8pt; color:#8a8a8a;\">®</span><span style=\" font-family:\'MS Shell Dlg 2\'; font-size:8pt; color:#8a8a8a;\"> and the Osdag logo are registered trademarks of Indian Institute of Technology Bombay (IIT Bombay).</span></p></body></html>"))
 
-from . import osdagMainPageIcons_rc
+from .resources import load_resources
 
 if __name__ == "__main__":
     import sys
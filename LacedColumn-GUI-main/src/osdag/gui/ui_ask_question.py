@@ -10,6 +10,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 class Ui_AskQuestion(object):
     def setupUi(self, Dialog):
+        load_resources('main_page')
         Dialog.setObjectName("Dialog")
         Dialog.resize(265, 88)
         icon = QtGui.QIcon()
@@ -33,7 +34,7 @@ class Ui_AskQuestion(object):
         self.label.setText(_translate("Dialog", "Please visit :"))
         self.label_2.setText(_translate("Dialog", "<html><head/><body><p><a href=\"https://osdag.fossee.in/forum\"><span style=\" text-decoration: underline; color:#0000ff;\">https://osdag.fossee.in/forum</span></a></p></body></html>"))
 
-from . import osdagMainPageIcons_rc
+from .resources import load_resources
 
 if __name__ == "__main__":
     import sys
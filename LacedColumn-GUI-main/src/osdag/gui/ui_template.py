@@ -16,11 +16,15 @@ from .ui_tutorial import Ui_Tutorial
 from .ui_aboutosdag import Ui_AboutOsdag
 from .ui_ask_question import Ui_AskQuestion
 from ..texlive.Design_wrapper import init_display as init_display_off_screen
-from ..update_version_check import Update
+from ..update_version_check import UpdateCheck
 
 from ..Common import *
 from ..utils.common.component import *
 from ..utils.common.Section_Properties_Calculator import *
+from ..utils.common.design_cache import design_cache, module_name
+from ..utils.common.instrumentation import design_timing, timer, trace
+from ..utils.common.osi_file import OsiError, load_osi, save_osi
+from .resources import load_resources
 from .customized_popup import Ui_Popup
 # from .ui_summary_popup import Ui_Dialog1
 #from .ui_design_preferences import Ui_Dialog
@@ -125,13 +129,13 @@ class Ui_ModuleWindow(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event):
         self.resized.emit()
-        print('event:', event)
+        trace.debug('event: %s', event)
         return super(Ui_ModuleWindow, self).resizeEvent(event)
 
     def changeEvent(self, event):
         if event.type() == QEvent.WindowStateChange:
             if event.oldState() == Qt.WindowNoState or self.windowState() == Qt.WindowMaximized:
-                print("WindowMaximized")
+                trace.debug('WindowMaximized')
                 x = width//2
                 y = height//2
                 mouse = Controller()
@@ -213,35 +217,36 @@ class Window(QMainWindow):
         return self.ui.get_right_elements()
 
     def open_summary_popup(self, main):
-        print('main.module_name',main.module_name(main))
+        trace.debug('main.module_name %s', main.module_name(main))
         if not main.design_button_status:
             QMessageBox.warning(self, 'Warning', 'No design created!')
             return
         if main.design_status: # and main.module_name(main) != KEY_DISP_FLEXURE and main.module_name(main) != KEY_DISP_FLEXURE2
-            from ..osdagMainSettings import backend_name
-            off_display, _, _, _ = init_display_off_screen(backend_str=backend_name())
-            print('off_display', off_display)
-            self.commLogicObj.display = off_display
-            current_component = self.commLogicObj.component
-            self.commLogicObj.display_3DModel("Model", "gradient_bg")
-
-            image_folder_path = "./ResourceFiles/images"
-            if not os.path.exists(image_folder_path):
-                os.makedirs(image_folder_path)
-
-            off_display.set_bg_gradient_color([255,255,255],[255,255,255])
-            off_display.ExportToImage(os.path.join(image_folder_path, '3d.png'))
-            off_display.View_Front()
-            off_display.FitAll()
-            off_display.ExportToImage(os.path.join(image_folder_path, 'front.png'))
-            off_display.View_Top()
-            off_display.FitAll()
-            off_display.ExportToImage(os.path.join(image_folder_path, 'top.png'))
-            off_display.View_Right()
-            off_display.FitAll()
-            off_display.ExportToImage(os.path.join(image_folder_path, 'side.png'))
-            self.commLogicObj.display = self.display
-            self.commLogicObj.component = current_component
+            with timer('ui.cad_images'):
+                from ..osdagMainSettings import backend_name
+                off_display, _, _, _ = init_display_off_screen(backend_str=backend_name())
+                trace.debug('off_display %s', off_display)
+                self.commLogicObj.display = off_display
+                current_component = self.commLogicObj.component
+                self.commLogicObj.display_3DModel("Model", "gradient_bg")
+
+                image_folder_path = "./ResourceFiles/images"
+                if not os.path.exists(image_folder_path):
+                    os.makedirs(image_folder_path)
+
+                off_display.set_bg_gradient_color([255,255,255],[255,255,255])
+                off_display.ExportToImage(os.path.join(image_folder_path, '3d.png'))
+                off_display.View_Front()
+                off_display.FitAll()
+                off_display.ExportToImage(os.path.join(image_folder_path, 'front.png'))
+                off_display.View_Top()
+                off_display.FitAll()
+                off_display.ExportToImage(os.path.join(image_folder_path, 'top.png'))
+                off_display.View_Right()
+                off_display.FitAll()
+                off_display.ExportToImage(os.path.join(image_folder_path, 'side.png'))
+                self.commLogicObj.display = self.display
+                self.commLogicObj.component = current_component
 
         self.new_window = QtWidgets.QDialog(self)
         self.new_ui = Ui_Dialog1(main.design_status,loggermsg=self.textEdit.toPlainText())
@@ -327,7 +332,7 @@ class Window(QMainWindow):
         root_path = os.path.join('ResourceFiles', 'html_page', '_build', 'html')
         for html_file in os.listdir(root_path):
             # if html_file.startswith('index'):
-            print(os.path.splitext(html_file)[1])
+            trace.debug('%s', os.path.splitext(html_file)[1])
             if os.path.splitext(html_file)[1] == '.html':
                 if sys.platform == ("win32" or "win64"):
                     os.startfile(os.path.join(root_path, html_file))
@@ -369,6 +374,7 @@ class Window(QMainWindow):
         self.btn_Design.clicked.connect(lambda: self.start_loadingWindow(main, data))
 
     def setupUi(self, MainWindow, main, folder):
+        load_resources('module_window')
         # --- Reset output/calculated state and clear output dock on module open ---
         if hasattr(main, 'reset_output_state'):
             main.reset_output_state()
@@ -581,7 +587,7 @@ class Window(QMainWindow):
 
         input_dp_conn_list = main.input_dictionary_without_design_pref(main)
         input_dp_conn_list = [i[0] for i in input_dp_conn_list if i[2] == "Input Dock"]
-        print(f'input_dp_conn_list {input_dp_conn_list}')
+        trace.debug('input_dp_conn_list %s', input_dp_conn_list)
 
 
         """
@@ -589,7 +595,7 @@ class Window(QMainWindow):
         and creates the specified QT widgets, [Ref input_values function is any module for details]
         """
         option_list = main.input_values(self)
-        print(f'setupui option_list {option_list}')
+        trace.debug('setupui option_list %s', option_list)
 
         _translate = QtCore.QCoreApplication.translate
 
@@ -841,7 +847,7 @@ class Window(QMainWindow):
 
         new_list = main.customized_input(main)
         updated_list = main.input_value_changed(main)
-        print(f'\n ui_template.py input_value_changed {updated_list} \n new_list {new_list}')
+        trace.debug('ui_template.py input_value_changed %s   new_list %s', updated_list, new_list)
         data = {}
 
         d = {}
@@ -857,7 +863,7 @@ class Window(QMainWindow):
                     arg_list = []
                     if onchange_key_popup != []:
                         for change_key in onchange_key_popup[0][0]:
-                            print(change_key)
+                            trace.debug('%s', change_key)
                             arg_list.append(self.dockWidgetContents.findChild(QtWidgets.QWidget, change_key).currentText())
                         data[t[0] + "_customized"] = [all_values_available for all_values_available in
                                                       t[1](arg_list) if all_values_available not in disabled_values]
@@ -868,7 +874,7 @@ class Window(QMainWindow):
                     data[t[0] + "_customized"] = [all_values_available for all_values_available in t[1]()
                                                   if all_values_available not in disabled_values]
             try:
-                print(f"<class 'AttributeError'>: {d} \n {new_list}")
+                trace.debug("<class 'AttributeError'>: %s   %s", d, new_list)
 
                 #changed this code bcz an error was occuring in the code -t.s.
                 # Connect signals only for widgets that exist
@@ -878,7 +884,7 @@ class Window(QMainWindow):
                         if widget is not None and hasattr(widget, 'activated'):
                             widget.activated.connect(lambda checked, w=widget: self.popup(w, new_list, updated_list, data))
             except Exception as e:
-                print(f"Error connecting signals: {str(e)}")
+                trace.debug('Error connecting signals: %s', str(e))
                 # changed ended here -t.s.
                 pass
 
@@ -894,7 +900,7 @@ class Window(QMainWindow):
                 for key_name in t[0]:
                     key_changed = self.dockWidgetContents.findChild(QtWidgets.QWidget, key_name)
                     self.on_change_connect(key_changed, updated_list, data, main)
-                    print(f"key_name{key_name} \n key_changed{key_changed}  \n self.on_change_connect ")
+                    trace.debug('key_name%s   key_changed%s    self.on_change_connect', key_name, key_changed)
 
         self.btn_Reset = QtWidgets.QPushButton(self.dockWidgetContents)
         self.btn_Reset.setGeometry(QtCore.QRect((maxi_width//2)-110, 650, 100, 35))
@@ -916,12 +922,12 @@ class Window(QMainWindow):
         @author: Umair
 
         """
-        print("Calling main.output_values(main, False)")
+        trace.debug('Calling main.output_values(main, False)')
         try:
             out_list = main.output_values(main, False)
         except TypeError:
             out_list = main.output_values(False)
-        print("out_list:", out_list)
+        trace.debug('out_list: %s', out_list)
         self.outputDock = QtWidgets.QDockWidget(MainWindow)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
         sizePolicy.setHorizontalStretch(1)
@@ -1277,9 +1283,9 @@ class Window(QMainWindow):
         self.actionDesign_Preferences = QtWidgets.QAction(MainWindow)
 
         self.actionDesign_Preferences.setObjectName("actionDesign_Preferences")
-        print(f"inside common_function_for_save_and_design ")
+        trace.debug('inside common_function_for_save_and_design')
         self.actionDesign_Preferences.triggered.connect(lambda: self.common_function_for_save_and_design(main, data, "Design_Pref"))
-        print(f"outside common_function_for_save_and_design ")
+        trace.debug('outside common_function_for_save_and_design')
         self.actionDesign_Preferences.triggered.connect(lambda: self.combined_design_prefer(data,main))
         self.actionDesign_Preferences.triggered.connect(self.design_preferences)
         self.designPrefDialog = DesignPreferences(main, self, input_dictionary=self.input_dock_inputs)
@@ -1413,14 +1419,16 @@ class Window(QMainWindow):
         if not os.path.isdir(last_design_folder):
             os.makedirs(last_design_folder)
         if os.path.isfile(last_design_file):
-            with open(str(last_design_file), 'r') as last_design:
-                last_design_dictionary = yaml.safe_load(last_design)
-                print(f'last_design_dictionary {last_design_dictionary}')
+            try:
+                last_design_dictionary = load_osi(str(last_design_file))
+            except OsiError as e:
+                trace.warning('Last design not loaded: %s', e)
+            trace.debug('last_design_dictionary %s', last_design_dictionary)
         if isinstance(last_design_dictionary, dict):
             self.setDictToUserInputs(last_design_dictionary, option_list, data, new_list)
             if "out_titles_status" in last_design_dictionary.keys():
                 title_status = last_design_dictionary["out_titles_status"]
-                print("titles", title_status)
+                trace.debug('titles %s', title_status)
                 title_count = 0
                 out_titles = []
                 title_repeat = 1
@@ -1454,18 +1462,19 @@ class Window(QMainWindow):
             all_results = main.get_all_section_results()
             if all_results and isinstance(all_results, list) and len(all_results) > 0:
                 best_section = all_results[0]  # or use the logic that selects the real output
-                print("\n[INFO] Final calculated values (used in output dock):")
+                trace.debug('Final calculated values (used in output dock):')
                 for k, v in best_section.items():
-                    print(f"  {k}: {v}")
+                    trace.debug('%s: %s', k, v)
 
         # ... after self.inputDock is created in setupUi ...
         self.inputDock.setMinimumWidth(400)
         self.in_widget.setMinimumWidth(400)
 
     def notification(self):
-        update_class = Update()
-        msg = update_class.notifi()
-        QMessageBox.information(self, 'Info', msg)
+        # the check runs in the background, the message is shown when it ends
+        self.update_check = UpdateCheck(self)
+        self.update_check.checked.connect(lambda msg, available: QMessageBox.information(self, 'Info', msg))
+        self.update_check.start()
 
     def save_output_to_csv(self, main):
         def save_fun():
@@ -1611,10 +1620,10 @@ class Window(QMainWindow):
                 arg_list.append(key.currentText())
 
             val = f(arg_list)
-            print(f"\n object_name {object_name}")
-            print(f"\n k2_key {k2_key}")
-            print(f"\n typ {typ}")
-            print(f"\n k2 {k2}")
+            trace.debug('object_name %s', object_name)
+            trace.debug('k2_key %s', k2_key)
+            trace.debug('typ %s', typ)
+            trace.debug('k2 %s', k2)
             if typ == TYPE_COMBOBOX:
                 k2.clear()
                 for values in val:
@@ -1648,7 +1657,7 @@ class Window(QMainWindow):
                 if k2 is not None and isinstance(k2, QtWidgets.QLabel):
                     k2.setPixmap(pixmap1)
                 else:
-                    print(f"[ERROR] k2 is not a QLabel or is None for key {k2_key}, type: {type(k2)}")
+                    trace.error('k2 is not a QLabel or is None for key %s, type: %s', k2_key, type(k2))
             elif typ == TYPE_TEXTBOX:
                 if val:
                     k2.setEnabled(True)
@@ -1731,7 +1740,7 @@ class Window(QMainWindow):
                 self.output_title_fields[no_field_title][0].setVisible(False)
 
     def output_title_visiblity(self, visible_fields, key, titles, title_repeat):
-        print(f"key={key} \n titles={titles} ")
+        trace.debug('key=%s   titles=%s', key, titles)
         if visible_fields == 0:
             if key in titles:
                 title_key = key + str(title_repeat)
@@ -1817,8 +1826,8 @@ class Window(QMainWindow):
             self.clear_output_fields()
         design_dictionary = {}
         self.input_dock_inputs = {}
-        print(f"\n op_list {op_list}")
-        print(f"\n data_list{data_list}")
+        trace.debug('op_list %s', op_list)
+        trace.debug('data_list%s', data_list)
         for op in op_list:
             widget = self.dockWidgetContents.findChild(QtWidgets.QWidget, op[0])
             if op[2] == TYPE_COMBOBOX:
@@ -1855,9 +1864,9 @@ class Window(QMainWindow):
         if hasattr(main, 'effective_length_yy') and main.effective_length_yy is not None:
             try:
                 debug_val = float(main.effective_length_yy)
-                print(f"[DEBUG] Calculated effective_length_yy: {debug_val}")
+                trace.debug('Calculated effective_length_yy: %s', debug_val)
             except Exception:
-                print(f"[DEBUG] Calculated effective_length_yy: {main.effective_length_yy}")
+                trace.debug('Calculated effective_length_yy: %s', main.effective_length_yy)
             # print(f"\n self.input_dock_inputs{self.input_dock_inputs}")     
 
 
@@ -1866,7 +1875,7 @@ class Window(QMainWindow):
                 self.input_dock_inputs.update({design_pref_key: self.design_pref_inputs[design_pref_key]})
         
         if self.designPrefDialog.flag:
-            print('flag true')
+            trace.debug('flag true')
 
             des_pref_input_list = main.input_dictionary_design_pref(main)
             edit_tabs_list = main.edit_tabs(main)
@@ -1890,16 +1899,16 @@ class Window(QMainWindow):
             else:
                 des_pref_input_list_updated = des_pref_input_list
 
-            print(f"design_fn des_pref_input_list_updated = {des_pref_input_list_updated}\n")
+            trace.debug('design_fn des_pref_input_list_updated = %s', des_pref_input_list_updated)
             for des_pref in des_pref_input_list_updated:
                 tab_name = des_pref[0]
                 input_type = des_pref[1]
                 input_list = des_pref[2]
                 tab = self.designPrefDialog.ui.findChild(QtWidgets.QWidget, tab_name)
-                print(f"design_fn tab_name = {tab_name}\n")
-                print(f"design_fn input_type = {input_type}\n")
-                print(f"design_fn input_list = {input_list}\n")
-                print(f"design_fn tab = {tab}\n")
+                trace.debug('design_fn tab_name = %s', tab_name)
+                trace.debug('design_fn input_type = %s', input_type)
+                trace.debug('design_fn input_list = %s', input_list)
+                trace.debug('design_fn tab = %s', tab)
                 for key_name in input_list:
                     key = tab.findChild(QtWidgets.QWidget, key_name)
                     if key is None:
@@ -1911,13 +1920,13 @@ class Window(QMainWindow):
                         val = key.currentText()
                         design_dictionary.update({key_name: val})
         else:
-            print('flag false')
+            trace.debug('flag false')
             for without_des_pref in main.input_dictionary_without_design_pref(main):
                 input_dock_key = without_des_pref[0]
                 input_list = without_des_pref[1]
                 input_source = without_des_pref[2]
-                print(f"\n ========================Check===========================")
-                print(f"\n self.design_pref_inputs.keys() {self.design_pref_inputs.keys()}")
+                trace.debug('========================Check===========================')
+                trace.debug('self.design_pref_inputs.keys() %s', self.design_pref_inputs.keys())
                 for key_name in input_list:
                     if input_source == 'Input Dock':
                             design_dictionary.update({key_name: design_dictionary[input_dock_key]})
@@ -1934,9 +1943,9 @@ class Window(QMainWindow):
 
         self.design_inputs = design_dictionary
         self.design_inputs = design_dictionary
-        print(f"\n self.input_dock_inputs {self.input_dock_inputs}")
-        print(f"\n design_fn design_dictionary{self.design_inputs}")
-        print(f"\n main.input_dictionary_without_design_pref(main){main.input_dictionary_without_design_pref(main)}")
+        trace.debug('self.input_dock_inputs %s', self.input_dock_inputs)
+        trace.debug('design_fn design_dictionary%s', self.design_inputs)
+        trace.debug('main.input_dictionary_without_design_pref(main)%s', main.input_dictionary_without_design_pref(main))
 
     '''
     @author: Umair
@@ -1949,8 +1958,7 @@ class Window(QMainWindow):
         if not fileName:
             return
         try:
-            with open(fileName, 'w') as input_file:
-                yaml.dump(self.design_inputs, input_file)
+            save_osi(fileName, self.design_inputs)
         except Exception as e:
             QMessageBox.warning(self, "Application",
                                 "Cannot write file %s:\n%s" % (fileName, str(e)))
@@ -2010,9 +2018,7 @@ class Window(QMainWindow):
         if not fileName:
             return
         try:
-            in_file = str(fileName)
-            with open(in_file, 'r') as fileObject:
-                uiObj = yaml.safe_load(fileObject)
+            uiObj = load_osi(str(fileName))
             module = uiObj[KEY_MODULE]
 
             # module_class = self.return_class(module)
@@ -2033,6 +2039,10 @@ class Window(QMainWindow):
             QMessageBox.information(self, "Unable to open file",
                                     "There was an error opening \"%s\"" % fileName)
             return
+        except OsiError as e:
+            QMessageBox.information(self, "Invalid input file",
+                                    "\"%s\" is not a valid input file:\n%s" % (fileName, "\n".join(e.errors)))
+            return
 
     # Function for loading inputs from a file to Ui
     '''
@@ -2146,9 +2156,9 @@ class Window(QMainWindow):
                 data[data_key] = [data_values for data_values in data[data_key]
                                   if data_values not in data_key_tuple[2]]
 
-        print(f"ui_template.py common_function_for_save_and_design \n")
-        print(f"option_list {option_list} \n")
-        print(f"data {data} ")
+        trace.debug('ui_template.py common_function_for_save_and_design')
+        trace.debug('option_list %s', option_list)
+        trace.debug('data %s', data)
 
         # Ensure designPrefDialog is always defined before design_fn uses it
         if not hasattr(self, 'designPrefDialog') or self.designPrefDialog is None:
@@ -2166,13 +2176,15 @@ class Window(QMainWindow):
             return
         # Always run calculation after collecting inputs
         if hasattr(main, "calculate") and callable(getattr(main, "calculate")):
-            print("[DEBUG] Calling main.calculate with design_inputs:", self.design_inputs)
+            trace.debug('Calling main.calculate with design_inputs: %s', self.design_inputs)
             try:
-                main.calculate(self.design_inputs)
+                with design_timing(module_name(main, self.design_inputs)), timer('ui.design'):
+                    if design_cache.design(main, self.design_inputs, main.calculate):
+                        trace.debug('Design restored from the design cache')
             except Exception as e:
                 import traceback
                 error_msg = f"Error during calculation: {e}\n{traceback.format_exc()}"
-                print(error_msg)
+                trace.error('%s', error_msg)
                 if hasattr(main, 'logger'):
                     main.logger.error(error_msg)
                 QMessageBox.critical(self, "Calculation Error", error_msg)
@@ -2183,7 +2195,7 @@ class Window(QMainWindow):
             return
         elif trigger_type == "Design_Pref":
             # Prevent multiple DesignPreferences dialogs and windows
-            print(f"trigger_type == Design_Pref")
+            trace.debug('trigger_type == Design_Pref')
             # Only create one DesignPreferences dialog at a time
             if hasattr(self, 'designPrefDialog') and self.designPrefDialog is not None:
                 try:
@@ -2196,27 +2208,28 @@ class Window(QMainWindow):
                     self.designPrefDialog.flag = False
                 else:
                     self.designPrefDialog.flag = True
-            print(f"QDialog done")
+            trace.debug('QDialog done')
             return
         # --- Always perform calculation and show best section in output dock, print all results to terminal ---
         # After calculation, always get the latest output values with flag=True
         if hasattr(main, "output_values"):
             try:
-                out_list = main.output_values(True)
+                with timer('ui.output_values'):
+                    out_list = main.output_values(True)
                 result_dict = {k: v for (k, _, typ, v, *_rest) in out_list if typ == TYPE_TEXTBOX and k is not None}
                 self.update_output_values(result_dict)
-                print("[INFO] Output calculation values shown in output dock (from output_values True):")
+                trace.debug('Output calculation values shown in output dock (from output_values True):')
                 for k, v in result_dict.items():
-                    print(f"  {k}: {v}")
+                    trace.debug('%s: %s', k, v)
             except Exception as e:
                 import traceback
                 error_msg = f"Error during output update: {e}\n{traceback.format_exc()}"
-                print(error_msg)
+                trace.error('%s', error_msg)
                 if hasattr(main, 'logger'):
                     main.logger.error(error_msg)
                 QMessageBox.critical(self, "Output Error", error_msg)
         else:
-            print("[ERROR] main.output_values(True) not found!")
+            trace.error('main.output_values(True) not found!')
 
     def retakeScreenshot(self,fName):
         Ww=self.frameGeometry().width()
@@ -2611,16 +2624,15 @@ class Window(QMainWindow):
     def combined_design_prefer(self, data, main):
 
         on_change_tab_list = main.tab_value_changed()
-        print(f"ui_template combined_design_prefer on_change_tab_list= {on_change_tab_list} \n")
+        trace.debug('ui_template combined_design_prefer on_change_tab_list= %s', on_change_tab_list)
         for new_values in on_change_tab_list:
             (tab_name, key_list, key_to_change, key_type, f) = new_values
             tab = self.designPrefDialog.ui.tabWidget.tabs.findChild(QtWidgets.QWidget, tab_name)
-            print(f"key_list = {key_list} \n"
-                  f"tab {tab}")
+            trace.debug('key_list = %s  tab %s', key_list, tab)
 
             for key_name in key_list:
                 key = tab.findChild(QtWidgets.QWidget, key_name)
-                print(f"key= {key} \n")
+                trace.debug('key= %s', key)
 
                 if isinstance(key, QtWidgets.QComboBox):
                     self.connect_combobox_for_tab(key, tab, on_change_tab_list, main)
@@ -2677,8 +2689,8 @@ class Window(QMainWindow):
         key.currentIndexChanged.connect(lambda: self.tab_change(key, tab, new, main))
 
     def tab_change(self, key, tab, new, main):
-        print("key ", key)
-        print("obj name ", key.objectName())
+        trace.debug('key  %s', key)
+        trace.debug('obj name  %s', key.objectName())
         for tup in new:
             (tab_name, key_list, k2_key_list, typ, f) = tup
             if tab_name != tab.objectName() or (key and key.objectName()) not in key_list:
@@ -3110,7 +3122,7 @@ class Window(QMainWindow):
 
     # After design, update output dock value fields only (static structure)
     def update_output_values(self, result_dict):
-        print("\n[INFO] Output calculation values for all sections:")
+        trace.debug('Output calculation values for all sections:')
         # Build a mapping of all QLineEdit object names in the output dock
         output_fields = {w.objectName(): w for w in self.dockWidgetContents_out.findChildren(QtWidgets.QLineEdit)}
         # Try to match result_dict keys to output field names, allowing for flexible key names
@@ -3128,14 +3140,14 @@ class Window(QMainWindow):
                     if field_name.lower() in k.lower() or k.lower() in field_name.lower():
                         value = result_dict[k]
                         break
-            print(f"[DEBUG][ui_template] Setting {field_name} to {value}")
+            trace.debug('Setting %s to %s', field_name, value)
             widget.setText(str(value) if value is not None else "")
-            print(f"  {field_name}: {value}")
+            trace.debug('%s: %s', field_name, value)
         # --- FORCE PATCH: Always set effective_length_yy if present in result_dict ---
         if "effective_length_yy" in output_fields:
             forced_val = result_dict.get("effective_length_yy", "")
             output_fields["effective_length_yy"].setText(str(forced_val))
-            print(f"[DEBUG][ui_template] FORCED set effective_length_yy to {forced_val}")
+            trace.debug('FORCED set effective_length_yy to %s', forced_val)
 
 class Dialog1(QtWidgets.QDialog):
     dialogShown = QtCore.pyqtSignal()
@@ -3143,7 +3155,6 @@ class Dialog1(QtWidgets.QDialog):
         super(Dialog1, self).showEvent(event)
         self.dialogShown.emit()
 
-from . import icons_rc
 if __name__ == '__main__':
     # set_osdaglogger()
 
@@ -48,6 +48,7 @@ import pickle
 # import cairosvg
 
 from ..update_version_check import Update
+from .resources import load_resources
 import pandas as pd
 
 
@@ -348,6 +349,7 @@ class Window(QMainWindow):
             return None
 
     def setupUi(self, MainWindow, main,folder):
+        load_resources('module_window')
         self.design_inputs = {}
         self.prev_inputs = {}
         self.input_dock_inputs = {}
@@ -2978,7 +2980,6 @@ class Dialog1(QtWidgets.QDialog):
         super(Dialog1, self).showEvent(event)
         self.dialogShown.emit()
 
-from . import icons_rc
 if __name__ == '__main__':
     # set_osdaglogger()
     print(f"ui_template mac")
@@ -0,0 +1,95 @@
+"""Import smoke check of the Osdag modules.
+
+Every module of the design, utility and report packages (and osdag.Common and the benchmarks) is imported in a
+new interpreter of its own, so that an import cycle or a module level dependency shows up in the module where it
+happens, whatever was imported before it. With --headless, PyQt5 and OCC (pythonocc) are blocked in the new
+interpreters, to check that the design modules import without the GUI and the CAD libraries:
+
+    python -m osdag.import_check
+    python -m osdag.import_check --headless
+
+The modules which fail to import are listed with the last line of their error, and the check exits with status 1.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# packages checked, relative to the osdag package, and the top level modules checked (not osdag.Command_line, a script
+# which designs the examples of ResourceFiles/design_example when it is imported)
+PACKAGES = ['design_type', 'utils', 'design_report']
+MODULES = ['osdag.Common', 'osdag.Module_benchmark']
+
+# top level packages blocked with --headless
+HEADLESS_BLOCKED = ['PyQt5', 'OCC']
+
+_IMPORT = """
+import importlib, sys
+blocked = {blocked!r}
+if blocked:
+    class _Blocked(object):
+        def find_spec(self, name, path=None, target=None):
+            if name.split('.')[0] in blocked:
+                raise ImportError('{{}} is blocked by the headless import check'.format(name))
+            return None
+    sys.meta_path.insert(0, _Blocked())
+importlib.import_module({module!r})
+"""
+
+
+def package_modules(packages=PACKAGES):
+    """Return the names of the modules of the packages, found from the source files (without importing them)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    modules = []
+    for package in packages:
+        for directory, subdirectories, file_names in os.walk(os.path.join(root, package)):
+            subdirectories[:] = sorted(name for name in subdirectories if name != '__pycache__')
+            if '__init__.py' not in file_names:
+                subdirectories[:] = []
+                continue
+            prefix = 'osdag.' + os.path.relpath(directory, root).replace(os.sep, '.')
+            modules.append(prefix)
+            modules.extend(prefix + '.' + name[:-3] for name in sorted(file_names)
+                           if name.endswith('.py') and name != '__init__.py')
+    return modules
+
+
+def check_import(module, blocked=()):
+    """Import a module in a new interpreter
+
+    Returns: None if the module imports, else the last line of the error
+    """
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = src + os.pathsep + env.get('PYTHONPATH', '')
+    process = subprocess.run([sys.executable, '-c', _IMPORT.format(blocked=list(blocked), module=module)],
+                             capture_output=True, text=True, env=env, cwd=src)
+    if process.returncode == 0:
+        return None
+    lines = [line for line in process.stderr.strip().splitlines() if line.strip()]
+    return lines[-1] if lines else 'exit status {}'.format(process.returncode)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--headless', action='store_true', help='block PyQt5 and OCC')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='interpreters run in parallel')
+    parser.add_argument('modules', nargs='*', help='modules to check (default: all)')
+    args = parser.parse_args(argv)
+
+    modules = args.modules or MODULES + package_modules()
+    blocked = HEADLESS_BLOCKED if args.headless else ()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        errors = list(executor.map(lambda module: check_import(module, blocked), modules))
+
+    failed = [(module, error) for module, error in zip(modules, errors) if error]
+    for module, error in failed:
+        print('FAIL {}: {}'.format(module, error))
+    print('{} of {} modules imported{}'.format(len(modules) - len(failed), len(modules),
+                                               ' (PyQt5 and OCC blocked)' if args.headless else ''))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
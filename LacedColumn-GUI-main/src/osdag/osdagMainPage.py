@@ -89,9 +89,10 @@ import time
 from importlib.resources import files
 import urllib.request
 from PyQt5.QtWidgets import QMessageBox,QApplication, QDialog, QMainWindow
-from .update_version_check import Update
+from .update_version_check import UpdateCheck, check_on_startup, set_check_on_startup
 #from Thread import timer
 from .get_DPI_scale import scale
+from .utils.common.profiling import profile_from_environment
 
 ############################ Pre-Build Database Updation/Creation #################
 # TODO: Is there a better way to create and use the sqlite file rather than directly in the installation?
@@ -266,6 +267,7 @@ class OsdagMainWindow(QMainWindow):
         self.ui.comboBox_help.currentIndexChanged.connect(self.selection_change)
         self.ui.myStackedWidget.currentChanged.connect(self.current_changed)
         self.Under_Development='UNDER DEVELOPMENT'
+        self.update_check = None
         self.Modules={
                 'Connection' : {'Simple Connection' : [
                                     ('Lap Joint Bolted',str(files("osdag.data.ResourceFiles.images").joinpath("LapJointBolted.png")),'Lap_Joint_Bolted'),
@@ -468,6 +470,33 @@ class OsdagMainWindow(QMainWindow):
         frameGm.moveCenter(centerPoint)
         self.move(frameGm.topLeft())
 
+    def start_update_check(self, use_cache=True, show_result=False):
+        '''
+        Check for a newer version on a background thread. The result is shown when the check ends: always if
+        show_result is True, otherwise only when a newer version is available.
+        '''
+        self.cancel_update_check()
+        self.update_check = UpdateCheck(self, use_cache)
+        self.update_check.checked.connect(lambda msg, available: self.show_update_result(msg, available, show_result))
+        self.update_check.start()
+
+    def cancel_update_check(self):
+        if self.update_check is not None:
+            self.update_check.cancel()
+            self.update_check = None
+
+    def show_update_result(self, msg, available, show_result):
+        self.update_check = None
+        if not (show_result or available):
+            return
+        box = QMessageBox(QMessageBox.Information, 'Info', msg, QMessageBox.Ok, self)
+        check_box = QtWidgets.QCheckBox('Check for updates when Osdag starts')
+        check_box.setChecked(check_on_startup())
+        box.setCheckBox(check_box)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: set_check_on_startup(check_box.isChecked()))
+        box.open()
+
     @pyqtSlot(int)
     def current_changed(self, index):
         l = list(self.Modules.keys())
@@ -518,9 +547,7 @@ class OsdagMainWindow(QMainWindow):
         elif loc == "Ask Us a Question":
             self.ask_question()
         elif loc == "Check for Update":
-            update_class = Update()
-            msg = update_class.notifi()
-            QMessageBox.information(self, 'Info',msg)
+            self.start_update_check(use_cache=False, show_result=True)
         # elif loc == "FAQ":
         #     pass
 
@@ -987,13 +1014,17 @@ def do_stuff():
 
     # trayIcon.show()
 
+    if check_on_startup():
+        window.start_update_check()
+    app.aboutToQuit.connect(window.cancel_update_check)
+
     try:
         # window.notification2()
-        #update = Update(0)
-        #update.notifi()
 
         sys.excepthook = hook_exception
-        QCoreApplication.exit(app.exec()) # to properly close the Qt Application use QCoreApplication instead of sys
+        # OSDAG_PROFILE=<file> profiles the session, see utils/common/profiling.py
+        with profile_from_environment():
+            QCoreApplication.exit(app.exec()) # to properly close the Qt Application use QCoreApplication instead of sys
     except BaseException as e:
         print("ERROR", e)
 
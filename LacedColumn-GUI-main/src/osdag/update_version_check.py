@@ -1,55 +1,131 @@
 ######################### UpDateNotifi ################
-import urllib.request
-import requests
+"""Check whether a newer version of Osdag is released.
+
+The check reads the latest version from the README of the Osdag repository. It runs on a background thread
+(UpdateCheck), with a short network timeout, so that neither the startup nor the "Check for Update" menu waits for the
+network. The result of the last check is kept in ~/.osdag/update_check.json, and the check at startup reuses it for a
+day. The startup check can be turned off from the message of the "Check for Update" menu, or by setting
+OSDAG_UPDATE_CHECK=0.
+"""
+import json
+import os
 import re
-from PyQt5.QtWidgets import QMessageBox,QMainWindow
-import sys
+import threading
+import time
+import urllib.request
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from ._version import __version__
+
+UPDATE_URL = "https://raw.githubusercontent.com/osdag-admin/Osdag/master/README.md"
+DOWNLOAD_URL = "https://osdag.fossee.in/resources/downloads"
+TIMEOUT = 3                 # seconds
+CACHE_AGE = 24 * 60 * 60    # seconds the result of the last check is reused at startup
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.osdag', 'update_check.json')
+
+
+def read_cache():
+    try:
+        with open(CACHE_FILE, 'r') as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_cache(**values):
+    cache = read_cache()
+    cache.update(values)
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w') as cache_file:
+            json.dump(cache, cache_file)
+    except OSError:
+        pass
+
+
+def check_on_startup():
+    """Return True if the update check should run when Osdag starts"""
+    if os.environ.get('OSDAG_UPDATE_CHECK', '1').strip().lower() in ('0', 'no', 'false', 'off'):
+        return False
+    return read_cache().get('check_on_startup', True)
+
+
+def set_check_on_startup(flag):
+    write_cache(check_on_startup=bool(flag))
+
 
 class Update():
-    def __init__(self):
+    def __init__(self, timeout=TIMEOUT):
         super().__init__()
-        self.old_version=self.get_current_version()
-        # msg = self.notifi()
+        self.timeout = timeout
+        self.old_version = self.get_current_version()
 
-    def notifi(self):
+    def latest_version(self, use_cache=False):
+        """Return the version of the latest release, None if it could not be read
+
+        Args:
+            use_cache: True to return the result of the last check if it is less than a day old
+        """
+        cache = read_cache()
+        if use_cache and cache.get('latest') and time.time() - cache.get('checked', 0) < CACHE_AGE:
+            return cache['latest']
         try:
-            url = "https://raw.githubusercontent.com/osdag-admin/Osdag/master/README.md"
-            file = urllib.request.urlopen(url)
-            version = 'not found'
-            for line in file:
-                decoded_line = line.decode("utf-8")
-                match = re.search(r'Download the latest release version (\S+)', decoded_line)
-                if match:
-                    version = match.group(1)
-                    version = version.split("<")[0]
-                    break
-            # decoded_line = line.decode("utf-8")
-            # new_version = decoded_line.split("=")[1]
-            if version != self.old_version:
-                msg = 'Current version: '+ self.old_version+'<br>'+'Latest version '+ str(version)+'<br>'+\
-                      'Update will be available <a href=\"https://osdag.fossee.in/resources/downloads\"> here <a/>'
-            else:
-                msg = 'Already up to date'
-            return msg
-        except:
+            with urllib.request.urlopen(UPDATE_URL, timeout=self.timeout) as file:
+                version = 'not found'
+                for line in file:
+                    decoded_line = line.decode("utf-8")
+                    match = re.search(r'Download the latest release version (\S+)', decoded_line)
+                    if match:
+                        version = match.group(1)
+                        version = version.split("<")[0]
+                        break
+        except Exception:
+            return None
+        write_cache(latest=version, checked=time.time())
+        return version
+
+    def is_update_available(self, version):
+        return version is not None and version != 'not found' and version != self.old_version
+
+    def message(self, version):
+        if version is None:
             return "No internet connection"
+        if version != self.old_version:
+            return 'Current version: ' + self.old_version + '<br>' + 'Latest version ' + str(version) + '<br>' + \
+                   'Update will be available <a href=\"' + DOWNLOAD_URL + '\"> here <a/>'
+        return 'Already up to date'
+
+    def notifi(self, use_cache=False):
+        return self.message(self.latest_version(use_cache))
 
     def get_current_version(self):
-        version_file = "_version.py"
-        rel_path = str(sys.path[0])
-        rel_path = rel_path.replace("\\", "/")
-        VERSIONFILE = rel_path +'/'+ version_file
+        return __version__
 
-        try:
-            verstrline = open(VERSIONFILE, "rt").read()
-        except EnvironmentError:
-            pass  # Okay, there is no version file.
-        else:
-            VSRE = r"^__version__ = ['\"]([^'\"]*)['\"]"
-            mo = re.search(VSRE, verstrline, re.M)
-            if mo:
-                verstr = mo.group(1)
-                return verstr
-            else:
-                print("unable to find version in %s" % (VERSIONFILE,))
-                raise RuntimeError("if %s.py exists, it is required to be well-formed" % (VERSIONFILE,))
+
+class UpdateCheck(QObject):
+    """Run the update check on a background thread
+
+    checked is emitted on the thread of the object (the GUI thread) with the message and whether a newer version is
+    available, unless the check was cancelled.
+    """
+    checked = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None, use_cache=False, timeout=TIMEOUT):
+        super().__init__(parent)
+        self.use_cache = use_cache
+        self.timeout = timeout
+        self._cancelled = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, name='osdag-update-check', daemon=True).start()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _run(self):
+        update = Update(self.timeout)
+        version = update.latest_version(self.use_cache)
+        if not self._cancelled.is_set():
+            self.checked.emit(update.message(version), update.is_update_available(version))
@@ -0,0 +1,141 @@
+"""Bolt group analysis for eccentrically loaded bolted connections.
+
+The functions below accept arrays of bolt layouts, so that the resultant force on the critical bolt and the reduced bolt
+capacity of several candidate layouts (bolts in one line x bolt lines x pitch x gauge) are computed in a single pass.
+The scalar methods of Plate (get_vres, get_bolt_red) are built on these functions, and Plate.get_web_plate_details and
+get_flange_plate_details score the candidate layouts of their search in batches with score_bolt_layouts. The large grip
+reduction factor (beta_lg) is calculated by the connection modules and passed in.
+
+Reference: IS 800:2007, cl 10.3.3.1 (long joints) and cl 10.3.3.2 (large grip lengths)
+"""
+import numpy as np
+
+
+def rectangular_bolt_group(bolts_one_line, bolt_line, pitch, gauge):
+    """Calculate the coordinates of the bolts of rectangular bolt groups about the centroid of each group
+
+    Args:
+        bolts_one_line: number of bolts in one line, along the gauge (int or array)
+        bolt_line: number of bolt lines, along the pitch (int or array)
+        pitch: pitch distance in mm (float or array)
+        gauge: gauge distance in mm (float or array)
+
+    Returns:
+        x, y, mask (arrays of shape (number of layouts, maximum number of bolts)) - x is measured along the pitch and y along
+        the gauge, mask is False for the padding of layouts with less bolts than the largest layout
+    """
+    bolts_one_line, bolt_line, pitch, gauge = np.broadcast_arrays(np.atleast_1d(np.asarray(bolts_one_line, dtype=int)),
+                                                                  np.atleast_1d(np.asarray(bolt_line, dtype=int)),
+                                                                  np.atleast_1d(np.asarray(pitch, dtype=float)),
+                                                                  np.atleast_1d(np.asarray(gauge, dtype=float)))
+    rows = np.arange(max(bolts_one_line.max(), 1))[None, :, None]
+    columns = np.arange(max(bolt_line.max(), 1))[None, None, :]
+
+    y = (rows - (bolts_one_line[:, None, None] - 1) / 2) * gauge[:, None, None]
+    x = (columns - (bolt_line[:, None, None] - 1) / 2) * pitch[:, None, None]
+    mask = (rows < bolts_one_line[:, None, None]) & (columns < bolt_line[:, None, None])
+
+    shape = mask.shape
+    x, y = np.broadcast_to(x, shape), np.broadcast_to(y, shape)
+    return (np.where(mask, x, 0.0).reshape(shape[0], -1), np.where(mask, y, 0.0).reshape(shape[0], -1),
+            mask.reshape(shape[0], -1))
+
+
+def polar_moment(x, y, mask):
+    """Calculate the polar moment (sum of r^2) of bolt groups about their centroids
+
+    Args:
+        x, y, mask: bolt coordinates and mask of each layout as returned by rectangular_bolt_group (arrays)
+
+    Returns: sum of the squares of the distances of the bolts from the centroid in mm^2 (array)
+    """
+    return np.sum(np.where(mask, x ** 2 + y ** 2, 0.0), axis=-1)
+
+
+def bolt_group_forces(x, y, mask, shear_load, axial_load, moment):
+    """Calculate the resultant force on the critical bolt of bolt groups subjected to shear, axial force and in-plane moment
+
+    Args:
+        x, y, mask: bolt coordinates and mask of each layout as returned by rectangular_bolt_group (arrays)
+        shear_load: shear force along the gauge (along y) in N (float or array)
+        axial_load: axial force along the pitch (along x) in N (float or array)
+        moment: in-plane moment on the bolt group in N-mm (float or array)
+
+    Returns: dictionary of arrays - xmax, ymax, sigma_r_sq, vbv (direct shear), tmv (vertical component due to moment),
+             abh (direct axial), tmh (horizontal component due to moment) and vres (resultant on the critical bolt)
+    """
+    bolts = np.sum(mask, axis=-1)
+    xmax = np.max(np.where(mask, np.abs(x), 0.0), axis=-1)
+    ymax = np.max(np.where(mask, np.abs(y), 0.0), axis=-1)
+    sigma_r_sq = polar_moment(x, y, mask)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tmh = np.where(sigma_r_sq > 0, moment * ymax / sigma_r_sq, 0.0)
+        tmv = np.where(sigma_r_sq > 0, moment * xmax / sigma_r_sq, 0.0)
+    vbv = shear_load / bolts
+    abh = axial_load / bolts
+    vres = np.sqrt((vbv + tmv) ** 2 + (tmh + abh) ** 2)
+
+    return {'xmax': xmax, 'ymax': ymax, 'sigma_r_sq': sigma_r_sq, 'vbv': vbv, 'tmv': tmv, 'abh': abh, 'tmh': tmh, 'vres': vres}
+
+
+def long_joint_reduction(joint_length, bolt_dia):
+    """Calculate the reduction factor for long joints [Reference: Cl 10.3.3.1, IS 800:2007]
+
+    Args:
+        joint_length: length of the joint in mm (float or array)
+        bolt_dia: nominal diameter of the bolt in mm (float or array)
+
+    Returns: beta_lj (array), rounded to two decimals, 1.0 where the joint length does not exceed 15 times the bolt diameter
+    """
+    joint_length = np.asarray(joint_length, dtype=float)
+    beta_lj = np.round(np.clip(1.075 - joint_length / (200 * bolt_dia), 0.75, 1.0), 2)
+    return np.where(joint_length > 15 * bolt_dia, beta_lj, 1.0)
+
+
+def reduced_bolt_capacity(bolt_capacity, beta_lj, beta_lg=1.0):
+    """Calculate the bolt capacity reduced for long joints and large grip lengths
+
+    Args:
+        bolt_capacity: capacity of the bolt in N (float or array)
+        beta_lj: reduction factor for long joints (float or array)
+        beta_lg: reduction factor for large grip lengths (float or array)
+
+    Returns: reduced bolt capacity in N and the beta_lg applied (arrays)
+
+    Note: beta_lg is limited to beta_lj when the large grip reduction is applicable (beta_lg != 1)
+    """
+    beta_lj = np.asarray(beta_lj, dtype=float)
+    beta_lg = np.asarray(beta_lg, dtype=float)
+    beta_lg = np.where((beta_lg >= beta_lj) & (beta_lg != 1), beta_lj, beta_lg)
+    return np.round(beta_lj, 2) * bolt_capacity * beta_lg, beta_lg
+
+
+def score_bolt_layouts(bolts_one_line, bolt_line, pitch, gauge, bolt_capacity, bolt_dia, shear_load=0.0, axial_load=0.0,
+                       moment=0.0, joint_length=None, beta_lg=1.0):
+    """Calculate the critical bolt force, reduced bolt capacity and utilisation of several rectangular bolt layouts at once
+
+    Args:
+        bolts_one_line, bolt_line, pitch, gauge: description of the candidate layouts (int/float or arrays)
+        bolt_capacity: capacity of the bolt in N (float or array)
+        bolt_dia: nominal diameter of the bolt in mm (float or array)
+        shear_load: shear force along the gauge in N (float or array)
+        axial_load: axial force along the pitch in N (float or array)
+        moment: in-plane moment on the bolt group in N-mm (float or array), e.g. shear_load * eccentricity + web_moment
+        joint_length: length of the joint for the long joint reduction in mm (float or array), taken as the larger of the bolt
+                      group dimensions when not given
+        beta_lg: reduction factor for large grip lengths (float or array)
+
+    Returns: dictionary of arrays - the entries of bolt_group_forces, and beta_lj, beta_lg, bolt_capacity_red and
+             utilisation (vres / bolt_capacity_red) of each layout
+    """
+    x, y, mask = rectangular_bolt_group(bolts_one_line, bolt_line, pitch, gauge)
+    result = bolt_group_forces(x, y, mask, shear_load, axial_load, moment)
+
+    if joint_length is None:
+        joint_length = np.maximum(2 * result['ymax'], 2 * result['xmax'])
+    result['beta_lj'] = long_joint_reduction(joint_length, bolt_dia)
+    result['bolt_capacity_red'], result['beta_lg'] = reduced_bolt_capacity(bolt_capacity, result['beta_lj'], beta_lg)
+    result['utilisation'] = result['vres'] / result['bolt_capacity_red']
+
+    return result
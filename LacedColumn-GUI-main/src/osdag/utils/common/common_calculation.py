@@ -109,3 +109,39 @@ def calculate_roots(lst=None):
     r_2 = roots[1]
     r = max(r_1, r_2)  # picking the highest positive value from the roots
 
+
+
+def cubic_max_real_root(k1, k2, k3):
+    """Calculate the largest real root of the cubic equation y^3 + k1*y^2 + k2*y + k3 = 0 in closed form
+
+    Args:
+        k1, k2, k3 (float or array): constants of the (monic) cubic equation, scalars or arrays of equal shape
+
+    Returns: largest real root (float or array)
+
+    Note: The roots are computed by Cardano's method when the cubic has one real root and by the trigonometric method when it has
+          three real roots, so that several equations can be solved in one vectorised call instead of one np.roots call each.
+    """
+    k1 = np.asarray(k1, dtype=float)
+    k2 = np.asarray(k2, dtype=float)
+    k3 = np.asarray(k3, dtype=float)
+
+    # depressed cubic t^3 + p*t + q = 0, where y = t - k1/3
+    p = k2 - (k1 ** 2 / 3)
+    q = (2 * k1 ** 3 / 27) - (k1 * k2 / 3) + k3
+    discriminant = (q / 2) ** 2 + (p / 3) ** 3
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # one real root (Cardano)
+        sqrt_disc = np.sqrt(np.maximum(discriminant, 0))
+        t_one = np.cbrt(-q / 2 + sqrt_disc) + np.cbrt(-q / 2 - sqrt_disc)
+
+        # three real roots (trigonometric), the largest one corresponds to k = 0
+        m = 2 * np.sqrt(np.maximum(-p / 3, 0))
+        cos_arg = np.clip((3 * q / (2 * p)) * np.sqrt(np.maximum(-3 / p, 0)), -1, 1)
+        t_three = m * np.cos(np.arccos(cos_arg) / 3)
+
+    t = np.where((discriminant > 0) | (p >= 0), t_one, t_three)
+    y = t - k1 / 3
+
+    return y if y.ndim else float(y)
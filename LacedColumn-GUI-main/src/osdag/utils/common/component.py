@@ -10,8 +10,11 @@ from ...Common import *
 from pylatex import Math, TikZ, Axis, Plot, Figure, Matrix, Alignat
 from pylatex.utils import italic, NoEscape
 import math
+import bisect
+from functools import lru_cache
 import numpy as np
 from .common_calculation import *
+from .bolt_group import rectangular_bolt_group, bolt_group_forces, long_joint_reduction, score_bolt_layouts
 
 # Define local connectdb function to avoid circular import
 def connectdb(table_name, call_type="dropdown"):
@@ -359,6 +362,21 @@ class Nut(Material):
         return repr
 
 
+
+@lru_cache(maxsize=None)
+def fillet_weld_design_stress(ultimate_stresses, fabrication=KEY_DP_FAB_SHOP):
+    """Design stress of fillet weld [Reference: Cl 10.5.7.1.1, IS 800:2007], cached per combination of ultimate stresses and
+    fabrication so that weld design loops do not recompute it
+
+    Args:
+        ultimate_stresses - Ultimate stresses of weld and parent metal in MPa (tuple)
+        fabrication - Either 'shop' or 'field' (str)
+    Returns:
+        Design strength of fillet weld in MPa (float)
+    """
+    return IS800_2007.cl_10_5_7_1_1_fillet_weld_design_stress(ultimate_stresses, fabrication)
+
+
 class Weld:
 
     def __init__(self, material_g_o="", type=KEY_DP_WELD_TYPE_FILLET, fabrication= KEY_DP_FAB_SHOP):
@@ -416,7 +434,7 @@ class Weld:
 
     def get_weld_strength(self, connecting_fu, weld_fabrication, t_weld, weld_angle):
         # connecting_fu.append(self.fu)
-        f_wd = IS800_2007.cl_10_5_7_1_1_fillet_weld_design_stress(connecting_fu, weld_fabrication)
+        f_wd = fillet_weld_design_stress(tuple(connecting_fu), weld_fabrication)
         self.throat_tk = \
             round(IS800_2007.cl_10_5_3_2_fillet_weld_effective_throat_thickness \
                       (t_weld, weld_angle), 2)
@@ -425,7 +443,7 @@ class Weld:
         self.strength = weld_strength
 
     def get_weld_strength_lj(self, connecting_fu, weld_fabrication, t_weld, weld_angle, length):
-        f_wd = IS800_2007.cl_10_5_7_1_1_fillet_weld_design_stress(connecting_fu, weld_fabrication)
+        f_wd = fillet_weld_design_stress(tuple(connecting_fu), weld_fabrication)
         self.throat_tk = \
             round(IS800_2007.cl_10_5_3_2_fillet_weld_effective_throat_thickness \
                       (t_weld, weld_angle), 2)
@@ -446,6 +464,73 @@ class Weld:
         weld_stress = round(math.sqrt((T_wh + A_wh) ** 2 + (T_wv + V_wv) ** 2), 2)
         self.stress = weld_stress
 
+    def check_size(self, weld_size, connecting_fu, weld_shear, weld_axial, weld_twist=0.0, weld_angle=90, long_joint=False):
+        """Update the throat thickness, effective length, strength and stress of two parallel lines of fillet weld of
+        length self.length for the given weld size
+
+        Args:
+            weld_size - size of the fillet weld in mm (float)
+            connecting_fu - ultimate stresses of weld and parent metal in MPa (list)
+            weld_shear, weld_axial - forces along and across the weld lines in N (float)
+            weld_twist - in-plane moment on the weld group in N-mm (float)
+            weld_angle - angle between fusion faces in degrees (int)
+            long_joint - True if the strength is to be reduced for long joints [Reference: Cl 10.5.7.3, IS 800:2007] (bool)
+        Returns:
+            True if the strength of the weld is greater than the stress (bool)
+        """
+        self.size = weld_size
+        self.eff_length = IS800_2007.cl_10_5_4_1_fillet_weld_effective_length(fillet_size=weld_size, available_length=self.length)
+        self.get_weld_strength(connecting_fu=connecting_fu, weld_fabrication=self.fabrication, t_weld=weld_size,
+                               weld_angle=weld_angle)
+        if long_joint is True:
+            self.beta_lw = IS800_2007.cl_10_5_7_3_weld_long_joint(self.eff_length, self.throat_tk)
+            self.strength = self.strength * self.beta_lw
+
+        if self.eff_length <= 0:
+            self.stress = math.inf
+        elif weld_twist != 0.0:
+            self.get_weld_stress(weld_shear=weld_shear, weld_axial=weld_axial, l_weld=2 * self.eff_length, weld_twist=weld_twist,
+                                 Ip_weld=2 * self.eff_length ** 3 / 12, y_max=self.eff_length / 2, x_max=0.0)
+        else:
+            self.get_weld_stress(weld_shear=weld_shear, weld_axial=weld_axial, l_weld=2 * self.eff_length)
+
+        return self.strength > self.stress
+
+    def design_size(self, available_welds, connecting_fu, weld_shear, weld_axial, weld_twist=0.0, weld_angle=90, long_joint=False):
+        """Select the smallest size from the available weld sizes for which the strength of two parallel lines of fillet weld
+        of length self.length exceeds the stress
+
+        Args:
+            available_welds - available weld sizes in mm, sorted in ascending order (list)
+            other arguments - as in check_size
+        Returns:
+            True if a weld size satisfies the strength check, else False with the largest available size assigned (bool)
+
+        Note: The strength is at most f_wd times the throat thickness (the long joint factor is at most 1.0), and the stress
+              is least for the smallest size (the stress increases with the size as the effective length reduces). The
+              available sizes whose f_wd times throat thickness does not exceed the stress on the smallest size can not pass
+              the check and are skipped. The check is not monotonic above them (on a short weld a larger size can fail where
+              a smaller one passes), so the remaining sizes are checked in ascending order and the first one that passes is
+              taken.
+        """
+        if self.check_size(available_welds[0], connecting_fu, weld_shear, weld_axial, weld_twist, weld_angle, long_joint):
+            return True
+
+        # upper bound of the strength of each size, rounded as in get_weld_strength
+        f_wd = fillet_weld_design_stress(tuple(connecting_fu), self.fabrication)
+        strengths = [round(f_wd * IS800_2007.cl_10_5_3_2_fillet_weld_effective_throat_thickness(size, weld_angle), 2)
+                     for size in available_welds]
+        lo = max(bisect.bisect_right(strengths, self.stress), 1)
+
+        for weld_size in available_welds[lo:]:
+            if self.check_size(weld_size, connecting_fu, weld_shear, weld_axial, weld_twist, weld_angle, long_joint):
+                return True
+
+        if lo >= len(available_welds):
+            # no size can pass: the largest available size is assigned, as after a check of every size
+            self.check_size(available_welds[-1], connecting_fu, weld_shear, weld_axial, weld_twist, weld_angle, long_joint)
+        return False
+
     def weld_size(self, plate_thickness, member_thickness, edge_type="Square"):
 
         max_weld_thickness = (min(plate_thickness, member_thickness))
@@ -742,22 +827,18 @@ class Plate(Material):
         :return: resultant load on bolt due to eccentricity of shear force
         """
         length_avail = (bolts_one_line - 1) * gauge
-        ymax = length_avail / 2
-        xmax = pitch * (bolt_line - 1) / 2
-        r_sq = 0
-        n = float(bolts_one_line) / 2.0 - 0.5
-        b = float((bolt_line - 1)) / 2
-        for x in np.arange(b, -b - 1, -1):
-            for y in np.arange(-n, n + 1, 1):
-                r_sq = r_sq + ((pitch * x) ** 2 + (abs(y) * gauge) ** 2)
-        sigma_r_sq = r_sq
-
-        vbv = shear_load / (bolts_one_line * bolt_line)
+        x, y, mask = rectangular_bolt_group(bolts_one_line, bolt_line, pitch, gauge)
         moment_demand = round((shear_load * ecc + web_moment), 3)
-        tmh = moment_demand * ymax / sigma_r_sq
-        tmv = moment_demand * xmax / sigma_r_sq
-        abh = axial_load / (bolts_one_line * bolt_line)
-        vres = math.sqrt((vbv + tmv) ** 2 + (tmh + abh) ** 2)
+        forces = bolt_group_forces(x, y, mask, shear_load, axial_load, moment_demand)
+
+        ymax = float(forces['ymax'][0])
+        xmax = float(forces['xmax'][0])
+        sigma_r_sq = float(forces['sigma_r_sq'][0])
+        vbv = float(forces['vbv'][0])
+        tmh = float(forces['tmh'][0])
+        tmv = float(forces['tmv'][0])
+        abh = float(forces['abh'][0])
+        vres = float(forces['vres'][0])
 
         self.ymax = ymax
         self.xmax = xmax
@@ -784,19 +865,6 @@ class Plate(Material):
         """
         if end_dist == 0.0 and gap == 0.0:
             self.length_avail = max(((bolts_one_line - 1) * gauge), ((bolts_line - 1) * pitch))
-            if self.length_avail > 15 * bolt_dia:
-                self.beta_lj = 1.075 - self.length_avail / (200 * bolt_dia)
-
-                if self.beta_lj > 1:
-                    self.beta_lj = 1.0
-                elif self.beta_lj < 0.75:
-                    self.beta_lj = 0.75
-                else:
-                    self.beta_lj = round(self.beta_lj, 2)
-                bolt_capacity_red = round(self.beta_lj, 2) * bolt_capacity
-            else:
-                self.beta_lj = 1.0
-                bolt_capacity_red = bolt_capacity
         else:
             if web_thickness == 0.0:
                 self.length_avail = max((2 * (((bolts_line - 1) * pitch) + end_dist) + (2 * gap)),
@@ -805,19 +873,10 @@ class Plate(Material):
                 midgauge = 2 * (edge_dist + root_radius) + web_thickness
                 self.length_avail = max((2 * (((bolts_line - 1) * pitch) + end_dist) + (2 * gap)),
                                    (((bolts_one_line / 2 - 1) * gauge) + midgauge))
-            if self.length_avail > 15 * bolt_dia:
-                self.beta_lj = 1.075 - self.length_avail / (200 * bolt_dia)
-                if  self.beta_lj > 1:
-                    self.beta_lj = 1.0
-                elif  self.beta_lj < 0.75:
-                    self.beta_lj = 0.75
-                else:
-                    self.beta_lj =  round(self.beta_lj, 2)
-                bolt_capacity_red = round( self.beta_lj, 2) * bolt_capacity
 
-            else:
-                self.beta_lj = 1.0
-                bolt_capacity_red = bolt_capacity
+        # reduction for long joints [Reference: Cl 10.3.3.1, IS 800:2007]
+        self.beta_lj = float(long_joint_reduction(self.length_avail, bolt_dia))
+        bolt_capacity_red = self.beta_lj * bolt_capacity
 
         self.beta_lg = beta_lg
         if self.beta_lg >= self.beta_lj and self.beta_lg !=1:
@@ -830,6 +889,107 @@ class Plate(Material):
 
         return bolt_capacity_red
 
+    def score_plate_layouts(self, layouts, bolt_capacity, bolt_dia, shear_load, axial_load, moment, end_dist=0.0,
+                            gap=0.0, root_radius=0.0, web_thickness=0.0, beta_lg=1.0):
+        """
+        :param layouts: candidate layouts (bolt_line, bolts_one_line, plate height, gauge, edge_dist, pitch, ...)
+        :param moment: moment on the bolt group of each layout (list) or of all of them
+        :return: resultant force on the critical bolt and reduced bolt capacity of the layouts (arrays), as get_vres
+                 and get_bolt_red (with the same end_dist, gap, root_radius and web_thickness) for one layout
+        """
+        bolt_line, bolts_one_line, plate_h, gauge, edge_dist, pitch = \
+            (np.array([layout[i] for layout in layouts], dtype=float) for i in range(6))
+        if end_dist == 0.0 and gap == 0.0:
+            joint_length = np.maximum((bolts_one_line - 1) * gauge, (bolt_line - 1) * pitch)
+        elif web_thickness == 0.0:
+            joint_length = np.maximum(2 * (((bolt_line - 1) * pitch) + end_dist) + (2 * gap),
+                                      (bolts_one_line - 1) * gauge)
+        else:
+            midgauge = 2 * (edge_dist + root_radius) + web_thickness
+            joint_length = np.maximum(2 * (((bolt_line - 1) * pitch) + end_dist) + (2 * gap),
+                                      ((bolts_one_line / 2 - 1) * gauge) + midgauge)
+        scores = score_bolt_layouts(bolts_one_line, bolt_line, pitch, gauge, bolt_capacity, bolt_dia, shear_load,
+                                    axial_load, np.asarray(moment, dtype=float), joint_length, beta_lg)
+        return scores['vres'], scores['bolt_capacity_red']
+
+    def next_web_plate_layouts(self, layout, web_plate_h_min, web_plate_h_max, min_edge_dist, min_gauge, max_spacing,
+                               max_edge_dist, shear_ecc, min_bolts_one_line, bolt_line_limit, count=8):
+        """
+        :param layout: bolt_line, bolts_one_line, web_plate_h, gauge, edge_dist, pitch, bolts_required
+        :param count: number of layouts returned (less if the bolt line limit is exceeded)
+        :return: layouts tried in turn after layout by get_web_plate_details: a plate 10 mm taller if the gauge can be
+                 increased with shear eccentricity, else one more bolt
+        """
+        [bolt_line, bolts_one_line, web_plate_h, gauge, edge_dist, pitch, bolts_required] = layout
+        layouts = []
+        while len(layouts) < count:
+            if web_plate_h is not False:
+                [gauge, edge_dist, web_plate_h_recalc] = self.get_gauge_edge_dist(web_plate_h + 10, bolts_one_line,
+                                                                                  min_edge_dist,
+                                                                                  max_spacing, max_edge_dist)
+                if web_plate_h_recalc <= web_plate_h_max and shear_ecc is True and gauge != 0:
+                    # gauge is recalculated only if there is shear ecc or else increase in bolt is the only option
+                    web_plate_h += 10
+
+                # If height cannot be increased number of bolts is increased by 1
+                else:
+                    bolts_required = bolt_line * bolts_one_line
+                    bolts_required += 1
+                    [bolt_line, bolts_one_line, web_plate_h] = \
+                        self.get_web_plate_l_bolts_one_line(web_plate_h_max, web_plate_h_min, bolts_required,
+                                                            min_edge_dist, min_gauge, min_bolts_one_line)
+                [gauge, edge_dist, web_plate_h] = self.get_gauge_edge_dist(web_plate_h, bolts_one_line, min_edge_dist,
+                                                                           max_spacing, max_edge_dist)
+
+            while web_plate_h is False:
+                bolts_required += 1
+                [bolt_line, bolts_one_line, web_plate_h] = \
+                    self.get_web_plate_l_bolts_one_line(web_plate_h_max, web_plate_h_min, bolts_required,
+                                                        min_edge_dist, min_gauge, min_bolts_one_line)
+                [gauge, edge_dist, web_plate_h] = self.get_gauge_edge_dist(web_plate_h, bolts_one_line,
+                                                                           min_edge_dist, max_spacing,
+                                                                           max_edge_dist)
+
+            if bolt_line == 1:
+                pitch = 0.0
+            else:
+                pitch = min_gauge
+            layouts.append((bolt_line, bolts_one_line, web_plate_h, gauge, edge_dist, pitch, bolts_required))
+            if bolt_line > bolt_line_limit and web_plate_h != False:
+                # the search ends here whatever the bolt force
+                break
+        return layouts
+
+    def next_flange_plate_layouts(self, layout, flange_plate_h_min, flange_plate_h_max, min_edge_dist, min_gauge,
+                                  max_spacing, max_edge_dist, web_thickness, root_radius, bolt_line_limit, count=8):
+        """
+        :param layout: bolt_line, bolts_one_line, flange_plate_h, gauge, edge_dist, pitch
+        :param count: number of layouts returned (less if the bolt line limit is exceeded)
+        :return: layouts tried in turn after layout by get_flange_plate_details, one more bolt each
+        """
+        [bolt_line, bolts_one_line, flange_plate_h, gauge, edge_dist, pitch] = layout
+        layouts = []
+        while len(layouts) < count:
+            bolts_required = bolt_line * bolts_one_line
+            bolts_required += 1
+            [bolt_line, bolts_one_line, flange_plate_h] = \
+                self.get_flange_plate_l_bolts_one_line(flange_plate_h_max, flange_plate_h_min, bolts_required,
+                                                       min_edge_dist, min_gauge,
+                                                       web_thickness, root_radius)
+
+            [gauge, edge_dist, flange_plate_h] = self.get_gauge_edge_dist_flange(flange_plate_h, bolts_one_line,
+                                                                                 min_edge_dist, max_spacing,
+                                                                                 max_edge_dist, web_thickness,
+                                                                                 root_radius)
+            if bolt_line == 1:
+                pitch = 0.0
+            else:
+                pitch = min_gauge
+            layouts.append((bolt_line, bolts_one_line, flange_plate_h, gauge, edge_dist, pitch))
+            if bolt_line > bolt_line_limit:
+                break
+        return layouts
+
     # def length_grip_bolt_cap_red(self, plate_quantity, parent_tk, plate_tk, diameter, bolt_capacity,vres):
     #     length_grip_l_g = (plate_quantity * plate_tk) + parent_tk
     #     self.beta_lg = IS800_2007.cl_10_3_3_2_bolt_large_grip(d=diameter, l_g=length_grip_l_g, l_j=self.length_avail)
@@ -931,41 +1091,35 @@ class Plate(Material):
                                                       gauge, bolt_line, pitch, bolt_capacity,
                                                       bolt_dia, end_dist, gap, beta_lg=beta_lg)
 
-            while (bolt_line <= bolt_line_limit and vres > bolt_capacity_red) or web_plate_h == False:
-                if web_plate_h is not False:
-
-
-                    [gauge, edge_dist, web_plate_h_recalc] = self.get_gauge_edge_dist(web_plate_h + 10, bolts_one_line,
-                                                                                      min_edge_dist,
-                                                                                      max_spacing, max_edge_dist)
-                    if web_plate_h_recalc <= web_plate_h_max and shear_ecc is True and gauge != 0:
-                        # gauge is recalculated only if there is shear ecc or else increase in bolt is the only option
-                        web_plate_h += 10
-
-                    # If height cannot be increased number of bolts is increased by 1 and loop is repeated
+            if (bolt_line <= bolt_line_limit and vres > bolt_capacity_red) or web_plate_h == False:
+                # the layouts tried in turn (a taller plate or one more bolt) follow from the plate geometry alone: they
+                # are generated in batches and the bolt forces and reduced capacities of a batch are found in one call,
+                # the first layout which carries the load (or exceeds the bolt line limit) is taken
+                layout = (bolt_line, bolts_one_line, web_plate_h, gauge, edge_dist, pitch, bolts_required)
+                while True:
+                    layouts = self.next_web_plate_layouts(layout, web_plate_h_min, web_plate_h_max, min_edge_dist,
+                                                          min_gauge, max_spacing, max_edge_dist, shear_ecc,
+                                                          min_bolts_one_line, bolt_line_limit)
+                    if shear_ecc is True:
+                        moments = [round((shear_load * ((layout[5] * max((layout[0] - 1) / 2, 0)) + end_dist + gap)
+                                          + web_moment), 3) for layout in layouts]
+                        [vres, bolt_capacity_red] = self.score_plate_layouts(layouts, bolt_capacity, bolt_dia,
+                                                                             shear_load, axial_load, moments,
+                                                                             *((end_dist, gap) if joint != None else ()),
+                                                                             beta_lg=beta_lg)
                     else:
-                        bolts_required = bolt_line * bolts_one_line
-                        bolts_required += 1
-                        [bolt_line, bolts_one_line, web_plate_h] = \
-                            self.get_web_plate_l_bolts_one_line(web_plate_h_max, web_plate_h_min, bolts_required,
-                                                                min_edge_dist, min_gauge, min_bolts_one_line)
-                    [gauge, edge_dist, web_plate_h] = self.get_gauge_edge_dist(web_plate_h, bolts_one_line, min_edge_dist,
-                                                                               max_spacing, max_edge_dist)
-
-                while web_plate_h is False:
-                    bolts_required += 1
-                    [bolt_line, bolts_one_line, web_plate_h] = \
-                        self.get_web_plate_l_bolts_one_line(web_plate_h_max, web_plate_h_min, bolts_required,
-                                                            min_edge_dist, min_gauge, min_bolts_one_line)
-                    [gauge, edge_dist, web_plate_h] = self.get_gauge_edge_dist(web_plate_h, bolts_one_line,
-                                                                               min_edge_dist, max_spacing,
-                                                                               max_edge_dist)
-
-                if bolt_line == 1:
-                    pitch = 0.0
-                else:
-                    pitch = min_gauge
-
+                        [vres, bolt_capacity_red] = self.score_plate_layouts(layouts, bolt_capacity, bolt_dia,
+                                                                             resultant_force, 0.0, 0.0,
+                                                                             *((end_dist, gap) if joint != None else ()),
+                                                                             beta_lg=beta_lg)
+                    carried = [not ((layout[0] <= bolt_line_limit and layout_vres > layout_capacity)
+                                    or layout[2] == False)
+                               for layout, layout_vres, layout_capacity in zip(layouts, vres, bolt_capacity_red)]
+                    if any(carried):
+                        break
+                    layout = layouts[-1]
+                [bolt_line, bolts_one_line, web_plate_h, gauge, edge_dist, pitch, bolts_required] = \
+                    layouts[carried.index(True)]
 
                 if shear_ecc is True:
                     # If check for shear eccentricity is true, resultant force in bolt is calculated
@@ -1069,27 +1223,30 @@ class Plate(Material):
                                                       gauge, bolt_line, pitch, bolt_capacity,
                                                       bolt_dia, end_dist, gap, edge_dist, root_radius, web_thickness, beta_lg= beta_lg)
 
-            # while bolt_line <= bolt_line_limit and vres > bolt_capacity_red:
-            # [gauge, edge_dist, flange_plate_h] = \
-            #     self.get_gauge_edge_dist_flange(flange_plate_h, bolts_one_line, min_edge_dist, max_spacing,
-            #                                     max_edge_dist, web_thickness, root_radius)
-            while bolt_line <= bolt_line_limit and vres > bolt_capacity_red:
-                bolts_required = bolt_line * bolts_one_line
-                bolts_required += 1
-                [bolt_line, bolts_one_line, flange_plate_h] = \
-                    self.get_flange_plate_l_bolts_one_line(flange_plate_h_max, flange_plate_h_min, bolts_required,
-                                                           min_edge_dist, min_gauge,
-                                                           web_thickness, root_radius)  #
-
-                [gauge, edge_dist, flange_plate_h] = self.get_gauge_edge_dist_flange(flange_plate_h, bolts_one_line,
-                                                                                     min_edge_dist, max_spacing,
-                                                                                     max_edge_dist, web_thickness,
-                                                                                     root_radius)
-
-                if bolt_line == 1:
-                    pitch = 0.0
-                else:
-                    pitch = min_gauge
+            if bolt_line <= bolt_line_limit and vres > bolt_capacity_red:
+                # the layouts tried in turn (one more bolt) follow from the plate geometry alone: they are generated in
+                # batches and scored in one call, the first layout which carries the load (or exceeds the bolt line
+                # limit) is taken
+                layout = (bolt_line, bolts_one_line, flange_plate_h, gauge, edge_dist, pitch)
+                while True:
+                    layouts = self.next_flange_plate_layouts(layout, flange_plate_h_min, flange_plate_h_max,
+                                                             min_edge_dist, min_gauge, max_spacing, max_edge_dist,
+                                                             web_thickness, root_radius, bolt_line_limit)
+                    if joint == None:
+                        [vres, bolt_capacity_red] = self.score_plate_layouts(layouts, bolt_capacity, bolt_dia,
+                                                                             res_force, 0.0, 0.0, beta_lg=beta_lg)
+                    else:
+                        [vres, bolt_capacity_red] = self.score_plate_layouts(layouts, bolt_capacity, bolt_dia,
+                                                                             res_force, 0.0, 0.0, end_dist, gap,
+                                                                             root_radius, web_thickness,
+                                                                             beta_lg=beta_lg)
+                    carried = [not (layout[0] <= bolt_line_limit and layout_vres > layout_capacity)
+                               for layout, layout_vres, layout_capacity in zip(layouts, vres, bolt_capacity_red)]
+                    if any(carried):
+                        break
+                    layout = layouts[-1]
+                [bolt_line, bolts_one_line, flange_plate_h, gauge, edge_dist, pitch] = layouts[carried.index(True)]
+
                 vres = res_force / (bolt_line * bolts_one_line)
                 if joint == None:
                     bolt_capacity_red = self.get_bolt_red(bolts_one_line,
@@ -1101,23 +1258,6 @@ class Plate(Material):
                                                           bolt_dia, end_dist, gap, edge_dist, root_radius,
                                                           web_thickness,beta_lg= beta_lg)
 
-                # convergence = bolt_capacity_red - vres
-                #
-                # if convergence < 0:
-                #     if count == 0:
-                #         initial_convergence = convergence
-                #         count = count + 1
-                #     else:
-                #         if initial_convergence <= convergence:
-                #             initial_convergence = convergence
-                #         else:
-                #             break
-                # else:
-                #     pass
-            #
-            # bolt_capacity_red = self.get_bolt_red(bolts_one_line,
-            #                                       gauge, bolt_line, pitch, bolt_capacity,
-            #                                       bolt_dia, end_dist, gap)
             if vres > bolt_capacity_red:
                 self.design_status = False
                 self.reason = "Bolt line limit is reached. Select higher grade/Diameter or choose different connection."
@@ -0,0 +1,278 @@
+"""Cache of complete designs, keyed by a canonical hash of the design inputs.
+
+A design is identified by the module, the design inputs (input dock and design preference values), the version of Osdag
+and the version of the section and material database. Two designs with the same inputs, given in any order, have the
+same key. The cache holds the state of the design module after the design (its attributes), the design dictionary as
+updated by the design and the log records emitted during the design, so that a repeated design restores the module and
+replays the messages instead of calculating again.
+
+The entries are held in memory, with a least recently used bound, and optionally written to a directory on disk (set
+OSDAG_DESIGN_CACHE to a folder to keep the cache between sessions). The files on disk are pickles, which run code when
+they are loaded: each file is signed with an HMAC-SHA256 digest, keyed with a secret kept in the Osdag folder of the
+user's home directory (~/.osdag/design_cache.key), and a file whose digest does not match is not loaded.
+"""
+import ast
+import contextlib
+import copy
+import hashlib
+import hmac
+import inspect
+import json
+import logging
+import os
+import pickle
+import textwrap
+from collections import OrderedDict
+from functools import lru_cache
+
+from ...Common import PATH_TO_DATABASE, KEY_MODULE
+from ..._version import __version__
+
+KEY_FILE = os.path.join(os.path.expanduser('~'), '.osdag', 'design_cache.key')
+
+
+def database_version(database=PATH_TO_DATABASE):
+    """Return a token which changes whenever the section and material database is modified"""
+    try:
+        stat = os.stat(database)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _canonical(value):
+    """Convert design inputs to JSON compatible values, with dictionaries sorted by key"""
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def module_name(main, design_inputs):
+    """Return the name of the module of a design, from the design inputs or the class of the design object"""
+    if design_inputs.get(KEY_MODULE):
+        return str(design_inputs[KEY_MODULE])
+    return main.__name__ if isinstance(main, type) else type(main).__name__
+
+
+def design_key(module, design_inputs, database=PATH_TO_DATABASE):
+    """Calculate the cache key of a design
+
+    Args:
+        module: name of the design module (str)
+        design_inputs: design dictionary, input dock and design preference values (dict)
+        database: path of the section and material database
+
+    Returns: hexadecimal SHA-256 digest (str)
+    """
+    document = {'module': module, 'inputs': _canonical(design_inputs), 'version': __version__,
+                'database': database_version(database)}
+    return hashlib.sha256(json.dumps(document, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class RecordCollector(logging.Handler):
+    """Keep the log records emitted during a design (or a stage of a design)"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        # the record is shared with the other handlers: a copy is kept, with the message formatted
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+@contextlib.contextmanager
+def collect_records(logger_name='Osdag'):
+    """Collect the log records of a logger (and of its children) emitted within the context
+
+    Yields: the list the records are appended to
+    """
+    collector = RecordCollector()
+    logger = logging.getLogger(logger_name)
+    logger.addHandler(collector)
+    try:
+        yield collector.records
+    finally:
+        logger.removeHandler(collector)
+
+
+def replay_records(records):
+    """Emit again log records kept by collect_records, through the handlers of their loggers"""
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+
+
+@lru_cache(maxsize=None)
+def class_attributes(cls):
+    """Return the names assigned in the body of a class (its defaults, tables and caches, which are not results of a
+    design), found from its source
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+    except (OSError, TypeError, SyntaxError):
+        return frozenset()
+    names = set()
+    for statement in tree.body[0].body:
+        targets = statement.targets if isinstance(statement, ast.Assign) else \
+            [statement.target] if isinstance(statement, (ast.AnnAssign, ast.AugAssign)) else []
+        names.update(target.id for target in targets if isinstance(target, ast.Name))
+    return frozenset(names)
+
+
+def design_state(main):
+    """Collect the attributes set by the design of a design object (or of a design class used without an instance),
+    which can be pickled: the attributes of the object, or those of the class which are not assigned in its body
+
+    Returns: dictionary of attribute name to pickled value
+    """
+    attributes = vars(main)
+    excluded = class_attributes(main) if isinstance(main, type) else frozenset()
+    state = {}
+    for name, value in list(attributes.items()):
+        if name.startswith('__') or name in excluded or callable(value) or \
+                isinstance(value, (staticmethod, classmethod, property)):
+            continue
+        try:
+            state[name] = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            continue
+    return state
+
+
+def restore_design_state(main, state):
+    """Set the attributes of a design object (or design class) from a state returned by design_state"""
+    for name, value in state.items():
+        setattr(main, name, pickle.loads(value))
+
+
+class DesignCache(object):
+    """Least recently used cache of designs, held in memory and optionally on disk"""
+
+    def __init__(self, maxsize=32, directory=None, key_file=KEY_FILE):
+        """
+        Args:
+            maxsize: largest number of entries held in memory
+            directory: folder of the entries written to disk (created with the first entry), None to keep them in
+                       memory only
+            key_file: file of the secret key of the signatures of the files on disk (created when first needed)
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.key_file = key_file
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._secret = None
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _signing_key(self):
+        """Return the secret key of the signatures, created (readable by the user only) the first time"""
+        if self._secret is None:
+            try:
+                with open(self.key_file, 'rb') as key_file:
+                    self._secret = key_file.read()
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(self.key_file), exist_ok=True)
+                secret = os.urandom(32)
+                try:
+                    descriptor = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                except FileExistsError:
+                    # created by another session in the meantime
+                    with open(self.key_file, 'rb') as key_file:
+                        secret = key_file.read()
+                else:
+                    with os.fdopen(descriptor, 'wb') as key_file:
+                        key_file.write(secret)
+                self._secret = secret
+        return self._secret
+
+    def _signature(self, key, data):
+        # the cache key is signed with the data, so that a file copied to the name of another key is not accepted
+        return hmac.new(self._signing_key(), key.encode('ascii') + data, hashlib.sha256).digest()
+
+    def get(self, key):
+        """Return the entry of a key, or None"""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.directory is not None and os.path.isfile(self._path(key)):
+            try:
+                with open(self._path(key), 'rb') as cache_file:
+                    signature, data = cache_file.read(hashlib.sha256().digest_size), cache_file.read()
+                if not hmac.compare_digest(signature, self._signature(key, data)):
+                    return None
+                entry = pickle.loads(data)
+            except Exception:
+                return None
+            self._store(key, entry)
+            return entry
+        return None
+
+    def put(self, key, entry):
+        """Add an entry to the cache, and write it to the cache directory when one is set"""
+        self._store(key, entry)
+        if self.directory is not None:
+            try:
+                data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self._path(key), 'wb') as cache_file:
+                    cache_file.write(self._signature(key, data))
+                    cache_file.write(data)
+            except Exception:
+                pass
+
+    def _store(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        if self.directory is not None and os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def design(self, main, design_inputs, run):
+        """Run a design through the cache
+
+        Args:
+            main: design object, or design class used without an instance
+            design_inputs: design dictionary (dict), updated in place as the design would update it
+            run: function running the design from the design dictionary, e.g. main.calculate
+
+        Returns: True when the design was restored from the cache, False when it was calculated
+
+        Note: attributes of the design object which cannot be pickled (widgets, open files) are not cached, and keep the
+              value they have when the design is restored
+        """
+        key = design_key(module_name(main, design_inputs), design_inputs)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            restore_design_state(main, entry['state'])
+            design_inputs.clear()
+            design_inputs.update(copy.deepcopy(entry['design_inputs']))
+            replay_records(entry['records'])
+            return True
+
+        self.misses += 1
+        with collect_records() as records:
+            run(design_inputs)
+        self.put(key, {'state': design_state(main), 'design_inputs': copy.deepcopy(design_inputs),
+                       'records': records})
+        return False
+
+
+design_cache = DesignCache(directory=os.environ.get('OSDAG_DESIGN_CACHE'))
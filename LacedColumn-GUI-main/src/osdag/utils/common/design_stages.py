@@ -0,0 +1,84 @@
+"""Memoised stages of a member design.
+
+A design is split into stages (e.g. section classification, capacity of the candidate sections, utilisation and ranking),
+each declaring the attributes of the design object it reads (its inputs) and the attributes it sets (its outputs). When a
+stage is run again with the same input values, its outputs are restored from the previous run instead of being
+calculated again, so that a change of the load only re-evaluates the stages which depend on the load.
+
+The memo is kept on the design object, in the attribute stage_memo, and holds the last run of every stage, with the log
+records the stage emitted, which are emitted again when its outputs are restored. A design which runs a stage more than
+once calls new_design when it starts, so that the records of a stage are emitted once per design.
+"""
+import copy
+
+from .design_cache import collect_records, replay_records
+
+
+class DesignStage(object):
+    """Description of a stage: its name, the attributes it reads and the attributes it sets"""
+
+    def __init__(self, name, inputs, outputs):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+
+    def input_values(self, design):
+        return [copy.deepcopy(getattr(design, name, None)) for name in self.inputs]
+
+
+def run_stage(design, stage, function):
+    """Run a stage of a design, or restore its outputs when its inputs have not changed since its last run
+
+    Args:
+        design: design object (or design class used without an instance)
+        stage: DesignStage
+        function: function running the stage, without arguments
+
+    Returns: the value returned by the function (from the memo when the stage is not run)
+
+    Note: the messages the stage logged (to the Osdag logger) are logged again when its outputs are restored, unless
+          they were already logged in the same design (see new_design)
+    """
+    memo = getattr(design, 'stage_memo', None)
+    if memo is None:
+        memo = {}
+        setattr(design, 'stage_memo', memo)
+    emitted = getattr(design, 'stage_emitted', None)
+
+    inputs = stage.input_values(design)
+    entry = memo.get(stage.name)
+    if entry is not None and entry['inputs'] == inputs:
+        for name, value in entry['outputs'].items():
+            setattr(design, name, copy.copy(value))
+        if emitted is None or stage.name not in emitted:
+            replay_records(entry['records'])
+        if emitted is not None:
+            emitted.add(stage.name)
+        return entry['result']
+
+    with collect_records() as records:
+        result = function()
+    if emitted is not None:
+        emitted.add(stage.name)
+    memo[stage.name] = {'inputs': inputs, 'result': result, 'records': records,
+                        'outputs': {name: copy.copy(getattr(design, name)) for name in stage.outputs
+                                    if hasattr(design, name)}}
+    return result
+
+
+def new_design(design):
+    """Start a new design: the log records of each stage are emitted the first time the stage is run or restored in the
+    design, and not again when it is restored later in the same design
+    """
+    setattr(design, 'stage_emitted', set())
+
+
+def clear_stages(design, *names):
+    """Forget the last run of the given stages (of all the stages when no name is given)"""
+    memo = getattr(design, 'stage_memo', None)
+    if memo is None:
+        return
+    if not names:
+        memo.clear()
+    for name in names:
+        memo.pop(name, None)
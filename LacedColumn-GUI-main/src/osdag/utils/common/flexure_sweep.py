@@ -0,0 +1,222 @@
+"""Shear and bending strength of I-sections, evaluated for a list of sections at once.
+
+The functions below accept arrays of section properties (one entry per section), so that the elastic lateral torsional
+buckling moment, the non-dimensional slenderness, the bending stress reduction factor, the design bending strength and
+the design shear strength of all the sections of a flexure design are computed in a single pass. The flexure modules
+(simply supported, cantilever and other supports) build the arrays from the sections they connect to, and pick the
+optimum section from the result table returned by beam_strength_table, or by beam_strength_envelope for a list of load
+cases.
+
+Reference: IS 800:2007, cl 8.2.1 (laterally supported beams), cl 8.2.2 and Annex E (laterally unsupported beams) and
+           cl 8.4 (shear)
+"""
+import math
+import numpy as np
+
+from ...Common import KEY_DISP_SUPPORT2
+
+
+def section_columns(sections, attributes):
+    """Collect the attributes of section objects as arrays
+
+    Args:
+        sections: list of section objects (ISection, Beam, Column)
+        attributes: list of attribute names
+
+    Returns: dictionary of arrays, one entry per attribute
+    """
+    return {attribute: np.array([getattr(section, attribute) for section in sections], dtype=float)
+            for attribute in attributes}
+
+
+def design_shear_strength(A_v, f_y, gamma_m0):
+    """Calculate the design shear strength in yielding [Reference: Cl 8.4, IS 800:2007]
+
+    Args:
+        A_v: shear area in mm^2 (float or array)
+        f_y: yield stress in MPa (float or array)
+        gamma_m0: partial safety factor for failure by yielding (float)
+
+    Returns: design shear strength in N (array)
+    """
+    return np.asarray(A_v, dtype=float) * f_y / (math.sqrt(3) * gamma_m0)
+
+
+def design_bending_strength(Z_p, Z_e, f_y, gamma_m0, support):
+    """Calculate the design bending strength of laterally supported beams [Reference: Cl 8.2.1.2, IS 800:2007]
+
+    Args:
+        Z_p, Z_e: plastic and elastic section modulus in mm^3 (float or array)
+        f_y: yield stress in MPa (float or array)
+        gamma_m0: partial safety factor for failure by yielding (float)
+        support: KEY_DISP_SUPPORT1 (simply supported) or KEY_DISP_SUPPORT2 (cantilever)
+
+    Returns: design bending strength in N-mm (array), limited to 1.2 Z_e f_y / gamma_m0 (1.5 for cantilevers)
+
+    Note: beta_b is taken as 1.0, as in IS800_2007.cl_8_2_1_2_design_bending_strength
+    """
+    limit = 1.5 if support == KEY_DISP_SUPPORT2 else 1.2
+    M_d = np.asarray(Z_p, dtype=float) * f_y / gamma_m0
+    return np.minimum(M_d, limit * np.asarray(Z_e, dtype=float) * f_y / gamma_m0)
+
+
+def elastic_lateral_torsional_buckling_moment(E, mu, I_y, I_t, I_w, L_LT, beta_b, Z_p, h_f, r_y, t_f):
+    """Calculate the elastic lateral torsional buckling moment and the extreme fibre bending compressive stress
+    [Reference: Cl 8.2.2.1 and Annex E, IS 800:2007]
+
+    Args:
+        E: modulus of elasticity in MPa (float)
+        mu: Poisson's ratio (float)
+        I_y: moment of inertia about the minor axis in mm^4 (float or array)
+        I_t, I_w: torsion and warping constants in mm^4 and mm^6 (float or array)
+        L_LT: effective length for lateral torsional buckling in mm (float or array)
+        beta_b: 1.0 for plastic and compact sections, Z_e / Z_p for semi-compact sections (float or array)
+        Z_p: plastic section modulus in mm^3 (float or array)
+        h_f: centre to centre distance between the flanges in mm (float or array)
+        r_y: radius of gyration about the minor axis in mm (float or array)
+        t_f: flange thickness in mm (float or array)
+
+    Returns: M_cr in N-mm and f_crb in MPa (arrays), M_cr being the least of the three estimates of
+             IS800_2007.cl_8_2_2_Unsupported_beam_bending_non_slenderness
+    """
+    G = E / (2 + 2 * mu)
+    slenderness = L_LT / r_y
+    factor = np.sqrt(1 + ((slenderness / (h_f / t_f)) ** 2) / 20)
+    f_crb = (1.1 * math.pi ** 2 * E / slenderness ** 2) * factor
+    M_cr = np.minimum.reduce([np.sqrt((math.pi ** 2 * E * I_y / L_LT ** 2) * (G * I_t + (math.pi ** 2 * E * I_w / L_LT ** 2))),
+                              beta_b * Z_p * f_crb,
+                              (math.pi ** 2 * E * I_y * h_f / L_LT ** 2) / 2 * factor])
+    return M_cr, f_crb
+
+
+def non_dimensional_slenderness_lt(beta_b, Z_p, Z_e, f_y, M_cr):
+    """Calculate the non-dimensional slenderness ratio for lateral torsional buckling [Reference: Cl 8.2.2, IS 800:2007]
+
+    Args:
+        beta_b: 1.0 for plastic and compact sections, Z_e / Z_p for semi-compact sections (float or array)
+        Z_p, Z_e: plastic and elastic section modulus in mm^3 (float or array)
+        f_y: yield stress in MPa (float or array)
+        M_cr: elastic lateral torsional buckling moment in N-mm (float or array)
+
+    Returns: lambda_LT (array), limited to sqrt(1.2 Z_e f_y / M_cr)
+    """
+    return np.minimum(np.sqrt(beta_b * Z_p * f_y / M_cr), np.sqrt(1.2 * Z_e * f_y / M_cr))
+
+
+def lateral_torsional_buckling_stress(lambda_lt, alpha_lt, f_y, gamma_m0):
+    """Calculate the design bending compressive stress of laterally unsupported beams [Reference: Cl 8.2.2, IS 800:2007]
+
+    Args:
+        lambda_lt: non-dimensional slenderness ratio (float or array)
+        alpha_lt: imperfection factor, 0.21 for rolled and 0.49 for welded sections (float or array)
+        f_y: yield stress in MPa (float or array)
+        gamma_m0: partial safety factor for failure by yielding (float)
+
+    Returns: phi_LT, chi_LT (limited to 1.0) and f_bd in MPa (arrays)
+    """
+    phi_lt = 0.5 * (1 + alpha_lt * (lambda_lt - 0.2) + lambda_lt ** 2)
+    X_lt = np.minimum(1 / (phi_lt + np.sqrt(phi_lt ** 2 - lambda_lt ** 2)), 1.0)
+    return phi_lt, X_lt, X_lt * f_y / gamma_m0
+
+
+def high_shear_reduction(M_d, Z_p, depth, web_thickness, f_y, gamma_m0, V, V_d):
+    """Calculate the design bending strength reduced for high shear [Reference: Cl 9.2.2, IS 800:2007]
+
+    Args:
+        M_d: design bending strength in N-mm (float or array)
+        Z_p: plastic section modulus in mm^3 (float or array)
+        depth, web_thickness: depth of the section and thickness of the web in mm (float or array)
+        f_y: yield stress in MPa (float or array)
+        gamma_m0: partial safety factor for failure by yielding (float)
+        V: factored shear force in N (float)
+        V_d: design shear strength in N (float or array)
+
+    Returns: M_dv in N-mm (limited to 1.2 Z_p f_y / gamma_m0), M_fd in N-mm and beta (arrays)
+    """
+    M_fd = (Z_p - depth ** 2 * web_thickness / 4) * f_y / gamma_m0
+    beta = ((2 * V / V_d) - 1) ** 2
+    M_dv = np.minimum(M_d - beta * (M_d - M_fd), 1.2 * Z_p * f_y / gamma_m0)
+    return M_dv, M_fd, beta
+
+
+def beam_strength_table(Z_p, Z_e, depth, web_thickness, f_y, shear_area, plastic, moment, shear, support, gamma_m0,
+                        lambda_lt=None, alpha_lt=None):
+    """Calculate the shear strength, bending strength and utilisation of a list of sections
+
+    Args:
+        Z_p, Z_e: plastic and elastic section modulus in mm^3 (array)
+        depth, web_thickness: depth of the section and thickness of the web in mm (array)
+        f_y: yield stress in MPa (array)
+        shear_area: shear area in mm^2 (array)
+        plastic: True for plastic and compact sections, False for semi-compact sections (array of bool)
+        moment: factored bending moment in N-mm (float)
+        shear: factored shear force in N (float)
+        support: KEY_DISP_SUPPORT1 (simply supported) or KEY_DISP_SUPPORT2 (cantilever)
+        gamma_m0: partial safety factor for failure by yielding (float)
+        lambda_lt: non-dimensional slenderness ratio for lateral torsional buckling, None for laterally supported beams
+                   (array)
+        alpha_lt: imperfection factor for lateral torsional buckling (array)
+
+    Returns: dictionary of arrays - V_d (kN), high_shear, M_d (N-mm), beta_b, M_b (N-mm, design bending strength after the
+             high shear reduction), bending_strength (kN-m), reduced (True where the high shear reduction of plastic and
+             compact sections is applied), M_fd (N-mm), beta_reduced, ur, and for laterally unsupported beams phi_lt, X_lt
+             and f_bd (MPa)
+    """
+    plastic = np.asarray(plastic, dtype=bool)
+    table = {}
+    V_d = design_shear_strength(shear_area, f_y, gamma_m0)
+    table['V_d'] = V_d / 10 ** 3
+    table['high_shear'] = shear / 1000 > 0.6 * table['V_d']
+    table['M_d'] = design_bending_strength(Z_p, Z_e, f_y, gamma_m0, support)
+    table['beta_b'] = np.where(plastic, 1.0, Z_e / Z_p)
+
+    if lambda_lt is None:
+        M_b = table['M_d']
+        M_b_high_shear = Z_e * f_y / gamma_m0
+    else:
+        table['phi_lt'], table['X_lt'], table['f_bd'] = lateral_torsional_buckling_stress(lambda_lt, alpha_lt, f_y, gamma_m0)
+        M_b = np.where(plastic, Z_p, Z_e) * table['f_bd']
+        M_b_high_shear = table['beta_b'] * Z_p * table['f_bd']
+
+    M_dv, table['M_fd'], table['beta_reduced'] = high_shear_reduction(M_b, Z_p, depth, web_thickness, f_y, gamma_m0,
+                                                                      shear, V_d)
+    table['reduced'] = table['high_shear'] & plastic
+    table['M_b'] = np.where(table['reduced'], M_dv, np.where(table['high_shear'], M_b_high_shear, M_b))
+    table['bending_strength'] = table['M_b'] / 10 ** 6
+    table['ur'] = np.maximum(moment / table['bending_strength'] * 10 ** -6, shear / table['V_d'] * 10 ** -3)
+
+    return table
+
+
+def beam_strength_envelope(Z_p, Z_e, depth, web_thickness, f_y, shear_area, plastic, moments, shears, support,
+                           gamma_m0, lambda_lt=None, alpha_lt=None):
+    """Calculate the strength and utilisation of a list of sections under a list of load cases, and keep the governing
+    case of each section
+
+    The sections are checked under all the cases at once, the forces of the cases broadcast as a column against the
+    arrays of the sections (the strengths which do not depend on the forces are computed once).
+
+    Args:
+        moments, shears: factored bending moments in N-mm and shear forces in N of the cases (array)
+        other arguments: as for beam_strength_table
+
+    Returns: the dictionary of beam_strength_table, with the values of the governing case of each section, and
+             case (index of the governing case), ur_moment and ur_shear (utilisation ratios of the moment and shear
+             checks in that case), moment_case and shear_case (index of the case governing each check)
+    """
+    moments = np.asarray(moments, dtype=float)[:, np.newaxis]
+    shears = np.asarray(shears, dtype=float)[:, np.newaxis]
+    table = beam_strength_table(Z_p, Z_e, depth, web_thickness, f_y, shear_area, plastic, moments, shears, support,
+                                gamma_m0, lambda_lt, alpha_lt)
+    sections = np.arange(len(np.atleast_1d(Z_p)))
+    ur_moment = np.broadcast_to(moments / table['bending_strength'] * 10 ** -6, table['ur'].shape)
+    ur_shear = np.broadcast_to(shears / table['V_d'] * 10 ** -3, table['ur'].shape)
+
+    case = np.argmax(table['ur'], axis=0)
+    envelope = {name: (values[case, sections] if np.ndim(values) == 2 else values) for name, values in table.items()}
+    envelope['case'] = case
+    envelope['ur_moment'] = ur_moment[case, sections]
+    envelope['ur_shear'] = ur_shear[case, sections]
+    envelope['moment_case'] = np.argmax(ur_moment, axis=0)
+    envelope['shear_case'] = np.argmax(ur_shear, axis=0)
+    return envelope
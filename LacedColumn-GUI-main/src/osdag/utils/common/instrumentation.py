@@ -0,0 +1,248 @@
+"""Timers and counters for the hot paths of the design modules.
+
+The stages of a design (section classification, loading of sections from the database, capacity of the candidate
+sections, detailing, 3D model and report) are wrapped in named timers, and repeated operations are counted:
+
+    with timer('laced_column.classification', sections=len(self.sec_list)):
+        ...
+    count('flexure.sections_checked')
+
+Instrumentation is disabled by default, and a disabled timer or counter costs one attribute lookup. It is enabled by
+setting the environment variable OSDAG_INSTRUMENTATION=1 (0, no, false and off leave it disabled), or by calling
+enable(). Every timer then emits a structured record (name, duration, nesting depth and the fields given to the timer)
+on the logger 'Osdag.timing'. The detailed values the design modules used to print while designing are logged on
+'Osdag.trace' at the DEBUG level. Both loggers write to stderr when instrumentation is enabled; otherwise only the
+warnings and errors of 'Osdag.trace' are written. Neither reaches the log dock of the GUI.
+
+Each design run inside design_timing() collects its records into a DesignTimings breakdown; set OSDAG_TIMING_DUMP to a
+folder to write the breakdown of every design to a JSON file.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+timing_logger = logging.getLogger('Osdag.timing')
+trace = logging.getLogger('Osdag.trace')
+timing_logger.propagate = False
+timing_logger.addHandler(logging.NullHandler())
+trace.propagate = False
+_warning_handler = logging.StreamHandler()
+_warning_handler.setLevel(logging.WARNING)
+trace.addHandler(_warning_handler)
+for _logger in (timing_logger, trace):
+    _logger.setLevel(logging.WARNING)
+
+
+class StructuredFormatter(logging.Formatter):
+    """Format timing records as one JSON document per line, and other records as plain text"""
+
+    def format(self, record):
+        data = getattr(record, 'timing', None)
+        if data is None:
+            return super().format(record)
+        return json.dumps(dict(data, logger=record.name, time=record.created), default=str)
+
+
+class _Settings(object):
+    enabled = False
+    dump_directory = None
+    handler = None
+
+
+settings = _Settings()
+_state = threading.local()
+
+
+def enable(flag=True, stream=None, dump_directory=None):
+    """Enable (or disable) the timers and counters
+
+    Args:
+        flag: True to enable, False to disable
+        stream: stream the records are written to (default: stderr)
+        dump_directory: folder to write the timing breakdown of every design to (None to not write them)
+    """
+    settings.enabled = flag
+    settings.dump_directory = dump_directory
+    if settings.handler is not None:
+        for _logger in (timing_logger, trace):
+            _logger.removeHandler(settings.handler)
+        settings.handler = None
+    if flag:
+        trace.removeHandler(_warning_handler)
+        settings.handler = logging.StreamHandler(stream)
+        settings.handler.setFormatter(StructuredFormatter(fmt='%(asctime)s - %(name)s - %(message)s',
+                                                          datefmt='%Y-%m-%d %H:%M:%S'))
+        for _logger in (timing_logger, trace):
+            _logger.addHandler(settings.handler)
+            _logger.setLevel(logging.DEBUG)
+    else:
+        trace.addHandler(_warning_handler)
+        for _logger in (timing_logger, trace):
+            _logger.setLevel(logging.WARNING)
+
+
+def enabled():
+    return settings.enabled
+
+
+def _stack():
+    stack = getattr(_state, 'stack', None)
+    if stack is None:
+        stack = _state.stack = []
+    return stack
+
+
+def _collectors():
+    collectors = getattr(_state, 'collectors', None)
+    if collectors is None:
+        collectors = _state.collectors = []
+    return collectors
+
+
+def _emit(record):
+    for collector in _collectors():
+        collector.add(record)
+    timing_logger.debug('%s %s', record['type'], record['name'], extra={'timing': record})
+
+
+class _NullTimer(object):
+    """Timer used while instrumentation is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer(object):
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        stack = _stack()
+        self.depth = len(stack)
+        stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        _stack().pop()
+        record = dict(self.fields, type='timer', name=self.name, seconds=seconds, depth=self.depth)
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        _emit(record)
+        return False
+
+
+def timer(name, **fields):
+    """Time a block of code
+
+    Args:
+        name: name of the timer, '<module>.<stage>' (str)
+        fields: values added to the record, e.g. the number of sections (JSON compatible)
+
+    Returns: context manager
+    """
+    if not settings.enabled:
+        return _NULL_TIMER
+    return _Timer(name, fields)
+
+
+def timed(name):
+    """Decorator timing every call of a function (or method) with a timer of the given name"""
+    def decorator(function):
+        def wrapper(*args, **kwargs):
+            if not settings.enabled:
+                return function(*args, **kwargs)
+            with _Timer(name, {}):
+                return function(*args, **kwargs)
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        wrapper.__wrapped__ = function
+        return wrapper
+    return decorator
+
+
+def count(name, value=1):
+    """Add a value to a named counter of the current design (no record is logged for counters)"""
+    if not settings.enabled:
+        return
+    for collector in _collectors():
+        collector.counters[name] = collector.counters.get(name, 0) + value
+
+
+class DesignTimings(object):
+    """Timing breakdown of one design: the timer records and the counters"""
+
+    def __init__(self, module):
+        self.module = module
+        self.records = []
+        self.counters = {}
+        self.seconds = 0.0
+
+    def add(self, record):
+        self.records.append(record)
+
+    def totals(self):
+        """Return the total time of each timer and the number of times it ran, in the order the timers first ran"""
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record['name'], {'seconds': 0.0, 'calls': 0})
+            total['seconds'] += record['seconds']
+            total['calls'] += 1
+        return totals
+
+    def as_dict(self):
+        return {'module': self.module, 'seconds': self.seconds, 'totals': self.totals(), 'counters': self.counters,
+                'records': self.records}
+
+    def dump(self, file_name):
+        with open(file_name, 'w') as dump_file:
+            json.dump(self.as_dict(), dump_file, indent=2, default=str)
+
+
+class design_timing(object):
+    """Collect the timers and counters of one design into a DesignTimings breakdown
+
+    The breakdown is logged as a 'design' record and, when a dump folder is set, written to
+    <dump folder>/<module>_<time>.json.
+    """
+
+    def __init__(self, module):
+        self.timings = DesignTimings(module)
+
+    def __enter__(self):
+        if settings.enabled:
+            _collectors().append(self.timings)
+            self.start = time.perf_counter()
+        return self.timings
+
+    def __exit__(self, *exc):
+        if not settings.enabled or self.timings not in _collectors():
+            return False
+        _collectors().remove(self.timings)
+        self.timings.seconds = time.perf_counter() - self.start
+        timing_logger.debug('design %s', self.timings.module,
+                            extra={'timing': {'type': 'design', 'name': self.timings.module,
+                                              'seconds': self.timings.seconds, 'totals': self.timings.totals(),
+                                              'counters': self.timings.counters}})
+        if settings.dump_directory:
+            os.makedirs(settings.dump_directory, exist_ok=True)
+            file_name = '{}_{}_{:06d}.json'.format(''.join(c if c.isalnum() else '_' for c in str(self.timings.module)),
+                                                   time.strftime('%Y%m%d_%H%M%S'), int(time.time() % 1 * 1e6))
+            self.timings.dump(os.path.join(settings.dump_directory, file_name))
+        return False
+
+
+if os.environ.get('OSDAG_INSTRUMENTATION', '').strip().lower() not in ('', '0', 'no', 'false', 'off') or \
+        os.environ.get('OSDAG_TIMING_DUMP'):
+    enable(dump_directory=os.environ.get('OSDAG_TIMING_DUMP'))
@@ -5,7 +5,8 @@ Started on 01 - Nov - 2018
 @author: ajmalbabums
 """
 import math
-from ...Common import *
+from .section_classification import outstand_flange_class, web_class, web_axial_class, angle_class, tube_class, \
+    class_name
 import pandas as pd
 
 # Define constants locally to avoid circular import
@@ -191,36 +192,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / f_y)
-        
-        ratio = width / thickness
-
-        if section_type == 'Rolled':
-            if ratio <= (9.4 * epsilon):
-                section_class = 'Plastic'
-            elif ratio <= (10.5 * epsilon):
-                section_class = 'Compact'
-            elif ratio <= (15.7 * epsilon):
-                section_class = 'Semi-Compact'
-            else:
-                section_class = 'Slender'
-        else:
-            if ratio <= (8.4 * epsilon):
-                section_class = 'Plastic'
-            elif ratio <= (9.4 * epsilon):
-                section_class = 'Compact'
-            elif ratio <= (13.6 * epsilon):
-                section_class = 'Semi-Compact'
-            else:
-                section_class = 'Slender'
-        print(f" flange_class"
-                    f" width {width}"
-                    f" thickness {thickness}"
-                    f" epsilon {epsilon}"
-                    )
-        print(f" section_type {section_type}"
-              f" section_class {section_class}")
-        return [section_class, ratio]
+        section_class, ratio = outstand_flange_class(width, thickness, f_y, section_type)
+        return [class_name(section_class), float(ratio)]
 
     @staticmethod
     def Table2_iii(depth, thickness, f_y, classification_type='Neutral axis at mid-depth'):
@@ -239,37 +212,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / f_y)
-
-        ratio = depth / thickness
-
-        print(f" web_class \n" 
-              f" depth {depth} \n"
-              f" thickness {thickness} \n"
-              f" epsilon {epsilon} \n"
-               f" classification_type {classification_type}\n"
-              )
-
-        if classification_type == 'Neutral axis at mid-depth':
-            if ratio < (84 * epsilon):
-                section_class = KEY_Plastic
-            elif ratio < (105 * epsilon):
-                section_class = KEY_Compact
-            elif ratio < (126 * epsilon):
-                section_class = KEY_SemiCompact
-            else:
-                section_class = 'Slender'
-
-        elif classification_type == 'Generally':
-            pass
-        elif classification_type == 'Axial compression':
-            if ratio > (42 * epsilon):
-                section_class = 'Slender'
-            else:
-                section_class = 'Semi-Compact'
-        print(f" section_class {section_class}")
-
-        return section_class
+        section_class, ratio = web_class(depth, thickness, f_y, classification_type)
+        return class_name(section_class)
 
     @staticmethod
     def Table2_iv(depth, thickness_web, f_y):
@@ -295,15 +239,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / int(f_y))
-        d_t = depth / thickness_web
-
-        if d_t <= (42 * epsilon) :
-            section_class = KEY_SemiCompact
-        else:
-            section_class = 'Slender'
-
-        return [section_class, d_t]
+        section_class, d_t = web_axial_class(depth, thickness_web, f_y)
+        return [class_name(section_class), float(d_t)]
 
     @staticmethod
     def Table2_vi(width, depth, thickness, f_y, force_type = "Axial Compression"):
@@ -329,29 +266,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / int(f_y))
-
-        b_t = width / thickness
-        d_t = depth / thickness
-        bd_t = (width + depth) / thickness
-
-
-        if force_type == 'Axial Compression':
-            if b_t <= (15.7 * epsilon) and d_t<= (15.7 * epsilon) and  bd_t<= (25 * epsilon):
-                section_class = KEY_SemiCompact
-            else:
-                section_class = 'Slender'
-        else:
-            if b_t <= (9.4 * epsilon) and d_t<= (9.4 * epsilon):
-                section_class = KEY_Plastic
-            elif b_t <= (10.5 * epsilon) and d_t<= (10.5 * epsilon):
-                section_class = KEY_Compact
-            elif b_t <= (15.7 * epsilon) and d_t<= (15.7 * epsilon):
-                section_class = KEY_SemiCompact
-            else:
-                section_class = 'Slender'
-
-        return [section_class, b_t,d_t, bd_t ]
+        section_class, b_t, d_t, bd_t = angle_class(width, depth, thickness, f_y, force_type, single_angle=True)
+        return [class_name(section_class), float(b_t), float(d_t), float(bd_t)]
 
     @staticmethod
     def Table2_vii(width, depth, thickness, f_y, force_type = "Axial Compression"):
@@ -377,30 +293,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / int(f_y))
-
-        b_t = width / thickness
-        d_t = depth / thickness
-        bd_t = (width + depth) / thickness
-
-        if force_type == 'Axial Compression':
-            if d_t<= (15.7 * epsilon) :
-                '''When adding more cases, you need to modify Strut angle'''
-                section_class = KEY_SemiCompact
-            else:
-                section_class = 'Slender'
-        else:
-            if b_t <= (9.4 * epsilon) and d_t<= (9.4 * epsilon):
-                section_class = KEY_Plastic
-            elif b_t <= (10.5 * epsilon) and d_t<= (10.5 * epsilon):
-                section_class = KEY_Compact
-            elif b_t <= (15.7 * epsilon) and d_t<= (15.7 * epsilon):
-                section_class = KEY_SemiCompact
-            else:
-                section_class = 'Slender'
-
-        return [section_class, b_t,d_t, bd_t ]
-
+        section_class, b_t, d_t, bd_t = angle_class(width, depth, thickness, f_y, force_type, single_angle=False)
+        return [class_name(section_class), float(b_t), float(d_t), float(bd_t)]
 
     @staticmethod
     def Table2_x(outer_diameter, tube_thickness, f_y, load_type='axial compression'):
@@ -419,29 +313,8 @@ class IS800_2007(object):
         Reference: Table 2 and Cl.3.7.2, IS 800:2007
 
         """
-        epsilon = math.sqrt(250 / f_y)
-
-        ratio = outer_diameter / tube_thickness
-
-        print(f"outer_diameter{outer_diameter},tube_thickness{tube_thickness}")
-
-        if load_type == 'axial compression':
-            if ratio > (88 * epsilon**2):
-                section_class = 'Slender'
-            else:
-                section_class = 'Semi-Compact'
-        else:
-            if ratio <= (42 * epsilon**2):
-                section_class = 'Plastic'
-            elif (ratio > (42 * epsilon**2)) and (ratio <= (52 * epsilon**2)):
-                section_class = 'Compact'
-            elif ratio <= (146 * epsilon**2):
-                section_class = 'Semi-Compact'
-            else:
-                section_class = 'Slender'
-
-        return section_class
-    
+        section_class, ratio = tube_class(outer_diameter, tube_thickness, f_y, load_type)
+        return class_name(section_class)
 
     # ==========================================================================
     """    SECTION  3     GENERAL DESIGN REQUIREMENTS   """
@@ -2218,4 +2091,9 @@ class IS800_2007(object):
     """    ANNEX  H       PLASTIC PROPERTIES OF BEAMS   """
     # ==========================================================================
     """     ------------------END------------------     """
-    
\ No newline at end of file
+    
+
+
+# imported after IS800_2007 is defined: Common imports component, which imports IS800_2007 from this module (the names of
+# Common are only used when the methods are called)
+from ...Common import *
@@ -0,0 +1,110 @@
+"""Tables of factored load cases (load combinations) of a design.
+
+A design dictionary holds the factored forces of the input dock (KEY_AXIAL, KEY_SHEAR, KEY_MOMENT, in kN and kNm), and
+may hold a table of load cases under KEY_LOAD_CASES: a list of mappings, one per case, with the name of the case under
+KEY_LOAD_CASE_NAME and its forces under the keys of the input dock, e.g. in an .osi file
+
+    Load.Cases:
+    - Name: 1.5 (DL + LL)
+      Load.Moment: '120'
+      Load.Shear: '80'
+    - Name: 1.2 (DL + LL + WL)
+      Load.Moment: '95'
+      Load.Shear: '110'
+
+LoadCases holds the forces of all the cases as arrays (N and N-mm), so that a module computes the section properties and
+capacities of a candidate section once and checks all the cases at once, broadcasting the case arrays (column()) against
+the section arrays; envelope() then keeps the governing case of every section. Without a table, the forces of the input
+dock are the only case.
+"""
+import numpy as np
+
+from ...Common import KEY_LOAD_CASES, KEY_LOAD_CASE_NAME, KEY_AXIAL, KEY_SHEAR, KEY_MOMENT
+from .load import Load
+
+
+def _force(value):
+    if value is None or str(value).strip() in ('', 'Disabled'):
+        return 0.0
+    return float(value)
+
+
+class LoadCases(object):
+    """Factored forces of the load cases of a design
+
+    Attributes:
+        names: names of the cases
+        axial, shear: axial and shear forces in N (arrays, one value per case)
+        moment: bending moments in N-mm (array)
+    """
+
+    def __init__(self, names, axial, shear, moment):
+        self.names = list(names)
+        self.axial = np.asarray(axial, dtype=float)
+        self.shear = np.asarray(shear, dtype=float)
+        self.moment = np.asarray(moment, dtype=float)
+        self._loads = {}
+
+    @classmethod
+    def from_design_dictionary(cls, design_dictionary, axial_key=KEY_AXIAL, shear_key=KEY_SHEAR,
+                               moment_key=KEY_MOMENT):
+        """Read the load cases of a design dictionary (forces in kN and kNm)
+
+        Args:
+            design_dictionary: design dictionary, with or without a table under KEY_LOAD_CASES
+            axial_key, shear_key, moment_key: keys of the forces of the module (None for a force the module does not
+                                              take)
+
+        Returns: LoadCases, with a single case holding the forces of the input dock when there is no table
+        """
+        cases = design_dictionary.get(KEY_LOAD_CASES) or [design_dictionary]
+        names, axial, shear, moment = [], [], [], []
+        for number, case in enumerate(cases, start=1):
+            if not isinstance(case, dict):
+                raise ValueError('load case {} should be a mapping of the forces of the case'.format(number))
+            names.append(str(case.get(KEY_LOAD_CASE_NAME) or 'Load case {}'.format(number)))
+            axial.append(1e3 * _force(case.get(axial_key)) if axial_key else 0.0)
+            shear.append(1e3 * _force(case.get(shear_key)) if shear_key else 0.0)
+            moment.append(1e6 * _force(case.get(moment_key)) if moment_key else 0.0)
+        return cls(names, axial, shear, moment)
+
+    def __len__(self):
+        return len(self.names)
+
+    def load(self, case):
+        """Return the forces of a case as a Load"""
+        case = int(case)
+        if case not in self._loads:
+            self._loads[case] = Load(axial_force=self.axial[case], shear_force=self.shear[case],
+                                     moment=self.moment[case])
+        return self._loads[case]
+
+    def envelope_load(self):
+        """Return a Load of the largest magnitude of each force over the cases (the forces of the case, for a single
+        case), for the checks which only increase with each force
+        """
+        if len(self) == 1:
+            return self.load(0)
+        return Load(axial_force=np.abs(self.axial).max(), shear_force=np.abs(self.shear).max(),
+                    moment=np.abs(self.moment).max())
+
+    def governing_cases(self):
+        """Return the name of the case with the largest magnitude of each force"""
+        return {force: self.names[int(np.argmax(np.abs(values)))]
+                for force, values in (('axial', self.axial), ('shear', self.shear), ('moment', self.moment))}
+
+    @staticmethod
+    def column(values):
+        """Return an array of the cases as a column, to broadcast against an array of sections"""
+        return np.asarray(values, dtype=float)[:, np.newaxis]
+
+    @staticmethod
+    def envelope(ur):
+        """Return the utilisation ratio of the governing case of each section and the index of that case
+
+        Args:
+            ur: utilisation ratios, one row per case and one column per section (array)
+        """
+        ur = np.atleast_2d(ur)
+        governing = np.argmax(ur, axis=0)
+        return ur[governing, np.arange(ur.shape[1])], governing
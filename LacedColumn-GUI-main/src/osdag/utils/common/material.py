@@ -1,7 +1,5 @@
 import sqlite3
-from ...Common import *
 import logging
-from .is800_2007 import IS800_2007
 
 
 class Material(object):
@@ -163,3 +161,8 @@ def get_material_properties(material_grade, thickness=41):
         'unit_mass': material.unit_mass
     }
 
+
+# imported after Material is defined: Common imports component, which imports Material from this module (the names are
+# only used when the methods are called)
+from ...Common import *
+from .is800_2007 import IS800_2007
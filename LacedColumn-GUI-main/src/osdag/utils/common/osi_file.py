@@ -0,0 +1,219 @@
+"""Reading and writing of Osdag input files (.osi).
+
+An .osi file is a YAML mapping of the design dictionary: input dock values and design preferences, keyed by the KEY_*
+names of Common.py. The files are parsed with the libyaml loader and dumper (CSafeLoader/CSafeDumper) when PyYAML is
+built with libyaml, and with the pure Python safe loader and dumper otherwise.
+
+Every file is checked once, on load, against the schema of its module: the type of each known value (text, list of
+texts such as section or bolt diameter lists, load values, tables of load cases) is checked, values written by hand
+without quotes are converted to text, and a single text given for a list is converted to a list of one item. Keys which
+are not in the schema (design preferences of a module, output title status...) are kept as they are. load_osi_files()
+reads many files concurrently, for batch runs over folders of design examples.
+"""
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from ...Common import *
+
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+TEXT = 'text'                   # str
+TEXTS = 'list of texts'         # list of str
+LOAD = 'load'                   # str holding a number, empty when not given
+INTEGERS = 'list of integers'   # list of int
+LOAD_CASES = 'list of load cases'   # list of mappings of load values, with a name
+
+# type of the values common to all the modules
+OSI_FIELDS = {
+    KEY_MODULE: TEXT,
+    KEY_MATERIAL: TEXT,
+    KEY_SECSIZE: TEXT,
+    KEY_SEC_PROFILE: TEXT,
+    KEY_SUPTNGSEC: TEXT,
+    KEY_SUPTDSEC: TEXT,
+    KEY_D: TEXTS,
+    KEY_GRD: TEXTS,
+    KEY_DIA_ANCHOR_ICF: TEXTS,
+    KEY_GRD_ANCHOR_ICF: TEXTS,
+    KEY_DIA_ANCHOR_OCF: TEXTS,
+    KEY_GRD_ANCHOR_OCF: TEXTS,
+    KEY_PLATETHK: TEXTS,
+    KEY_FLANGEPLATE_THICKNESS: TEXTS,
+    KEY_WEBPLATE_THICKNESS: TEXTS,
+    KEY_ANGLE_LIST: TEXTS,
+    KEY_TOPANGLE: TEXTS,
+    KEY_SHEAR: LOAD,
+    KEY_SHEAR_MAJOR: LOAD,
+    KEY_SHEAR_MINOR: LOAD,
+    KEY_AXIAL: LOAD,
+    KEY_AXIAL_BP: LOAD,
+    KEY_AXIAL_TENSION_BP: LOAD,
+    KEY_MOMENT: LOAD,
+    KEY_MOMENT_MAJOR: LOAD,
+    KEY_MOMENT_MINOR: LOAD,
+    KEY_LENGTH: LOAD,
+    KEY_LOAD_CASES: LOAD_CASES,
+    'out_titles_status': INTEGERS,
+}
+
+# values whose type differs in some modules: the member designation is a list of sections in the modules optimising the
+# section
+OSI_MODULE_FIELDS = {module: {KEY_SECSIZE: TEXTS} for module in [
+    KEY_DISP_TENSION_BOLTED, KEY_DISP_TENSION_WELDED, KEY_DISP_COMPRESSION_COLUMN, KEY_DISP_COMPRESSION_Strut,
+    KEY_DISP_LACEDCOL, KEY_DISP_COMPRESSION_LacedColumn, KEY_DISP_BATTENEDCOL, KEY_DISP_FLEXURE, KEY_DISP_FLEXURE2,
+    KEY_DISP_FLEXURE3]}
+
+
+class OsiError(ValueError):
+    """Raised when an .osi file can not be read or does not match the schema of its module"""
+
+    def __init__(self, file_name, errors):
+        self.file_name = file_name
+        self.errors = errors
+        super().__init__('{}: {}'.format(file_name, '; '.join(errors)))
+
+    def __reduce__(self):
+        # raised in the worker processes of load_osi_files()
+        return OsiError, (self.file_name, self.errors)
+
+
+@functools.lru_cache(maxsize=None)
+def module_schema(module):
+    """Return the schema of a module: dictionary of key to type of value"""
+    schema = dict(OSI_FIELDS)
+    schema.update(OSI_MODULE_FIELDS.get(module, {}))
+    return schema
+
+
+def _scalar(value):
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+def _text(value):
+    # YAML reads 1.0 and 10 as numbers; write them back as the text the input dock would hold
+    return value if isinstance(value, str) else str(value)
+
+
+def _check(key, value, value_type, errors):
+    """Return the value converted to the type of the schema, appending a message to errors if it is not valid"""
+    if value is None:
+        return value
+    if value_type == TEXT:
+        if _scalar(value):
+            return _text(value)
+    elif value_type == TEXTS:
+        if _scalar(value):
+            return [_text(value)]
+        if isinstance(value, list) and all(_scalar(item) for item in value):
+            return [_text(item) for item in value]
+    elif value_type == LOAD:
+        if _scalar(value):
+            value = _text(value)
+            try:
+                if value.strip() not in ('', 'Disabled'):
+                    float(value)
+                return value
+            except ValueError:
+                pass
+    elif value_type == INTEGERS:
+        if isinstance(value, list) and all(isinstance(item, int) for item in value):
+            return value
+    elif value_type == LOAD_CASES:
+        if isinstance(value, list) and all(isinstance(case, dict) for case in value):
+            return [{name: _check(name, item, LOAD, errors) if name != KEY_LOAD_CASE_NAME else _text(item)
+                     for name, item in case.items()} for case in value]
+    errors.append('{} should be a {} (found {!r})'.format(key, value_type, value))
+    return value
+
+
+def validate(design_inputs, file_name='<design>'):
+    """Check a design dictionary against the schema of its module
+
+    Args:
+        design_inputs: design dictionary read from an .osi file
+        file_name: name of the file, for the messages
+
+    Returns: the design dictionary, with the values converted to the types of the schema
+    """
+    if not isinstance(design_inputs, dict):
+        raise OsiError(file_name, ['the file does not hold a design dictionary'])
+    errors = []
+    module = design_inputs.get(KEY_MODULE)
+    if not isinstance(module, str):
+        errors.append('{} is missing'.format(KEY_MODULE))
+    schema = module_schema(module)
+    validated = {}
+    for key, value in design_inputs.items():
+        if not isinstance(key, str):
+            errors.append('{!r} is not a valid key'.format(key))
+        elif key in schema:
+            value = _check(key, value, schema[key], errors)
+        validated[key] = value
+    if errors:
+        raise OsiError(file_name, errors)
+    return validated
+
+
+def load_osi(file_name):
+    """Read and validate an .osi file
+
+    Returns: design dictionary
+    """
+    try:
+        with open(file_name, 'r') as fileObject:
+            design_inputs = yaml.load(fileObject, Loader=Loader)
+    except yaml.YAMLError as e:
+        raise OsiError(file_name, [str(e).replace('\n', ' ')])
+    return validate(design_inputs, file_name)
+
+
+def _plain(value):
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def save_osi(file_name, design_inputs):
+    """Write a design dictionary to an .osi file (values which YAML can not represent are written as text)"""
+    with open(file_name, 'w') as input_file:
+        yaml.dump(_plain(design_inputs), input_file, Dumper=Dumper, default_flow_style=False)
+
+
+def _load(file_name):
+    try:
+        return load_osi(file_name), None
+    except (OSError, OsiError) as e:
+        return None, e
+
+
+def load_osi_files(file_names, workers=None):
+    """Read and validate many .osi files concurrently
+
+    Args:
+        file_names: paths of the .osi files
+        workers: number of worker processes (default: one per CPU, none for a handful of files)
+
+    Returns: list of (path, design dictionary), in the order of file_names
+
+    Raises OsiError (or OSError) for the first file which can not be read, once all the files are read.
+    """
+    file_names = list(file_names)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(file_names) >= 64 else 1
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(_load, file_names, chunksize=max(1, len(file_names) // (4 * workers))))
+    else:
+        results = [_load(file_name) for file_name in file_names]
+    for design_inputs, error in results:
+        if error is not None:
+            raise error
+    return [(file_name, design_inputs) for file_name, (design_inputs, error) in zip(file_names, results)]
@@ -0,0 +1,240 @@
+"""Profiling of designs, batches of designs and GUI sessions.
+
+Two collectors are available:
+
+    sample      a background thread samples the stack of the profiled thread every few milliseconds. The overhead is
+                small enough to profile real workloads. The samples are written as collapsed stacks (one line
+                'frame;frame;frame count' per stack), which flamegraph.pl, speedscope and similar tools read directly.
+    cprofile    the deterministic profiler of the standard library, written as a pstats file (read with pstats,
+                snakeviz, gprof2dot...).
+
+Both print a summary aggregated by Osdag module and function. A design or a batch of design examples is profiled from
+the command line:
+
+    python -m osdag.utils.common.profiling column_bolted1.osi --output column_bolted1.folded
+    python -m osdag.utils.common.profiling design_example/ --mode cprofile --output batch.prof --repeat 5
+
+and a GUI session by setting OSDAG_PROFILE to the output file before starting Osdag (OSDAG_PROFILE_MODE selects the
+collector, sample by default, and OSDAG_PROFILE_INTERVAL the sampling interval in seconds).
+"""
+import argparse
+import collections
+import contextlib
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+
+PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def frame_name(code, module):
+    """Name of a frame in the collapsed stacks and the summary: '<module>:<function>'"""
+    return '{}:{}'.format(module, code.co_name)
+
+
+def is_osdag(module):
+    return module == 'osdag' or module.startswith('osdag.')
+
+
+class SamplingProfiler(object):
+    """Sample the stack of a thread at a fixed interval, from a background thread"""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks = collections.Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(frame_name(frame.f_code, frame.f_globals.get('__name__', '?')))
+            frame = frame.f_back
+        if stack:
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='osdag-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self, file_name):
+        """Write the samples as collapsed stacks"""
+        with open(file_name, 'w') as output:
+            for stack, count in self.stacks.most_common():
+                output.write('{} {}\n'.format(';'.join(stack), count))
+
+    def summary(self):
+        """Aggregate the samples by Osdag function
+
+        Returns: list of (function, self samples, total samples), by decreasing total samples
+        """
+        own = collections.Counter()
+        total = collections.Counter()
+        for stack, count in self.stacks.items():
+            functions = [name for name in stack if is_osdag(name.split(':')[0])]
+            if not functions:
+                continue
+            own[functions[-1]] += count
+            for name in set(functions):
+                total[name] += count
+        return [(name, own[name], count) for name, count in total.most_common()]
+
+
+def _module_of_file(file_name):
+    """Module name of a source file of the osdag package (the file name for other files)"""
+    path = os.path.abspath(file_name)
+    if not path.startswith(PACKAGE_PATH + os.sep):
+        return file_name
+    module = os.path.splitext(os.path.relpath(path, os.path.dirname(PACKAGE_PATH)))[0].replace(os.sep, '.')
+    return module[:-len('.__init__')] if module.endswith('.__init__') else module
+
+
+def cprofile_summary(profile):
+    """Aggregate the pstats of a cProfile run by Osdag function
+
+    Returns: list of (function, own time, cumulative time, calls), by decreasing cumulative time
+    """
+    rows = collections.defaultdict(lambda: [0.0, 0.0, 0])
+    for (file_name, line, function), (cc, nc, tt, ct, callers) in pstats.Stats(profile).stats.items():
+        module = _module_of_file(file_name)
+        if not is_osdag(module):
+            continue
+        row = rows['{}:{}'.format(module, function)]
+        row[0] += tt
+        row[1] += ct
+        row[2] += nc
+    return sorted(((name, own, cumulative, calls) for name, (own, cumulative, calls) in rows.items()),
+                  key=lambda row: row[2], reverse=True)
+
+
+def print_summary(collector, stream=None, limit=25):
+    stream = stream or sys.stdout
+    if isinstance(collector, SamplingProfiler):
+        stream.write('{} samples every {:.1f} ms\n'.format(collector.samples, collector.interval * 1000))
+        stream.write('{:>8} {:>8}  {}\n'.format('self %', 'total %', 'function'))
+        for name, own, total in collector.summary()[:limit]:
+            stream.write('{:>8.1f} {:>8.1f}  {}\n'.format(100.0 * own / max(collector.samples, 1),
+                                                        100.0 * total / max(collector.samples, 1), name))
+    else:
+        stream.write('{:>10} {:>10} {:>8}  {}\n'.format('own s', 'cum s', 'calls', 'function'))
+        for name, own, cumulative, calls in cprofile_summary(collector)[:limit]:
+            stream.write('{:>10.4f} {:>10.4f} {:>8}  {}\n'.format(own, cumulative, calls, name))
+
+
+@contextlib.contextmanager
+def profile(output, mode='sample', interval=0.005, summary=True):
+    """Profile the block of code run inside the context
+
+    Args:
+        output: file the profile is written to (collapsed stacks for 'sample', pstats for 'cprofile')
+        mode: 'sample' or 'cprofile'
+        interval: sampling interval in seconds
+        summary: True to print the summary by Osdag function on stderr
+
+    Returns: the collector (SamplingProfiler or cProfile.Profile)
+    """
+    if mode == 'sample':
+        collector = SamplingProfiler(interval)
+        collector.start()
+    elif mode == 'cprofile':
+        collector = cProfile.Profile()
+        collector.enable()
+    else:
+        raise ValueError("Profiling mode '{}' is not available".format(mode))
+    try:
+        yield collector
+    finally:
+        if mode == 'sample':
+            collector.stop()
+            collector.write(output)
+        else:
+            collector.disable()
+            collector.dump_stats(output)
+        if summary:
+            print_summary(collector, sys.stderr)
+            sys.stderr.write('Profile written to {}\n'.format(output))
+
+
+def profile_from_environment():
+    """Profile context set by OSDAG_PROFILE (output file), OSDAG_PROFILE_MODE and OSDAG_PROFILE_INTERVAL, or a context
+    doing nothing when OSDAG_PROFILE is not set"""
+    output = os.environ.get('OSDAG_PROFILE')
+    if not output:
+        return contextlib.nullcontext()
+    return profile(output, os.environ.get('OSDAG_PROFILE_MODE', 'sample'),
+                   float(os.environ.get('OSDAG_PROFILE_INTERVAL', 0.005)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m osdag.utils.common.profiling',
+                                     description='Profile designs of .osi files without the GUI')
+    parser.add_argument('inputs', nargs='+', help='.osi files, or folders of .osi files')
+    parser.add_argument('--mode', choices=['sample', 'cprofile'], default='sample',
+                        help='sample: low overhead sampling, written as collapsed stacks; '
+                             'cprofile: deterministic profile, written as a pstats file (default: sample)')
+    parser.add_argument('--output', help='profile file (default: osdag.folded or osdag.prof)')
+    parser.add_argument('--interval', type=float, default=0.005, help='sampling interval in seconds (default: 0.005)')
+    parser.add_argument('--repeat', type=int, default=1, help='runs of each design (default: 1)')
+    parser.add_argument('--no-report', action='store_true', help='skip the report data of the designs')
+    parser.add_argument('--limit', type=int, default=25, help='functions listed in the summary (default: 25)')
+    args = parser.parse_args(argv)
+
+    from ...Module_benchmark import BENCHMARK_MODULES, DesignBenchmark, load_examples
+    from ...Common import KEY_MODULE
+
+    examples = []
+    for path in args.inputs:
+        if os.path.isdir(path):
+            examples.extend(load_examples(path))
+        else:
+            examples.extend(load_examples(os.path.dirname(path) or '.', os.path.basename(path)))
+    benchmark = DesignBenchmark(repeat=args.repeat, import_repeat=0, report=not args.no_report)
+    classes = {}
+    for file_name, design_inputs in examples:
+        module = design_inputs.get(KEY_MODULE)
+        if module in BENCHMARK_MODULES and module not in classes:
+            classes[module] = benchmark.design_class(module)
+
+    output = args.output or ('osdag.folded' if args.mode == 'sample' else 'osdag.prof')
+    failed = 0
+    start = time.perf_counter()
+    with profile(output, args.mode, args.interval, summary=False) as collector:
+        for file_name, design_inputs in examples:
+            main_class = classes.get(design_inputs.get(KEY_MODULE))
+            if main_class is None:
+                continue
+            try:
+                for i in range(args.repeat):
+                    benchmark.run_design(main_class, file_name, design_inputs)
+            except Exception as e:
+                failed += 1
+                sys.stderr.write('{}: {}: {}\n'.format(file_name, type(e).__name__, e))
+    print_summary(collector, limit=args.limit)
+    print('{} designs profiled in {:.2f} s ({} failed), profile written to {}'.format(
+        sum(1 for file_name, design_inputs in examples if design_inputs.get(KEY_MODULE) in classes) - failed,
+        time.perf_counter() - start, failed, output))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
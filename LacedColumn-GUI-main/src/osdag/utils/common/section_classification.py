@@ -0,0 +1,247 @@
+"""Classification of cross-sections as per Table 2 of IS 800:2007, for a list of sections at once.
+
+The functions below accept arrays of element dimensions (one entry per section), so that the class of the flanges, the
+web and the whole cross-section of all the candidate sections of a member design are found in a single call. The scalar
+methods of IS800_2007 (Table2_i, Table2_iii, Table2_iv, Table2_vi, Table2_vii and Table2_x) are built on these
+functions, the flexure modules classify their candidate lists with classify_sections and the column, beam-column and
+laced column modules with classify_column_sections.
+
+Reference: IS 800:2007, cl 3.7.2 and Table 2
+"""
+import numpy as np
+
+# the section classes, as in Common (not imported from Common, which imports this module through component and
+# is800_2007)
+KEY_Plastic = "Plastic"
+KEY_Compact = "Compact"
+KEY_SemiCompact = "Semi-Compact"
+KEY_Slender = 'Slender'
+
+# classes in the order of increasing slenderness, the class code of a section is its index in this array
+SECTION_CLASSES = np.array([KEY_Plastic, KEY_Compact, KEY_SemiCompact, KEY_Slender], dtype=object)
+
+
+def epsilon(f_y):
+    """Calculate the yield stress ratio, epsilon = sqrt(250 / f_y)
+
+    Args:
+        f_y: yield stress in MPa (float or array)
+
+    Returns: epsilon (array)
+    """
+    return np.sqrt(250 / np.asarray(f_y, dtype=float))
+
+
+def class_code(ratio, limits, strict=False):
+    """Find the class code of each element from its width to thickness ratio
+
+    Args:
+        ratio: width to thickness ratio (float or array)
+        limits: limiting ratios of the plastic, compact and semi-compact classes (list of floats or arrays), None for
+                a class which is not defined for the element
+        strict: True when the ratio must be less than the limit (Table 2, sr. no iii), False when it may be equal
+
+    Returns: class code (array of int), the index of the class in SECTION_CLASSES
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    code = np.zeros(ratio.shape, dtype=int)
+    for limit in limits:
+        if limit is None:
+            code = code + 1
+        elif strict:
+            code = code + (ratio >= limit)
+        else:
+            code = code + (ratio > limit)
+    return code
+
+
+def class_name(code):
+    """Convert class codes to the class names used by Osdag
+
+    Args:
+        code: class code (int or array)
+
+    Returns: class name (array of str)
+    """
+    return SECTION_CLASSES[np.asarray(code, dtype=int)]
+
+
+def governing_class(*codes):
+    """Find the class of the cross-section as the most slender class of its elements
+
+    Args:
+        codes: class code of each element, e.g. the flange and the web (arrays)
+
+    Returns: class code of the cross-section (array of int)
+    """
+    return np.maximum.reduce([np.asarray(code, dtype=int) for code in codes])
+
+
+def outstand_flange_class(width, thickness, f_y, section_type='Rolled'):
+    """Classify the outstanding element of a compression flange [Reference: Table 2 sr. no i, IS 800:2007]
+
+    Args:
+        width: width of the outstand in mm (float or array)
+        thickness: thickness of the flange in mm (float or array)
+        f_y: yield stress in MPa (float or array)
+        section_type: 'Rolled' or 'Welded' (str or array of str)
+
+    Returns: class code (array of int) and b/t ratio (array)
+    """
+    e = epsilon(f_y)
+    ratio = np.asarray(width, dtype=float) / thickness
+    rolled = np.asarray(section_type) == 'Rolled'
+    limits = [np.where(rolled, 9.4, 8.4) * e, np.where(rolled, 10.5, 9.4) * e, np.where(rolled, 15.7, 13.6) * e]
+    return class_code(ratio, limits), ratio
+
+
+def web_class(depth, thickness, f_y, classification_type='Neutral axis at mid-depth'):
+    """Classify the web of an I, H or box section [Reference: Table 2 sr. no iii, IS 800:2007]
+
+    Args:
+        depth: depth of the web in mm (float or array)
+        thickness: thickness of the web in mm (float or array)
+        f_y: yield stress in MPa (float or array)
+        classification_type: 'Neutral axis at mid-depth' or 'Axial compression' (str or array of str)
+
+    Returns: class code (array of int) and d/t ratio (array)
+    """
+    e = epsilon(f_y)
+    ratio = np.asarray(depth, dtype=float) / thickness
+    classification_type = np.asarray(classification_type)
+    if not np.isin(classification_type, ['Neutral axis at mid-depth', 'Axial compression']).all():
+        raise ValueError("Web classification '{}' is not available".format(classification_type))
+    return np.where(classification_type == 'Axial compression', class_code(ratio, [None, None, 42 * e]),
+                    class_code(ratio, [84 * e, 105 * e, 126 * e], strict=True)), ratio
+
+
+def web_axial_class(depth, thickness, f_y):
+    """Classify the web of a channel under axial compression [Reference: Table 2 sr. no iv, IS 800:2007]
+
+    Args:
+        depth: depth of the web in mm (float or array)
+        thickness: thickness of the web in mm (float or array)
+        f_y: yield stress in MPa (float or array), taken as its integer part as in Table2_iv
+
+    Returns: class code (array of int) and d/t ratio (array)
+    """
+    e = epsilon(np.trunc(f_y))
+    ratio = np.asarray(depth, dtype=float) / thickness
+    return class_code(ratio, [None, None, 42 * e]), ratio
+
+
+def angle_class(width, depth, thickness, f_y, force_type='Axial Compression', single_angle=True):
+    """Classify single angles (and angles connected back to back) [Reference: Table 2 sr. no vi and vii, IS 800:2007]
+
+    Args:
+        width: width of the smaller leg (b) in mm (float or array)
+        depth: width of the larger leg (d) in mm (float or array)
+        thickness: thickness of the angle in mm (float or array)
+        f_y: yield stress in MPa (float or array), taken as its integer part as in Table2_vi
+        force_type: 'Axial Compression' or compression due to bending (str)
+        single_angle: True for sr. no vi (b/t, d/t and (b+d)/t are checked under axial compression), False for sr. no vii
+                      (only d/t is checked)
+
+    Returns: class code (array of int) and the b/t, d/t and (b+d)/t ratios (arrays)
+    """
+    e = epsilon(np.trunc(f_y))
+    b_t = np.asarray(width, dtype=float) / thickness
+    d_t = np.asarray(depth, dtype=float) / thickness
+    bd_t = (np.asarray(width, dtype=float) + depth) / thickness
+    if force_type == 'Axial Compression':
+        if single_angle:
+            code = governing_class(class_code(b_t, [None, None, 15.7 * e]), class_code(d_t, [None, None, 15.7 * e]),
+                                   class_code(bd_t, [None, None, 25 * e]))
+        else:
+            code = class_code(d_t, [None, None, 15.7 * e])
+    else:
+        limits = [9.4 * e, 10.5 * e, 15.7 * e]
+        code = governing_class(class_code(b_t, limits), class_code(d_t, limits))
+    return code, b_t, d_t, bd_t
+
+
+def tube_class(outer_diameter, thickness, f_y, load_type='axial compression'):
+    """Classify circular hollow tubes [Reference: Table 2 sr. no x, IS 800:2007]
+
+    Args:
+        outer_diameter: outer diameter of the tube in mm (float or array)
+        thickness: thickness of the tube in mm (float or array)
+        f_y: yield stress in MPa (float or array)
+        load_type: 'axial compression' or moment (str)
+
+    Returns: class code (array of int) and D/t ratio (array)
+    """
+    e_sq = epsilon(f_y) ** 2
+    ratio = np.asarray(outer_diameter, dtype=float) / thickness
+    if load_type == 'axial compression':
+        return class_code(ratio, [None, None, 88 * e_sq]), ratio
+    return class_code(ratio, [42 * e_sq, 52 * e_sq, 146 * e_sq]), ratio
+
+
+def classify_sections(flange_width, flange_thickness, web_depth, web_thickness, f_y, section_type='Rolled',
+                      web_classification_type='Neutral axis at mid-depth', flange_f_y=None):
+    """Classify I and H sections from the dimensions of their flanges and webs
+
+    Args:
+        flange_width: width of the outstand of the flange in mm (array)
+        flange_thickness: thickness of the flange in mm (array)
+        web_depth: depth of the web in mm (array)
+        web_thickness: thickness of the web in mm (array)
+        f_y: yield stress in MPa (array)
+        section_type: 'Rolled' or 'Welded' (str or array of str)
+        web_classification_type: 'Neutral axis at mid-depth' (flexure) or 'Axial compression' (str or array of str)
+        flange_f_y: yield stress used for the flange in MPa (array), f_y when not given
+
+    Returns: dictionary of arrays - flange_class, web_class, section_class (class names), flange_ratio, web_ratio and
+             section_code (class code of the cross-section)
+    """
+    flange_code, flange_ratio = outstand_flange_class(flange_width, flange_thickness,
+                                                      f_y if flange_f_y is None else flange_f_y, section_type)
+    web_code, web_ratio = web_class(web_depth, web_thickness, f_y, web_classification_type)
+    section_code = governing_class(flange_code, web_code)
+    return {'flange_class': class_name(flange_code), 'flange_ratio': flange_ratio,
+            'web_class': class_name(web_code), 'web_ratio': web_ratio,
+            'section_class': class_name(section_code), 'section_code': section_code}
+
+
+def classify_column_sections(sections, f_y, profile='I'):
+    """Classify the candidate sections of axially loaded columns
+
+    Args:
+        sections: list of section objects (Beam, Column, Channel, RHS, SHS or CHS)
+        f_y: yield stress of the material of each section in MPa (array)
+        profile: 'I' for beams and columns, 'Channel' for channels, 'RHS' for rectangular and square hollow sections,
+                 'CHS' for circular hollow sections
+
+    Returns: dictionary of arrays - flange_class, web_class, section_class (class names), flange_ratio and web_ratio
+             (ratios checked against Table 2) and section_code
+
+    Note: the outstand of welded I-sections is taken as (b_f - t_w) / 2 (b_f - t_w for channels) and their flange is
+          classified with the yield stress of the section, the webs and the walls of hollow sections are classified for
+          axial compression
+    """
+    f_y = np.asarray(f_y, dtype=float)
+    thickness = np.array([section.flange_thickness for section in sections], dtype=float)
+    if profile == 'CHS':
+        flange_code, flange_ratio = tube_class([section.out_diameter for section in sections], thickness, f_y)
+        web_code, web_ratio = flange_code, flange_ratio
+    else:
+        web_depth = np.array([section.depth for section in sections], dtype=float) - 2 * thickness
+        if profile == 'RHS':
+            flange_code, flange_ratio = web_class(web_depth, thickness, f_y, 'Axial compression')
+            web_code, web_ratio = flange_code, flange_ratio
+        else:
+            section_type = np.array([section.type for section in sections])
+            rolled = section_type == 'Rolled'
+            flange_width = np.array([section.flange_width for section in sections], dtype=float)
+            web_thickness = np.array([section.web_thickness for section in sections], dtype=float)
+            # a channel has one outstand per flange, the full width of the flange
+            outstands = 1 if profile == 'Channel' else 2
+            flange_code, flange_ratio = outstand_flange_class(
+                np.where(rolled, flange_width / outstands, (flange_width - web_thickness) / outstands), thickness,
+                np.where(rolled, f_y, [section.fy for section in sections]), section_type)
+            web_code, web_ratio = web_class(web_depth, web_thickness, f_y, 'Axial compression')
+    section_code = governing_class(flange_code, web_code)
+    return {'flange_class': class_name(flange_code), 'flange_ratio': flange_ratio,
+            'web_class': class_name(web_code), 'web_ratio': web_ratio,
+            'section_class': class_name(section_code), 'section_code': section_code}
@@ -0,0 +1,281 @@
+"""Bulk import and export of the section tables of the Osdag section database.
+
+The sections of a spreadsheet (.xlsx) or a comma separated file (.csv) are streamed row by row, validated column-wise and
+written to the Columns, Beams, Angles or Channels table with one executemany call in a single transaction. The export
+streams the rows of one or more tables from the database cursor, in chunks, into a write-only workbook (one sheet per
+table) or a CSV file. The functions do not depend on Qt, so that the same import and export are used by the design
+preferences dialog and from the command line:
+
+    python -m osdag.utils.common.section_database import my_sections.xlsx --table Beams
+    python -m osdag.utils.common.section_database export sections.xlsx --table Beams --table Columns
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from ...Common import PATH_TO_DATABASE
+
+SECTION_TABLES = ['Columns', 'Beams', 'Angles', 'Channels']
+
+# columns which must hold numbers for a row to be imported (same check as DesignPreferences.import_db_validation)
+NUMERIC_FIELDS = ['Mass', 'Area', 'D', 'B', 'tw', 'T', 'FlangeSlope', 'R1', 'R2', 'Iz', 'Iy', 'rz', 'ry', 'Zz', 'Zy',
+                  'Zpz', 'Zpy', 'It', 'Iw']
+
+
+class SectionImportError(Exception):
+    """Raised when the file to be imported cannot be matched with a section table"""
+
+
+class SectionImportResult(object):
+    """Summary of a bulk import: imported, discarded (failed validation) and ignored (already in the database) sections"""
+
+    def __init__(self, table):
+        self.table = table
+        self.imported = []
+        self.discarded = []
+        self.ignored = []
+        self.read_time = 0.0
+        self.write_time = 0.0
+
+    @property
+    def rows(self):
+        return len(self.imported) + len(self.discarded) + len(self.ignored)
+
+    def summary(self):
+        return "{}: {} rows read, {} imported, {} discarded, {} ignored (read {:.2f} s, write {:.2f} s)".format(
+            self.table, self.rows, len(self.imported), len(self.discarded), len(self.ignored), self.read_time,
+            self.write_time)
+
+
+def table_header(conn, table):
+    """Return the column names of a section table, in the order of the table (same as Common.get_db_header)"""
+    if table not in SECTION_TABLES:
+        raise SectionImportError("Table {} is not a section table".format(table))
+    cursor = conn.execute("SELECT * FROM {} LIMIT 0".format(table))
+    return [description[0] for description in cursor.description]
+
+
+def _csv_value(value):
+    """Convert a text cell of a CSV file to the value openpyxl would read from the same cell of a spreadsheet"""
+    if value == '':
+        return None
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_section_rows(file_name, table):
+    """Stream the rows of the sheet (or CSV file) of a section table
+
+    Args:
+        file_name: path of a .xlsx workbook with a sheet named after the table, or of a .csv file
+        table: 'Columns', 'Beams', 'Angles' or 'Channels'
+
+    Returns: iterator over the rows, the first row being the header (tuples of cell values)
+    """
+    if os.path.splitext(file_name)[1].lower() == '.csv':
+        with open(file_name, newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, None)
+            if header is not None:
+                yield tuple(header)
+            for row in reader:
+                yield tuple(_csv_value(value) for value in row)
+        return
+
+    import openpyxl
+    wb = openpyxl.load_workbook(file_name, read_only=True, data_only=True)
+    try:
+        if table not in wb.sheetnames:
+            raise SectionImportError('File does not contain {} Sheet.'.format(table))
+        for row in wb[table].iter_rows(values_only=True):
+            yield row
+    finally:
+        wb.close()
+
+
+def validate_section_rows(header, rows):
+    """Check the numeric columns of all the rows at once
+
+    Args:
+        header: column names (list of str)
+        rows: section rows, in the order of the header (list of tuples)
+
+    Returns: boolean array, True for the rows which pass the validation checks
+    """
+    numeric = [index for index, key in enumerate(header) if key in NUMERIC_FIELDS]
+    if not rows or not numeric:
+        return np.ones(len(rows), dtype=bool)
+    values = np.array([[row[index] for index in numeric] for row in rows], dtype=object)
+    is_number = np.frompyfunc(lambda value: isinstance(value, (int, float)) and not isinstance(value, bool), 1, 1)
+    return is_number(values).astype(bool).all(axis=1)
+
+
+def import_sections(file_name, table, database=PATH_TO_DATABASE):
+    """Import the custom sections of a file into a section table in a single transaction
+
+    Args:
+        file_name: path of a .xlsx workbook (sheet named after the table) or a .csv file, with the header of the table
+        table: 'Columns', 'Beams', 'Angles' or 'Channels'
+        database: path of the sqlite database
+
+    Returns: SectionImportResult
+
+    Note: the section tables have no unique key on Designation, so sections which already exist in the table (or occur
+          earlier in the file) are ignored, as in the import of the design preferences dialog, and not updated
+    """
+    result = SectionImportResult(table)
+    conn = sqlite3.connect(database)
+    try:
+        header = table_header(conn, table)
+
+        start = time.perf_counter()
+        rows = read_section_rows(file_name, table)
+        file_header = [str(value) for value in next(rows, ())]
+        if file_header != header:
+            raise SectionImportError('{} Sheet has headers different than database.'.format(table))
+        designation = header.index('Designation')
+        rows = [tuple(row) + (None,) * (len(header) - len(row)) for row in rows
+                if any(value is not None for value in row)]
+        valid = validate_section_rows(header, rows)
+        result.read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        existing = {row[0] for row in conn.execute("SELECT Designation FROM {}".format(table))}
+        columns = [key for key in header if key != 'Id']
+        indices = [header.index(key) for key in columns]
+        source = columns.index('Source')
+        records = []
+        for row, row_valid in zip(rows, valid):
+            if not row_valid:
+                result.discarded.append(str(row[designation]))
+            elif row[designation] in existing:
+                result.ignored.append(row[designation])
+            else:
+                existing.add(row[designation])
+                record = [row[index] for index in indices]
+                record[source] = 'Custom'
+                records.append(record)
+                result.imported.append(row[designation])
+
+        with conn:
+            conn.executemany("INSERT INTO {} ({}) VALUES ({})".format(table, ','.join(columns),
+                                                                       ','.join('?' * len(columns))), records)
+        result.write_time = time.perf_counter() - start
+    finally:
+        conn.close()
+    return result
+
+
+def export_sections(file_name, tables, database=PATH_TO_DATABASE, header_only=False, chunk_size=1000):
+    """Export section tables to a workbook (one sheet per table) or a CSV file (one table), in a single pass
+
+    Args:
+        file_name: path of the .xlsx or .csv file to be written
+        tables: list of table names ('Columns', 'Beams', 'Angles' or 'Channels')
+        database: path of the sqlite database
+        header_only: True to write only the header of each table (template for the import)
+        chunk_size: number of rows fetched from the cursor at a time
+
+    Returns: dictionary of the number of rows written for each table
+    """
+    csv_file = os.path.splitext(file_name)[1].lower() == '.csv'
+    if csv_file and len(tables) != 1:
+        raise SectionImportError('A CSV file can hold only one table, {} were given.'.format(len(tables)))
+
+    counts = {}
+    conn = sqlite3.connect(database)
+    try:
+        if csv_file:
+            with open(file_name, 'w', newline='') as out:
+                write_tables(conn, {tables[0]: csv.writer(out).writerow}, counts, header_only, chunk_size)
+        else:
+            import openpyxl
+            out = openpyxl.Workbook(write_only=True)
+            write_tables(conn, {table: out.create_sheet(table).append for table in tables}, counts, header_only,
+                         chunk_size)
+            out.save(file_name)
+    finally:
+        conn.close()
+    return counts
+
+
+def write_tables(conn, writers, counts, header_only=False, chunk_size=1000):
+    """Write the header and rows of section tables, a chunk of rows fetched from the cursor at a time
+
+    Args:
+        conn: connection to the sqlite database
+        writers: function appending a row, for each table (dict)
+        counts: dictionary updated with the number of rows written for each table
+    """
+    for table, append in writers.items():
+        append(table_header(conn, table))
+        counts[table] = 0
+        if header_only:
+            continue
+        cursor = conn.execute("SELECT * FROM {}".format(table))
+        rows = cursor.fetchmany(chunk_size)
+        while rows:
+            for row in rows:
+                append(row)
+            counts[table] += len(rows)
+            rows = cursor.fetchmany(chunk_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m osdag.utils.common.section_database',
+                                     description='Import and export the section tables of the Osdag section database')
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help='import sections from a .xlsx or .csv file')
+    import_parser.add_argument('file', help='.xlsx workbook with a sheet per table, or .csv file of one table')
+    import_parser.add_argument('--table', choices=SECTION_TABLES, action='append',
+                               help='table to import (default: every sheet of the workbook named after a table)')
+    import_parser.add_argument('--database', default=PATH_TO_DATABASE, help='path of the sqlite database')
+    export_parser = commands.add_parser('export', help='export section tables to a .xlsx or .csv file')
+    export_parser.add_argument('file', help='.xlsx workbook (one sheet per table) or .csv file (one table)')
+    export_parser.add_argument('--table', choices=SECTION_TABLES, action='append',
+                               help='table to export (default: all the section tables)')
+    export_parser.add_argument('--header-only', action='store_true', help='write only the headers of the tables')
+    export_parser.add_argument('--database', default=PATH_TO_DATABASE, help='path of the sqlite database')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        start = time.perf_counter()
+        try:
+            counts = export_sections(args.file, args.table or SECTION_TABLES, args.database, args.header_only)
+        except SectionImportError as e:
+            print(e)
+            return 1
+        for table, count in counts.items():
+            print('{}: {} rows exported'.format(table, count))
+        print('{} written in {:.2f} s'.format(args.file, time.perf_counter() - start))
+        return 0
+
+    tables = args.table
+    if tables is None:
+        if os.path.splitext(args.file)[1].lower() == '.csv':
+            parser.error('--table is required for .csv files')
+        import openpyxl
+        wb = openpyxl.load_workbook(args.file, read_only=True)
+        tables = [table for table in SECTION_TABLES if table in wb.sheetnames]
+        wb.close()
+
+    status = 0
+    for table in tables:
+        try:
+            print(import_sections(args.file, table, args.database).summary())
+        except SectionImportError as e:
+            print('{}: {}'.format(table, e))
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""Results of the trial sections of an optimum section design, stored by column.
+
+The member design modules (laced column, flexure, tension) try every section of the input list and pick the optimum
+one. SectionResults records one row per trial section - designation, section class, capacity, utilisation ratio, mass,
+cost and the reason the section failed, if it failed for a reason other than its utilisation ratio - with the
+detailed results of the module for that section. Two sections with the same utilisation ratio are two rows, so no
+result is lost.
+
+The columns are held as a NumPy structured array, built once after the sweep, so that the optimum section ("most
+utilised passing", the section the modules select when optimising the utilisation ratio), the lightest and the
+cheapest passing section, the least failing section (shown when no section passes) and the next best alternatives are
+found with array operations instead of sorting dictionaries keyed by the utilisation ratio.
+
+Of passing sections with the same utilisation ratio, the lightest is selected. The dictionaries keyed by the
+utilisation ratio kept the last of them (the last section tried), so a design with such a tie selects a lighter
+section than it did before.
+"""
+import numpy as np
+
+# columns of the result table
+FIELDS = [
+    ('designation', object),
+    ('section_class', object),
+    ('capacity', float),
+    ('ur', float),
+    ('mass', float),            # kg/m
+    ('cost', float),            # INR
+    ('failure', object),        # reason the section fails, '' if it passes on its utilisation ratio
+]
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class SectionResults(object):
+    """Table of the results of the trial sections of a design
+
+    Rows are added with add() during the sweep, in the order the sections are tried, and the detailed results of a row
+    are read with results[index]. The selection methods return row indices (None when no row matches); rows with the
+    same utilisation ratio are ranked lightest first, other ties are broken by the order of the rows.
+    """
+
+    def __init__(self):
+        self._columns = {name: [] for name, _ in FIELDS}
+        self._details = []
+        self._table = None
+
+    def __len__(self):
+        return len(self._details)
+
+    def __getitem__(self, index):
+        return self._details[index]
+
+    def __iter__(self):
+        return iter(self._details)
+
+    def add(self, designation, ur, capacity=None, section_class=None, mass=None, cost=None, failure='', details=None):
+        """Add the results of a trial section
+
+        Args:
+            designation: designation of the section
+            ur: utilisation ratio
+            capacity: design capacity of the section (unit of the module)
+            section_class: class of the section (Plastic, Compact, Semi-Compact, Slender)
+            mass: mass of the section in kg/m
+            cost: cost of the member in INR
+            failure: reason the section fails, other than its utilisation ratio ('' if none)
+            details: dictionary of the detailed results of the module for the section
+
+        Returns: index of the row
+        """
+        row = dict(designation=designation, section_class=section_class, capacity=_number(capacity), ur=_number(ur),
+                   mass=_number(mass), cost=_number(cost), failure=failure or '')
+        for name, _ in FIELDS:
+            self._columns[name].append(row[name])
+        self._details.append(dict(details) if details else {})
+        self._table = None
+        return len(self._details) - 1
+
+    def update(self, index, **details):
+        """Add to the detailed results of a row"""
+        self._details[index].update(details)
+
+    @property
+    def table(self):
+        """Structured array of the columns, one record per row"""
+        if self._table is None:
+            table = np.empty(len(self), dtype=FIELDS)
+            for name, _ in FIELDS:
+                table[name] = self._columns[name]
+            self._table = table
+        return self._table
+
+    def index(self, designation):
+        """Return the index of the last row of a section, None if the section was not tried"""
+        for index in range(len(self) - 1, -1, -1):
+            if self._columns['designation'][index] == designation:
+                return index
+        return None
+
+    def passing(self, limit=1.0):
+        """Return a boolean array, True for the rows with a utilisation ratio up to limit and no failure reason"""
+        table = self.table
+        return (table['ur'] <= limit) & (table['failure'] == '')
+
+    def top_k(self, k, limit=1.0):
+        """Return the indices of the k passing rows with the highest utilisation ratio, highest (then lightest) first"""
+        candidates = np.flatnonzero(self.passing(limit))
+        if k <= 0 or not len(candidates):
+            return []
+        ur = self.table['ur'][candidates]
+        if k < len(candidates):
+            # the rows above the k-th highest utilisation ratio, and all the rows tied with it
+            threshold = ur[np.argpartition(-ur, k - 1)[k - 1]]
+            candidates, ur = candidates[ur >= threshold], ur[ur >= threshold]
+        mass = self.table['mass'][candidates]
+        order = np.lexsort((candidates, np.where(np.isnan(mass), np.inf, mass), -ur))
+        return [int(index) for index in candidates[order][:k]]
+
+    def most_utilised(self, limit=1.0):
+        """Return the index of the passing row with the highest utilisation ratio (the optimum section)"""
+        top = self.top_k(1, limit)
+        return top[0] if top else None
+
+    def _least(self, column, mask):
+        values = np.where(mask & ~np.isnan(self.table[column]), self.table[column], np.inf)
+        if not len(values) or np.isinf(values.min()):
+            return None
+        return int(np.argmin(values))
+
+    def lightest(self, limit=1.0):
+        """Return the index of the passing row with the least mass"""
+        return self._least('mass', self.passing(limit))
+
+    def cheapest(self, limit=1.0):
+        """Return the index of the passing row with the least cost"""
+        return self._least('cost', self.passing(limit))
+
+    def least_failing(self, limit=1.0):
+        """Return the index of the row with the least utilisation ratio above limit (the best of the failing sections)"""
+        return self._least('ur', self.table['ur'] > limit)
+
+    def least_utilised(self):
+        """Return the index of the row with the least utilisation ratio"""
+        return self._least('ur', np.ones(len(self), dtype=bool))
+
+    def rank(self, k=5, limit=1.0):
+        """Answer the selection queries of a design at once
+
+        Returns: dictionary of row indices - 'top' (list of the k most utilised passing rows), 'lightest', 'cheapest'
+                 and 'least_failing'
+        """
+        passing = self.passing(limit)
+        return {
+            'top': self.top_k(k, limit),
+            'lightest': self._least('mass', passing),
+            'cheapest': self._least('cost', passing),
+            'least_failing': self.least_failing(limit),
+        }